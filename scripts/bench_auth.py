@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""Benchmark per-request auth cost and JWKS refresh behaviour; emit perf-auth.json.
+
+Starts the Neon Auth stand-in from ``tests/smoke/smoke_lib/neon_stub.py`` as
+the JWKS origin and the Go server with ``NEON_AUTH_BASE_URL`` pointed at it,
+then drives each scenario open-loop at every rate in the sweep:
+
+- ``public``: ``GET /health``, no auth (baseline)
+- ``session_cookie``: ``GET /api/v1/me`` with a ``boring_session`` cookie,
+  parsed by ``SessionManager.Parse`` in the middleware on every request
+- ``exchange_hs256``: ``POST /auth/token-exchange`` with an HS256 token
+  (``TokenVerifier.verifyHS256``)
+- ``exchange_eddsa``: the same route with a stand-in EdDSA token
+  (``NeonVerifier.Verify`` and ``jwksCache.lookup``)
+
+Both exchanges do the same post-verification work (``OnAuthenticated`` and
+``SetCookie``), so their latency difference isolates EdDSA verification.
+Finally the EdDSA scenario is rerun at the highest rate with the signing key
+rotated part-way through: tokens with the new ``kid`` miss the verifier's
+JWKS cache, and the report shows the tail latency around the rotation and
+how many JWKS fetches it triggered.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from bench_common import (
+    ARTIFACTS_DIR,
+    ROOT,
+    build_server_binary,
+    ensure_port_free,
+    get_session_cookie,
+    latency_summary,
+    parse_int_list,
+    prepare_workspace_root,
+    start_server,
+    stop_server,
+    wait_for_health,
+)
+
+sys.path.insert(0, str(ROOT / "tests" / "smoke"))
+
+from smoke_lib.neon_stub import NeonAuthStub, SigningKey  # noqa: E402
+
+
+DEFAULT_OUTPUT = ARTIFACTS_DIR / "perf-auth.json"
+SCENARIOS = ("public", "session_cookie", "exchange_hs256", "exchange_eddsa")
+
+
+@dataclass
+class Sample:
+    offset_s: float
+    latency_ms: float
+    lag_ms: float
+    status: str
+    ok: bool
+
+
+@dataclass
+class RateRun:
+    rate: float
+    duration_s: float
+    wall_seconds: float = 0.0
+    samples: list[Sample] = field(default_factory=list)
+
+    def summary(self) -> dict[str, Any]:
+        return summarize_samples(self.samples, self.wall_seconds) | {"rate": self.rate}
+
+
+def summarize_samples(samples: list[Sample], wall_seconds: float) -> dict[str, Any]:
+    statuses: dict[str, int] = {}
+    for sample in samples:
+        statuses[sample.status] = statuses.get(sample.status, 0) + 1
+    ok = [sample.latency_ms for sample in samples if sample.ok]
+    return {
+        "requests": len(samples),
+        "errors": len(samples) - len(ok),
+        "achieved_rps": 0.0 if wall_seconds <= 0 else len(samples) / wall_seconds,
+        "max_lag_ms": max((sample.lag_ms for sample in samples), default=0.0),
+        "statuses": dict(sorted(statuses.items())),
+        **latency_summary(ok),
+    }
+
+
+async def run_at_rate(
+    rate: float,
+    duration_s: float,
+    call: Callable[[int], Awaitable[httpx.Response]],
+    *,
+    ok_statuses: tuple[int, ...] = (200,),
+) -> RateRun:
+    """Start request ``i`` at ``i / rate`` seconds regardless of how earlier ones fare.
+
+    Open-loop, unlike ``run_at_concurrency``: a slow server shows up as
+    latency and scheduling lag instead of silently lowering the offered load.
+    """
+    run = RateRun(rate=rate, duration_s=duration_s)
+    total = max(1, int(rate * duration_s))
+    interval = 1.0 / rate
+    started = time.perf_counter()
+
+    async def one(index: int, scheduled: float) -> None:
+        sent = time.perf_counter()
+        lag_ms = max(0.0, (sent - scheduled) * 1000.0)
+        try:
+            response = await call(index)
+        except httpx.HTTPError as exc:
+            run.samples.append(Sample(sent - started, (time.perf_counter() - sent) * 1000.0, lag_ms, type(exc).__name__, False))
+            return
+        run.samples.append(Sample(
+            sent - started,
+            (time.perf_counter() - sent) * 1000.0,
+            lag_ms,
+            str(response.status_code),
+            response.status_code in ok_statuses,
+        ))
+
+    tasks = []
+    for index in range(total):
+        scheduled = started + index * interval
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(index, scheduled)))
+    await asyncio.gather(*tasks)
+    run.wall_seconds = time.perf_counter() - started
+    run.samples.sort(key=lambda sample: sample.offset_s)
+    return run
+
+
+def _b64url(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def mint_hs256(secret: str, claims: dict[str, Any]) -> str:
+    """HS256 JWT as ``TokenVerifier.verifyHS256`` expects (signed with the session secret)."""
+    header = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+    payload = _b64url(json.dumps(claims, separators=(",", ":")).encode())
+    signature = hmac.new(secret.encode("utf-8"), f"{header}.{payload}".encode("ascii"), hashlib.sha256).digest()
+    return f"{header}.{payload}.{_b64url(signature)}"
+
+
+def bench_identity(index: int) -> tuple[str, str]:
+    return f"auth-bench-{index}", f"auth-bench-{index}@example.com"
+
+
+def hs256_pool(secret: str, size: int, *, ttl_s: int = 3600) -> list[str]:
+    now = int(time.time())
+    return [
+        mint_hs256(secret, {"sub": sub, "email": email, "iat": now, "exp": now + ttl_s})
+        for sub, email in map(bench_identity, range(size))
+    ]
+
+
+def eddsa_pool(stub: NeonAuthStub, size: int, *, key: SigningKey | None = None) -> list[str]:
+    return [stub.state.issue_token(sub=sub, email=email, key=key) for sub, email in map(bench_identity, range(size))]
+
+
+def rotation_summary(
+    samples: list[Sample],
+    *,
+    rotated_at_s: float,
+    window_s: float,
+    wall_seconds: float,
+) -> dict[str, Any]:
+    """Split samples into before the rotation, the first ``window_s`` after it, and the rest."""
+    before = [sample for sample in samples if sample.offset_s < rotated_at_s]
+    window = [sample for sample in samples if rotated_at_s <= sample.offset_s < rotated_at_s + window_s]
+    after = [sample for sample in samples if sample.offset_s >= rotated_at_s + window_s]
+    return {
+        "before": summarize_samples(before, rotated_at_s),
+        "rotation_window": summarize_samples(window, window_s),
+        "after": summarize_samples(after, max(0.0, wall_seconds - rotated_at_s - window_s)),
+    }
+
+
+def overhead_rows(scenarios: dict[str, list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Per rate: session-cookie cost over the public baseline, and EdDSA over HS256 verification."""
+    by_rate = {
+        name: {row["rate"]: row for row in rows}
+        for name, rows in scenarios.items()
+    }
+    rows = []
+    for rate in sorted({rate for rows_by_rate in by_rate.values() for rate in rows_by_rate}):
+        row: dict[str, Any] = {"rate": rate}
+        public = by_rate.get("public", {}).get(rate)
+        session = by_rate.get("session_cookie", {}).get(rate)
+        if public and session:
+            row["session_cookie_over_public_p50_ms"] = session["p50_ms"] - public["p50_ms"]
+        hs256 = by_rate.get("exchange_hs256", {}).get(rate)
+        eddsa = by_rate.get("exchange_eddsa", {}).get(rate)
+        if hs256 and eddsa:
+            row["eddsa_over_hs256_p50_ms"] = eddsa["p50_ms"] - hs256["p50_ms"]
+            row["eddsa_over_hs256_p99_ms"] = eddsa["p99_ms"] - hs256["p99_ms"]
+        rows.append(row)
+    return rows
+
+
+def scenario_call(
+    name: str,
+    client: httpx.AsyncClient,
+    *,
+    session_cookie: str,
+    hs256_tokens: list[str],
+    eddsa_tokens: list[str],
+) -> Callable[[int], Awaitable[httpx.Response]]:
+    if name == "public":
+        return lambda index: client.get("/health")
+    if name == "session_cookie":
+        return lambda index: client.get("/api/v1/me", cookies={"boring_session": session_cookie})
+    tokens = hs256_tokens if name == "exchange_hs256" else eddsa_tokens
+    return lambda index: client.post(
+        "/auth/token-exchange",
+        json={"access_token": tokens[index % len(tokens)], "redirect_uri": "/"},
+    )
+
+
+async def benchmark_rotation(
+    client: httpx.AsyncClient,
+    stub: NeonAuthStub,
+    *,
+    rate: float,
+    duration_s: float,
+    rotate_fraction: float,
+    window_s: float,
+    pool_size: int,
+) -> dict[str, Any]:
+    old_tokens = eddsa_pool(stub, pool_size)
+    new_key = SigningKey.generate()
+    new_tokens = eddsa_pool(stub, pool_size, key=new_key)
+    rotate_index = int(rate * duration_s * rotate_fraction)
+    marks: dict[str, float] = {}
+    fetches_start = stub.state.counters.get("jwks", 0)
+
+    async def call(index: int) -> httpx.Response:
+        if index == rotate_index:
+            marks["rotated_at"] = time.perf_counter()
+            marks["fetches_at_rotation"] = stub.state.counters.get("jwks", 0)
+            stub.state.rotate_key(new_key)
+        tokens = new_tokens if index >= rotate_index else old_tokens
+        return await client.post(
+            "/auth/token-exchange",
+            json={"access_token": tokens[index % len(tokens)], "redirect_uri": "/"},
+        )
+
+    started = time.perf_counter()
+    run = await run_at_rate(rate, duration_s, call)
+    fetches_end = stub.state.counters.get("jwks", 0)
+    rotated_at_s = marks.get("rotated_at", started) - started
+    return {
+        "rate": rate,
+        "rotated_at_s": rotated_at_s,
+        "new_kid": new_key.kid,
+        "jwks_fetches_before_rotation": int(marks.get("fetches_at_rotation", fetches_start)) - fetches_start,
+        "jwks_fetches_after_rotation": fetches_end - int(marks.get("fetches_at_rotation", fetches_start)),
+        **rotation_summary(run.samples, rotated_at_s=rotated_at_s, window_s=window_s, wall_seconds=run.wall_seconds),
+        "overall": run.summary(),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=18128)
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--rates", default="50,100,200,400", help="Offered requests/second per level")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per rate level")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--token-pool", type=int, default=32, help="Distinct tokens (and users) per scenario")
+    parser.add_argument("--jwks-latency-ms", type=float, default=0.0, help="Delay the stand-in adds to each JWKS response")
+    parser.add_argument("--rotation-duration", type=float, default=10.0)
+    parser.add_argument("--rotate-at", type=float, default=0.5, help="Fraction of the rotation run at which the key rotates")
+    parser.add_argument("--rotation-window", type=float, default=1.0, help="Seconds after rotation reported separately")
+    parser.add_argument("--no-rotation", action="store_true")
+    parser.add_argument("--startup-timeout", type=float, default=30.0)
+    parser.add_argument("--keep-workspace", action="store_true")
+    return parser.parse_args()
+
+
+async def run_main() -> dict[str, Any]:
+    args = parse_args()
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    rates = parse_int_list(args.rates)
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = sorted(set(scenarios) - set(SCENARIOS))
+    if unknown:
+        raise ValueError(f"unknown scenarios {unknown}; choose from {list(SCENARIOS)}")
+    ensure_port_free(args.port)
+    binary = build_server_binary()
+    workspace = Path(tempfile.mkdtemp(prefix="boring-ui-auth-bench-"))
+    config_path = prepare_workspace_root(workspace)
+    session_secret = secrets.token_hex(32)
+
+    stub = NeonAuthStub().start()
+    stub.state.jwks_delay_seconds = args.jwks_latency_ms / 1000.0
+    handle = start_server(
+        binary,
+        args.port,
+        config_path=config_path,
+        extra_env={
+            "NEON_AUTH_BASE_URL": stub.base_url,
+            "NEON_AUTH_JWKS_URL": f"{stub.base_url}/.well-known/jwks.json",
+            "BORING_SESSION_SECRET": session_secret,
+            "BORING_UI_SESSION_SECRET": session_secret,
+        },
+    )
+    results_by_scenario: dict[str, list[dict[str, Any]]] = {name: [] for name in scenarios}
+    rotation = None
+    try:
+        wait_for_health(args.port, args.startup_timeout)
+        cookie = await get_session_cookie(args.port)
+        hs256_tokens = hs256_pool(session_secret, args.token_pool)
+        eddsa_tokens = eddsa_pool(stub, args.token_pool)
+        limits = httpx.Limits(max_connections=max(rates), max_keepalive_connections=max(rates))
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=30.0) as client:
+            # Warm connections, the users behind the token pools and the JWKS cache.
+            for name in scenarios:
+                call = scenario_call(name, client, session_cookie=cookie, hs256_tokens=hs256_tokens, eddsa_tokens=eddsa_tokens)
+                for index in range(args.token_pool):
+                    await call(index)
+            cold_fetches = stub.state.counters.get("jwks", 0)
+            for rate in rates:
+                for name in scenarios:
+                    call = scenario_call(name, client, session_cookie=cookie, hs256_tokens=hs256_tokens, eddsa_tokens=eddsa_tokens)
+                    fetches_before = stub.state.counters.get("jwks", 0)
+                    run = await run_at_rate(rate, args.duration, call)
+                    results_by_scenario[name].append(
+                        run.summary() | {"jwks_fetches": stub.state.counters.get("jwks", 0) - fetches_before}
+                    )
+            if not args.no_rotation:
+                rotation = await benchmark_rotation(
+                    client,
+                    stub,
+                    rate=max(rates),
+                    duration_s=args.rotation_duration,
+                    rotate_fraction=args.rotate_at,
+                    window_s=args.rotation_window,
+                    pool_size=args.token_pool,
+                )
+    finally:
+        stop_server(handle)
+        stub.stop()
+        if not args.keep_workspace:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    results = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "binary": str(binary),
+        "rates": rates,
+        "duration_s": args.duration,
+        "jwks_latency_ms": args.jwks_latency_ms,
+        "scenarios": results_by_scenario,
+        "verification_overhead": overhead_rows(results_by_scenario),
+        "rotation": rotation,
+        "jwks_fetches": {"warmup": cold_fetches, "total": stub.state.counters.get("jwks", 0)},
+        "server_log": str(handle.log_path),
+    }
+    output_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return results
+
+
+def main() -> None:
+    print(json.dumps(asyncio.run(run_main()), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""Shared helpers for the Go backend benchmarks in scripts/bench_*.py.
+
+Server lifecycle (build, start, health-wait, stop), dev-login, latency
+summaries and a fixed-concurrency request driver. Only depends on httpx so
+the pure pieces stay importable without the websocket stack.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import signal
+import socket
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+
+ROOT = Path(__file__).resolve().parents[1]
+ARTIFACTS_DIR = ROOT / "ci-artifacts"
+
+
+@dataclass
+class ServerHandle:
+    process: subprocess.Popen[str]
+    log_path: Path
+    port: int
+
+
+@dataclass
+class ConcurrencyRun:
+    concurrency: int
+    requests: int
+    wall_seconds: float
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: dict[str, int] = field(default_factory=dict)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": 0.0 if self.requests == 0 else self.errors / self.requests,
+            "throughput_rps": 0.0 if self.wall_seconds <= 0 else self.requests / self.wall_seconds,
+            "statuses": dict(sorted(self.statuses.items())),
+            **latency_summary(self.latencies_ms),
+        }
+
+
+def build_server_binary() -> Path:
+    tmpdir = Path(tempfile.mkdtemp(prefix="boring-ui-go-perf-"))
+    binary = tmpdir / "boring-ui-go"
+    subprocess.run(
+        ["go", "build", "-o", str(binary), "./cmd/server"],
+        cwd=ROOT,
+        check=True,
+    )
+    return binary
+
+
+def server_env(port: int, *, config_path: Path | None = None, extra: dict[str, str] | None = None) -> dict[str, str]:
+    """Local-mode dev-autologin env; ``config_path``'s directory is the workspace root."""
+    env = os.environ.copy()
+    env.update(
+        {
+            "BUI_APP_TOML": str(config_path or ROOT / "boring.app.toml"),
+            "BORING_HOST": "127.0.0.1",
+            "BORING_PORT": str(port),
+            "DEV_AUTOLOGIN": "1",
+            "AUTH_DEV_USER_ID": "user-1",
+            "AUTH_DEV_EMAIL": "owner@example.com",
+            "CONTROL_PLANE_PROVIDER": "local",
+            "DATABASE_URL": "",
+            "SUPABASE_DB_URL": "",
+            "SUPABASE_URL": "",
+            "SUPABASE_ANON_KEY": "",
+            "SUPABASE_SERVICE_ROLE_KEY": "",
+            "SUPABASE_JWT_SECRET": "",
+        }
+    )
+    if extra:
+        env.update(extra)
+    return env
+
+
+def prepare_workspace_root(root: Path) -> Path:
+    """Make ``root`` a workspace root by copying the repo's boring.app.toml into it."""
+    root.mkdir(parents=True, exist_ok=True)
+    config_path = root / "boring.app.toml"
+    config_path.write_text((ROOT / "boring.app.toml").read_text(encoding="utf-8"), encoding="utf-8")
+    return config_path
+
+
+def wait_for_health(port: int, timeout: float) -> float:
+    deadline = time.perf_counter() + timeout
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    with httpx.Client(timeout=1.0) as client:
+        while time.perf_counter() < deadline:
+            try:
+                response = client.get(url)
+                if response.status_code == 200:
+                    return (time.perf_counter() - start) * 1000.0
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.02)
+    raise TimeoutError(f"/health did not become ready on port {port}")
+
+
+def start_server(
+    binary: Path,
+    port: int,
+    *,
+    config_path: Path | None = None,
+    extra_env: dict[str, str] | None = None,
+) -> ServerHandle:
+    log_file = tempfile.NamedTemporaryFile(prefix="boring-ui-go-perf-", suffix=".log", delete=False)
+    log_path = Path(log_file.name)
+    log_file.close()
+    process = subprocess.Popen(
+        [str(binary)],
+        cwd=config_path.parent if config_path else ROOT,
+        env=server_env(port, config_path=config_path, extra=extra_env),
+        stdout=open(log_path, "w", encoding="utf-8"),
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    return ServerHandle(process=process, log_path=log_path, port=port)
+
+
+def stop_server(handle: ServerHandle) -> None:
+    if handle.process.poll() is not None:
+        return
+    handle.process.send_signal(signal.SIGTERM)
+    try:
+        handle.process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        handle.process.kill()
+        handle.process.wait(timeout=5)
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, math.ceil(len(ordered) * ratio) - 1)
+    return ordered[index]
+
+
+def latency_summary(values_ms: list[float]) -> dict[str, float]:
+    return {
+        "p50_ms": percentile(values_ms, 0.50),
+        "p95_ms": percentile(values_ms, 0.95),
+        "p99_ms": percentile(values_ms, 0.99),
+        "mean_ms": sum(values_ms) / len(values_ms) if values_ms else 0.0,
+        "max_ms": max(values_ms) if values_ms else 0.0,
+    }
+
+
+def read_rss_mb(pid: int) -> float:
+    status_path = Path(f"/proc/{pid}/status")
+    for line in status_path.read_text(encoding="utf-8").splitlines():
+        if line.startswith("VmRSS:"):
+            parts = line.split()
+            return int(parts[1]) / 1024.0
+    raise RuntimeError(f"VmRSS not found for pid {pid}")
+
+
+def process_stats(pid: int) -> dict[str, float]:
+    """RSS, thread count, open FDs and direct child processes for ``pid`` (Linux /proc)."""
+    status: dict[str, str] = {}
+    for line in Path(f"/proc/{pid}/status").read_text(encoding="utf-8").splitlines():
+        key, _, value = line.partition(":")
+        status[key] = value.strip()
+    children = 0
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            fields = (entry / "stat").read_text(encoding="utf-8").rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == pid:
+            children += 1
+    return {
+        "rss_mb": int(status["VmRSS"].split()[0]) / 1024.0,
+        "threads": int(status["Threads"]),
+        "fds": len(list(Path(f"/proc/{pid}/fd").iterdir())),
+        "children": children,
+    }
+
+
+def ensure_port_free(port: int) -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if sock.connect_ex(("127.0.0.1", port)) == 0:
+            raise RuntimeError(f"port {port} is already in use")
+
+
+async def get_session_cookie(
+    port: int,
+    *,
+    user_id: str = "user-1",
+    email: str = "owner@example.com",
+) -> str:
+    async with httpx.AsyncClient(follow_redirects=False, timeout=5.0) as client:
+        response = await client.get(
+            f"http://127.0.0.1:{port}/auth/login",
+            params={
+                "user_id": user_id,
+                "email": email,
+                "redirect_uri": "/health",
+            },
+        )
+        if response.status_code not in (200, 302):
+            response.raise_for_status()
+        cookie = client.cookies.get("boring_session")
+        if not cookie:
+            raise RuntimeError("login flow did not return boring_session cookie")
+        return cookie
+
+
+async def run_at_concurrency(
+    concurrency: int,
+    requests: int,
+    call: Callable[[int], Awaitable[httpx.Response]],
+    *,
+    ok_statuses: tuple[int, ...] = (200,),
+) -> ConcurrencyRun:
+    """Issue ``requests`` calls with exactly ``concurrency`` in flight.
+
+    ``call(i)`` performs request ``i``; transport errors and statuses outside
+    ``ok_statuses`` count as errors and are excluded from the latencies.
+    """
+    run = ConcurrencyRun(concurrency=concurrency, requests=requests, wall_seconds=0.0)
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                response = await call(index)
+            except httpx.HTTPError as exc:
+                run.errors += 1
+                key = type(exc).__name__
+                run.statuses[key] = run.statuses.get(key, 0) + 1
+                continue
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            key = str(response.status_code)
+            run.statuses[key] = run.statuses.get(key, 0) + 1
+            if response.status_code in ok_statuses:
+                run.latencies_ms.append(elapsed_ms)
+            else:
+                run.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    run.wall_seconds = time.perf_counter() - started
+    return run
+
+
+def parse_int_list(raw: str) -> list[int]:
+    return [int(item) for item in raw.split(",") if item.strip()]
@@ -0,0 +1,676 @@
+#!/usr/bin/env python3
+"""Benchmark control-plane routes against state size and emit perf-control-plane.json.
+
+The default ``CONTROL_PLANE_PROVIDER=local`` repository runs every operation
+through ``withState``/``readState``: take the process mutex and an exclusive
+``flock``, read and decode the whole ``.boring/local_db.json``, and for
+writes re-encode, fsync and rename it. For each ``USERSxWORKSPACES`` size
+this script pre-seeds that file, starts the Go server on it, logs in a set of
+seeded users and drives a weighted mix of ``/api/v1/workspaces`` and
+``/api/v1/me/settings`` calls at each concurrency level.
+
+Alongside per-operation latency it reports lock contention two ways: a probe
+thread that repeatedly takes the same ``flock`` and times the wait, and the
+queueing delay (latency at concurrency N minus the single-client latency).
+
+``--providers local,postgres`` runs the same seed and workload mix against
+``repository_postgres.go`` too: a throwaway Postgres cluster (initdb/pg_ctl)
+is loaded with the control-plane schema and the same rows, the server gets
+``DATABASE_URL``, and ``pg_stat_activity`` is sampled to show how the
+``internal/db/pool.go`` connection pool saturates.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import fcntl
+import glob
+import json
+import random
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from bench_common import (
+    ARTIFACTS_DIR,
+    ROOT,
+    build_server_binary,
+    ensure_port_free,
+    get_session_cookie,
+    latency_summary,
+    parse_int_list,
+    prepare_workspace_root,
+    run_at_concurrency,
+    start_server,
+    stop_server,
+    wait_for_health,
+)
+
+
+DEFAULT_OUTPUT = ARTIFACTS_DIR / "perf-control-plane.json"
+LOCAL_STATE_FILE = Path(".boring") / "local_db.json"
+DEFAULT_MIX = "list_workspaces:50,get_settings:20,put_settings:20,create_workspace:10"
+SEED_TIMESTAMP = "2026-01-01T00:00:00+00:00"
+PROVIDERS = ("local", "postgres")
+POSTGRES_SCHEMA = ROOT / "internal" / "modules" / "controlplane" / "testdata" / "controlplane_schema.sql"
+DB_POOL_GO = ROOT / "internal" / "db" / "pool.go"
+BENCH_SETTINGS_KEY = "bench-settings-key"
+
+
+@dataclass(frozen=True)
+class StateSize:
+    users: int
+    workspaces: int
+
+    @property
+    def label(self) -> str:
+        return f"{self.users}x{self.workspaces}"
+
+
+@dataclass
+class LockProbe:
+    """Repeatedly take the repository's ``flock`` and record how long each wait took."""
+
+    lock_path: Path
+    interval: float = 0.005
+    waits_ms: list[float] = field(default_factory=list)
+    _stop: threading.Event = field(default_factory=threading.Event)
+    _thread: threading.Thread | None = None
+
+    def _run(self) -> None:
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("a+") as handle:
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                self.waits_ms.append((time.perf_counter() - started) * 1000.0)
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        self.waits_ms.clear()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="lock-probe", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> dict[str, Any]:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        return lock_probe_summary(self.waits_ms)
+
+
+def lock_probe_summary(waits_ms: list[float], *, contended_ms: float = 0.1) -> dict[str, Any]:
+    contended = [value for value in waits_ms if value > contended_ms]
+    return {
+        "probes": len(waits_ms),
+        "contended": len(contended),
+        "contended_ratio": 0.0 if not waits_ms else len(contended) / len(waits_ms),
+        **latency_summary(waits_ms),
+    }
+
+
+def parse_state_sizes(raw: str) -> list[StateSize]:
+    """Parse ``"1000x2000,10000x20000"`` (users x workspaces) into state sizes."""
+    sizes = []
+    for item in raw.split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        match = re.fullmatch(r"(\d+)x(\d+)", item)
+        if not match or int(match.group(1)) < 1 or int(match.group(2)) < 1:
+            raise ValueError(f"invalid state size {item!r}; use USERSxWORKSPACES, e.g. 1000x2000")
+        sizes.append(StateSize(users=int(match.group(1)), workspaces=int(match.group(2))))
+    if not sizes:
+        raise ValueError("at least one state size is required")
+    return sizes
+
+
+def parse_mix(raw: str) -> dict[str, int]:
+    mix = {}
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, weight = item.partition(":")
+        if name.strip() not in OPERATIONS:
+            raise ValueError(f"unknown operation {name.strip()!r}; choose from {sorted(OPERATIONS)}")
+        mix[name.strip()] = int(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("workload mix needs at least one positive weight")
+    return mix
+
+
+def build_schedule(mix: dict[str, int], requests: int, *, seed: int) -> list[str]:
+    """Deterministic shuffled list of ``requests`` operation names in ``mix`` proportions."""
+    total = sum(mix.values())
+    schedule = []
+    for name, weight in mix.items():
+        schedule.extend([name] * round(requests * weight / total))
+    while len(schedule) < requests:
+        schedule.append(max(mix, key=mix.get))
+    schedule = schedule[:requests]
+    random.Random(seed).shuffle(schedule)
+    return schedule
+
+
+def bench_user(index: int) -> tuple[str, str]:
+    return f"bench-user-{index}", f"bench-user-{index}@example.com"
+
+
+def seed_local_state(state_path: Path, size: StateSize, *, settings_keys: int = 8) -> int:
+    """Write a ``local_db.json`` with ``size`` users and workspaces; returns its size in bytes.
+
+    Workspaces are owned round-robin by the seeded users, each with an owner
+    membership, settings and a ready runtime row, matching what the Go
+    repository writes for real sign-ups.
+    """
+    users: dict[str, Any] = {}
+    for index in range(size.users):
+        user_id, email = bench_user(index)
+        users[user_id] = {
+            "user_id": user_id,
+            "email": email,
+            "display_name": f"Bench User {index}",
+            "settings": {f"pref_{key}": f"value-{key}" for key in range(settings_keys)},
+            "last_seen_at": SEED_TIMESTAMP,
+            "created_at": SEED_TIMESTAMP,
+            "updated_at": SEED_TIMESTAMP,
+        }
+
+    workspaces: dict[str, Any] = {}
+    memberships: dict[str, Any] = {}
+    workspace_settings: dict[str, Any] = {}
+    workspace_runtime: dict[str, Any] = {}
+    for index in range(size.workspaces):
+        workspace_id = f"ws-bench{index:06d}"
+        owner, _ = bench_user(index % size.users)
+        workspaces[workspace_id] = {
+            "workspace_id": workspace_id,
+            "name": f"Bench Workspace {index}",
+            "app_id": "boring-ui",
+            "created_by": owner,
+            "created_at": SEED_TIMESTAMP,
+            "updated_at": SEED_TIMESTAMP,
+            "deleted_at": None,
+        }
+        membership_id = f"{workspace_id}:{owner}"
+        memberships[membership_id] = {
+            "membership_id": membership_id,
+            "workspace_id": workspace_id,
+            "user_id": owner,
+            "role": "owner",
+            "status": "active",
+            "deleted_at": None,
+            "created_at": SEED_TIMESTAMP,
+            "updated_at": SEED_TIMESTAMP,
+        }
+        workspace_settings[workspace_id] = {"github_installation_id": f"inst-{index % 97}"}
+        workspace_runtime[workspace_id] = {
+            "state": "ready",
+            "retryable": False,
+            "retry_count": 0,
+            "provisioning_requested_at": None,
+        }
+
+    state = {
+        "users": users,
+        "workspaces": workspaces,
+        "memberships": memberships,
+        "invites": {},
+        "workspace_settings": workspace_settings,
+        "workspace_runtime": workspace_runtime,
+    }
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(state, indent=2).encode("utf-8")
+    state_path.write_bytes(data)
+    return len(data)
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def seed_postgres_sql(size: StateSize, settings_key: str, *, settings_keys: int = 8) -> str:
+    """SQL that loads the same rows as ``seed_local_state`` into the control-plane schema.
+
+    Settings, workspace settings and runtimes are ``pgp_sym_encrypt``-ed with
+    ``settings_key`` exactly as ``PostgresRepository`` stores them.
+    """
+    key = _sql_literal(settings_key)
+    ts = _sql_literal(SEED_TIMESTAMP)
+    user_settings = ", ".join(f"'pref_{index}', 'value-{index}'" for index in range(settings_keys))
+    workspace_id = "'ws-bench' || lpad(i::text, 6, '0')"
+    owner = f"'bench-user-' || (i % {size.users})"
+    return f"""
+BEGIN;
+INSERT INTO users (user_id, email, display_name, last_seen_at, created_at, updated_at)
+SELECT 'bench-user-' || i, 'bench-user-' || i || '@example.com', 'Bench User ' || i, {ts}, {ts}, {ts}
+FROM generate_series(0, {size.users - 1}) AS i;
+INSERT INTO settings (user_id, value, created_at, updated_at)
+SELECT 'bench-user-' || i, pgp_sym_encrypt(json_build_object({user_settings})::text, {key}), {ts}, {ts}
+FROM generate_series(0, {size.users - 1}) AS i;
+INSERT INTO workspaces (workspace_id, name, app_id, created_by, deleted_at, created_at, updated_at)
+SELECT {workspace_id}, 'Bench Workspace ' || i, 'boring-ui', {owner}, NULL, {ts}, {ts}
+FROM generate_series(0, {size.workspaces - 1}) AS i;
+INSERT INTO members (workspace_id, user_id, role, status, deleted_at, created_at, updated_at)
+SELECT {workspace_id}, {owner}, 'owner', 'active', NULL, {ts}, {ts}
+FROM generate_series(0, {size.workspaces - 1}) AS i;
+INSERT INTO workspace_settings (workspace_id, value, created_at, updated_at)
+SELECT {workspace_id}, pgp_sym_encrypt(json_build_object('github_installation_id', 'inst-' || (i % 97))::text, {key}), {ts}, {ts}
+FROM generate_series(0, {size.workspaces - 1}) AS i;
+INSERT INTO workspace_runtimes (workspace_id, value, created_at, updated_at)
+SELECT {workspace_id}, pgp_sym_encrypt('{{"state": "ready", "retryable": false, "retry_count": 0, "provisioning_requested_at": null}}', {key}), {ts}, {ts}
+FROM generate_series(0, {size.workspaces - 1}) AS i;
+COMMIT;
+ANALYZE;
+"""
+
+
+def declared_pool_limits(pool_go: Path = DB_POOL_GO) -> dict[str, int | None]:
+    try:
+        text = pool_go.read_text(encoding="utf-8")
+    except OSError:
+        return {"min_conns": None, "max_conns": None}
+    limits = {}
+    for key, const in (("min_conns", "DefaultMinConns"), ("max_conns", "DefaultMaxConns")):
+        match = re.search(rf"{const}\s+int32\s*=\s*(\d+)", text)
+        limits[key] = int(match.group(1)) if match else None
+    return limits
+
+
+def find_pg_bin(explicit: str = "") -> Path:
+    """Directory holding initdb/pg_ctl/psql: ``--pg-bin-dir``, PATH, or a distro install."""
+    if explicit:
+        return Path(explicit)
+    initdb = shutil.which("initdb")
+    if initdb:
+        return Path(initdb).parent
+    candidates = sorted(glob.glob("/usr/lib/postgresql/*/bin/initdb")) + sorted(glob.glob("/usr/local/opt/postgresql*/bin/initdb"))
+    if candidates:
+        return Path(candidates[-1]).parent
+    raise RuntimeError("postgres binaries not found; install PostgreSQL or pass --pg-bin-dir")
+
+
+@dataclass
+class DisposablePostgres:
+    """A throwaway single-user cluster in ``data_dir``, trust auth on 127.0.0.1."""
+
+    bin_dir: Path
+    data_dir: Path
+    port: int
+
+    @property
+    def dsn(self) -> str:
+        return f"postgresql://postgres@127.0.0.1:{self.port}/postgres?sslmode=disable"
+
+    def _run(self, tool: str, *args: str, stdin: str | None = None) -> str:
+        result = subprocess.run(
+            [str(self.bin_dir / tool), *args],
+            input=stdin,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout
+
+    def start(self) -> None:
+        self._run("initdb", "-D", str(self.data_dir), "-U", "postgres", "--auth=trust", "-E", "UTF8", "--no-sync")
+        self._run(
+            "pg_ctl", "-D", str(self.data_dir), "-l", str(self.data_dir / "postgres.log"), "-w",
+            "-o", f"-p {self.port} -k {self.data_dir} -c listen_addresses=127.0.0.1",
+            "start",
+        )
+
+    def stop(self) -> None:
+        try:
+            self._run("pg_ctl", "-D", str(self.data_dir), "-m", "fast", "-w", "stop")
+        except subprocess.CalledProcessError:
+            pass
+
+    def psql(self, sql: str) -> str:
+        return self._run("psql", self.dsn, "-v", "ON_ERROR_STOP=1", "-q", "-A", "-t", "-f", "-", stdin=sql)
+
+    def reset(self, schema: Path = POSTGRES_SCHEMA) -> None:
+        self.psql("DROP SCHEMA public CASCADE; CREATE SCHEMA public;\n" + schema.read_text(encoding="utf-8"))
+
+
+@dataclass
+class PoolSampler:
+    """Sample the server's connections in ``pg_stat_activity`` while a level runs."""
+
+    postgres: DisposablePostgres
+    interval: float = 0.1
+    samples: list[dict[str, int]] = field(default_factory=list)
+    _stop: threading.Event = field(default_factory=threading.Event)
+    _thread: threading.Thread | None = None
+
+    QUERY = (
+        "SELECT count(*), count(*) FILTER (WHERE state = 'active'), "
+        "count(*) FILTER (WHERE state = 'idle') "
+        "FROM pg_stat_activity WHERE application_name = 'boring-ui';"
+    )
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                total, active, idle = (int(value) for value in self.postgres.psql(self.QUERY).strip().split("|"))
+                self.samples.append({"total": total, "active": active, "idle": idle})
+            except (subprocess.CalledProcessError, ValueError):
+                pass
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        self.samples.clear()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="pool-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> dict[str, Any]:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        return pool_summary(self.samples, declared_pool_limits()["max_conns"])
+
+
+def pool_summary(samples: list[dict[str, int]], max_conns: int | None) -> dict[str, Any]:
+    """Peak and mean pool usage; ``saturated_ratio`` is the share of samples with every connection busy."""
+    if not samples:
+        return {"samples": 0, "max_conns": max_conns}
+    saturated = [item for item in samples if max_conns and item["active"] >= max_conns]
+    return {
+        "samples": len(samples),
+        "max_conns": max_conns,
+        "peak_total": max(item["total"] for item in samples),
+        "peak_active": max(item["active"] for item in samples),
+        "mean_active": sum(item["active"] for item in samples) / len(samples),
+        "saturated_ratio": len(saturated) / len(samples),
+    }
+
+
+def compare_providers(providers: dict[str, list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Postgres/local p50 and throughput ratios per size, concurrency and operation."""
+    local = {item["size"]: item for item in providers.get("local", [])}
+    rows = []
+    for pg_size in providers.get("postgres", []):
+        local_size = local.get(pg_size["size"])
+        if local_size is None:
+            continue
+        for local_run, pg_run in zip(local_size["runs"], pg_size["runs"]):
+            for name, pg_op in pg_run["operations"].items():
+                local_op = local_run["operations"].get(name)
+                if not local_op:
+                    continue
+                rows.append({
+                    "size": pg_size["size"],
+                    "concurrency": pg_run["concurrency"],
+                    "operation": name,
+                    "local_p50_ms": local_op["p50_ms"],
+                    "postgres_p50_ms": pg_op["p50_ms"],
+                    "p50_ratio": 0.0 if local_op["p50_ms"] <= 0 else pg_op["p50_ms"] / local_op["p50_ms"],
+                    "throughput_ratio": (
+                        0.0 if local_op["throughput_rps"] <= 0 else pg_op["throughput_rps"] / local_op["throughput_rps"]
+                    ),
+                })
+    return rows
+
+
+def _list_workspaces(client: httpx.AsyncClient, _index: int) -> Awaitable[httpx.Response]:
+    return client.get("/api/v1/workspaces")
+
+
+def _get_settings(client: httpx.AsyncClient, _index: int) -> Awaitable[httpx.Response]:
+    return client.get("/api/v1/me/settings")
+
+
+def _put_settings(client: httpx.AsyncClient, index: int) -> Awaitable[httpx.Response]:
+    return client.put("/api/v1/me/settings", json={"theme": "dark" if index % 2 else "light", "bench_seq": index})
+
+
+def _create_workspace(client: httpx.AsyncClient, index: int) -> Awaitable[httpx.Response]:
+    return client.post("/api/v1/workspaces", json={"name": f"bench-run-{index}"})
+
+
+OPERATIONS: dict[str, Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]] = {
+    "list_workspaces": _list_workspaces,
+    "get_settings": _get_settings,
+    "put_settings": _put_settings,
+    "create_workspace": _create_workspace,
+}
+
+
+async def run_mix(
+    clients: list[httpx.AsyncClient],
+    schedule: list[str],
+    concurrency: int,
+) -> dict[str, Any]:
+    """Run ``schedule`` across ``clients`` (one per user) with ``concurrency`` in flight."""
+    per_op: dict[str, list[float]] = {name: [] for name in set(schedule)}
+    per_op_errors: dict[str, int] = {name: 0 for name in set(schedule)}
+
+    async def call(index: int) -> httpx.Response:
+        name = schedule[index]
+        started = time.perf_counter()
+        try:
+            response = await OPERATIONS[name](clients[index % len(clients)], index)
+        except httpx.HTTPError:
+            per_op_errors[name] += 1
+            raise
+        if response.status_code == 200:
+            per_op[name].append((time.perf_counter() - started) * 1000.0)
+        else:
+            per_op_errors[name] += 1
+        return response
+
+    run = await run_at_concurrency(concurrency, len(schedule), call)
+    summary = run.summary()
+    summary["operations"] = {
+        name: {
+            "requests": len(per_op[name]) + per_op_errors[name],
+            "errors": per_op_errors[name],
+            "throughput_rps": 0.0 if run.wall_seconds <= 0 else (len(per_op[name]) + per_op_errors[name]) / run.wall_seconds,
+            **latency_summary(per_op[name]),
+        }
+        for name in sorted(per_op)
+    }
+    return summary
+
+
+def queueing_delay(runs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Per level and operation, p50 above the lowest-concurrency p50 (time spent waiting, not working)."""
+    if not runs:
+        return []
+    base = runs[0]["operations"]
+    rows = []
+    for run in runs:
+        rows.append({
+            "concurrency": run["concurrency"],
+            "p50_wait_ms": {
+                name: max(0.0, stats["p50_ms"] - base[name]["p50_ms"])
+                for name, stats in run["operations"].items()
+                if name in base
+            },
+        })
+    return rows
+
+
+async def login_clients(
+    port: int,
+    users: int,
+    *,
+    limits: httpx.Limits,
+) -> list[httpx.AsyncClient]:
+    clients = []
+    for index in range(users):
+        user_id, email = bench_user(index)
+        cookie = await get_session_cookie(port, user_id=user_id, email=email)
+        clients.append(httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}",
+            cookies={"boring_session": cookie},
+            timeout=60.0,
+            limits=limits,
+        ))
+    return clients
+
+
+async def benchmark_size(
+    port: int,
+    sampler: LockProbe | PoolSampler,
+    *,
+    sessions: int,
+    levels: list[int],
+    requests: int,
+    mix: dict[str, int],
+    seed: int,
+    state_path: Path | None = None,
+) -> list[dict[str, Any]]:
+    """Run every concurrency level; ``sampler`` watches the lock (local) or the pool (postgres)."""
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    clients = await login_clients(port, sessions, limits=limits)
+    sampler_key = "lock_probe" if isinstance(sampler, LockProbe) else "pool"
+    runs = []
+    try:
+        for level_index, concurrency in enumerate(levels):
+            schedule = build_schedule(mix, requests, seed=seed + level_index)
+            state_bytes_before = state_path.stat().st_size if state_path else None
+            sampler.start()
+            try:
+                run = await run_mix(clients, schedule, concurrency)
+            finally:
+                observed = sampler.stop()
+            if state_path is not None:
+                run["state_bytes_before"] = state_bytes_before
+                run["state_bytes_after"] = state_path.stat().st_size
+            run[sampler_key] = observed
+            runs.append(run)
+    finally:
+        for client in clients:
+            await client.aclose()
+    return runs
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark control-plane routes against state size.")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--port", type=int, default=18127)
+    parser.add_argument("--startup-timeout", type=float, default=30.0)
+    parser.add_argument("--sizes", default="100x200,1000x2000,5000x10000,20000x40000", help="USERSxWORKSPACES list")
+    parser.add_argument("--sessions", type=int, default=32, help="Seeded users to log in and drive")
+    parser.add_argument("--concurrency", default="1,4,16,64", help="Comma-separated concurrency sweep")
+    parser.add_argument("--requests", type=int, default=400, help="Requests per concurrency level")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="operation:weight list")
+    parser.add_argument("--probe-interval", type=float, default=0.005, help="Seconds between lock probes")
+    parser.add_argument("--providers", default="local", help="Comma-separated: local, postgres")
+    parser.add_argument("--pg-bin-dir", default="", help="Directory with initdb/pg_ctl/psql")
+    parser.add_argument("--pg-port", type=int, default=18432)
+    parser.add_argument("--pool-sample-interval", type=float, default=0.1, help="Seconds between pg_stat_activity samples")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep-workspaces", action="store_true")
+    return parser.parse_args()
+
+
+def parse_providers(raw: str) -> list[str]:
+    providers = [item.strip() for item in raw.split(",") if item.strip()]
+    unknown = sorted(set(providers) - set(PROVIDERS))
+    if unknown or not providers:
+        raise ValueError(f"unknown providers {unknown}; choose from {list(PROVIDERS)}")
+    return providers
+
+
+async def run_main() -> dict[str, Any]:
+    args = parse_args()
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    sizes = parse_state_sizes(args.sizes)
+    levels = parse_int_list(args.concurrency)
+    mix = parse_mix(args.mix)
+    providers = parse_providers(args.providers)
+    ensure_port_free(args.port)
+    binary = build_server_binary()
+    scratch = Path(tempfile.mkdtemp(prefix="boring-ui-control-plane-bench-"))
+
+    postgres = None
+    if "postgres" in providers:
+        ensure_port_free(args.pg_port)
+        postgres = DisposablePostgres(find_pg_bin(args.pg_bin_dir), scratch / "pgdata", args.pg_port)
+        postgres.start()
+
+    results_by_provider: dict[str, list[dict[str, Any]]] = {provider: [] for provider in providers}
+    try:
+        for size in sizes:
+            sessions = min(args.sessions, size.users)
+            for provider in providers:
+                config_path = prepare_workspace_root(scratch / provider / size.label)
+                state_path = config_path.parent / LOCAL_STATE_FILE
+                extra_env = None
+                if provider == "local":
+                    seeded_bytes = seed_local_state(state_path, size)
+                    sampler: LockProbe | PoolSampler = LockProbe(
+                        state_path.with_name(state_path.name + ".lock"), interval=args.probe_interval,
+                    )
+                else:
+                    postgres.reset()
+                    postgres.psql(seed_postgres_sql(size, BENCH_SETTINGS_KEY))
+                    seeded_bytes = None
+                    sampler = PoolSampler(postgres, interval=args.pool_sample_interval)
+                    extra_env = {"DATABASE_URL": postgres.dsn, "BORING_SETTINGS_KEY": BENCH_SETTINGS_KEY}
+                handle = start_server(binary, args.port, config_path=config_path, extra_env=extra_env)
+                try:
+                    wait_for_health(args.port, args.startup_timeout)
+                    runs = await benchmark_size(
+                        args.port,
+                        sampler,
+                        sessions=sessions,
+                        levels=levels,
+                        requests=args.requests,
+                        mix=mix,
+                        seed=args.seed,
+                        state_path=state_path if provider == "local" else None,
+                    )
+                finally:
+                    stop_server(handle)
+                results_by_provider[provider].append({
+                    "size": size.label,
+                    "users": size.users,
+                    "workspaces": size.workspaces,
+                    "seeded_state_bytes": seeded_bytes,
+                    "sessions": sessions,
+                    "runs": runs,
+                    "queueing_delay": queueing_delay(runs),
+                    "server_log": str(handle.log_path),
+                })
+    finally:
+        if postgres is not None:
+            postgres.stop()
+        if not args.keep_workspaces:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    results = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "binary": str(binary),
+        "mix": mix,
+        "concurrency_levels": levels,
+        "requests_per_level": args.requests,
+        "pool_limits": declared_pool_limits() if postgres is not None else None,
+        "providers": results_by_provider,
+        "comparison": compare_providers(results_by_provider),
+    }
+    output_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return results
+
+
+def main() -> None:
+    results = asyncio.run(run_main())
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
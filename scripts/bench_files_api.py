@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Benchmark /api/v1/files/* against a synthetic workspace tree and emit perf-files.json.
+
+Generates a deterministic tree (depth, fan-out, file-size mix, binary and
+UTF-16 files) in a throwaway workspace root, starts the Go server on it, and
+sweeps list/read/write/search across concurrency levels. Read and write are
+broken down per size bucket (and per encoding for read); search is checked
+against the slot limit that ``acquireSearchSlot`` enforces.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from bench_common import (
+    ARTIFACTS_DIR,
+    ROOT,
+    build_server_binary,
+    ensure_port_free,
+    get_session_cookie,
+    parse_int_list,
+    prepare_workspace_root,
+    run_at_concurrency,
+    start_server,
+    stop_server,
+    wait_for_health,
+)
+
+
+DEFAULT_OUTPUT = ARTIFACTS_DIR / "perf-files.json"
+FILES_SERVICE_GO = ROOT / "internal" / "modules" / "files" / "service.go"
+TREE_DIR = "bench-tree"
+WRITE_DIR = "bench-writes"
+SIZE_UNITS = {"": 1, "b": 1, "k": 1024, "m": 1024 * 1024}
+TEXT_LINE = "the quick brown fox jumps over the lazy dog 0123456789\n"
+
+
+@dataclass(frozen=True)
+class SizeBucket:
+    label: str
+    size: int
+    weight: int
+
+
+@dataclass(frozen=True)
+class GeneratedFile:
+    path: str
+    size: int
+    kind: str
+    bucket: str
+
+
+def parse_sizes(raw: str) -> list[SizeBucket]:
+    """Parse ``"1k:60,64k:30,1m:10"`` into weighted size buckets."""
+    buckets = []
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        label, _, weight = item.partition(":")
+        match = re.fullmatch(r"(\d+)([bkm]?)", label.strip().lower())
+        if not match:
+            raise ValueError(f"invalid size {label!r}; use e.g. 512, 4k, 2m")
+        buckets.append(SizeBucket(
+            label=label.strip().lower(),
+            size=int(match.group(1)) * SIZE_UNITS[match.group(2)],
+            weight=int(weight or 1),
+        ))
+    if not buckets:
+        raise ValueError("at least one size bucket is required")
+    return buckets
+
+
+def _file_bytes(kind: str, size: int, rng: random.Random) -> bytes:
+    if kind == "binary":
+        return b"\x00" + rng.randbytes(max(0, size - 1))
+    text = (TEXT_LINE * (size // len(TEXT_LINE) + 1))[: max(1, size // 2 if kind == "utf16" else size)]
+    if kind == "utf16":
+        return text.encode("utf-16")
+    return text.encode("utf-8")
+
+
+def generate_tree(
+    root: Path,
+    *,
+    depth: int,
+    fanout: int,
+    files_per_dir: int,
+    sizes: list[SizeBucket],
+    binary_ratio: float = 0.05,
+    utf16_ratio: float = 0.05,
+    seed: int = 1,
+) -> tuple[list[str], list[GeneratedFile]]:
+    """Write the synthetic tree under ``root/bench-tree``; return (dirs, files) as workspace-relative paths."""
+    rng = random.Random(seed)
+    weights = [bucket.weight for bucket in sizes]
+    dirs: list[str] = []
+    files: list[GeneratedFile] = []
+
+    def fill(rel_dir: str, level: int) -> None:
+        (root / rel_dir).mkdir(parents=True, exist_ok=True)
+        dirs.append(rel_dir)
+        for index in range(files_per_dir):
+            bucket = rng.choices(sizes, weights=weights)[0]
+            roll = rng.random()
+            kind = "binary" if roll < binary_ratio else "utf16" if roll < binary_ratio + utf16_ratio else "text"
+            suffix = {"binary": ".bin", "utf16": ".utf16.txt", "text": ".txt"}[kind]
+            rel_path = f"{rel_dir}/file-{level}-{index}{suffix}"
+            data = _file_bytes(kind, bucket.size, rng)
+            (root / rel_path).write_bytes(data)
+            files.append(GeneratedFile(path=rel_path, size=len(data), kind=kind, bucket=bucket.label))
+        if level < depth:
+            for child in range(fanout):
+                fill(f"{rel_dir}/dir-{level + 1}-{child}", level + 1)
+
+    fill(TREE_DIR, 0)
+    return dirs, files
+
+
+def declared_search_slots(service_go: Path = FILES_SERVICE_GO) -> int | None:
+    try:
+        match = re.search(r"maxConcurrentSearch\s*=\s*(\d+)", service_go.read_text(encoding="utf-8"))
+    except OSError:
+        return None
+    return int(match.group(1)) if match else None
+
+
+def saturation_concurrency(runs: list[dict[str, Any]], *, min_gain: float = 0.10) -> int | None:
+    """First concurrency level whose throughput gain over the previous level is below ``min_gain``."""
+    for previous, current in zip(runs, runs[1:]):
+        if previous["throughput_rps"] <= 0:
+            continue
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 + min_gain):
+            return previous["concurrency"]
+    return None
+
+
+async def sweep(
+    levels: list[int],
+    requests: int,
+    make_call,
+    *,
+    ok_statuses: tuple[int, ...] = (200,),
+) -> list[dict[str, Any]]:
+    results = []
+    for concurrency in levels:
+        run = await run_at_concurrency(concurrency, requests, make_call(concurrency), ok_statuses=ok_statuses)
+        results.append(run.summary())
+    return results
+
+
+async def benchmark_files(
+    client: httpx.AsyncClient,
+    dirs: list[str],
+    files: list[GeneratedFile],
+    sizes: list[SizeBucket],
+    *,
+    levels: list[int],
+    requests: int,
+    seed: int,
+) -> dict[str, Any]:
+    rng = random.Random(seed)
+    operations: dict[str, Any] = {}
+
+    def list_call(_concurrency: int):
+        return lambda _i: client.get("/api/v1/files/list", params={"path": rng.choice(dirs)})
+
+    operations["list"] = await sweep(levels, requests, list_call)
+
+    read_groups: dict[str, list[GeneratedFile]] = {}
+    for item in files:
+        read_groups.setdefault(f"{item.kind}:{item.bucket}", []).append(item)
+    operations["read"] = {}
+    for group, members in sorted(read_groups.items()):
+        # Binary files are rejected with 400 unsupported_encoding; that is
+        # the expected fast path, so time it instead of counting it as an error.
+        ok_statuses = (400,) if group.startswith("binary:") else (200,)
+
+        def read_call(_concurrency: int, members=members):
+            return lambda _i: client.get("/api/v1/files/read", params={"path": rng.choice(members).path})
+
+        operations["read"][group] = await sweep(levels, requests, read_call, ok_statuses=ok_statuses)
+
+    operations["write"] = {}
+    for bucket in sizes:
+        content = (TEXT_LINE * (bucket.size // len(TEXT_LINE) + 1))[: bucket.size]
+
+        def write_call(concurrency: int, bucket=bucket, content=content):
+            return lambda i: client.put(
+                "/api/v1/files/write",
+                params={"path": f"{WRITE_DIR}/{bucket.label}-c{concurrency}-{i % max(1, concurrency * 4)}.txt"},
+                json={"content": content},
+            )
+
+        operations["write"][bucket.label] = await sweep(levels, requests, write_call)
+
+    def search_call(_concurrency: int):
+        return lambda _i: client.get(
+            "/api/v1/files/search",
+            params={"q": f"*file-{rng.randrange(0, 3)}-*", "path": TREE_DIR},
+        )
+
+    search_runs = await sweep(levels, requests, search_call)
+    operations["search"] = {
+        "runs": search_runs,
+        "declared_slot_limit": declared_search_slots(),
+        "saturation_concurrency": saturation_concurrency(search_runs),
+    }
+    return operations
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the Files API and emit perf-files.json.")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--port", type=int, default=18121)
+    parser.add_argument("--startup-timeout", type=float, default=10.0)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--fanout", type=int, default=4)
+    parser.add_argument("--files-per-dir", type=int, default=8)
+    parser.add_argument("--sizes", default="1k:60,16k:25,256k:10,4m:5", help="size:weight buckets")
+    parser.add_argument("--binary-ratio", type=float, default=0.05)
+    parser.add_argument("--utf16-ratio", type=float, default=0.05)
+    parser.add_argument("--concurrency", default="1,4,16,64", help="Comma-separated concurrency sweep")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per operation per concurrency level")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep-tree", action="store_true", help="Leave the generated workspace on disk")
+    return parser.parse_args()
+
+
+async def run_main() -> dict[str, Any]:
+    args = parse_args()
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    sizes = parse_sizes(args.sizes)
+    levels = parse_int_list(args.concurrency)
+    ensure_port_free(args.port)
+
+    workspace = Path(tempfile.mkdtemp(prefix="boring-ui-files-bench-"))
+    config_path = prepare_workspace_root(workspace)
+    generated_at = time.perf_counter()
+    dirs, files = generate_tree(
+        workspace,
+        depth=args.depth,
+        fanout=args.fanout,
+        files_per_dir=args.files_per_dir,
+        sizes=sizes,
+        binary_ratio=args.binary_ratio,
+        utf16_ratio=args.utf16_ratio,
+        seed=args.seed,
+    )
+    (workspace / WRITE_DIR).mkdir(exist_ok=True)
+    tree = {
+        "root": str(workspace),
+        "dirs": len(dirs),
+        "files": len(files),
+        "bytes": sum(item.size for item in files),
+        "by_kind": {kind: sum(1 for item in files if item.kind == kind) for kind in ("text", "utf16", "binary")},
+        "by_bucket": {bucket.label: sum(1 for item in files if item.bucket == bucket.label) for bucket in sizes},
+        "generate_seconds": time.perf_counter() - generated_at,
+    }
+
+    binary = build_server_binary()
+    handle = start_server(binary, args.port, config_path=config_path)
+    try:
+        wait_for_health(args.port, args.startup_timeout)
+        cookie = await get_session_cookie(args.port)
+        limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{args.port}",
+            cookies={"boring_session": cookie},
+            timeout=30.0,
+            limits=limits,
+        ) as client:
+            operations = await benchmark_files(
+                client, dirs, files, sizes, levels=levels, requests=args.requests, seed=args.seed,
+            )
+        results = {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "binary": str(binary),
+            "tree": tree,
+            "concurrency_levels": levels,
+            "requests_per_level": args.requests,
+            "operations": operations,
+            "server_log": str(handle.log_path),
+        }
+        output_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        return results
+    finally:
+        stop_server(handle)
+        if not args.keep_tree:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+
+def main() -> None:
+    results = asyncio.run(run_main())
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""Benchmark /api/v1/git/{status,log,diff,branches} across repository sizes and emit perf-git.json.
+
+For each ``COMMITSxFILES`` size, builds a bare repository with ``git
+fast-import`` (no network), clones it locally as the working tree, adds
+branches and a configurable share of dirty/untracked files, then starts the
+Go server with that clone as its workspace root and times each route. The
+report carries per-size latency summaries, a CSV next to the JSON and an
+ASCII plot of p50 against repository size per route.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from bench_common import (
+    ARTIFACTS_DIR,
+    build_server_binary,
+    ensure_port_free,
+    get_session_cookie,
+    prepare_workspace_root,
+    run_at_concurrency,
+    start_server,
+    stop_server,
+    wait_for_health,
+)
+
+
+DEFAULT_OUTPUT = ARTIFACTS_DIR / "perf-git.json"
+ROUTES = ("status", "log", "diff", "branches")
+BENCH_AUTHOR = "Bench <bench@example.com>"
+
+
+@dataclass(frozen=True)
+class RepoSize:
+    commits: int
+    files: int
+
+    @property
+    def label(self) -> str:
+        return f"{self.commits}x{self.files}"
+
+
+@dataclass
+class BuiltRepo:
+    size: RepoSize
+    bare: Path
+    work: Path
+    dirty_paths: list[str]
+    untracked_paths: list[str]
+    branches: int
+    build_seconds: float
+
+
+def parse_repo_sizes(raw: str) -> list[RepoSize]:
+    """Parse ``"100x100,1000x1000"`` (commits x files) into repo sizes."""
+    sizes = []
+    for item in raw.split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        match = re.fullmatch(r"(\d+)x(\d+)", item)
+        if not match or int(match.group(1)) < 1 or int(match.group(2)) < 1:
+            raise ValueError(f"invalid repo size {item!r}; use COMMITSxFILES, e.g. 1000x500")
+        sizes.append(RepoSize(commits=int(match.group(1)), files=int(match.group(2))))
+    if not sizes:
+        raise ValueError("at least one repo size is required")
+    return sizes
+
+
+def _git(cwd: Path, *args: str, stdin: bytes | None = None) -> str:
+    result = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        input=stdin,
+        capture_output=True,
+        check=True,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+    )
+    return result.stdout.decode("utf-8", "replace")
+
+
+def _file_path(index: int, fanout: int) -> str:
+    return f"src/d{index % fanout}/f{index}.txt"
+
+
+def _blob(text: str) -> bytes:
+    data = text.encode("utf-8")
+    return b"data " + str(len(data)).encode() + b"\n" + data + b"\n"
+
+
+def fast_import_stream(size: RepoSize, *, fanout: int, files_per_commit: int, seed: int) -> bytes:
+    """Build a fast-import stream: one commit adding every file, then small edits."""
+    rng = random.Random(seed)
+    base_ts = 1_700_000_000
+    chunks: list[bytes] = []
+    for commit in range(size.commits):
+        chunks.append(b"commit refs/heads/main\n")
+        chunks.append(f"mark :{commit + 1}\n".encode())
+        chunks.append(f"committer {BENCH_AUTHOR} {base_ts + commit * 60} +0000\n".encode())
+        chunks.append(_blob(f"bench commit {commit}"))
+        if commit:
+            chunks.append(f"from :{commit}\n".encode())
+            touched = {rng.randrange(size.files) for _ in range(files_per_commit)}
+        else:
+            touched = set(range(size.files))
+        for index in sorted(touched):
+            chunks.append(f"M 100644 inline {_file_path(index, fanout)}\n".encode())
+            chunks.append(_blob(f"file {index} rev {commit}\n" + "line\n" * (index % 20)))
+    return b"".join(chunks)
+
+
+def build_repository(
+    root: Path,
+    size: RepoSize,
+    *,
+    dirty_ratio: float,
+    untracked_ratio: float = 0.0,
+    branches: int = 5,
+    fanout: int = 16,
+    files_per_commit: int = 3,
+    seed: int = 1,
+) -> BuiltRepo:
+    """Create ``root/<label>/bare.git`` and a dirty local clone ``root/<label>/work``."""
+    started = time.perf_counter()
+    base = root / size.label
+    bare = base / "bare.git"
+    work = base / "work"
+    bare.mkdir(parents=True)
+    _git(base, "init", "--bare", "--initial-branch=main", str(bare))
+    _git(bare, "fast-import", "--quiet", stdin=fast_import_stream(
+        size, fanout=fanout, files_per_commit=files_per_commit, seed=seed,
+    ))
+    _git(base, "clone", "--quiet", "--no-hardlinks", str(bare), str(work))
+    for index in range(branches):
+        _git(work, "branch", f"bench-{index}", f"HEAD~{min(index, size.commits - 1)}")
+
+    rng = random.Random(seed + 1)
+    dirty_count = round(size.files * dirty_ratio)
+    dirty_paths = [_file_path(index, fanout) for index in sorted(rng.sample(range(size.files), dirty_count))]
+    for rel_path in dirty_paths:
+        with (work / rel_path).open("a", encoding="utf-8") as handle:
+            handle.write("dirty edit\n")
+    untracked_paths = [f"untracked/u{index}.txt" for index in range(round(size.files * untracked_ratio))]
+    for rel_path in untracked_paths:
+        (work / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (work / rel_path).write_text("untracked\n", encoding="utf-8")
+
+    # The server's workspace root is the directory holding boring.app.toml;
+    # keep it out of `git status` so it does not skew the dirty count.
+    prepare_workspace_root(work)
+    with (work / ".git" / "info" / "exclude").open("a", encoding="utf-8") as handle:
+        handle.write("boring.app.toml\n")
+
+    return BuiltRepo(
+        size=size,
+        bare=bare,
+        work=work,
+        dirty_paths=dirty_paths,
+        untracked_paths=untracked_paths,
+        branches=branches,
+        build_seconds=time.perf_counter() - started,
+    )
+
+
+def ascii_plot(rows: list[dict[str, Any]], *, metric: str = "p50_ms", width: int = 40) -> str:
+    """One bar per (route, size) scaled to the slowest value for ``metric``."""
+    peak = max((row[metric] for row in rows), default=0.0) or 1.0
+    lines = [f"{metric} by repository size (commits x files)"]
+    for route in ROUTES:
+        route_rows = [row for row in rows if row["route"] == route]
+        if not route_rows:
+            continue
+        lines.append(f"{route}:")
+        for row in route_rows:
+            bar = "#" * max(1, round(width * row[metric] / peak))
+            lines.append(f"  {row['size']:>12} {bar} {row[metric]:.1f}ms")
+    return "\n".join(lines)
+
+
+async def benchmark_routes(
+    client: httpx.AsyncClient,
+    repo: BuiltRepo,
+    *,
+    requests: int,
+    concurrency: int,
+    log_limit: int,
+) -> dict[str, Any]:
+    diff_targets = repo.dirty_paths or [_file_path(0, 16)]
+    calls = {
+        "status": lambda _i: client.get("/api/v1/git/status"),
+        "log": lambda _i: client.get("/api/v1/git/log", params={"limit": log_limit}),
+        "diff": lambda i: client.get("/api/v1/git/diff", params={"path": diff_targets[i % len(diff_targets)]}),
+        "branches": lambda _i: client.get("/api/v1/git/branches"),
+    }
+    results = {}
+    for route in ROUTES:
+        # One warm-up request so the first sample does not pay for cold page cache.
+        await calls[route](0)
+        run = await run_at_concurrency(concurrency, requests, calls[route])
+        results[route] = run.summary()
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark git routes across repo sizes and emit perf-git.json.")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--port", type=int, default=18122)
+    parser.add_argument("--startup-timeout", type=float, default=10.0)
+    parser.add_argument("--sizes", default="10x100,100x1000,1000x5000,5000x20000", help="COMMITSxFILES list")
+    parser.add_argument("--dirty-ratio", type=float, default=0.01)
+    parser.add_argument("--untracked-ratio", type=float, default=0.0)
+    parser.add_argument("--branches", type=int, default=5)
+    parser.add_argument("--files-per-commit", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=50, help="Requests per route per size")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--log-limit", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep-repos", action="store_true")
+    return parser.parse_args()
+
+
+async def run_main() -> dict[str, Any]:
+    args = parse_args()
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    sizes = parse_repo_sizes(args.sizes)
+    ensure_port_free(args.port)
+    binary = build_server_binary()
+    scratch = Path(tempfile.mkdtemp(prefix="boring-ui-git-bench-"))
+
+    per_size: list[dict[str, Any]] = []
+    rows: list[dict[str, Any]] = []
+    try:
+        for size in sizes:
+            repo = build_repository(
+                scratch,
+                size,
+                dirty_ratio=args.dirty_ratio,
+                untracked_ratio=args.untracked_ratio,
+                branches=args.branches,
+                files_per_commit=args.files_per_commit,
+                seed=args.seed,
+            )
+            handle = start_server(binary, args.port, config_path=repo.work / "boring.app.toml")
+            try:
+                wait_for_health(args.port, args.startup_timeout)
+                cookie = await get_session_cookie(args.port)
+                async with httpx.AsyncClient(
+                    base_url=f"http://127.0.0.1:{args.port}",
+                    cookies={"boring_session": cookie},
+                    timeout=60.0,
+                ) as client:
+                    routes = await benchmark_routes(
+                        client, repo, requests=args.requests, concurrency=args.concurrency, log_limit=args.log_limit,
+                    )
+            finally:
+                stop_server(handle)
+            per_size.append({
+                "size": size.label,
+                "commits": size.commits,
+                "files": size.files,
+                "dirty_files": len(repo.dirty_paths),
+                "untracked_files": len(repo.untracked_paths),
+                "branches": repo.branches,
+                "build_seconds": repo.build_seconds,
+                "server_log": str(handle.log_path),
+                "routes": routes,
+            })
+            for route, summary in routes.items():
+                rows.append({"size": size.label, "commits": size.commits, "files": size.files, "route": route, **summary})
+    finally:
+        if not args.keep_repos:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    csv_path = output_path.with_suffix(".csv")
+    with csv_path.open("w", encoding="utf-8", newline="") as handle:
+        fields = ["size", "commits", "files", "route", "requests", "errors", "p50_ms", "p95_ms", "p99_ms", "mean_ms", "max_ms"]
+        writer = csv.DictWriter(handle, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+    results = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "binary": str(binary),
+        "dirty_ratio": args.dirty_ratio,
+        "untracked_ratio": args.untracked_ratio,
+        "concurrency": args.concurrency,
+        "requests_per_route": args.requests,
+        "sizes": per_size,
+        "csv": str(csv_path),
+        "plot": ascii_plot(rows),
+    }
+    output_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return results
+
+
+def main() -> None:
+    results = asyncio.run(run_main())
+    print(json.dumps({key: value for key, value in results.items() if key != "plot"}, indent=2))
+    print(results["plot"])
+
+
+if __name__ == "__main__":
+    main()
@@ -4,30 +4,27 @@ from __future__ import annotations
 import argparse
 import asyncio
 import json
-import math
-import os
-import signal
-import socket
-import subprocess
-import tempfile
 import time
-from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import httpx
 import websockets
 
+from bench_common import (
+    ARTIFACTS_DIR,
+    build_server_binary,
+    ensure_port_free,
+    get_session_cookie,
+    percentile,
+    read_rss_mb,
+    start_server,
+    stop_server,
+    wait_for_health,
+)
 
-ROOT = Path(__file__).resolve().parents[1]
-DEFAULT_OUTPUT = ROOT / "ci-artifacts" / "perf-go.json"
 
-
-@dataclass
-class ServerHandle:
-    process: subprocess.Popen[str]
-    log_path: Path
-    port: int
+DEFAULT_OUTPUT = ARTIFACTS_DIR / "perf-go.json"
 
 
 def parse_args() -> argparse.Namespace:
@@ -45,123 +42,6 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def build_server_binary() -> Path:
-    tmpdir = Path(tempfile.mkdtemp(prefix="boring-ui-go-perf-"))
-    binary = tmpdir / "boring-ui-go"
-    subprocess.run(
-        ["go", "build", "-o", str(binary), "./cmd/server"],
-        cwd=ROOT,
-        check=True,
-    )
-    return binary
-
-
-def server_env(port: int) -> dict[str, str]:
-    env = os.environ.copy()
-    env.update(
-        {
-            "BUI_APP_TOML": str(ROOT / "boring.app.toml"),
-            "BORING_HOST": "127.0.0.1",
-            "BORING_PORT": str(port),
-            "DEV_AUTOLOGIN": "1",
-            "AUTH_DEV_USER_ID": "user-1",
-            "AUTH_DEV_EMAIL": "owner@example.com",
-            "CONTROL_PLANE_PROVIDER": "local",
-            "DATABASE_URL": "",
-            "SUPABASE_DB_URL": "",
-            "SUPABASE_URL": "",
-            "SUPABASE_ANON_KEY": "",
-            "SUPABASE_SERVICE_ROLE_KEY": "",
-            "SUPABASE_JWT_SECRET": "",
-        }
-    )
-    return env
-
-
-def wait_for_health(port: int, timeout: float) -> float:
-    deadline = time.perf_counter() + timeout
-    url = f"http://127.0.0.1:{port}/health"
-    start = time.perf_counter()
-    with httpx.Client(timeout=1.0) as client:
-        while time.perf_counter() < deadline:
-            try:
-                response = client.get(url)
-                if response.status_code == 200:
-                    return (time.perf_counter() - start) * 1000.0
-            except httpx.HTTPError:
-                pass
-            time.sleep(0.02)
-    raise TimeoutError(f"/health did not become ready on port {port}")
-
-
-def start_server(binary: Path, port: int) -> ServerHandle:
-    log_file = tempfile.NamedTemporaryFile(prefix="boring-ui-go-perf-", suffix=".log", delete=False)
-    log_path = Path(log_file.name)
-    log_file.close()
-    process = subprocess.Popen(
-        [str(binary)],
-        cwd=ROOT,
-        env=server_env(port),
-        stdout=open(log_path, "w", encoding="utf-8"),
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
-    return ServerHandle(process=process, log_path=log_path, port=port)
-
-
-def stop_server(handle: ServerHandle) -> None:
-    if handle.process.poll() is not None:
-        return
-    handle.process.send_signal(signal.SIGTERM)
-    try:
-        handle.process.wait(timeout=5)
-    except subprocess.TimeoutExpired:
-        handle.process.kill()
-        handle.process.wait(timeout=5)
-
-
-def percentile(values: list[float], ratio: float) -> float:
-    if not values:
-        return 0.0
-    ordered = sorted(values)
-    index = max(0, math.ceil(len(ordered) * ratio) - 1)
-    return ordered[index]
-
-
-def read_rss_mb(pid: int) -> float:
-    status_path = Path(f"/proc/{pid}/status")
-    for line in status_path.read_text(encoding="utf-8").splitlines():
-        if line.startswith("VmRSS:"):
-            parts = line.split()
-            return int(parts[1]) / 1024.0
-    raise RuntimeError(f"VmRSS not found for pid {pid}")
-
-
-def ensure_port_free(port: int) -> None:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        if sock.connect_ex(("127.0.0.1", port)) == 0:
-            raise RuntimeError(f"port {port} is already in use")
-
-
-async def get_session_cookie(port: int) -> str:
-    async with httpx.AsyncClient(follow_redirects=False, timeout=5.0) as client:
-        response = await client.get(
-            f"http://127.0.0.1:{port}/auth/login",
-            params={
-                "user_id": "user-1",
-                "email": "owner@example.com",
-                "redirect_uri": "/health",
-            },
-        )
-        if response.status_code not in (200, 302):
-            response.raise_for_status()
-        cookie = client.cookies.get("boring_session")
-        if not cookie:
-            raise RuntimeError("login flow did not return boring_session cookie")
-        return cookie
-
-
 async def benchmark_health(port: int, rps: int, duration_seconds: int) -> dict[str, Any]:
     total_requests = rps * duration_seconds
     url = f"http://127.0.0.1:{port}/health"
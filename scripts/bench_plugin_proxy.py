@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""Benchmark the /api/x plugin proxy hop, plugin cold start and watcher restarts; emit perf-plugins.json.
+
+Drops a trivial stdlib echo plugin into ``kurt/plugins/<name>`` of a
+throwaway workspace root and starts the Go server on it. Measures:
+
+* cold start: server spawn until the plugin answers through the proxy;
+* overhead: the same echo request sent straight to the plugin's port and
+  through ``/api/x/<name>/...`` (``internal/plugins/proxy.go``), across
+  payload sizes and concurrency levels;
+* restart: time from touching the plugin source (``watcher.go`` debounce,
+  ``supervisor.go`` stop/start and health check) until a new plugin process
+  answers through the proxy.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from bench_common import (
+    ARTIFACTS_DIR,
+    build_server_binary,
+    ensure_port_free,
+    get_session_cookie,
+    parse_int_list,
+    prepare_workspace_root,
+    run_at_concurrency,
+    start_server,
+    stop_server,
+    wait_for_health,
+)
+
+
+DEFAULT_OUTPUT = ARTIFACTS_DIR / "perf-plugins.json"
+PLUGIN_NAME = "bench_echo"
+SIZE_UNITS = {"": 1, "b": 1, "k": 1024, "m": 1024 * 1024}
+
+# Minimal plugin backend: /health for the supervisor, /whoami so the bench
+# can learn the supervisor-assigned port and detect restarts, /echo returning
+# the request body.
+PLUGIN_SERVER = '''\
+import json
+import os
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PORT = int(os.environ["PORT"])
+STARTED_AT = time.time()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/octet-stream"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/health":
+            self._send(200, b"ok", "text/plain")
+        elif path == "/whoami":
+            body = json.dumps({"pid": os.getpid(), "port": PORT, "started_at": STARTED_AT}).encode()
+            self._send(200, body, "application/json")
+        else:
+            self._send(404, b"not found", "text/plain")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        if self.path.split("?", 1)[0] == "/echo":
+            self._send(200, body)
+        else:
+            self._send(404, b"not found", "text/plain")
+
+
+ThreadingHTTPServer.daemon_threads = True
+ThreadingHTTPServer(("127.0.0.1", PORT), Handler).serve_forever()
+'''
+
+
+def parse_payload_sizes(raw: str) -> list[int]:
+    """Parse ``"0,1k,64k,1m"`` into byte counts."""
+    sizes = []
+    for item in raw.split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        match = re.fullmatch(r"(\d+)([bkm]?)", item)
+        if not match:
+            raise ValueError(f"invalid payload size {item!r}; use e.g. 0, 512, 4k, 1m")
+        sizes.append(int(match.group(1)) * SIZE_UNITS[match.group(2)])
+    if not sizes:
+        raise ValueError("at least one payload size is required")
+    return sizes
+
+
+def write_plugin(root: Path, name: str = PLUGIN_NAME) -> Path:
+    """Write ``root/kurt/plugins/<name>`` (manifest + server); return the watched source file."""
+    plugin_dir = root / "kurt" / "plugins" / name
+    plugin_dir.mkdir(parents=True, exist_ok=True)
+    source = plugin_dir / "server.py"
+    source.write_text(PLUGIN_SERVER, encoding="utf-8")
+    (plugin_dir / "plugin.toml").write_text(
+        f'name = "{name}"\n'
+        f"command = {json.dumps([sys.executable, 'server.py'])}\n"
+        'watch = ["server.py"]\n',
+        encoding="utf-8",
+    )
+    return source
+
+
+def overhead(direct: dict[str, Any], proxied: dict[str, Any]) -> dict[str, float]:
+    """Latency added by the proxy hop per percentile, and the throughput ratio."""
+    result = {
+        key.replace("_ms", "_added_ms"): proxied[key] - direct[key]
+        for key in ("p50_ms", "p95_ms", "p99_ms", "mean_ms")
+    }
+    result["throughput_ratio"] = (
+        0.0 if direct["throughput_rps"] <= 0 else proxied["throughput_rps"] / direct["throughput_rps"]
+    )
+    return result
+
+
+async def whoami(client: httpx.AsyncClient, url: str) -> dict[str, Any] | None:
+    try:
+        response = await client.get(url)
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200:
+        return None
+    return response.json()
+
+
+async def wait_for_plugin(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout: float,
+    *,
+    not_pid: int | None = None,
+) -> dict[str, Any]:
+    """Poll ``url`` (a /whoami route) until a plugin process other than ``not_pid`` answers."""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        info = await whoami(client, url)
+        if info is not None and info.get("pid") != not_pid:
+            return info
+        await asyncio.sleep(0.01)
+    raise TimeoutError(f"plugin did not answer at {url} within {timeout}s")
+
+
+async def benchmark_overhead(
+    proxied: httpx.AsyncClient,
+    direct: httpx.AsyncClient,
+    *,
+    sizes: list[int],
+    levels: list[int],
+    requests: int,
+) -> list[dict[str, Any]]:
+    rows = []
+    for size in sizes:
+        payload = b"x" * size
+        for concurrency in levels:
+            runs = {}
+            for label, client, path in (
+                ("direct", direct, "/echo"),
+                ("proxied", proxied, f"/api/x/{PLUGIN_NAME}/echo"),
+            ):
+                # One warm-up request so connection setup is not in the first sample.
+                await client.post(path, content=payload)
+                run = await run_at_concurrency(
+                    concurrency, requests, lambda _i, client=client, path=path: client.post(path, content=payload),
+                )
+                runs[label] = run.summary()
+            rows.append({
+                "payload_bytes": size,
+                "concurrency": concurrency,
+                "direct": runs["direct"],
+                "proxied": runs["proxied"],
+                "overhead": overhead(runs["direct"], runs["proxied"]),
+            })
+    return rows
+
+
+async def benchmark_restarts(
+    client: httpx.AsyncClient,
+    source: Path,
+    *,
+    restarts: int,
+    timeout: float,
+) -> list[dict[str, Any]]:
+    url = f"/api/x/{PLUGIN_NAME}/whoami"
+    results = []
+    for index in range(restarts):
+        before = await wait_for_plugin(client, url, timeout)
+        started = time.perf_counter()
+        with source.open("a", encoding="utf-8") as handle:
+            handle.write(f"# bench restart {index}\n")
+        after = await wait_for_plugin(client, url, timeout, not_pid=before["pid"])
+        results.append({
+            "restart_ms": (time.perf_counter() - started) * 1000.0,
+            "old_pid": before["pid"],
+            "new_pid": after["pid"],
+            "port_changed": before["port"] != after["port"],
+        })
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the plugin proxy hop and restarts; emit perf-plugins.json.")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--port", type=int, default=18126)
+    parser.add_argument("--startup-timeout", type=float, default=15.0)
+    parser.add_argument("--payload-sizes", default="0,1k,64k,1m", help="Echo body sizes")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency sweep")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per path per size per level")
+    parser.add_argument("--restarts", type=int, default=5, help="Source edits to time watcher restarts")
+    parser.add_argument("--keep-workspace", action="store_true")
+    return parser.parse_args()
+
+
+async def run_main() -> dict[str, Any]:
+    args = parse_args()
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    sizes = parse_payload_sizes(args.payload_sizes)
+    levels = parse_int_list(args.concurrency)
+    ensure_port_free(args.port)
+    binary = build_server_binary()
+
+    workspace = Path(tempfile.mkdtemp(prefix="boring-ui-plugin-bench-"))
+    config_path = prepare_workspace_root(workspace)
+    source = write_plugin(workspace)
+    base_url = f"http://127.0.0.1:{args.port}"
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+
+    spawned = time.perf_counter()
+    handle = start_server(binary, args.port, config_path=config_path)
+    try:
+        server_ready_ms = wait_for_health(args.port, args.startup_timeout)
+        cookie = await get_session_cookie(args.port)
+        async with httpx.AsyncClient(
+            base_url=base_url,
+            cookies={"boring_session": cookie},
+            timeout=30.0,
+            limits=limits,
+        ) as proxied:
+            plugin = await wait_for_plugin(proxied, f"/api/x/{PLUGIN_NAME}/whoami", args.startup_timeout)
+            cold_start = {
+                "server_ready_ms": server_ready_ms,
+                "plugin_ready_ms": (time.perf_counter() - spawned) * 1000.0,
+                "plugin_port": plugin["port"],
+            }
+            async with httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{plugin['port']}",
+                timeout=30.0,
+                limits=limits,
+            ) as direct:
+                rows = await benchmark_overhead(
+                    proxied, direct, sizes=sizes, levels=levels, requests=args.requests,
+                )
+            restarts = await benchmark_restarts(
+                proxied, source, restarts=args.restarts, timeout=args.startup_timeout,
+            )
+
+        restart_ms = [item["restart_ms"] for item in restarts]
+        results = {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "binary": str(binary),
+            "plugin": PLUGIN_NAME,
+            "payload_sizes": sizes,
+            "concurrency_levels": levels,
+            "requests_per_level": args.requests,
+            "cold_start": cold_start,
+            "overhead": rows,
+            "restarts": {
+                "runs": restarts,
+                "mean_ms": sum(restart_ms) / len(restart_ms) if restart_ms else 0.0,
+                "max_ms": max(restart_ms, default=0.0),
+            },
+            "server_log": str(handle.log_path),
+        }
+        output_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        return results
+    finally:
+        stop_server(handle)
+        if not args.keep_workspace:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+
+def main() -> None:
+    results = asyncio.run(run_main())
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
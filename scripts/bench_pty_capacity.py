@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Benchmark PTY session capacity, echo latency and idle reaping; emit perf-pty.json.
+
+Opens ``/ws/pty?provider=shell`` sessions one at a time up to
+``PTY_MAX_SESSIONS`` plus an overflow, timing each create and sampling
+server RSS/threads/FDs/children after each so per-session growth is
+visible. Then measures keystroke-to-echo round trips in every session
+concurrently, goes idle, and checks that ``cleanupLoop`` reaps all sessions
+within ``PTY_IDLE_TTL_MS`` plus one cleanup tick and that the server's
+resources return to baseline.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+import websockets
+
+from bench_common import (
+    ARTIFACTS_DIR,
+    build_server_binary,
+    ensure_port_free,
+    get_session_cookie,
+    latency_summary,
+    prepare_workspace_root,
+    process_stats,
+    start_server,
+    stop_server,
+    wait_for_health,
+)
+
+
+DEFAULT_OUTPUT = ARTIFACTS_DIR / "perf-pty.json"
+CLEAR_LINE = "\x15"
+
+
+@dataclass
+class OpenSession:
+    conn: Any
+    session_id: str
+    buffer: str = ""
+    reader: asyncio.Task | None = None
+    output: asyncio.Event = field(default_factory=asyncio.Event)
+    closed: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+def growth_per_session(samples: list[dict[str, float]], baseline: dict[str, float]) -> dict[str, float]:
+    """Average per-session increase of each resource over the baseline sample."""
+    if not samples:
+        return {key: 0.0 for key in baseline}
+    last = samples[-1]
+    count = len(samples)
+    return {key: (last[key] - baseline[key]) / count for key in baseline}
+
+
+def returned_to_baseline(
+    baseline: dict[str, float],
+    after: dict[str, float],
+    *,
+    rss_tolerance_mb: float,
+    fd_tolerance: int = 2,
+) -> dict[str, bool]:
+    return {
+        "rss": after["rss_mb"] - baseline["rss_mb"] <= rss_tolerance_mb,
+        "fds": after["fds"] - baseline["fds"] <= fd_tolerance,
+        "children": after["children"] <= baseline["children"],
+        "threads": after["threads"] <= baseline["threads"] + fd_tolerance,
+    }
+
+
+async def _read_output(session: OpenSession) -> None:
+    try:
+        async for payload in session.conn:
+            try:
+                message = json.loads(payload)
+            except json.JSONDecodeError:
+                continue
+            if message.get("type") == "output":
+                session.buffer = (session.buffer + (message.get("data") or ""))[-65536:]
+                session.output.set()
+    except Exception:
+        pass
+    finally:
+        session.closed.set()
+
+
+async def open_session(ws_base: str, headers: dict[str, str]) -> tuple[OpenSession | None, float, str]:
+    """Open one shell session; returns (session, create_ms, outcome)."""
+    started = time.perf_counter()
+    try:
+        conn = await websockets.connect(f"{ws_base}/ws/pty?provider=shell", additional_headers=headers)
+    except websockets.exceptions.InvalidStatus as exc:
+        return None, (time.perf_counter() - started) * 1000.0, f"rejected_{exc.response.status_code}"
+    first = json.loads(await asyncio.wait_for(conn.recv(), timeout=10.0))
+    create_ms = (time.perf_counter() - started) * 1000.0
+    if first.get("type") != "session" or not first.get("session_id"):
+        await conn.close()
+        error_type = (first.get("error") or {}).get("type") if isinstance(first.get("error"), dict) else None
+        return None, create_ms, f"error_{error_type or first.get('type')}"
+    session = OpenSession(conn=conn, session_id=first["session_id"])
+    session.reader = asyncio.create_task(_read_output(session))
+    return session, create_ms, "created"
+
+
+async def echo_round_trip(session: OpenSession, token: str, timeout: float) -> float | None:
+    session.buffer = ""
+    session.output.clear()
+    started = time.perf_counter()
+    await session.conn.send(json.dumps({"type": "input", "data": token}))
+    deadline = started + timeout
+    while token not in session.buffer:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return None
+        session.output.clear()
+        try:
+            await asyncio.wait_for(session.output.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            return None
+    elapsed = (time.perf_counter() - started) * 1000.0
+    await session.conn.send(json.dumps({"type": "input", "data": CLEAR_LINE}))
+    return elapsed
+
+
+async def list_session_count(client: httpx.AsyncClient) -> int:
+    response = await client.get("/api/v1/pty/sessions")
+    response.raise_for_status()
+    return len(response.json().get("sessions") or [])
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark PTY capacity and idle reaping; emit perf-pty.json.")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--port", type=int, default=18124)
+    parser.add_argument("--startup-timeout", type=float, default=10.0)
+    parser.add_argument("--max-sessions", type=int, default=10, help="PTY_MAX_SESSIONS for the server")
+    parser.add_argument("--overflow", type=int, default=3, help="Extra sessions to attempt beyond capacity")
+    parser.add_argument("--idle-ttl-ms", type=int, default=5000, help="PTY_IDLE_TTL_MS for the server")
+    parser.add_argument("--cleanup-interval-ms", type=int, default=500, help="PTY_CLEANUP_INTERVAL_MS")
+    parser.add_argument("--echo-rounds", type=int, default=20)
+    parser.add_argument("--echo-timeout", type=float, default=5.0)
+    parser.add_argument("--reap-slack-ms", type=int, default=1000, help="Allowed lateness beyond TTL + one tick")
+    parser.add_argument("--settle-seconds", type=float, default=2.0)
+    parser.add_argument("--rss-tolerance-mb", type=float, default=5.0)
+    return parser.parse_args()
+
+
+async def run_main() -> dict[str, Any]:
+    args = parse_args()
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_port_free(args.port)
+    binary = build_server_binary()
+    workspace = Path(tempfile.mkdtemp(prefix="boring-ui-pty-bench-"))
+    config_path = prepare_workspace_root(workspace)
+
+    handle = start_server(binary, args.port, config_path=config_path, extra_env={
+        "PTY_MAX_SESSIONS": str(args.max_sessions),
+        "PTY_IDLE_TTL_MS": str(args.idle_ttl_ms),
+        "PTY_CLEANUP_INTERVAL_MS": str(args.cleanup_interval_ms),
+    })
+    sessions: list[OpenSession] = []
+    try:
+        wait_for_health(args.port, args.startup_timeout)
+        pid = handle.process.pid
+        cookie = await get_session_cookie(args.port)
+        headers = {"Cookie": f"boring_session={cookie}"}
+        ws_base = f"ws://127.0.0.1:{args.port}"
+        await asyncio.sleep(0.5)
+        baseline = process_stats(pid)
+
+        # --- Capacity: create sessions one by one, past the limit ---
+        attempts = []
+        samples = []
+        for index in range(args.max_sessions + args.overflow):
+            session, create_ms, outcome = await open_session(ws_base, headers)
+            attempts.append({"index": index, "outcome": outcome, "create_ms": create_ms})
+            if session is not None:
+                sessions.append(session)
+                await asyncio.sleep(0.1)
+                samples.append(process_stats(pid))
+        created = [item for item in attempts if item["outcome"] == "created"]
+        rejected = [item for item in attempts if item["outcome"] != "created"]
+        peak = process_stats(pid)
+
+        # --- Echo round trip in every session concurrently ---
+        await asyncio.sleep(0.5)
+
+        async def echo_rounds(index: int, session: OpenSession) -> list[float | None]:
+            return [
+                await echo_round_trip(session, f"ECHO{index}X{round_}Z", args.echo_timeout)
+                for round_ in range(args.echo_rounds)
+            ]
+
+        echo_results = await asyncio.gather(*(echo_rounds(index, session) for index, session in enumerate(sessions)))
+        last_activity = time.perf_counter()
+        echo_ms = [value for rounds in echo_results for value in rounds if value is not None]
+        echo_timeouts = sum(1 for rounds in echo_results for value in rounds if value is None)
+
+        # --- Idle reaping: stay connected, send nothing, wait for cleanupLoop ---
+        reap_deadline_ms = args.idle_ttl_ms + args.cleanup_interval_ms + args.reap_slack_ms
+        reaped_at_ms = None
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{args.port}",
+            cookies={"boring_session": cookie},
+            timeout=5.0,
+        ) as client:
+            while (time.perf_counter() - last_activity) * 1000.0 < reap_deadline_ms * 2:
+                if await list_session_count(client) == 0:
+                    reaped_at_ms = (time.perf_counter() - last_activity) * 1000.0
+                    break
+                await asyncio.sleep(0.1)
+            remaining_sessions = await list_session_count(client)
+        closed_by_server = sum(1 for session in sessions if session.closed.is_set())
+
+        await asyncio.sleep(args.settle_seconds)
+        after = process_stats(pid)
+
+        results = {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "binary": str(binary),
+            "config": {
+                "max_sessions": args.max_sessions,
+                "idle_ttl_ms": args.idle_ttl_ms,
+                "cleanup_interval_ms": args.cleanup_interval_ms,
+            },
+            "capacity": {
+                "attempted": len(attempts),
+                "created": len(created),
+                "rejected": len(rejected),
+                "rejections": sorted({item["outcome"] for item in rejected}),
+                "create": latency_summary([item["create_ms"] for item in created]),
+                "reject": latency_summary([item["create_ms"] for item in rejected]),
+                "attempts": attempts,
+            },
+            "resources": {
+                "baseline": baseline,
+                "peak": peak,
+                "per_session": growth_per_session(samples, baseline),
+                "samples": samples,
+                "after_reap": after,
+            },
+            "echo": {
+                "rounds": len(echo_ms) + echo_timeouts,
+                "timeouts": echo_timeouts,
+                **latency_summary(echo_ms),
+            },
+            "idle_reap": {
+                "reaped_after_ms": reaped_at_ms,
+                "deadline_ms": reap_deadline_ms,
+                "remaining_sessions": remaining_sessions,
+                "connections_closed_by_server": closed_by_server,
+            },
+            "pass": {
+                "capacity_enforced": len(created) == args.max_sessions and len(rejected) == args.overflow,
+                "reaped_on_schedule": reaped_at_ms is not None and reaped_at_ms <= reap_deadline_ms,
+                **{
+                    f"{key}_returned_to_baseline": ok
+                    for key, ok in returned_to_baseline(
+                        baseline, after, rss_tolerance_mb=args.rss_tolerance_mb,
+                    ).items()
+                },
+            },
+            "server_log": str(handle.log_path),
+        }
+        output_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        return results
+    finally:
+        for session in sessions:
+            if session.reader is not None:
+                session.reader.cancel()
+            try:
+                await session.conn.close()
+            except Exception:
+                pass
+        stop_server(handle)
+
+
+def main() -> None:
+    results = asyncio.run(run_main())
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
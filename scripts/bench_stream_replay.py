@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Benchmark stream session history replay and emit perf-stream.json.
+
+Starts the Go server with a stub bridge command in place of the agent CLI
+(``BORING_UI_PTY_CLAUDE_COMMAND``), pushes message volumes through one
+session, and after each volume step reconnects K clients to
+``/ws/agent/normal/stream`` with different ``since`` offsets. Records replay
+latency, messages and bytes replayed, and server RSS as history grows, once
+per ``STREAM_HISTORY_LIMIT`` in the sweep, to size ``WithHistoryLimit`` and
+``WithMaxSessions``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import websockets
+
+from bench_common import (
+    ARTIFACTS_DIR,
+    build_server_binary,
+    ensure_port_free,
+    get_session_cookie,
+    latency_summary,
+    parse_int_list,
+    prepare_workspace_root,
+    read_rss_mb,
+    start_server,
+    stop_server,
+    wait_for_health,
+)
+
+
+DEFAULT_OUTPUT = ARTIFACTS_DIR / "perf-stream.json"
+STREAM_PATH = "/ws/agent/normal/stream"
+BURST_DONE = "bench_burst_done"
+
+# Stands in for the agent CLI: every {"type": "bench_burst"} line on stdin
+# becomes `count` assistant lines of `bytes` payload on stdout, followed by
+# a done marker so the producer knows the burst has been broadcast.
+STUB_BRIDGE = '''\
+import json
+import sys
+
+print(json.dumps({"type": "system", "subtype": "init"}), flush=True)
+for raw in sys.stdin:
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        continue
+    if message.get("type") != "bench_burst":
+        continue
+    start = int(message.get("start", 0))
+    count = int(message.get("count", 0))
+    text = "x" * int(message.get("bytes", 0))
+    out = sys.stdout
+    for seq in range(start, start + count):
+        out.write(json.dumps({"type": "assistant", "seq": seq, "text": text}) + "\\n")
+    out.write(json.dumps({"type": "result", "subtype": "%s", "count": count}) + "\\n")
+    out.flush()
+''' % BURST_DONE
+
+
+def write_stub_bridge(directory: Path) -> Path:
+    path = directory / "bench_stub_bridge.py"
+    path.write_text(STUB_BRIDGE, encoding="utf-8")
+    return path
+
+
+def replay_offsets(latest: int, fractions: list[float]) -> list[int]:
+    """Map fractions of the latest msg_id to distinct ``since`` values (0 = full replay)."""
+    offsets = sorted({max(0, min(latest, int(latest * fraction))) for fraction in fractions})
+    return offsets
+
+
+def expected_replay(latest: int, since: int, history_limit: int) -> int:
+    """Messages a reconnect with ``since`` should receive given the retained window."""
+    oldest_retained = max(0, latest - history_limit)
+    return max(0, latest - max(since, oldest_retained))
+
+
+async def push_volume(producer, *, start: int, count: int, payload_bytes: int, batch: int) -> int:
+    """Push ``count`` messages in bursts of ``batch`` and return the last msg_id seen."""
+    last_msg_id = 0
+    sent = 0
+    while sent < count:
+        size = min(batch, count - sent)
+        await producer.send(json.dumps({"type": "bench_burst", "start": start + sent, "count": size, "bytes": payload_bytes}))
+        while True:
+            message = json.loads(await asyncio.wait_for(producer.recv(), timeout=30.0))
+            last_msg_id = max(last_msg_id, int(message.get("msg_id") or 0))
+            if message.get("subtype") == BURST_DONE:
+                break
+        sent += size
+    return last_msg_id
+
+
+async def reconnect_and_replay(
+    ws_base: str,
+    headers: dict[str, str],
+    session_id: str,
+    since: int,
+    expected: int,
+    *,
+    idle_timeout: float,
+) -> dict[str, Any]:
+    started = time.perf_counter()
+    received = 0
+    received_bytes = 0
+    first_ms = None
+    url = f"{ws_base}{STREAM_PATH}?session_id={session_id}&since={since}"
+    async with websockets.connect(url, additional_headers=headers, max_size=None) as conn:
+        connected = json.loads(await asyncio.wait_for(conn.recv(), timeout=5.0))
+        connect_ms = (time.perf_counter() - started) * 1000.0
+        if connected.get("subtype") != "connected" or connected.get("session_id") != session_id:
+            raise RuntimeError(f"unexpected connect payload: {connected}")
+        while received < expected:
+            try:
+                payload = await asyncio.wait_for(conn.recv(), timeout=idle_timeout)
+            except asyncio.TimeoutError:
+                break
+            if first_ms is None:
+                first_ms = (time.perf_counter() - started) * 1000.0
+            received += 1
+            received_bytes += len(payload)
+    return {
+        "since": since,
+        "expected": expected,
+        "received": received,
+        "bytes": received_bytes,
+        "connect_ms": connect_ms,
+        "first_message_ms": first_ms or 0.0,
+        "replay_ms": (time.perf_counter() - started) * 1000.0,
+    }
+
+
+async def benchmark_history_limit(
+    port: int,
+    pid: int,
+    history_limit: int,
+    *,
+    volumes: list[int],
+    payload_bytes: int,
+    clients: int,
+    fractions: list[float],
+    batch: int,
+    idle_timeout: float,
+) -> dict[str, Any]:
+    cookie = await get_session_cookie(port)
+    headers = {"Cookie": f"boring_session={cookie}"}
+    ws_base = f"ws://127.0.0.1:{port}"
+    baseline_rss_mb = read_rss_mb(pid)
+    steps = []
+
+    async with websockets.connect(f"{ws_base}{STREAM_PATH}", additional_headers=headers, max_size=None) as producer:
+        connected = json.loads(await asyncio.wait_for(producer.recv(), timeout=10.0))
+        session_id = connected.get("session_id")
+        if not session_id:
+            raise RuntimeError(f"unexpected producer payload: {connected}")
+
+        pushed = 0
+        latest = 0
+        for volume in volumes:
+            if volume > pushed:
+                latest = await push_volume(
+                    producer, start=pushed, count=volume - pushed, payload_bytes=payload_bytes, batch=batch,
+                )
+                pushed = volume
+            rss_mb = read_rss_mb(pid)
+
+            replays = []
+            for since in replay_offsets(latest, fractions):
+                expected = expected_replay(latest, since, history_limit)
+                results = await asyncio.gather(*(
+                    reconnect_and_replay(ws_base, headers, session_id, since, expected, idle_timeout=idle_timeout)
+                    for _ in range(clients)
+                ))
+                replays.append({
+                    "since": since,
+                    "expected_messages": expected,
+                    "clients": clients,
+                    "short_clients": sum(1 for item in results if item["received"] < expected),
+                    "bytes_per_client": max(item["bytes"] for item in results),
+                    "bytes_total": sum(item["bytes"] for item in results),
+                    "connect": latency_summary([item["connect_ms"] for item in results]),
+                    "replay": latency_summary([item["replay_ms"] for item in results]),
+                })
+
+            steps.append({
+                "messages_pushed": pushed,
+                "latest_msg_id": latest,
+                "retained_messages": min(latest, history_limit),
+                "rss_mb": rss_mb,
+                "rss_delta_mb": rss_mb - baseline_rss_mb,
+                "replays": replays,
+            })
+
+    return {
+        "history_limit": history_limit,
+        "baseline_rss_mb": baseline_rss_mb,
+        "payload_bytes": payload_bytes,
+        "steps": steps,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark stream history replay and emit perf-stream.json.")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--port", type=int, default=18123)
+    parser.add_argument("--startup-timeout", type=float, default=10.0)
+    parser.add_argument("--history-limits", default="128,1024,8192", help="STREAM_HISTORY_LIMIT values to sweep")
+    parser.add_argument("--max-sessions", type=int, default=5, help="STREAM_MAX_SESSIONS for the server")
+    parser.add_argument("--volumes", default="100,1000,10000", help="Cumulative messages pushed per step")
+    parser.add_argument("--payload-bytes", type=int, default=512)
+    parser.add_argument("--batch", type=int, default=500, help="Messages per stub burst")
+    parser.add_argument("--clients", type=int, default=10, help="Concurrent reconnecting clients per offset")
+    parser.add_argument("--since-fractions", default="0,0.5,0.9,0.99", help="since = fraction x latest msg_id")
+    parser.add_argument("--idle-timeout", type=float, default=2.0)
+    return parser.parse_args()
+
+
+async def run_main() -> dict[str, Any]:
+    args = parse_args()
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    history_limits = parse_int_list(args.history_limits)
+    volumes = sorted(parse_int_list(args.volumes))
+    fractions = [float(item) for item in args.since_fractions.split(",") if item.strip()]
+    ensure_port_free(args.port)
+    binary = build_server_binary()
+
+    workspace = Path(tempfile.mkdtemp(prefix="boring-ui-stream-bench-"))
+    config_path = prepare_workspace_root(workspace)
+    stub = write_stub_bridge(workspace)
+
+    runs = []
+    logs = []
+    for history_limit in history_limits:
+        handle = start_server(binary, args.port, config_path=config_path, extra_env={
+            "BORING_UI_PTY_CLAUDE_COMMAND": f"{sys.executable} {stub}",
+            "STREAM_HISTORY_LIMIT": str(history_limit),
+            "STREAM_MAX_SESSIONS": str(args.max_sessions),
+        })
+        try:
+            wait_for_health(args.port, args.startup_timeout)
+            runs.append(await benchmark_history_limit(
+                args.port,
+                handle.process.pid,
+                history_limit,
+                volumes=volumes,
+                payload_bytes=args.payload_bytes,
+                clients=args.clients,
+                fractions=fractions,
+                batch=args.batch,
+                idle_timeout=args.idle_timeout,
+            ))
+            logs.append(str(handle.log_path))
+        finally:
+            stop_server(handle)
+
+    results = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "binary": str(binary),
+        "max_sessions": args.max_sessions,
+        "runs": runs,
+        "server_logs": logs,
+    }
+    output_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return results
+
+
+def main() -> None:
+    results = asyncio.run(run_main())
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""Benchmark the /api/v1/ui state and command queue under many clients; emit perf-uistate.json.
+
+For each client count in the sweep, starts the Go server on a fresh
+workspace root and runs one virtual client per ``client_id`` concurrently:
+every round upserts the client's pane state, enqueues a ``focus_panel`` and
+an ``open_panel`` command and pops both back through ``/commands/next``.
+``Service.saveLocked`` rewrites ``.boring/ui_state.json`` in full on every
+mutation, so besides throughput and tail latency per operation the report
+estimates write amplification: bytes rewritten per mutation (sampled file
+size) against the bytes each mutation actually changed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from bench_common import (
+    ARTIFACTS_DIR,
+    build_server_binary,
+    ensure_port_free,
+    get_session_cookie,
+    latency_summary,
+    parse_int_list,
+    prepare_workspace_root,
+    start_server,
+    stop_server,
+    wait_for_health,
+)
+
+
+DEFAULT_OUTPUT = ARTIFACTS_DIR / "perf-uistate.json"
+STATE_FILE = Path(".boring") / "ui_state.json"
+OPERATIONS = ("upsert", "enqueue", "pop")
+
+
+@dataclass
+class OperationStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: dict[str, int] = field(default_factory=dict)
+    payload_bytes: int = 0
+    mutations: int = 0
+
+    def record(self, status: int | str, elapsed_ms: float, *, ok: bool) -> None:
+        key = str(status)
+        self.statuses[key] = self.statuses.get(key, 0) + 1
+        if ok:
+            self.latencies_ms.append(elapsed_ms)
+        else:
+            self.errors += 1
+
+    def summary(self, wall_seconds: float) -> dict[str, Any]:
+        requests = len(self.latencies_ms) + self.errors
+        return {
+            "requests": requests,
+            "errors": self.errors,
+            "mutations": self.mutations,
+            "throughput_rps": 0.0 if wall_seconds <= 0 else requests / wall_seconds,
+            "statuses": dict(sorted(self.statuses.items())),
+            **latency_summary(self.latencies_ms),
+        }
+
+
+def client_state(client_id: str, round_: int, panels: int) -> dict[str, Any]:
+    """Pane state a client publishes; ``panel-0`` is always open so focus_panel is valid."""
+    open_panels = [
+        {"id": f"panel-{index}", "component": "editor", "title": f"file-{round_}-{index}.py"}
+        for index in range(panels)
+    ]
+    return {
+        "client_id": client_id,
+        "active_panel_id": f"panel-{round_ % panels}",
+        "open_panels": open_panels,
+        "meta": {"round": round_},
+        "captured_at_ms": int(time.time() * 1000),
+    }
+
+
+def write_amplification(
+    mutations: int,
+    size_samples: list[int],
+    payload_bytes: int,
+) -> dict[str, float]:
+    """Estimate bytes rewritten by full-file persistence relative to the bytes that changed.
+
+    Every mutation rewrites the whole state file, so bytes written is
+    approximately ``mutations`` times the mean file size over the run.
+    """
+    mean_file_bytes = sum(size_samples) / len(size_samples) if size_samples else 0.0
+    estimated = mutations * mean_file_bytes
+    return {
+        "mutations": mutations,
+        "mean_file_bytes": mean_file_bytes,
+        "max_file_bytes": max(size_samples, default=0),
+        "estimated_bytes_written": estimated,
+        "payload_bytes": payload_bytes,
+        "bytes_written_per_mutation": mean_file_bytes,
+        "amplification": 0.0 if payload_bytes <= 0 else estimated / payload_bytes,
+    }
+
+
+def read_proc_io(pid: int) -> dict[str, int] | None:
+    """``/proc/<pid>/io`` counters, or None where the kernel hides them."""
+    try:
+        text = Path(f"/proc/{pid}/io").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    counters = {}
+    for line in text.splitlines():
+        key, _, value = line.partition(":")
+        if value.strip().isdigit():
+            counters[key.strip()] = int(value)
+    return counters
+
+
+async def sample_file_size(path: Path, samples: list[int], stop: asyncio.Event, interval: float) -> None:
+    while not stop.is_set():
+        try:
+            samples.append(path.stat().st_size)
+        except OSError:
+            pass
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_client(
+    client: httpx.AsyncClient,
+    client_id: str,
+    stats: dict[str, OperationStats],
+    *,
+    rounds: int,
+    panels: int,
+) -> None:
+    async def timed(operation: str, method: str, url: str, **kwargs: Any) -> httpx.Response | None:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as exc:
+            stats[operation].record(type(exc).__name__, 0.0, ok=False)
+            return None
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        stats[operation].record(response.status_code, elapsed_ms, ok=response.status_code == 200)
+        return response if response.status_code == 200 else None
+
+    for round_ in range(rounds):
+        body = json.dumps(client_state(client_id, round_, panels))
+        if await timed("upsert", "PUT", "/api/v1/ui/state", content=body,
+                       headers={"Content-Type": "application/json"}) is not None:
+            stats["upsert"].mutations += 1
+            stats["upsert"].payload_bytes += len(body)
+
+        commands = (
+            {"kind": "focus_panel", "panel_id": "panel-0"},
+            {"kind": "open_panel", "component": "editor", "params": {"path": f"file-{round_}.py"}},
+        )
+        for command in commands:
+            body = json.dumps({"client_id": client_id, "command": command})
+            if await timed("enqueue", "POST", "/api/v1/ui/commands", content=body,
+                           headers={"Content-Type": "application/json"}) is not None:
+                stats["enqueue"].mutations += 1
+                stats["enqueue"].payload_bytes += len(body)
+
+        for _ in commands:
+            response = await timed("pop", "GET", "/api/v1/ui/commands/next", params={"client_id": client_id})
+            # Popping an empty queue does not persist, so only count real pops.
+            if response is not None and response.json().get("command"):
+                stats["pop"].mutations += 1
+                stats["pop"].payload_bytes += len(json.dumps(response.json()["command"]))
+
+
+async def benchmark_clients(
+    port: int,
+    pid: int,
+    state_path: Path,
+    clients: int,
+    *,
+    rounds: int,
+    panels: int,
+    sample_interval: float,
+) -> dict[str, Any]:
+    cookie = await get_session_cookie(port)
+    stats = {operation: OperationStats() for operation in OPERATIONS}
+    size_samples: list[int] = []
+    stop = asyncio.Event()
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    io_before = read_proc_io(pid)
+
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}",
+        cookies={"boring_session": cookie},
+        timeout=30.0,
+        limits=limits,
+    ) as client:
+        sampler = asyncio.create_task(sample_file_size(state_path, size_samples, stop, sample_interval))
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            run_client(client, f"bench-client-{index}", stats, rounds=rounds, panels=panels)
+            for index in range(clients)
+        ))
+        wall_seconds = time.perf_counter() - started
+        stop.set()
+        await sampler
+
+    io_after = read_proc_io(pid)
+    try:
+        size_samples.append(state_path.stat().st_size)
+    except OSError:
+        pass
+
+    mutations = sum(item.mutations for item in stats.values())
+    requests = sum(len(item.latencies_ms) + item.errors for item in stats.values())
+    proc_io = None
+    if io_before is not None and io_after is not None:
+        proc_io = {key: io_after[key] - io_before.get(key, 0) for key in ("wchar", "write_bytes") if key in io_after}
+    return {
+        "clients": clients,
+        "rounds_per_client": rounds,
+        "wall_seconds": wall_seconds,
+        "throughput_rps": 0.0 if wall_seconds <= 0 else requests / wall_seconds,
+        "mutations_per_second": 0.0 if wall_seconds <= 0 else mutations / wall_seconds,
+        "operations": {operation: stats[operation].summary(wall_seconds) for operation in OPERATIONS},
+        "persistence": write_amplification(
+            mutations, size_samples, sum(item.payload_bytes for item in stats.values()),
+        ),
+        "proc_io_delta": proc_io,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the UI state command queue and emit perf-uistate.json.")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--port", type=int, default=18125)
+    parser.add_argument("--startup-timeout", type=float, default=10.0)
+    parser.add_argument("--clients", default="1,10,50,200", help="Comma-separated client_id counts to sweep")
+    parser.add_argument("--rounds", type=int, default=20, help="Upsert/enqueue/pop rounds per client")
+    parser.add_argument("--panels", type=int, default=4, help="Open panels in each published state")
+    parser.add_argument("--sample-interval", type=float, default=0.02, help="State file size sampling period")
+    parser.add_argument("--keep-workspaces", action="store_true")
+    return parser.parse_args()
+
+
+async def run_main() -> dict[str, Any]:
+    args = parse_args()
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    client_counts = parse_int_list(args.clients)
+    ensure_port_free(args.port)
+    binary = build_server_binary()
+    scratch = Path(tempfile.mkdtemp(prefix="boring-ui-uistate-bench-"))
+
+    runs = []
+    try:
+        for clients in client_counts:
+            # Fresh workspace per level so the state file starts empty each time.
+            config_path = prepare_workspace_root(scratch / f"clients-{clients}")
+            handle = start_server(binary, args.port, config_path=config_path)
+            try:
+                wait_for_health(args.port, args.startup_timeout)
+                run = await benchmark_clients(
+                    args.port,
+                    handle.process.pid,
+                    config_path.parent / STATE_FILE,
+                    clients,
+                    rounds=args.rounds,
+                    panels=args.panels,
+                    sample_interval=args.sample_interval,
+                )
+            finally:
+                stop_server(handle)
+            run["server_log"] = str(handle.log_path)
+            runs.append(run)
+    finally:
+        if not args.keep_workspaces:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    results = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "binary": str(binary),
+        "rounds_per_client": args.rounds,
+        "panels": args.panels,
+        "runs": runs,
+    }
+    output_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return results
+
+
+def main() -> None:
+    results = asyncio.run(run_main())
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
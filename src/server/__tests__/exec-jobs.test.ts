@@ -216,6 +216,44 @@ describe('GET /api/v1/exec/jobs/:jobId', () => {
     const body = JSON.parse(res.payload)
     expect(body.code).toBe('INVALID_CURSOR')
   })
+  it('long-polls with wait_ms until new output arrives', async () => {
+    token = await testSessionCookie(); app = createApp({ config: testConfig(), skipValidation: true })
+    const startRes = await app.inject({
+      cookies: { boring_session: token },
+      method: 'POST',
+      url: '/api/v1/exec/start',
+      payload: { command: 'sleep 0.3 && echo "late"' },
+    })
+    const { job_id } = JSON.parse(startRes.payload)
+
+    const started = Date.now()
+    const res = await app.inject({
+      cookies: { boring_session: token },
+      method: 'GET',
+      url: `/api/v1/exec/jobs/${job_id}?after=0&wait_ms=5000`,
+    })
+    const elapsed = Date.now() - started
+
+    expect(res.statusCode).toBe(200)
+    const body = JSON.parse(res.payload)
+    expect(body.wait_ms).toBe(5000)
+    expect(body.chunks.join('')).toContain('late')
+    expect(elapsed).toBeGreaterThanOrEqual(200)
+    expect(elapsed).toBeLessThan(5000)
+  })
+
+  it('rejects invalid wait_ms values', async () => {
+    token = await testSessionCookie(); app = createApp({ config: testConfig(), skipValidation: true })
+    const res = await app.inject({
+      cookies: { boring_session: token },
+      method: 'GET',
+      url: '/api/v1/exec/jobs/nonexistent-id?wait_ms=-5',
+    })
+
+    expect(res.statusCode).toBe(400)
+    const body = JSON.parse(res.payload)
+    expect(body.code).toBe('INVALID_WAIT')
+  })
 })
 
 // ---------------------------------------------------------------------------
@@ -4,12 +4,13 @@
  * Short exec: POST /exec → synchronous result
  * Long-running: POST /exec/start → jobId, GET /exec/jobs/:id → chunks,
  *               POST /exec/jobs/:id/cancel → cancelled
+ *               GET /exec/jobs/:id?wait_ms=N long-polls until new output
  */
 import type { FastifyInstance, FastifyReply, FastifyRequest } from 'fastify'
 import { execInSandbox } from '../adapters/bwrapImpl.js'
 import { resolve } from 'node:path'
 import { realpathSync, statSync } from 'node:fs'
-import { startJob, readJob, cancelJob } from '../jobs/execJob.js'
+import { startJob, readJob, readJobWait, cancelJob, MAX_JOB_WAIT_MS } from '../jobs/execJob.js'
 import {
   getWorkspaceRoot,
   hasBwrap,
@@ -165,7 +166,9 @@ export async function registerExecRoutes(app: FastifyInstance): Promise<void> {
   })
 
   // GET /exec/jobs/:jobId — Read output chunks from a job
-  app.get<{ Params: { jobId: string }; Querystring: { after?: string } }>(
+  // Optional wait_ms long-polls for new output; the response echoes the
+  // effective wait so clients can tell the server supports it.
+  app.get<{ Params: { jobId: string }; Querystring: { after?: string; wait_ms?: string } }>(
     '/exec/jobs/:jobId',
     async (request, reply) => {
       const { jobId } = request.params
@@ -179,7 +182,20 @@ export async function registerExecRoutes(app: FastifyInstance): Promise<void> {
         })
       }
 
-      const result = readJob(jobId, after)
+      const waitStr = (request.query as any).wait_ms
+      const waitMs = waitStr ? parseInt(waitStr, 10) : undefined
+      if (waitMs !== undefined && (!Number.isFinite(waitMs) || waitMs < 0)) {
+        return reply.code(400).send({
+          error: 'validation',
+          code: 'INVALID_WAIT',
+          message: 'wait_ms must be a non-negative integer',
+        })
+      }
+
+      const effectiveWait = waitMs === undefined ? undefined : Math.min(waitMs, MAX_JOB_WAIT_MS)
+      const result = effectiveWait === undefined
+        ? readJob(jobId, after)
+        : await readJobWait(jobId, after, effectiveWait)
       if (!result) {
         return reply.code(404).send({
           error: 'not_found',
@@ -188,7 +204,7 @@ export async function registerExecRoutes(app: FastifyInstance): Promise<void> {
         })
       }
 
-      return result
+      return effectiveWait === undefined ? result : { ...result, wait_ms: effectiveWait }
     },
   )
 
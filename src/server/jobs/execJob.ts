@@ -44,6 +44,18 @@ const jobs = new Map<string, ExecJob>()
 
 const JOB_TTL_MS = 10 * 60 * 1000 // 10 minutes
 const MAX_JOB_OUTPUT_BYTES = 50 * 1024 * 1024 // 50MB per job
+/** Upper bound for long-poll reads (kept below typical proxy idle timeouts). */
+export const MAX_JOB_WAIT_MS = 25_000
+
+/** Long-poll readers waiting for new output or a state change, by job ID. */
+const jobWaiters = new Map<string, Set<() => void>>()
+
+function notifyJob(jobId: string): void {
+  const waiters = jobWaiters.get(jobId)
+  if (!waiters) return
+  jobWaiters.delete(jobId)
+  for (const wake of waiters) wake()
+}
 
 /** Periodically clean up finished jobs older than TTL. */
 function gcOldJobs(): void {
@@ -51,6 +63,7 @@ function gcOldJobs(): void {
   for (const [id, job] of jobs) {
     if (job.endedAt && now - job.endedAt > JOB_TTL_MS) {
       jobs.delete(id)
+      notifyJob(id)
     }
   }
 }
@@ -122,6 +135,7 @@ export function startJob(
       job.chunks.push(data.toString('utf-8'))
       job.totalBytes += data.length
     }
+    notifyJob(id)
   }
 
   proc.stdout?.on('data', captureData)
@@ -134,6 +148,7 @@ export function startJob(
     job.state = code === 0 ? 'completed' : 'failed'
     job.endedAt = Date.now()
     job.process = undefined
+    notifyJob(id)
   })
 
   proc.on('error', (err) => {
@@ -143,6 +158,7 @@ export function startJob(
     job.exitCode = 1
     job.endedAt = Date.now()
     job.process = undefined
+    notifyJob(id)
   })
 
   jobs.set(id, job)
@@ -174,6 +190,36 @@ export function readJob(
   }
 }
 
+/**
+ * Long-poll variant of readJob: if nothing new is available after the
+ * cursor and the job is still running, wait up to `waitMs` for output or
+ * a state change before reading.
+ */
+export async function readJobWait(
+  jobId: string,
+  afterCursor: number | undefined,
+  waitMs: number,
+): Promise<JobReadResult | null> {
+  const first = readJob(jobId, afterCursor)
+  if (!first || first.done || first.chunks.length > 0 || waitMs <= 0) return first
+
+  await new Promise<void>((resolve) => {
+    let waiters = jobWaiters.get(jobId)
+    if (!waiters) {
+      waiters = new Set()
+      jobWaiters.set(jobId, waiters)
+    }
+    const wake = () => {
+      clearTimeout(timer)
+      jobWaiters.get(jobId)?.delete(wake)
+      resolve()
+    }
+    const timer = setTimeout(wake, Math.min(waitMs, MAX_JOB_WAIT_MS))
+    waiters.add(wake)
+  })
+  return readJob(jobId, afterCursor)
+}
+
 /**
  * Cancel a running job.
  */
@@ -187,6 +233,7 @@ export function cancelJob(jobId: string): boolean {
   // Set state FIRST to prevent race with 'close' handler
   job.state = 'cancelled'
   job.endedAt = Date.now()
+  notifyJob(jobId)
 
   if (job.process && !job.process.killed) {
     job.process.kill('SIGTERM')
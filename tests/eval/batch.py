@@ -0,0 +1,514 @@
+"""Batch eval runner: many child-app evals concurrently with isolation.
+
+Schedules ``runs`` evals per profile across a worker pool and aggregates
+the resulting ``EvalResult``s into a single matrix report.
+
+Isolation:
+    - Every run gets its own projects root, so sibling project directories
+      never show up in another run's scope-hygiene snapshots
+    - Every run gets its own evidence dir under the batch root
+    - Local validation ports are leased per run (see
+      ``eval_child_app._acquire_trusted_local_auth_port``)
+    - Runs that deploy hold a Fly slot, and every run holds a Neon slot,
+      for their whole lifetime — the agent provisions both during its own
+      session, so the harness can only cap how many such runs overlap
+
+Jobs are interleaved round-robin across profiles so a long queue for one
+profile never starves the others.
+
+Usage::
+
+    python tests/eval/batch.py --profiles core auth-plus --runs 10 --workers 4
+    python tests/eval/batch.py --profiles core --runs 20 --max-fly-deploys 2 --skip-deploy
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.eval.contracts import EvalResult, NamingContract, _rand8, _utc_now_compact
+from tests.eval.eval_child_app import (
+    DEFAULT_AGENT_TIMEOUT,
+    DEFAULT_CLEANUP_TIMEOUT,
+    DEFAULT_VERIFY_TIMEOUT,
+    TRUSTED_LOCAL_AUTH_PORTS,
+    run_eval,
+)
+from tests.eval.eval_logger import EvalLogger
+from tests.eval.reason_codes import CheckStatus
+from tests.eval.results_store import default_results_db
+from tests.eval.runners.base import AgentRunner
+from tests.eval.sweeper import BATCH_DIRNAME
+
+
+PROFILES = ("core", "auth-plus", "full-stack", "extensible")
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_FLY_DEPLOYS = 2
+DEFAULT_MAX_NEON_PROJECTS = 4
+
+#: Upper bounds (exclusive) of the core-score histogram buckets.
+SCORE_BUCKETS = (0.2, 0.4, 0.6, 0.8, 1.0)
+
+
+# ---------------------------------------------------------------------------
+# Jobs and outcomes
+# ---------------------------------------------------------------------------
+
+@dataclass
+class BatchJob:
+    """A single scheduled eval within a batch."""
+
+    profile: str
+    index: int                     # 0-based run index within the profile
+    eval_id: str
+    projects_root: str
+    evidence_dir: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "profile": self.profile,
+            "index": self.index,
+            "eval_id": self.eval_id,
+            "projects_root": self.projects_root,
+            "evidence_dir": self.evidence_dir,
+        }
+
+
+@dataclass
+class BatchRunOutcome:
+    """Result (or harness failure) of one batch job."""
+
+    job: BatchJob
+    result: EvalResult | None = None
+    error: str = ""
+    elapsed_s: float = 0.0
+    queued_s: float = 0.0          # time spent waiting for slots
+
+    @property
+    def status(self) -> CheckStatus:
+        return self.result.status if self.result else CheckStatus.ERROR
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **self.job.to_dict(),
+            "status": self.status.value,
+            "core_score": self.result.core_score if self.result else None,
+            "overall_score": self.result.overall_score if self.result else None,
+            "status_detail": self.result.status_detail if self.result else self.error,
+            "elapsed_s": self.elapsed_s,
+            "queued_s": self.queued_s,
+        }
+
+
+@dataclass
+class BatchLimits:
+    """Concurrency caps shared by every job in a batch."""
+
+    workers: int = DEFAULT_WORKERS
+    max_fly_deploys: int = DEFAULT_MAX_FLY_DEPLOYS
+    max_neon_projects: int = DEFAULT_MAX_NEON_PROJECTS
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "max_fly_deploys": self.max_fly_deploys,
+            "max_neon_projects": self.max_neon_projects,
+            "local_auth_ports": len(TRUSTED_LOCAL_AUTH_PORTS),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Scheduling
+# ---------------------------------------------------------------------------
+
+def plan_jobs(
+    profiles: list[str],
+    runs_per_profile: int,
+    batch_root: str | Path,
+) -> list[BatchJob]:
+    """Build the job list, interleaved round-robin across profiles."""
+    batch_root = Path(batch_root)
+    jobs: list[BatchJob] = []
+    for index in range(runs_per_profile):
+        for profile in profiles:
+            naming = NamingContract.from_eval_id(projects_root=str(batch_root))
+            run_root = batch_root / "runs" / naming.app_slug
+            jobs.append(BatchJob(
+                profile=profile,
+                index=index,
+                eval_id=naming.eval_id,
+                projects_root=str(run_root),
+                evidence_dir=str(run_root / ".eval-evidence" / naming.app_slug),
+            ))
+    return jobs
+
+
+async def _execute_jobs(
+    jobs: list[BatchJob],
+    limits: BatchLimits,
+    run_job: Callable[[BatchJob], Any],
+    *,
+    needs_fly: bool,
+    logger: EvalLogger | None = None,
+) -> list[BatchRunOutcome]:
+    queue: asyncio.Queue[BatchJob] = asyncio.Queue()
+    for job in jobs:
+        queue.put_nowait(job)
+
+    neon_slots = asyncio.Semaphore(max(1, limits.max_neon_projects))
+    fly_slots = asyncio.Semaphore(max(1, limits.max_fly_deploys))
+    outcomes: dict[str, BatchRunOutcome] = {}
+
+    async def _worker() -> None:
+        while True:
+            try:
+                job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            queued_at = time.monotonic()
+            async with neon_slots:
+                if needs_fly:
+                    await fly_slots.acquire()
+                started = time.monotonic()
+                outcome = BatchRunOutcome(job=job, queued_s=started - queued_at)
+                if logger:
+                    logger.info(f"Batch: starting {job.profile}#{job.index} {job.eval_id}")
+                try:
+                    outcome.result = await run_job(job)
+                except Exception as exc:
+                    outcome.error = f"{type(exc).__name__}: {exc}"
+                finally:
+                    outcome.elapsed_s = time.monotonic() - started
+                    if needs_fly:
+                        fly_slots.release()
+            outcomes[job.eval_id] = outcome
+            if logger:
+                logger.info(
+                    f"Batch: finished {job.profile}#{job.index} "
+                    f"{outcome.status.value} ({outcome.elapsed_s:.1f}s)"
+                )
+
+    workers = max(1, min(limits.workers, len(jobs)))
+    await asyncio.gather(*(_worker() for _ in range(workers)))
+    return [outcomes[job.eval_id] for job in jobs if job.eval_id in outcomes]
+
+
+# ---------------------------------------------------------------------------
+# Aggregation
+# ---------------------------------------------------------------------------
+
+def _quantile(sorted_values: list[float], q: float) -> float:
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = q * (len(sorted_values) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def score_distribution(scores: list[float]) -> dict[str, Any]:
+    """Summarise a list of 0.0–1.0 scores."""
+    if not scores:
+        return {"count": 0}
+    ordered = sorted(scores)
+    histogram: dict[str, int] = {}
+    lower = 0.0
+    for upper in SCORE_BUCKETS:
+        label = f"{lower:.1f}-{upper:.1f}"
+        histogram[label] = sum(
+            1 for s in ordered
+            if lower <= s < upper or (upper == SCORE_BUCKETS[-1] and s == upper)
+        )
+        lower = upper
+    return {
+        "count": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.pstdev(ordered),
+        "min": ordered[0],
+        "p25": _quantile(ordered, 0.25),
+        "p50": _quantile(ordered, 0.50),
+        "p75": _quantile(ordered, 0.75),
+        "max": ordered[-1],
+        "histogram": histogram,
+    }
+
+
+def build_matrix_report(
+    outcomes: list[BatchRunOutcome],
+    *,
+    batch_id: str,
+    limits: BatchLimits,
+    elapsed_s: float = 0.0,
+) -> dict[str, Any]:
+    """Aggregate batch outcomes into a profile × metric matrix."""
+    by_profile: dict[str, list[BatchRunOutcome]] = {}
+    for outcome in outcomes:
+        by_profile.setdefault(outcome.job.profile, []).append(outcome)
+
+    profiles: dict[str, Any] = {}
+    for profile, runs in by_profile.items():
+        statuses: dict[str, int] = {}
+        for run in runs:
+            statuses[run.status.value] = statuses.get(run.status.value, 0) + 1
+
+        check_totals: dict[str, dict[str, int]] = {}
+        for run in runs:
+            if run.result is None:
+                continue
+            for check in run.result.checks:
+                row = check_totals.setdefault(check.id, {"runs": 0, "passed": 0, "failed": 0})
+                if check.status in (CheckStatus.SKIP, CheckStatus.INVALID):
+                    continue
+                row["runs"] += 1
+                if check.status == CheckStatus.PASS:
+                    row["passed"] += 1
+                else:
+                    row["failed"] += 1
+
+        scored = [run.result for run in runs if run.result is not None]
+        profiles[profile] = {
+            "runs": len(runs),
+            "pass_rate": statuses.get(CheckStatus.PASS.value, 0) / len(runs),
+            "statuses": statuses,
+            "harness_errors": [run.error for run in runs if run.error],
+            "core_score": score_distribution([r.core_score for r in scored]),
+            "overall_score": score_distribution([r.overall_score for r in scored]),
+            "elapsed_s": score_distribution([run.elapsed_s for run in runs]),
+            "checks": {
+                check_id: {
+                    **row,
+                    "pass_rate": row["passed"] / row["runs"] if row["runs"] else None,
+                }
+                for check_id, row in sorted(check_totals.items())
+            },
+        }
+
+    return {
+        "batch_id": batch_id,
+        "limits": limits.to_dict(),
+        "elapsed_s": elapsed_s,
+        "total_runs": len(outcomes),
+        "pass_rate": (
+            sum(1 for o in outcomes if o.status == CheckStatus.PASS) / len(outcomes)
+            if outcomes
+            else 0.0
+        ),
+        "profiles": profiles,
+        "runs": [outcome.to_dict() for outcome in outcomes],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+async def run_batch(
+    profiles: list[str],
+    runs_per_profile: int,
+    *,
+    projects_root: str = "/home/ubuntu/projects",
+    batch_root: str | None = None,
+    limits: BatchLimits | None = None,
+    agent_timeout: int = DEFAULT_AGENT_TIMEOUT,
+    verify_timeout: int = DEFAULT_VERIFY_TIMEOUT,
+    cleanup_timeout: int = DEFAULT_CLEANUP_TIMEOUT,
+    skip_deploy: bool = False,
+    skip_cleanup: bool = False,
+    runner_factory: Callable[[BatchJob], AgentRunner | None] | None = None,
+    verbose: bool = False,
+    quiet: bool = False,
+) -> dict[str, Any]:
+    """Run ``runs_per_profile`` evals for every profile and write the report.
+
+    Returns the matrix report, also written to ``<batch_root>/batch_report.json``.
+    """
+    limits = limits or BatchLimits()
+    batch_id = f"batch-{_utc_now_compact()}-{_rand8()}"
+    if batch_root is None:
+        batch_root = str(Path(projects_root) / BATCH_DIRNAME / batch_id)
+    Path(batch_root).mkdir(parents=True, exist_ok=True)
+
+    logger = EvalLogger(evidence_dir=batch_root, eval_id=batch_id, verbose=verbose, quiet=quiet)
+    # Runs get isolated projects roots; results still land in the fleet store.
+    results_db = str(default_results_db(projects_root))
+    jobs = plan_jobs(profiles, runs_per_profile, batch_root)
+    logger.info(
+        f"Batch started: {batch_id} ({len(jobs)} runs, profiles={','.join(profiles)}, "
+        f"workers={limits.workers})"
+    )
+
+    async def _run_job(job: BatchJob) -> EvalResult:
+        return await run_eval(
+            profile=job.profile,
+            eval_id=job.eval_id,
+            evidence_dir=job.evidence_dir,
+            projects_root=job.projects_root,
+            agent_timeout=agent_timeout,
+            verify_timeout=verify_timeout,
+            cleanup_timeout=cleanup_timeout,
+            skip_deploy=skip_deploy,
+            skip_cleanup=skip_cleanup,
+            runner=runner_factory(job) if runner_factory else None,
+            quiet=True,
+            results_db=results_db,
+        )
+
+    start = time.monotonic()
+    outcomes = await _execute_jobs(
+        jobs,
+        limits,
+        _run_job,
+        needs_fly=not skip_deploy,
+        logger=logger,
+    )
+    report = build_matrix_report(
+        outcomes,
+        batch_id=batch_id,
+        limits=limits,
+        elapsed_s=time.monotonic() - start,
+    )
+    path = Path(batch_root) / "batch_report.json"
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    for profile, row in report["profiles"].items():
+        core = row["core_score"]
+        logger.info(
+            f"Batch {profile}: pass_rate={row['pass_rate']:.0%} runs={row['runs']} "
+            + (f"core p50={core['p50']:.0%} min={core['min']:.0%}" if core.get("count") else "no scores")
+        )
+    logger.info(f"Batch report: {path}")
+    return report
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="batch",
+        description="Run many child-app evals concurrently and aggregate a matrix report",
+    )
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        choices=PROFILES,
+        default=["core"],
+        help="Profiles to evaluate (default: core)",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Runs per profile (default: 5)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Concurrent evals (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--max-fly-deploys",
+        type=int,
+        default=DEFAULT_MAX_FLY_DEPLOYS,
+        help=f"Concurrent runs allowed to deploy to Fly (default: {DEFAULT_MAX_FLY_DEPLOYS})",
+    )
+    parser.add_argument(
+        "--max-neon-projects",
+        type=int,
+        default=DEFAULT_MAX_NEON_PROJECTS,
+        help=f"Concurrent runs allowed to own a Neon project (default: {DEFAULT_MAX_NEON_PROJECTS})",
+    )
+    parser.add_argument(
+        "--projects-root",
+        default="/home/ubuntu/projects",
+        help="Root directory for generated projects",
+    )
+    parser.add_argument(
+        "--batch-root",
+        help=(
+            "Batch output directory (default: <projects-root>/.eval-batch/<batch-id>, "
+            "the only location the orphan sweeper scans)"
+        ),
+    )
+    parser.add_argument(
+        "--agent-timeout",
+        type=int,
+        default=DEFAULT_AGENT_TIMEOUT,
+        help=f"Agent execution timeout in seconds (default: {DEFAULT_AGENT_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--verification-timeout",
+        type=int,
+        default=DEFAULT_VERIFY_TIMEOUT,
+        help=f"Verification timeout in seconds (default: {DEFAULT_VERIFY_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--cleanup-timeout",
+        type=int,
+        default=DEFAULT_CLEANUP_TIMEOUT,
+        help=f"Cleanup timeout in seconds (default: {DEFAULT_CLEANUP_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--skip-deploy",
+        action="store_true",
+        help="Skip deployment and live validation",
+    )
+    parser.add_argument(
+        "--skip-cleanup",
+        action="store_true",
+        help="Skip resource cleanup after each eval",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Verbose logging (DEBUG level)",
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Suppress console output",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point. Returns 0 when every run passed, 1 otherwise."""
+    args = build_parser().parse_args(argv)
+    report = asyncio.run(run_batch(
+        args.profiles,
+        args.runs,
+        projects_root=args.projects_root,
+        batch_root=args.batch_root,
+        limits=BatchLimits(
+            workers=args.workers,
+            max_fly_deploys=args.max_fly_deploys,
+            max_neon_projects=args.max_neon_projects,
+        ),
+        agent_timeout=args.agent_timeout,
+        verify_timeout=args.verification_timeout,
+        cleanup_timeout=args.cleanup_timeout,
+        skip_deploy=args.skip_deploy,
+        skip_cleanup=args.skip_cleanup,
+        verbose=args.verbose,
+        quiet=args.quiet,
+    ))
+    return 0 if report["total_runs"] and report["pass_rate"] == 1.0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
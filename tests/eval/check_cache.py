@@ -0,0 +1,323 @@
+"""Check-result caching keyed on input fingerprints.
+
+Pure check groups (scaffolding, workflow, security, report quality) are
+deterministic functions of what they read: project files, the agent
+transcript, command log, selected manifest fields and evidence files.
+Each group declares those inputs as a module-level ``CACHE_INPUTS``;
+``CheckCache.run`` fingerprints them and replays the stored
+``CheckResult`` list when nothing changed.
+
+The fingerprint also covers the check module source, the ``tests.eval``
+modules it imports from and the check catalog, so editing a check (or its
+weight) invalidates its cache entry.
+Live checks (local dev, deployment, custom pane/tool) are never cached.
+
+Cache file: ``<evidence_dir>/check_cache.json``. It also stores the
+project index (``relpath -> [size, mtime_ns, sha256]``) so unchanged
+files are not re-hashed on the next verification. Re-verification opens
+it ``read_only`` so the original evidence dir is never modified.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from tests.eval.contracts import CheckResult, RunManifest, _serialise
+
+
+CACHE_FILENAME = "check_cache.json"
+CACHE_VERSION = 1
+
+#: Directories whose files are fingerprinted by stat (size, mtime) only.
+#: They are large and rarely edited by hand; a content change still moves
+#: their mtime.
+STAT_ONLY_DIRS = frozenset({
+    ".git",
+    ".mypy_cache",
+    ".next",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".turbo",
+    ".venv",
+    "__pycache__",
+    "dist",
+    "node_modules",
+})
+
+_CATALOG_SOURCE = Path(__file__).resolve().parent / "check_catalog.py"
+
+
+@dataclass(frozen=True)
+class CheckInputs:
+    """Declared inputs of a pure check group.
+
+    Attributes:
+        manifest_fields: RunManifest attributes the checks read.
+        project_tree: Whether the checks read files under ``project_root``.
+        evidence_globs: Evidence-dir globs the checks read (relative).
+        args: Keyword arguments of the ``run_*_checks`` function that feed
+            the checks (transcript, command log, snapshots, ...).
+        secrets: Whether results depend on the SecretRegistry contents.
+    """
+
+    manifest_fields: tuple[str, ...] = ()
+    project_tree: bool = False
+    evidence_globs: tuple[str, ...] = ()
+    args: tuple[str, ...] = ()
+    secrets: bool = False
+
+
+@dataclass
+class CacheStats:
+    """Per-run cache outcome, keyed by check group."""
+
+    hits: list[str] = field(default_factory=list)
+    misses: list[str] = field(default_factory=list)
+    reused_checks: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": list(self.hits),
+            "misses": list(self.misses),
+            "reused_checks": self.reused_checks,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Hashing helpers
+# ---------------------------------------------------------------------------
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _canonical(value: Any) -> Any:
+    """Normalise a check argument for hashing (sets become sorted lists)."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(_canonical(v) for v in value)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return _serialise(value)
+
+
+def _source_files(module: Any) -> list[Path]:
+    """Source files whose edits must invalidate *module*'s cached results.
+
+    The check module itself, the catalog, and every ``tests.eval`` module
+    it imports names from (parsing, report schema, redaction, ...).
+    """
+    files = {Path(inspect.getfile(module)).resolve(), _CATALOG_SOURCE}
+    for obj in vars(module).values():
+        dep = obj if inspect.ismodule(obj) else sys.modules.get(getattr(obj, "__module__", "") or "")
+        if dep is None or not dep.__name__.startswith("tests.eval"):
+            continue
+        dep_file = getattr(dep, "__file__", None)
+        if dep_file:
+            files.add(Path(dep_file).resolve())
+    return sorted(files)
+
+
+def _digest_json(value: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def index_project_tree(
+    root: Path,
+    previous: dict[str, list[Any]] | None = None,
+) -> dict[str, list[Any]]:
+    """Index every file under *root* as ``relpath -> [size, mtime_ns, sha256]``.
+
+    Hashes from *previous* are reused when size and mtime are unchanged.
+    Symlinks are recorded by target and never followed; files inside
+    ``STAT_ONLY_DIRS`` get an empty hash and rely on their stat signature.
+    """
+    previous = previous or {}
+    index: dict[str, list[Any]] = {}
+    if not root.is_dir():
+        return index
+
+    for current_root, dirnames, filenames in os.walk(root, topdown=True, followlinks=False):
+        current = Path(current_root)
+        rel_dir = current.relative_to(root)
+        stat_only = any(part in STAT_ONLY_DIRS for part in rel_dir.parts)
+        for name in sorted(dirnames):
+            path = current / name
+            if path.is_symlink():
+                index[str(rel_dir / name)] = [0, 0, f"link:{os.readlink(path)}"]
+        dirnames[:] = [d for d in dirnames if not (current / d).is_symlink()]
+
+        for name in filenames:
+            path = current / name
+            rel = str(rel_dir / name)
+            if path.is_symlink():
+                index[rel] = [0, 0, f"link:{os.readlink(path)}"]
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            prior = previous.get(rel)
+            if prior and prior[0] == st.st_size and prior[1] == st.st_mtime_ns:
+                index[rel] = prior
+            elif stat_only:
+                index[rel] = [st.st_size, st.st_mtime_ns, ""]
+            else:
+                try:
+                    index[rel] = [st.st_size, st.st_mtime_ns, _sha256_file(path)]
+                except OSError:
+                    continue
+    return index
+
+
+def _tree_digest(index: dict[str, list[Any]]) -> str:
+    """Digest of a project index. Stat fields count only for stat-only files."""
+    digest = hashlib.sha256()
+    for rel in sorted(index):
+        size, mtime_ns, content = index[rel]
+        marker = content or f"stat:{size}:{mtime_ns}"
+        digest.update(f"{rel}\0{marker}\0".encode())
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# CheckCache
+# ---------------------------------------------------------------------------
+
+class CheckCache:
+    """Evidence-dir cache of CheckResults for pure check groups."""
+
+    def __init__(
+        self,
+        evidence_dir: str | Path,
+        *,
+        enabled: bool = True,
+        read_only: bool = False,
+    ) -> None:
+        self._path = Path(evidence_dir) / CACHE_FILENAME
+        self.enabled = enabled
+        self.read_only = read_only
+        self.stats = CacheStats()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._project_index: dict[str, list[Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return
+        self._entries = data.get("entries") or {}
+        self._project_index = data.get("project_index") or {}
+
+    def save(self) -> None:
+        """Persist entries and the project index (no-op when ``read_only``)."""
+        if self.read_only:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({
+                "version": CACHE_VERSION,
+                "entries": self._entries,
+                "project_index": self._project_index,
+            }),
+            encoding="utf-8",
+        )
+        tmp.replace(self._path)
+
+    def fingerprint(
+        self,
+        group: str,
+        inputs: CheckInputs,
+        sources: list[Path],
+        manifest: RunManifest,
+        kwargs: dict[str, Any],
+    ) -> str:
+        """Hash every declared input of *group* into one fingerprint."""
+        parts: dict[str, Any] = {
+            "group": group,
+            "sources": {str(p): _sha256_file(p) for p in sources},
+            "manifest": {f: getattr(manifest, f) for f in inputs.manifest_fields},
+            "args": {name: _canonical(kwargs.get(name)) for name in inputs.args},
+        }
+        if inputs.project_tree:
+            self._project_index = index_project_tree(
+                Path(manifest.project_root),
+                self._project_index,
+            )
+            parts["project_tree"] = _tree_digest(self._project_index)
+        if inputs.evidence_globs:
+            evidence = Path(manifest.evidence_dir)
+            files = sorted({
+                p for pattern in inputs.evidence_globs for p in evidence.glob(pattern)
+                if p.is_file() and p.name != CACHE_FILENAME
+            })
+            parts["evidence"] = {
+                str(p.relative_to(evidence)): _sha256_file(p) for p in files
+            }
+        if inputs.secrets:
+            parts["secrets"] = kwargs["registry"].fingerprint()
+        return _digest_json(parts)
+
+    def run(
+        self,
+        check_fn: Callable[..., list[CheckResult]],
+        manifest: RunManifest,
+        **kwargs: Any,
+    ) -> list[CheckResult]:
+        """Run ``check_fn(manifest, **kwargs)`` or replay its cached results.
+
+        *check_fn*'s module must define ``CACHE_INPUTS``; passing a keyword
+        argument that is not declared there raises ``ValueError`` so a
+        missing declaration cannot silently produce stale hits.
+        """
+        module = sys.modules[check_fn.__module__]
+        inputs: CheckInputs = module.CACHE_INPUTS
+        group = module.__name__.rsplit(".", 1)[-1]
+        undeclared = set(kwargs) - set(inputs.args) - ({"registry"} if inputs.secrets else set())
+        if undeclared:
+            raise ValueError(
+                f"{group}: undeclared check inputs {sorted(undeclared)}"
+            )
+
+        if not self.enabled:
+            return check_fn(manifest, **kwargs)
+
+        fingerprint = self.fingerprint(
+            group,
+            inputs,
+            _source_files(module),
+            manifest,
+            kwargs,
+        )
+        entry = self._entries.get(group)
+        if entry and entry.get("fingerprint") == fingerprint:
+            results = [CheckResult.from_dict(c) for c in entry["checks"]]
+            self.stats.hits.append(group)
+            self.stats.reused_checks += len(results)
+            return results
+
+        results = check_fn(manifest, **kwargs)
+        self._entries[group] = {
+            "fingerprint": fingerprint,
+            "checks": [c.to_dict() for c in results],
+        }
+        self.stats.misses.append(group)
+        return results
@@ -9,6 +9,7 @@ from typing import Any
 from tests.eval.check_catalog import CATALOG
 from tests.eval.contracts import CheckResult, RunManifest
 from tests.eval.reason_codes import Attribution, CheckStatus
+from tests.eval.timing import run_checks
 
 
 class CustomPaneContext:
@@ -34,15 +35,15 @@ class CustomPaneContext:
 
 def run_custom_pane_checks(ctx: CustomPaneContext) -> list[CheckResult]:
     """Run all custom pane checks for the extensible profile."""
-    return [
-        _check_file_exists(ctx),
-        _check_default_export(ctx),
-        _check_in_capabilities(ctx),
-        _check_renders_eval_id(ctx),
-        _check_calls_backend(ctx),
-        _check_no_import_errors(ctx),
-        _check_live_capabilities(ctx),
-    ]
+    return run_checks(ctx, [
+        _check_file_exists,
+        _check_default_export,
+        _check_in_capabilities,
+        _check_renders_eval_id,
+        _check_calls_backend,
+        _check_no_import_errors,
+        _check_live_capabilities,
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -10,6 +10,7 @@ from typing import Any
 from tests.eval.check_catalog import CATALOG
 from tests.eval.contracts import CheckResult, RunManifest
 from tests.eval.reason_codes import Attribution, CheckStatus
+from tests.eval.timing import run_checks
 
 try:
     import tomllib
@@ -54,19 +55,19 @@ class CustomToolContext:
 
 def run_custom_tool_checks(ctx: CustomToolContext) -> list[CheckResult]:
     """Run all custom tool/router checks for the extensible profile."""
-    return [
-        _check_router_file_exists(ctx),
-        _check_toml_declared(ctx),
-        _check_local_200(ctx),
-        _check_local_correct(ctx),
-        _check_local_schema(ctx),
-        _check_input_varies(ctx),
-        _check_live_200(ctx),
-        _check_live_correct(ctx),
-        _check_live_nonce(ctx),
-        _check_in_capabilities(ctx),
-        _check_agent_invocation(ctx),
-    ]
+    return run_checks(ctx, [
+        _check_router_file_exists,
+        _check_toml_declared,
+        _check_local_200,
+        _check_local_correct,
+        _check_local_schema,
+        _check_input_varies,
+        _check_live_200,
+        _check_live_correct,
+        _check_live_nonce,
+        _check_in_capabilities,
+        _check_agent_invocation,
+    ])
 
 
 # ---------------------------------------------------------------------------
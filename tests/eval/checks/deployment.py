@@ -35,6 +35,7 @@ from tests.eval.check_catalog import CATALOG
 from tests.eval.contracts import CheckResult, RunManifest
 from tests.eval.providers.fly import FlyAdapter
 from tests.eval.reason_codes import Attribution, CheckStatus
+from tests.eval.timing import run_checks, span
 
 
 # ---------------------------------------------------------------------------
@@ -100,13 +101,15 @@ class DeploymentContext:
         url = self.deployed_url.rstrip("/") + path
         for attempt in range(retry + 1):
             try:
-                resp = httpx.request(
-                    method,
-                    url,
-                    json=payload,
-                    timeout=15,
-                    follow_redirects=True,
-                )
+                with span(method_key, "http", attempt=attempt) as call:
+                    resp = httpx.request(
+                        method,
+                        url,
+                        json=payload,
+                        timeout=15,
+                        follow_redirects=True,
+                    )
+                    call.attrs["status"] = resp.status_code
                 try:
                     body = resp.json()
                 except Exception:
@@ -141,44 +144,43 @@ class AuthSessionState:
 
 def run_deployment_checks(ctx: DeploymentContext) -> list[CheckResult]:
     """Run all deployment checks (core + profile-gated)."""
-    results: list[CheckResult] = []
-
-    # Core checks (17)
-    results.append(_check_deployed_url_present(ctx))
-    results.append(_check_url_discovered_independently(ctx))
-    results.append(_check_url_well_formed(ctx))
-    results.append(_check_fly_app_exists(ctx))
-    results.append(_check_neon_configured(ctx))
-    results.append(_check_neon_jwks_reachable(ctx))
-    results.append(_check_secrets_valid(ctx))
-    results.append(_check_root_html(ctx))
-    results.append(_check_health_200(ctx))
-    results.append(_check_custom_router_live(ctx))
-    results.append(_check_info_live(ctx))
-    results.append(_check_notes_crud(ctx))
-    results.append(_check_health_stable(ctx))
-    results.append(_check_info_stable(ctx))
-    results.append(_check_config_200(ctx))
-    results.append(_check_capabilities_200(ctx))
-    results.append(_check_caps_auth_neon(ctx))
-    results.append(_check_branding_match_if_profiled(ctx))
-
-    # Auth-plus checks (6)
-    results.append(_check_auth_signup(ctx))
-    results.append(_check_auth_signin(ctx))
-    results.append(_check_session_valid(ctx))
-    results.append(_check_auth_guard(ctx))
-    results.append(_check_custom_protected_route(ctx))
-    results.append(_check_logout(ctx))
-
-    # Full-stack checks (5)
-    results.append(_check_workspace_create(ctx))
-    results.append(_check_file_write(ctx))
-    results.append(_check_file_read(ctx))
-    results.append(_check_file_delete(ctx))
-    results.append(_check_git_cycle(ctx))
-
-    return results
+    checks = [
+        # Core checks (17)
+        _check_deployed_url_present,
+        _check_url_discovered_independently,
+        _check_url_well_formed,
+        _check_fly_app_exists,
+        _check_neon_configured,
+        _check_neon_jwks_reachable,
+        _check_secrets_valid,
+        _check_root_html,
+        _check_health_200,
+        _check_custom_router_live,
+        _check_info_live,
+        _check_notes_crud,
+        _check_health_stable,
+        _check_info_stable,
+        _check_config_200,
+        _check_capabilities_200,
+        _check_caps_auth_neon,
+        _check_branding_match_if_profiled,
+
+        # Auth-plus checks (6)
+        _check_auth_signup,
+        _check_auth_signin,
+        _check_session_valid,
+        _check_auth_guard,
+        _check_custom_protected_route,
+        _check_logout,
+
+        # Full-stack checks (5)
+        _check_workspace_create,
+        _check_file_write,
+        _check_file_read,
+        _check_file_delete,
+        _check_git_cycle,
+    ]
+    return run_checks(ctx, checks)
 
 
 # ---------------------------------------------------------------------------
@@ -16,6 +16,7 @@ from typing import Any
 from tests.eval.check_catalog import CATALOG
 from tests.eval.contracts import CheckResult, RunManifest
 from tests.eval.reason_codes import Attribution, CheckStatus
+from tests.eval.timing import run_checks
 
 
 # ---------------------------------------------------------------------------
@@ -85,23 +86,23 @@ class LocalDevContext:
 
 def run_local_dev_checks(ctx: LocalDevContext) -> list[CheckResult]:
     """Run all local dev checks."""
-    return [
-        _check_doctor_exit_0(ctx),
-        _check_doctor_no_errors(ctx),
-        _check_clean_room_dev_starts(ctx),
-        _check_no_agent_process_dependency(ctx),
-        _check_port_assigned(ctx),
-        _check_custom_health(ctx),
-        _check_custom_info(ctx),
-        _check_notes_crud(ctx),
-        _check_config_200(ctx),
-        _check_capabilities_200(ctx),
-        _check_capabilities_shape(ctx),
-        _check_caps_auth_neon(ctx),
-        _check_no_startup_import_errors(ctx),
-        _check_clean_shutdown(ctx),
-        _check_no_tracebacks(ctx),
-    ]
+    return run_checks(ctx, [
+        _check_doctor_exit_0,
+        _check_doctor_no_errors,
+        _check_clean_room_dev_starts,
+        _check_no_agent_process_dependency,
+        _check_port_assigned,
+        _check_custom_health,
+        _check_custom_info,
+        _check_notes_crud,
+        _check_config_200,
+        _check_capabilities_200,
+        _check_capabilities_shape,
+        _check_caps_auth_neon,
+        _check_no_startup_import_errors,
+        _check_clean_shutdown,
+        _check_no_tracebacks,
+    ])
 
 
 # ---------------------------------------------------------------------------
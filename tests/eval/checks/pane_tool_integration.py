@@ -8,6 +8,7 @@ from typing import Any
 from tests.eval.check_catalog import CATALOG
 from tests.eval.contracts import CheckResult, RunManifest
 from tests.eval.reason_codes import Attribution, CheckStatus
+from tests.eval.timing import run_checks
 
 
 class PaneToolIntegrationContext:
@@ -31,11 +32,11 @@ class PaneToolIntegrationContext:
 # ---------------------------------------------------------------------------
 
 def run_pane_tool_integration_checks(ctx: PaneToolIntegrationContext) -> list[CheckResult]:
-    return [
-        _check_pane_calls_tool(ctx),
-        _check_tool_contract_matches(ctx),
-        _check_both_share_nonce(ctx),
-    ]
+    return run_checks(ctx, [
+        _check_pane_calls_tool,
+        _check_tool_contract_matches,
+        _check_both_share_nonce,
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -16,6 +16,7 @@ from tests.eval.check_catalog import CATALOG
 from tests.eval.contracts import CheckResult, RunManifest
 from tests.eval.fly_cli import fly_cli_env, resolve_fly_api_token, resolve_fly_cli
 from tests.eval.reason_codes import Attribution, CheckStatus
+from tests.eval.timing import command_label, run_checks, span
 
 
 # ---------------------------------------------------------------------------
@@ -34,21 +35,21 @@ class PreflightContext:
 def run_preflight_checks(manifest: RunManifest) -> list[CheckResult]:
     """Run all 13 preflight checks."""
     ctx = PreflightContext(manifest)
-    return [
-        _check_bui_available(ctx),
-        _check_fly_available(ctx),
-        _check_vault_read_access(ctx),
-        _check_vault_write_access(ctx),
-        _check_network_reachable(ctx),
-        _check_project_root_writable(ctx),
-        _check_smoke_lib_imports(ctx),
-        _check_timeouts_configured(ctx),
-        _check_fresh_target_unused(ctx),
-        _check_scope_guard_available(ctx),
-        _check_provider_api_access(ctx),
-        _check_provider_quota_headroom(ctx),
-        _check_cleanup_permissions(ctx),
-    ]
+    return run_checks(ctx, [
+        _check_bui_available,
+        _check_fly_available,
+        _check_vault_read_access,
+        _check_vault_write_access,
+        _check_network_reachable,
+        _check_project_root_writable,
+        _check_smoke_lib_imports,
+        _check_timeouts_configured,
+        _check_fresh_target_unused,
+        _check_scope_guard_available,
+        _check_provider_api_access,
+        _check_provider_quota_headroom,
+        _check_cleanup_permissions,
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -80,13 +81,17 @@ def _run_cmd(
     timeout: int = 10,
     env: dict[str, str] | None = None,
 ) -> tuple[int, str, str]:
-    try:
-        r = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, env=env)
-        return r.returncode, r.stdout.strip(), r.stderr.strip()
-    except FileNotFoundError:
-        return -1, "", f"not found: {cmd[0]}"
-    except subprocess.TimeoutExpired:
-        return -2, "", f"timeout: {' '.join(cmd)}"
+    with span(command_label(cmd), "subprocess") as call:
+        try:
+            r = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, env=env)
+            call.attrs["rc"] = r.returncode
+            return r.returncode, r.stdout.strip(), r.stderr.strip()
+        except FileNotFoundError:
+            call.attrs["rc"] = -1
+            return -1, "", f"not found: {cmd[0]}"
+        except subprocess.TimeoutExpired:
+            call.attrs["rc"] = -2
+            return -2, "", f"timeout: {' '.join(cmd)}"
 
 
 # ---------------------------------------------------------------------------
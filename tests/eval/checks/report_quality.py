@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from tests.eval.check_cache import CheckInputs
 from tests.eval.check_catalog import CATALOG
 from tests.eval.contracts import CheckResult, ObservedCommand, RunManifest
 from tests.eval.parsing import extract_bui_commands, extract_report_json
@@ -17,6 +18,14 @@ from tests.eval.report_schema import (
     END_MARKER,
     validate_report,
 )
+from tests.eval.timing import run_checks
+
+
+#: Report grading reads the transcript, command log and harness observations.
+CACHE_INPUTS = CheckInputs(
+    manifest_fields=("app_slug", "eval_id", "verification_nonce"),
+    args=("agent_text", "command_log", "harness_observations"),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -48,19 +57,19 @@ def run_report_quality_checks(
 ) -> list[CheckResult]:
     """Run all 11 report quality checks."""
     ctx = ReportQualityContext(manifest, agent_text, command_log, harness_observations)
-    return [
-        _check_human_summary_present(ctx),
-        _check_machine_json_present(ctx),
-        _check_json_parseable(ctx),
-        _check_includes_identifiers(ctx),
-        _check_includes_commands_run(ctx),
-        _check_includes_local_results(ctx),
-        _check_includes_live_results(ctx),
-        _check_includes_known_issues(ctx),
-        _check_claims_match_evidence(ctx),
-        _check_commands_match_observed(ctx),
-        _check_scope_statement_truthful(ctx),
-    ]
+    return run_checks(ctx, [
+        _check_human_summary_present,
+        _check_machine_json_present,
+        _check_json_parseable,
+        _check_includes_identifiers,
+        _check_includes_commands_run,
+        _check_includes_local_results,
+        _check_includes_live_results,
+        _check_includes_known_issues,
+        _check_claims_match_evidence,
+        _check_commands_match_observed,
+        _check_scope_statement_truthful,
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -14,9 +14,11 @@ import re
 from pathlib import Path
 from typing import Any
 
+from tests.eval.check_cache import CheckInputs
 from tests.eval.check_catalog import CATALOG
 from tests.eval.contracts import CheckResult, RunManifest
 from tests.eval.reason_codes import Attribution, CheckStatus
+from tests.eval.timing import run_checks
 
 # Try tomllib (3.11+), fall back to tomli
 try:
@@ -28,6 +30,13 @@ except ImportError:
         tomllib = None  # type: ignore[assignment]
 
 
+#: Filesystem-only: the project tree plus the naming fields (see check_cache).
+CACHE_INPUTS = CheckInputs(
+    manifest_fields=("app_slug", "platform_profile", "project_root"),
+    project_tree=True,
+)
+
+
 # ---------------------------------------------------------------------------
 # Check context
 # ---------------------------------------------------------------------------
@@ -49,24 +58,22 @@ class ScaffoldingContext:
 def run_scaffolding_checks(manifest: RunManifest) -> list[CheckResult]:
     """Run all scaffolding checks and return results."""
     ctx = ScaffoldingContext(manifest)
-    results: list[CheckResult] = []
-
-    results.append(_check_dir_exists(ctx))
-    results.append(_check_toml_exists(ctx))
-    results.append(_check_toml_valid(ctx))
-    results.append(_check_name_matches(ctx))
-    results.append(_check_id_matches(ctx))
-    results.append(_check_pyproject_valid(ctx))
-    results.append(_check_backend_runtime_typescript(ctx))
-    results.append(_check_backend_entry_exists(ctx))
-    results.append(_check_app_factory_or_entrypoint(ctx))
-    results.append(_check_routers_dir_or_equivalent(ctx))
-    results.append(_check_custom_router_impl(ctx))
-    results.append(_check_custom_router_mounted(ctx))
-    results.append(_check_frontend_present_if_profiled(ctx))
-    results.append(_check_deploy_platform_fly(ctx))
-
-    return results
+    return run_checks(ctx, [
+        _check_dir_exists,
+        _check_toml_exists,
+        _check_toml_valid,
+        _check_name_matches,
+        _check_id_matches,
+        _check_pyproject_valid,
+        _check_backend_runtime_typescript,
+        _check_backend_entry_exists,
+        _check_app_factory_or_entrypoint,
+        _check_routers_dir_or_equivalent,
+        _check_custom_router_impl,
+        _check_custom_router_mounted,
+        _check_frontend_present_if_profiled,
+        _check_deploy_platform_fly,
+    ])
 
 
 def _spec(check_id: str) -> dict[str, Any]:
@@ -14,10 +14,12 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from tests.eval.check_cache import CheckInputs
 from tests.eval.check_catalog import CATALOG
 from tests.eval.contracts import CheckResult, RunManifest
 from tests.eval.reason_codes import Attribution, CheckStatus
 from tests.eval.redaction import SecretRegistry
+from tests.eval.timing import run_checks
 
 # Try tomllib for TOML parsing
 try:
@@ -29,6 +31,25 @@ except ImportError:
         tomllib = None  # type: ignore[assignment]
 
 
+#: Inputs fingerprinted by check_cache; git metadata is covered by the project tree.
+CACHE_INPUTS = CheckInputs(
+    manifest_fields=(
+        "app_slug",
+        "eval_id",
+        "event_log_path",
+        "evidence_dir",
+        "project_root",
+        "python_module",
+        "report_output_path",
+        "verification_nonce",
+    ),
+    project_tree=True,
+    evidence_globs=("*.txt", "http/**/*.json"),
+    args=("agent_stdout", "agent_stderr", "evidence_text", "pre_snapshot", "post_snapshot"),
+    secrets=True,
+)
+
+
 # ---------------------------------------------------------------------------
 # Check context
 # ---------------------------------------------------------------------------
@@ -70,27 +91,27 @@ def run_security_checks(
         manifest, registry, agent_stdout, agent_stderr,
         evidence_text, pre_snapshot, post_snapshot,
     )
-    return [
-        _check_no_secrets_in_toml(ctx),
-        _check_no_secrets_in_source(ctx),
-        _check_no_secrets_in_evidence(ctx),
-        _check_no_secrets_in_transcript(ctx),
-        _check_no_secrets_in_git_metadata(ctx),
-        _check_high_entropy_scan_clean(ctx),
-        _check_no_tokens_in_http_captures(ctx),
-        _check_vault_refs_complete(ctx),
-        _check_session_secret_vault_ref(ctx),
-        _check_env_safe_if_present(ctx),
-        _check_env_not_tracked(ctx),
-        _check_gitignore_hygiene(ctx),
-        _check_command_args_safe(ctx),
-        _check_redaction_prewrite(ctx),
-        _check_auth_provider_neon(ctx),
-        _check_no_forbidden_repo_changes(ctx),
-        _check_only_project_dir_mutated(ctx),
-        _check_no_symlink_escape(ctx),
-        _check_scope_guard_enforced(ctx),
-    ]
+    return run_checks(ctx, [
+        _check_no_secrets_in_toml,
+        _check_no_secrets_in_source,
+        _check_no_secrets_in_evidence,
+        _check_no_secrets_in_transcript,
+        _check_no_secrets_in_git_metadata,
+        _check_high_entropy_scan_clean,
+        _check_no_tokens_in_http_captures,
+        _check_vault_refs_complete,
+        _check_session_secret_vault_ref,
+        _check_env_safe_if_present,
+        _check_env_not_tracked,
+        _check_gitignore_hygiene,
+        _check_command_args_safe,
+        _check_redaction_prewrite,
+        _check_auth_provider_neon,
+        _check_no_forbidden_repo_changes,
+        _check_only_project_dir_mutated,
+        _check_no_symlink_escape,
+        _check_scope_guard_enforced,
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -10,9 +10,15 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from tests.eval.check_cache import CheckInputs
 from tests.eval.check_catalog import CATALOG
 from tests.eval.contracts import CheckResult, ObservedCommand, RunManifest
 from tests.eval.reason_codes import Attribution, CheckStatus
+from tests.eval.timing import run_checks
+
+
+#: Workflow grading depends only on the observed commands and agent text.
+CACHE_INPUTS = CheckInputs(args=("command_log", "agent_text"))
 
 
 # ---------------------------------------------------------------------------
@@ -42,13 +48,13 @@ def run_workflow_checks(
 ) -> list[CheckResult]:
     """Run all 5 workflow compliance checks."""
     ctx = WorkflowContext(manifest, command_log, agent_text)
-    return [
-        _check_scaffold_supported(ctx),
-        _check_doctor_supported(ctx),
-        _check_neon_supported(ctx),
-        _check_deploy_supported(ctx),
-        _check_no_unsupported_bypass(ctx),
-    ]
+    return run_checks(ctx, [
+        _check_scaffold_supported,
+        _check_doctor_supported,
+        _check_neon_supported,
+        _check_deploy_supported,
+        _check_no_unsupported_bypass,
+    ])
 
 
 # ---------------------------------------------------------------------------
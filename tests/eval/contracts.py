@@ -446,6 +446,8 @@ class OperationalMetrics:
     retry_counts: dict[str, int] = field(default_factory=dict)
     provider_api_calls: dict[str, int] = field(default_factory=dict)
     evidence_bundle_size_bytes: Optional[int] = None
+    # Phase → check family → check → call tree (see tests.eval.timing)
+    timings: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         return {f.name: _serialise(getattr(self, f.name)) for f in fields(self)}
@@ -459,6 +461,7 @@ class OperationalMetrics:
             retry_counts=dict(data.get("retry_counts", {})),
             provider_api_calls=dict(data.get("provider_api_calls", {})),
             evidence_bundle_size_bytes=data.get("evidence_bundle_size_bytes"),
+            timings=dict(data.get("timings", {})),
         )
 
 
@@ -8,12 +8,16 @@ Usage::
     python tests/eval/eval_child_app.py --profile core
     python tests/eval/eval_child_app.py --profile auth-plus --skip-cleanup
     python tests/eval/eval_child_app.py --cleanup-only /path/to/run_state.json
+    python tests/eval/eval_child_app.py --resume /path/to/run_state.json
+    python tests/eval/eval_child_app.py --reverify /path/to/evidence --skip-deploy \
+        --categories scaffolding,security
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import dataclasses
 import json
 import os
 import shutil
@@ -27,8 +31,9 @@ import traceback
 import urllib.error
 import urllib.parse
 import urllib.request
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 try:
     import tomllib
@@ -45,6 +50,7 @@ from tests.eval.capabilities import (
     skip_reasons_for_manifest,
     validate_profile_against_capabilities,
 )
+from tests.eval.check_cache import CacheStats, CheckCache
 from tests.eval.check_catalog import CATALOG
 from tests.eval.checks.deployment import DeploymentContext, run_deployment_checks
 from tests.eval.checks.local_dev import LocalDevContext, run_local_dev_checks
@@ -74,9 +80,18 @@ from tests.eval.report_schema import BEGIN_MARKER, END_MARKER
 from tests.eval.providers.fly import FlyAdapter
 from tests.eval.reason_codes import CheckStatus
 from tests.eval.redaction import SecretRegistry
+from tests.eval.results_store import ResultsStore, default_results_db
 from tests.eval.cleanup import run_cleanup
-from tests.eval.runners.base import AgentRunner, MockRunner, RunResult, SubprocessRunner
+from tests.eval.run_state import RunStateJournal, load_run_state
+from tests.eval.runners.base import (
+    AgentRunner,
+    MockRunner,
+    RunResult,
+    SubprocessRunner,
+    parse_command_log,
+)
 from tests.eval.scoring import compute_scores
+from tests.eval.timing import TimingRecorder, command_label, span
 
 
 # ---------------------------------------------------------------------------
@@ -87,6 +102,8 @@ DEFAULT_AGENT_TIMEOUT = 1200      # 20 min
 DEFAULT_VERIFY_TIMEOUT = 300      # 5 min
 DEFAULT_CLEANUP_TIMEOUT = 180     # 3 min
 
+WORKSPACE_SNAPSHOT_FILENAME = "workspace_snapshot.json"
+
 TRUSTED_LOCAL_AUTH_PORTS = (5176, 5175, 5174, 5173, 3000)
 SNAPSHOT_PRUNE_DIRS = {
     ".air",
@@ -111,15 +128,32 @@ def _save_run_state(
     evidence_dir: str,
     state: dict[str, Any],
 ) -> None:
-    """Persist run state for crash recovery."""
-    path = Path(evidence_dir) / "run_state.json"
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(state, indent=2, default=str), encoding="utf-8")
+    """Persist a complete run state snapshot for crash recovery.
+
+    ``run_eval`` itself journals incremental updates through
+    ``RunStateJournal``; this writes a fresh, compacted state in one go.
+    """
+    RunStateJournal(evidence_dir).update(state)
 
 
 def _load_run_state(path: str) -> dict[str, Any]:
-    """Load run state from a previous crash."""
-    return json.loads(Path(path).read_text(encoding="utf-8"))
+    """Load run state from a previous crash (snapshot plus journal)."""
+    return load_run_state(path)
+
+
+def _save_workspace_snapshot(evidence_dir: str, snapshot: set[str]) -> None:
+    """Keep the pre-agent workspace snapshot so a resumed run can diff against it."""
+    path = Path(evidence_dir) / WORKSPACE_SNAPSHOT_FILENAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(sorted(snapshot)), encoding="utf-8")
+
+
+def _load_workspace_snapshot(evidence_dir: str) -> set[str] | None:
+    path = Path(evidence_dir) / WORKSPACE_SNAPSHOT_FILENAME
+    try:
+        return set(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, TypeError):
+        return None
 
 
 def _load_report_output_text(manifest: RunManifest) -> str:
@@ -319,13 +353,43 @@ def _port_is_available(port: int) -> bool:
     return True
 
 
+#: Trusted ports handed to an in-flight local validation in this process.
+#: Concurrent evals (batch mode) must not race for the same port between
+#: the availability probe and ``bui dev`` binding it.
+_LEASED_LOCAL_AUTH_PORTS: set[int] = set()
+
+
 def _pick_trusted_local_auth_port() -> int | None:
     for port in TRUSTED_LOCAL_AUTH_PORTS:
+        if port in _LEASED_LOCAL_AUTH_PORTS:
+            continue
         if _port_is_available(port):
+            _LEASED_LOCAL_AUTH_PORTS.add(port)
             return port
     return None
 
 
+def _release_trusted_local_auth_port(port: int | None) -> None:
+    if port is not None:
+        _LEASED_LOCAL_AUTH_PORTS.discard(port)
+
+
+async def _acquire_trusted_local_auth_port(timeout_s: float) -> int | None:
+    """Pick a trusted port, waiting while sibling evals hold the others.
+
+    Without in-process leases this returns immediately, preserving the
+    single-run behaviour of failing fast when every port is taken.
+    """
+    deadline = time.monotonic() + timeout_s
+    while True:
+        port = _pick_trusted_local_auth_port()
+        if port is not None or not _LEASED_LOCAL_AUTH_PORTS:
+            return port
+        if time.monotonic() >= deadline:
+            return None
+        await asyncio.sleep(0.5)
+
+
 def _load_boring_app_toml(project_root: Path) -> dict[str, Any]:
     toml_path = project_root / "boring.app.toml"
     if not toml_path.is_file():
@@ -397,22 +461,25 @@ def _build_neon_local_dev_env(project_root: Path, port: int) -> dict[str, str]:
 def _http_probe(url: str, timeout_s: float = 5.0) -> tuple[int | None, Any | None]:
     """Fetch a URL and decode JSON when possible."""
     request = urllib.request.Request(url, method="GET")
-    try:
-        with urllib.request.urlopen(request, timeout=timeout_s) as response:
-            payload = response.read().decode("utf-8", errors="replace")
+    with span(f"GET {urllib.parse.urlsplit(url).path or '/'}", "http") as call:
+        try:
+            with urllib.request.urlopen(request, timeout=timeout_s) as response:
+                call.attrs["status"] = response.status
+                payload = response.read().decode("utf-8", errors="replace")
+                try:
+                    return response.status, json.loads(payload)
+                except json.JSONDecodeError:
+                    return response.status, payload
+        except urllib.error.HTTPError as exc:
+            call.attrs["status"] = exc.code
+            payload = exc.read().decode("utf-8", errors="replace")
             try:
-                return response.status, json.loads(payload)
+                body: Any = json.loads(payload)
             except json.JSONDecodeError:
-                return response.status, payload
-    except urllib.error.HTTPError as exc:
-        payload = exc.read().decode("utf-8", errors="replace")
-        try:
-            body: Any = json.loads(payload)
-        except json.JSONDecodeError:
-            body = payload
-        return exc.code, body
-    except Exception:
-        return None, None
+                body = payload
+            return exc.code, body
+        except Exception:
+            return None, None
 
 
 def _http_json_request(
@@ -428,22 +495,25 @@ def _http_json_request(
         headers["Content-Type"] = "application/json"
         data = json.dumps(payload).encode("utf-8")
     request = urllib.request.Request(url, method=method, data=data, headers=headers)
-    try:
-        with urllib.request.urlopen(request, timeout=timeout_s) as response:
-            body = response.read().decode("utf-8", errors="replace")
+    with span(f"{method} {urllib.parse.urlsplit(url).path or '/'}", "http") as call:
+        try:
+            with urllib.request.urlopen(request, timeout=timeout_s) as response:
+                call.attrs["status"] = response.status
+                body = response.read().decode("utf-8", errors="replace")
+                try:
+                    return response.status, json.loads(body)
+                except json.JSONDecodeError:
+                    return response.status, body
+        except urllib.error.HTTPError as exc:
+            call.attrs["status"] = exc.code
+            payload_text = exc.read().decode("utf-8", errors="replace")
             try:
-                return response.status, json.loads(body)
+                body: Any = json.loads(payload_text)
             except json.JSONDecodeError:
-                return response.status, body
-    except urllib.error.HTTPError as exc:
-        payload_text = exc.read().decode("utf-8", errors="replace")
-        try:
-            body: Any = json.loads(payload_text)
-        except json.JSONDecodeError:
-            body = payload_text
-        return exc.code, body
-    except Exception:
-        return None, None
+                body = payload_text
+            return exc.code, body
+        except Exception:
+            return None, None
 
 
 async def _run_command_capture(
@@ -454,6 +524,19 @@ async def _run_command_capture(
     env: dict[str, str] | None = None,
 ) -> tuple[int, str, str]:
     """Run a short-lived subprocess and capture its output."""
+    with span(command_label(command), "subprocess") as call:
+        result = await _run_command_capture_once(command, cwd=cwd, timeout_s=timeout_s, env=env)
+        call.attrs["rc"] = result[0]
+    return result
+
+
+async def _run_command_capture_once(
+    command: list[str],
+    *,
+    cwd: str,
+    timeout_s: int,
+    env: dict[str, str] | None = None,
+) -> tuple[int, str, str]:
     try:
         process = await asyncio.create_subprocess_exec(
             *command,
@@ -503,7 +586,7 @@ async def _run_local_dev_validation(
         env=os.environ.copy(),
     )
 
-    port = _pick_trusted_local_auth_port()
+    port = await _acquire_trusted_local_auth_port(timeout_s)
     if port is None:
         return (
             LocalDevContext(
@@ -520,6 +603,30 @@ async def _run_local_dev_validation(
             None,
         )
 
+    try:
+        return await _run_local_dev_server(
+            manifest,
+            timeout_s,
+            port,
+            doctor_exit=doctor_exit,
+            doctor_stdout=doctor_stdout,
+            doctor_stderr=doctor_stderr,
+        )
+    finally:
+        _release_trusted_local_auth_port(port)
+
+
+async def _run_local_dev_server(
+    manifest: RunManifest,
+    timeout_s: int,
+    port: int,
+    *,
+    doctor_exit: int,
+    doctor_stdout: str,
+    doctor_stderr: str,
+) -> tuple[LocalDevContext, float | None]:
+    """Start ``bui dev`` on a leased trusted port and probe the live app."""
+    project_root = Path(manifest.project_root)
     dev_env = os.environ.copy()
     try:
         dev_env.update(_build_neon_local_dev_env(project_root, port))
@@ -835,6 +942,279 @@ def _default_agent_runner(manifest: RunManifest) -> AgentRunner:
     ], cwd=manifest.project_root)
 
 
+# ---------------------------------------------------------------------------
+# Verification
+# ---------------------------------------------------------------------------
+
+#: Categories whose checks probe the live deployment.
+LIVE_CATEGORIES = frozenset({"deployment"})
+
+#: Extensible-profile checks that probe the deployed app rather than the tree.
+LIVE_PROBE_CHECK_IDS = frozenset({
+    "pane.live_capabilities",
+    "tool.live_200",
+    "tool.live_correct",
+    "tool.live_nonce",
+})
+
+#: Security checks that need the pre-agent workspace snapshot.
+SNAPSHOT_CHECK_IDS = frozenset({
+    "sec.no_forbidden_repo_changes",
+    "sec.only_project_dir_mutated",
+})
+
+
+@dataclass
+class VerificationOutcome:
+    """Ordered check results plus the harness facts scoring needs."""
+
+    checks: list[CheckResult]
+    skip_reasons: dict[str, str]
+    harness_observations: dict[str, bool]
+    deployed_url: str
+    time_to_local_health: float | None
+    cache_stats: CacheStats
+
+
+async def _run_verification(
+    manifest: RunManifest,
+    profile: str,
+    run_result: RunResult,
+    registry: SecretRegistry,
+    writer: EvidenceWriter,
+    logger: EvalLogger,
+    *,
+    projects_root: str,
+    pre_snapshot: set[str] | None,
+    preflight_checks: list[CheckResult],
+    skip_reasons: dict[str, str],
+    skip_deploy: bool,
+    verify_timeout: int,
+    use_check_cache: bool = True,
+    read_only_cache: bool = False,
+    categories: set[str] | None = None,
+    carried_checks: list[CheckResult] | None = None,
+    known_deployed_url: str = "",
+    on_deployed_url: Callable[[str], None] | None = None,
+) -> VerificationOutcome:
+    """Run every check group for *profile* and order the results.
+
+    ``known_deployed_url`` (a resumed run's saved URL) replaces the Fly
+    lookup; ``on_deployed_url`` is told the URL as soon as it is known so
+    the caller can persist it before the live probes start.
+
+    With ``categories`` set (re-verification), only those categories are
+    recomputed; the rest — and any live probe or snapshot check that cannot
+    be replayed — are taken from ``carried_checks``. ``read_only_cache``
+    replays the check cache without writing it back.
+    """
+    check_order = _resolve_check_order(profile)
+    effective_skip_reasons = dict(skip_reasons)
+    if skip_deploy:
+        for check_id in check_order:
+            spec = CATALOG.get(check_id)
+            if spec and spec.category == "deployment":
+                effective_skip_reasons[check_id] = "Skipped by --skip-deploy"
+
+    def rerun(category: str) -> bool:
+        return categories is None or category in categories
+
+    carried_by_id = {check.id: check for check in carried_checks or []}
+    carry_ids = {
+        check_id for check_id, check in carried_by_id.items()
+        if not rerun(check.category)
+    }
+    live = rerun("deployment")
+    if not live:
+        carry_ids |= LIVE_PROBE_CHECK_IDS & set(carried_by_id)
+    if pre_snapshot is None:
+        carry_ids |= SNAPSHOT_CHECK_IDS & set(carried_by_id)
+
+    def carried_pass(check_id: str) -> bool:
+        check = carried_by_id.get(check_id)
+        return check is not None and check.status == CheckStatus.PASS
+
+    time_to_local_health: float | None = None
+    needs_local = rerun("local_dev") or (
+        profile == "extensible" and (rerun("custom_pane") or rerun("custom_tool"))
+    )
+    if needs_local:
+        try:
+            with span("local_dev_validation", "stage"):
+                local_ctx, time_to_local_health = await asyncio.wait_for(
+                    _run_local_dev_validation(
+                        manifest,
+                        timeout_s=verify_timeout,
+                    ),
+                    timeout=verify_timeout + 30,
+                )
+        except asyncio.TimeoutError:
+            local_ctx = LocalDevContext(
+                manifest,
+                dev_started=False,
+                dev_stderr=(
+                    f"Local validation exceeded verification budget after {verify_timeout}s"
+                ),
+            )
+        local_ok = local_ctx.dev_started and local_ctx.health_status == 200
+    else:
+        local_ctx = LocalDevContext(manifest, dev_started=False)
+        local_ok = carried_pass("local.custom_health")
+
+    reported_url = extract_deployed_url(run_result.final_response, manifest)
+    if live:
+        fly_adapter = FlyAdapter()
+        discovered_url = known_deployed_url
+        if not discovered_url:
+            with span("discover_url", "stage"):
+                discovered_url = fly_adapter.app_url(manifest.app_slug)
+        deployment_ctx = DeploymentContext(
+            manifest,
+            deployed_url=discovered_url or reported_url,
+            fly_adapter=fly_adapter,
+        )
+        deployed_url = deployment_ctx.deployed_url or ""
+    else:
+        # No URL means the extensible live probes skip instead of calling out.
+        deployment_ctx = DeploymentContext(manifest, deployed_url=None)
+        deployed_url = known_deployed_url or reported_url or ""
+    if deployed_url and on_deployed_url is not None:
+        on_deployed_url(deployed_url)
+
+    check_cache = CheckCache(
+        manifest.evidence_dir,
+        enabled=use_check_cache,
+        read_only=read_only_cache,
+    )
+    generated_checks: list[CheckResult] = []
+    if rerun("preflight"):
+        generated_checks.extend(preflight_checks)
+    if rerun("scaffolding"):
+        with span("scaffolding", "check_family"):
+            generated_checks.extend(check_cache.run(run_scaffolding_checks, manifest))
+    if rerun("workflow"):
+        with span("workflow", "check_family"):
+            generated_checks.extend(check_cache.run(
+                run_workflow_checks,
+                manifest,
+                command_log=run_result.command_log,
+                agent_text=run_result.final_response,
+            ))
+    if rerun("local_dev"):
+        with span("local_dev", "check_family"):
+            generated_checks.extend(run_local_dev_checks(local_ctx))
+    if live:
+        with span("deployment", "check_family"):
+            generated_checks.extend(run_deployment_checks(deployment_ctx))
+    if profile == "extensible":
+        if rerun("custom_pane"):
+            with span("custom_pane", "check_family"):
+                generated_checks.extend(run_custom_pane_checks(CustomPaneContext(
+                    manifest,
+                    local_ctx=local_ctx,
+                    deployment_ctx=deployment_ctx,
+                )))
+        if rerun("custom_tool"):
+            with span("custom_tool", "check_family"):
+                generated_checks.extend(run_custom_tool_checks(CustomToolContext(
+                    manifest,
+                    local_ctx=local_ctx,
+                    deployment_ctx=deployment_ctx,
+                    command_log=run_result.command_log,
+                    agent_text=run_result.final_response,
+                )))
+        if rerun("pane_tool_integration"):
+            with span("pane_tool_integration", "check_family"):
+                generated_checks.extend(run_pane_tool_integration_checks(PaneToolIntegrationContext(
+                    manifest,
+                )))
+        _write_extensible_evidence(manifest, writer, local_ctx, deployment_ctx)
+
+    if rerun("security"):
+        with span("security", "check_family"):
+            post_snapshot = _snapshot_workspace(projects_root, manifest.project_root)
+            generated_checks.extend(check_cache.run(
+                run_security_checks,
+                manifest,
+                registry=registry,
+                agent_stdout=run_result.stdout,
+                agent_stderr=run_result.stderr,
+                evidence_text=run_result.final_response,
+                pre_snapshot=pre_snapshot,
+                post_snapshot=post_snapshot,
+            ))
+
+    current_by_id = {check.id: check for check in generated_checks}
+    current_by_id.update({check_id: carried_by_id[check_id] for check_id in carry_ids})
+    scaffold_router = current_by_id.get("scaff.custom_router_impl")
+    observations = {
+        "step_scaffold_succeeded": (
+            scaffold_router is not None
+            and scaffold_router.status == CheckStatus.PASS
+        ),
+        "step_local_validate_succeeded": local_ok,
+        "step_local_validation_succeeded": local_ok,
+        "step_neon_setup_succeeded": bool(
+            extract_neon_project_id(manifest.project_root, run_result.final_response)
+        ),
+        "step_deploy_succeeded": (
+            bool(deployed_url) if live
+            else carried_pass("deploy.deployed_url_present")
+        ),
+    }
+    if rerun("report_quality"):
+        with span("report_quality", "check_family"):
+            generated_checks.extend(check_cache.run(
+                run_report_quality_checks,
+                manifest,
+                agent_text=run_result.final_response,
+                command_log=run_result.command_log,
+                harness_observations=observations,
+            ))
+
+    generated_checks = [check for check in generated_checks if check.id not in carry_ids]
+    generated_checks.extend(carried_by_id[check_id] for check_id in sorted(carry_ids))
+    checks = _order_check_results(
+        check_order,
+        generated_checks,
+        effective_skip_reasons,
+        logger,
+    )
+
+    check_cache.save()
+    if check_cache.stats.hits:
+        logger.info(
+            f"Check cache: reused {check_cache.stats.reused_checks} results "
+            f"({', '.join(check_cache.stats.hits)})"
+        )
+    return VerificationOutcome(
+        checks=checks,
+        skip_reasons=effective_skip_reasons,
+        harness_observations=observations,
+        deployed_url=deployed_url,
+        time_to_local_health=time_to_local_health,
+        cache_stats=check_cache.stats,
+    )
+
+
+def _ingest_result(
+    results_db: str,
+    eval_result: EvalResult,
+    manifest: RunManifest,
+    logger: EvalLogger,
+) -> None:
+    """Append the result to the cross-run store. Never fails the eval."""
+    try:
+        with ResultsStore(results_db) as store:
+            store.ingest(
+                eval_result,
+                profile=manifest.platform_profile,
+                evidence_dir=manifest.evidence_dir,
+            )
+    except Exception as exc:
+        logger.warning(f"Results store ingest failed ({results_db}): {exc}")
+
+
 # ---------------------------------------------------------------------------
 # Orchestrator
 # ---------------------------------------------------------------------------
@@ -852,60 +1232,127 @@ async def run_eval(
     runner: AgentRunner | None = None,
     verbose: bool = False,
     quiet: bool = False,
+    results_db: str | None = None,
+    use_check_cache: bool = True,
+    profile_harness: bool = False,
+    resume_state: str | None = None,
 ) -> EvalResult:
     """Run the complete eval lifecycle.
 
-    Returns the EvalResult with all scores computed.
+    Returns the EvalResult with all scores computed. The result is also
+    appended to the cross-run results store (``results_db``, defaulting to
+    ``default_results_db(projects_root)``). Pure check groups replay cached
+    results from the evidence dir when their inputs are unchanged unless
+    ``use_check_cache`` is False.
+
+    The run's timing tree lands in ``operational_metrics.timings`` and, as a
+    Chrome/Perfetto trace, in ``<evidence_dir>/trace.json``; with
+    ``profile_harness`` each phase is also profiled into
+    ``<evidence_dir>/profiles/``.
+
+    With ``resume_state`` (a previous run's ``run_state.json``) the run
+    continues in place: manifest, profile and evidence dir come from the
+    saved state; a finished agent run is reloaded from its evidence files
+    instead of being repeated, and a written evidence bundle is reused so
+    only ingest and cleanup run again. Preflight, parsing and verification
+    are always redone — they are cheap next to the agent and deploy, and
+    the check cache replays unchanged pure check groups.
     """
     start_time = time.monotonic()
 
     completed_phases: list[str] = []
+    # Facts later phases (and --reverify) need, kept in every state snapshot.
+    state_extras: dict[str, Any] = {}
 
     def save_state(phase: str, **extra: Any) -> None:
-        _save_run_state(evidence_dir, {
+        journal.update({
             "phase": phase,
             "eval_id": naming.eval_id,
             "profile": profile,
             "completed_phases": list(completed_phases),
             "manifest": manifest.to_dict(),
+            **state_extras,
             **extra,
         })
 
-    # 1. Generate naming contract and manifest
-    naming = NamingContract.from_eval_id(eval_id, projects_root=projects_root)
-    if evidence_dir is None:
-        evidence_dir = str(
-            Path(projects_root) / ".eval-evidence" / naming.app_slug
-        )
+    # 1. Generate naming contract and manifest (or reload them to resume)
+    resumed: dict[str, Any] | None = None
+    if resume_state is not None:
+        resumed = load_run_state(resume_state)
+        manifest_data = resumed.get("manifest")
+        if not isinstance(manifest_data, dict):
+            raise ValueError("run_state.json is missing manifest data")
+        manifest = RunManifest.from_dict(manifest_data)
+        profile = str(resumed.get("profile") or manifest.platform_profile)
+        projects_root = str(Path(manifest.project_root).parent)
+        naming = NamingContract.from_eval_id(manifest.eval_id, projects_root=projects_root)
+        evidence_dir = evidence_dir or manifest.evidence_dir
+        manifest.evidence_dir = evidence_dir
+    else:
+        naming = NamingContract.from_eval_id(eval_id, projects_root=projects_root)
+        if evidence_dir is None:
+            evidence_dir = str(
+                Path(projects_root) / ".eval-evidence" / naming.app_slug
+            )
 
-    manifest = RunManifest.from_naming(
-        naming,
-        platform_profile=profile,
-    )
-    manifest.evidence_dir = evidence_dir
+        manifest = RunManifest.from_naming(
+            naming,
+            platform_profile=profile,
+        )
+        manifest.evidence_dir = evidence_dir
+    journal = RunStateJournal(evidence_dir, resume=resumed is not None)
+
+    previous_phases = set(resumed.get("completed_phases") or []) if resumed else set()
+    reuse_agent = "agent_execution" in previous_phases
+    previous_result_path = Path(evidence_dir) / "eval_result.json"
+    reuse_evidence = reuse_agent and "evidence" in previous_phases and previous_result_path.is_file()
+    if resumed is not None:
+        for key in ("run_result", "skip_reasons", "harness_observations", "deployed_url"):
+            if key in resumed:
+                state_extras[key] = resumed[key]
 
     # Initialize logger
+    timings = TimingRecorder(
+        naming.eval_id,
+        profile_dir=Path(evidence_dir) / "profiles" if profile_harness else None,
+    )
+    timings.activate()
     logger = EvalLogger(
         evidence_dir=evidence_dir,
         eval_id=naming.eval_id,
         verbose=verbose,
         quiet=quiet,
+        timings=timings,
+        append=resumed is not None,
     )
-    logger.info(f"Eval started: {naming.eval_id} (profile={profile})")
+    if resumed is None:
+        logger.info(f"Eval started: {naming.eval_id} (profile={profile})")
+    else:
+        logger.info(
+            f"Eval resumed: {naming.eval_id} (profile={profile}, "
+            f"previous phase={resumed.get('phase') or 'unknown'}, "
+            f"reusing {'evidence' if reuse_evidence else 'agent run' if reuse_agent else 'nothing'})"
+        )
 
     # Initialize secret registry
     registry = SecretRegistry()
-    pre_snapshot = _snapshot_workspace(projects_root, manifest.project_root)
+    if reuse_agent:
+        # The agent already ran; only the snapshot taken before it is meaningful.
+        pre_snapshot = _load_workspace_snapshot(evidence_dir)
+    else:
+        pre_snapshot = _snapshot_workspace(projects_root, manifest.project_root)
+        _save_workspace_snapshot(evidence_dir, pre_snapshot)
 
     # Save initial run state
-    save_state("init")
+    save_state("init" if resumed is None else "resumed")
 
     try:
         # 2. Preflight / introspection
         logger.phase_start("preflight")
         facts = discover_platform_facts()
         cap_manifest = build_manifest_from_facts(facts)
-        preflight_checks = run_preflight_checks(manifest)
+        with span("preflight", "check_family"):
+            preflight_checks = run_preflight_checks(manifest)
         cap_manifest = enrich_manifest_with_preflight_results(cap_manifest, preflight_checks)
         cap_issues = validate_profile_against_capabilities(profile, cap_manifest)
 
@@ -923,204 +1370,149 @@ async def run_eval(
         completed_phases.append("preflight")
         save_state("preflight_done", capability_issues=[i.to_dict() for i in cap_issues])
 
-        # 3. Generate prompt
-        logger.phase_start("prompt_generation")
-        prompt = generate_prompt(manifest, profile)
-        save_prompt(manifest, prompt)
-        logger.phase_end("prompt_generation", f"{len(prompt)} chars")
-        completed_phases.append("prompt_generation")
-        save_state("prompt_generation_done")
-
-        # Save manifest
         writer = EvidenceWriter(evidence_dir, registry)
-        writer.write_json("run_manifest.json", manifest.to_dict(), redact=False)
-
-        # 4. Run agent
-        logger.phase_start("agent_execution")
-        if runner is None:
-            runner = _default_agent_runner(manifest)
-
-        run_result = await runner.run(manifest, prompt, timeout_s=agent_timeout)
-        await runner.cleanup()
-        writer.write_run_result(run_result)
-        logger.phase_end(
-            "agent_execution",
-            f"exit={run_result.exit_code} timed_out={run_result.timed_out} "
-            f"elapsed={run_result.elapsed_s:.1f}s"
-        )
-        completed_phases.append("agent_execution")
-        save_state(
-            "agent_done",
-            exit_code=run_result.exit_code,
-            timed_out=run_result.timed_out,
-            run_result=_serialize_run_result_summary(run_result),
-        )
-
-        # 5. Parse response
-        report_output_text = _load_report_output_text(manifest)
-        parsed_report_output = extract_report_json(report_output_text) if report_output_text else None
-        if parsed_report_output:
-            _persist_plain_report_output(manifest, parsed_report_output)
-        if report_output_text and report_output_text not in run_result.final_response:
-            report_block = report_output_text
-            if BEGIN_MARKER not in report_output_text:
-                report_block = f"{BEGIN_MARKER}\n{report_output_text.strip()}\n{END_MARKER}"
-            combined = run_result.final_response.rstrip()
-            if combined:
-                combined = f"{combined}\n\n{report_block}"
-            else:
-                combined = report_block
-            run_result.final_response = combined
-            writer.write_text(
-                "agent_final_response.txt",
-                run_result.final_response,
-                producer="agent",
+        if reuse_agent:
+            run_result = load_run_result_from_evidence(evidence_dir, resumed)
+            completed_phases.extend(["prompt_generation", "agent_execution"])
+            logger.info(
+                f"Reusing agent run: exit={run_result.exit_code} "
+                f"timed_out={run_result.timed_out} elapsed={run_result.elapsed_s:.1f}s"
             )
-
-        logger.phase_start("parsing")
-        parsed_report = extract_report_json(run_result.final_response)
-        logger.phase_end("parsing", f"report={'found' if parsed_report else 'missing'}")
-        completed_phases.append("parsing")
-        save_state("parsing_done", report_found=parsed_report is not None)
-
-        # 6. Run verification checks
-        logger.phase_start("verification")
-        check_order = _resolve_check_order(profile)
-        effective_skip_reasons = dict(skip_reasons)
-        if skip_deploy:
-            for check_id in check_order:
-                spec = CATALOG.get(check_id)
-                if spec and spec.category == "deployment":
-                    effective_skip_reasons[check_id] = "Skipped by --skip-deploy"
-
-        try:
-            local_ctx, time_to_local_health = await asyncio.wait_for(
-                _run_local_dev_validation(
-                    manifest,
-                    timeout_s=verify_timeout,
-                ),
-                timeout=verify_timeout + 30,
+        else:
+            # 3. Generate prompt
+            logger.phase_start("prompt_generation")
+            prompt = generate_prompt(manifest, profile)
+            save_prompt(manifest, prompt)
+            logger.phase_end("prompt_generation", f"{len(prompt)} chars")
+            completed_phases.append("prompt_generation")
+            save_state("prompt_generation_done")
+
+            # Save manifest
+            writer.write_json("run_manifest.json", manifest.to_dict(), redact=False)
+
+            # 4. Run agent
+            logger.phase_start("agent_execution")
+            if runner is None:
+                runner = _default_agent_runner(manifest)
+
+            run_result = await runner.run(manifest, prompt, timeout_s=agent_timeout)
+            await runner.cleanup()
+            writer.write_run_result(run_result)
+            logger.phase_end(
+                "agent_execution",
+                f"exit={run_result.exit_code} timed_out={run_result.timed_out} "
+                f"elapsed={run_result.elapsed_s:.1f}s"
             )
-        except asyncio.TimeoutError:
-            local_ctx = LocalDevContext(
-                manifest,
-                dev_started=False,
-                dev_stderr=(
-                    f"Local validation exceeded verification budget after {verify_timeout}s"
-                ),
+            completed_phases.append("agent_execution")
+            state_extras["run_result"] = _serialize_run_result_summary(run_result)
+            save_state(
+                "agent_done",
+                exit_code=run_result.exit_code,
+                timed_out=run_result.timed_out,
             )
-            time_to_local_health = None
 
-        fly_adapter = FlyAdapter()
-        reported_url = extract_deployed_url(run_result.final_response, manifest)
-        discovered_url = fly_adapter.app_url(manifest.app_slug)
-        deployment_ctx = DeploymentContext(
-            manifest,
-            deployed_url=discovered_url or reported_url,
-            fly_adapter=fly_adapter,
-        )
+        if reuse_evidence:
+            eval_result = EvalResult.from_dict(json.loads(previous_result_path.read_text(encoding="utf-8")))
+            completed_phases.extend(["parsing", "verification", "scoring"])
+            logger.info(f"Reusing scored result: status={eval_result.status.value}")
+        else:
+            # 5. Parse response
+            report_output_text = _load_report_output_text(manifest)
+            parsed_report_output = extract_report_json(report_output_text) if report_output_text else None
+            if parsed_report_output:
+                _persist_plain_report_output(manifest, parsed_report_output)
+            if report_output_text and report_output_text not in run_result.final_response:
+                report_block = report_output_text
+                if BEGIN_MARKER not in report_output_text:
+                    report_block = f"{BEGIN_MARKER}\n{report_output_text.strip()}\n{END_MARKER}"
+                combined = run_result.final_response.rstrip()
+                if combined:
+                    combined = f"{combined}\n\n{report_block}"
+                else:
+                    combined = report_block
+                run_result.final_response = combined
+                writer.write_text(
+                    "agent_final_response.txt",
+                    run_result.final_response,
+                    producer="agent",
+                )
 
-        generated_checks: list[CheckResult] = []
-        generated_checks.extend(preflight_checks)
-        generated_checks.extend(run_scaffolding_checks(manifest))
-        generated_checks.extend(run_workflow_checks(
-            manifest,
-            run_result.command_log,
-            run_result.final_response,
-        ))
-        generated_checks.extend(run_local_dev_checks(local_ctx))
-        generated_checks.extend(run_deployment_checks(deployment_ctx))
-        if profile == "extensible":
-            generated_checks.extend(run_custom_pane_checks(CustomPaneContext(
-                manifest,
-                local_ctx=local_ctx,
-                deployment_ctx=deployment_ctx,
-            )))
-            generated_checks.extend(run_custom_tool_checks(CustomToolContext(
-                manifest,
-                local_ctx=local_ctx,
-                deployment_ctx=deployment_ctx,
-                command_log=run_result.command_log,
-                agent_text=run_result.final_response,
-            )))
-            generated_checks.extend(run_pane_tool_integration_checks(PaneToolIntegrationContext(
-                manifest,
-            )))
-            _write_extensible_evidence(manifest, writer, local_ctx, deployment_ctx)
+            logger.phase_start("parsing")
+            parsed_report = extract_report_json(run_result.final_response)
+            logger.phase_end("parsing", f"report={'found' if parsed_report else 'missing'}")
+            completed_phases.append("parsing")
+            save_state("parsing_done", report_found=parsed_report is not None)
 
-        post_snapshot = _snapshot_workspace(projects_root, manifest.project_root)
-        generated_checks.extend(run_security_checks(
-            manifest,
-            registry,
-            agent_stdout=run_result.stdout,
-            agent_stderr=run_result.stderr,
-            evidence_text=run_result.final_response,
-            pre_snapshot=pre_snapshot,
-            post_snapshot=post_snapshot,
-        ))
+            # 6. Run verification checks
+            def remember_deployed_url(url: str) -> None:
+                if state_extras.get("deployed_url") != url:
+                    state_extras["deployed_url"] = url
+                    save_state("deployed_url_known")
 
-        scaffolding_by_id = {check.id: check for check in generated_checks if check.category == "scaffolding"}
-        observations = {
-            "step_scaffold_succeeded": (
-                scaffolding_by_id.get("scaff.custom_router_impl") is not None
-                and scaffolding_by_id["scaff.custom_router_impl"].status == CheckStatus.PASS
-            ),
-            "step_local_validate_succeeded": (
-                local_ctx.dev_started and local_ctx.health_status == 200
-            ),
-            "step_local_validation_succeeded": (
-                local_ctx.dev_started and local_ctx.health_status == 200
-            ),
-            "step_neon_setup_succeeded": bool(
-                extract_neon_project_id(manifest.project_root, run_result.final_response)
-            ),
-            "step_deploy_succeeded": bool(deployment_ctx.deployed_url),
-        }
-        generated_checks.extend(run_report_quality_checks(
-            manifest,
-            run_result.final_response,
-            command_log=run_result.command_log,
-            harness_observations=observations,
-        ))
+            logger.phase_start("verification")
+            verification = await _run_verification(
+                manifest,
+                profile,
+                run_result,
+                registry,
+                writer,
+                logger,
+                projects_root=projects_root,
+                pre_snapshot=pre_snapshot,
+                preflight_checks=preflight_checks,
+                skip_reasons=skip_reasons,
+                skip_deploy=skip_deploy,
+                verify_timeout=verify_timeout,
+                use_check_cache=use_check_cache,
+                known_deployed_url=str(state_extras.get("deployed_url") or ""),
+                on_deployed_url=remember_deployed_url,
+            )
+            checks = verification.checks
+            time_to_local_health = verification.time_to_local_health
+            state_extras["skip_reasons"] = verification.skip_reasons
+            state_extras["harness_observations"] = verification.harness_observations
+            state_extras["deployed_url"] = verification.deployed_url
+            logger.phase_end(
+                "verification",
+                f"{len(checks)} checks executed ({verification.cache_stats.reused_checks} cached)",
+            )
+            completed_phases.append("verification")
+            save_state(
+                "verification_done",
+                check_count=len(checks),
+                check_cache=verification.cache_stats.to_dict(),
+            )
 
-        checks = _order_check_results(
-            check_order,
-            generated_checks,
-            effective_skip_reasons,
-            logger,
-        )
-        logger.phase_end("verification", f"{len(checks)} checks executed")
-        completed_phases.append("verification")
-        save_state("verification_done", check_count=len(checks))
-
-        # 7. Score
-        logger.phase_start("scoring")
-        eval_result = compute_scores(checks, naming.eval_id, profile)
-        eval_result.operational_metrics = OperationalMetrics(
-            time_to_local_health_seconds=time_to_local_health,
-            time_to_live_health_seconds=None,
-        )
-        eval_result.deployed_url = deployment_ctx.deployed_url or ""
-        eval_result.fly_app_name = manifest.app_slug
-        eval_result.neon_project_id = extract_neon_project_id(
-            manifest.project_root,
-            run_result.final_response,
-        ) or ""
-        logger.phase_end(
-            "scoring",
-            f"status={eval_result.status.value} core={eval_result.core_score:.0%}"
-        )
-        completed_phases.append("scoring")
-        save_state(
-            "scoring_done",
-            status=eval_result.status.value,
-            core_score=eval_result.core_score,
-            overall_score=eval_result.overall_score,
-        )
+            # 7. Score
+            logger.phase_start("scoring")
+            eval_result = compute_scores(checks, naming.eval_id, profile)
+            eval_result.operational_metrics = OperationalMetrics(
+                time_to_local_health_seconds=time_to_local_health,
+                time_to_live_health_seconds=None,
+                timings=timings.to_dict(),
+            )
+            eval_result.deployed_url = verification.deployed_url
+            eval_result.fly_app_name = manifest.app_slug
+            eval_result.neon_project_id = extract_neon_project_id(
+                manifest.project_root,
+                run_result.final_response,
+            ) or ""
+            logger.phase_end(
+                "scoring",
+                f"status={eval_result.status.value} core={eval_result.core_score:.0%}"
+            )
+            completed_phases.append("scoring")
+            save_state(
+                "scoring_done",
+                status=eval_result.status.value,
+                core_score=eval_result.core_score,
+                overall_score=eval_result.overall_score,
+            )
 
         # 8. Write evidence bundle
         logger.phase_start("evidence")
-        write_evidence_bundle(manifest, eval_result, run_result, registry)
+        eval_result.operational_metrics.timings = timings.to_dict()
+        bundle = write_evidence_bundle(manifest, eval_result, run_result, registry)
         logger.phase_end("evidence", "bundle written")
         completed_phases.append("evidence")
         save_state(
@@ -1146,6 +1538,19 @@ async def run_eval(
                 cleanup_errors=[r.to_dict() for r in eval_result.cleanup_errors],
             )
 
+        # Rewrite the result so its timing tree and cleanup errors are final.
+        eval_result.operational_metrics.timings = timings.to_dict()
+        bundle.write_json("eval_result.json", eval_result.to_dict())
+        bundle.write_json("trace.json", timings.to_trace().to_dict())
+        bundle.write_artifact_manifest()
+        # Ingest what is on disk, so a later backfill of this dir is a no-op.
+        _ingest_result(
+            results_db or str(default_results_db(projects_root)),
+            eval_result,
+            manifest,
+            logger,
+        )
+
         elapsed = time.monotonic() - start_time
         logger.info(
             f"Eval complete: {eval_result.status.value} "
@@ -1171,6 +1576,214 @@ async def run_eval(
         raise
 
 
+def load_run_result_from_evidence(
+    evidence_dir: str | Path,
+    state: dict[str, Any] | None = None,
+) -> RunResult:
+    """Rebuild the agent ``RunResult`` from a finished run's evidence dir.
+
+    Text artifacts come from the files ``EvidenceWriter.write_run_result``
+    wrote; exit code, timeout flag and elapsed time from ``run_state.json``.
+    """
+    evidence = Path(evidence_dir)
+
+    def _read(name: str) -> str:
+        path = evidence / name
+        return path.read_text(encoding="utf-8") if path.is_file() else ""
+
+    state = state or {}
+    summary = state.get("run_result") if isinstance(state.get("run_result"), dict) else {}
+    exit_code = summary.get("exit_code", state.get("exit_code"))
+    return RunResult(
+        exit_code=int(exit_code) if exit_code is not None else -1,
+        timed_out=bool(summary.get("timed_out", state.get("timed_out", False))),
+        stdout=_read("agent_stdout.txt"),
+        stderr=_read("agent_stderr.txt"),
+        final_response=_read("agent_final_response.txt"),
+        command_log=parse_command_log(_read("command_log.jsonl")),
+        elapsed_s=float(summary.get("elapsed_s") or 0.0),
+    )
+
+
+def _next_rescore_dir(evidence_dir: Path) -> Path:
+    rescores = evidence_dir / "rescores"
+    existing = [
+        int(child.name[1:]) for child in rescores.glob("v[0-9]*")
+        if child.is_dir() and child.name[1:].isdigit()
+    ] if rescores.is_dir() else []
+    return rescores / f"v{max(existing, default=0) + 1:03d}"
+
+
+async def reverify_eval(
+    evidence_dir: str,
+    *,
+    categories: set[str] | None = None,
+    skip_deploy: bool = False,
+    verify_timeout: int = DEFAULT_VERIFY_TIMEOUT,
+    results_db: str | None = None,
+    use_check_cache: bool = True,
+    verbose: bool = False,
+    quiet: bool = False,
+) -> EvalResult:
+    """Re-run verification and scoring for a finished run without the agent.
+
+    ``RunResult`` is rebuilt from the saved artifacts. ``categories``
+    limits which check categories are recomputed; everything else is
+    carried over from the run's ``eval_result.json``. With ``skip_deploy``
+    the live deployment probes are not repeated and their previous results
+    are kept. The original evidence is left untouched — the re-score goes
+    to ``<evidence_dir>/rescores/vNNN/``.
+    """
+    evidence = Path(evidence_dir)
+    state = _load_run_state(str(evidence / "run_state.json"))
+    manifest_data = state.get("manifest")
+    if not isinstance(manifest_data, dict):
+        raise ValueError("run_state.json is missing manifest data")
+    manifest = RunManifest.from_dict(manifest_data)
+    manifest.evidence_dir = str(evidence)
+    profile = str(state.get("profile") or manifest.platform_profile)
+
+    previous_path = evidence / "eval_result.json"
+    previous = (
+        EvalResult.from_dict(json.loads(previous_path.read_text(encoding="utf-8")))
+        if previous_path.is_file()
+        else None
+    )
+    if categories is not None:
+        unknown = categories - {spec.category for spec in CATALOG.values()}
+        if unknown:
+            raise ValueError(f"Unknown check categories: {sorted(unknown)}")
+        if previous is None:
+            raise ValueError(
+                "Re-verifying selected categories needs the run's eval_result.json"
+            )
+
+    selected = set(categories) if categories is not None else None
+    skip_flag = skip_deploy
+    if skip_deploy and previous is not None:
+        # Keep the recorded live results instead of marking them skipped.
+        selected = (selected or {spec.category for spec in CATALOG.values()}) - LIVE_CATEGORIES
+        skip_flag = False
+
+    rescore_dir = _next_rescore_dir(evidence)
+    logger = EvalLogger(
+        evidence_dir=str(rescore_dir),
+        eval_id=manifest.eval_id,
+        verbose=verbose,
+        quiet=quiet,
+    )
+    logger.timings.activate()
+    logger.info(
+        f"Re-verify started: {manifest.eval_id} (profile={profile}, "
+        f"categories={','.join(sorted(selected)) if selected is not None else 'all'})"
+    )
+    registry = SecretRegistry()
+    writer = EvidenceWriter(rescore_dir, registry)
+    run_result = load_run_result_from_evidence(evidence, state)
+    preflight_checks = (
+        [check for check in previous.checks if check.category == "preflight"]
+        if previous is not None
+        else run_preflight_checks(manifest)
+    )
+
+    logger.phase_start("verification")
+    verification = await _run_verification(
+        manifest,
+        profile,
+        run_result,
+        registry,
+        writer,
+        logger,
+        projects_root=str(Path(manifest.project_root).parent),
+        pre_snapshot=None,
+        preflight_checks=preflight_checks,
+        skip_reasons=dict(state.get("skip_reasons") or {}),
+        skip_deploy=skip_flag,
+        verify_timeout=verify_timeout,
+        use_check_cache=use_check_cache,
+        read_only_cache=True,
+        categories=selected,
+        carried_checks=previous.checks if previous is not None else None,
+    )
+    logger.phase_end(
+        "verification",
+        f"{len(verification.checks)} checks ({verification.cache_stats.reused_checks} cached)",
+    )
+
+    logger.phase_start("scoring")
+    eval_result = compute_scores(verification.checks, manifest.eval_id, profile)
+    previous_metrics = previous.operational_metrics if previous is not None else None
+    eval_result.operational_metrics = OperationalMetrics(
+        time_to_local_health_seconds=(
+            verification.time_to_local_health
+            if verification.time_to_local_health is not None
+            else getattr(previous_metrics, "time_to_local_health_seconds", None)
+        ),
+        time_to_live_health_seconds=None,
+    )
+    eval_result.deployed_url = verification.deployed_url or (previous.deployed_url if previous else "")
+    eval_result.fly_app_name = manifest.app_slug
+    eval_result.neon_project_id = extract_neon_project_id(
+        manifest.project_root,
+        run_result.final_response,
+    ) or ""
+    logger.phase_end(
+        "scoring",
+        f"status={eval_result.status.value} core={eval_result.core_score:.0%}"
+    )
+
+    previous_by_id = {check.id: check for check in previous.checks} if previous else {}
+    changed = [
+        {
+            "id": check.id,
+            "before": previous_by_id[check.id].status.value if check.id in previous_by_id else None,
+            "after": check.status.value,
+            "reason_code": check.reason_code,
+        }
+        for check in eval_result.checks
+        if check.id not in previous_by_id or previous_by_id[check.id].status != check.status
+    ]
+    eval_result.operational_metrics.timings = logger.timings.to_dict()
+    writer.write_json("run_manifest.json", manifest.to_dict(), redact=False)
+    writer.write_json("eval_result.json", eval_result.to_dict())
+    writer.write_json("trace.json", logger.timings.to_trace().to_dict())
+    writer.write_summary(manifest, eval_result)
+    writer.write_json("rescore.json", {
+        "version": rescore_dir.name,
+        "eval_id": manifest.eval_id,
+        "profile": profile,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "source_evidence_dir": str(evidence),
+        "categories": sorted(selected) if selected is not None else None,
+        "skip_deploy": skip_deploy,
+        "check_cache": verification.cache_stats.to_dict(),
+        "previous": {
+            "status": previous.status.value,
+            "core_score": previous.core_score,
+            "overall_score": previous.overall_score,
+        } if previous is not None else None,
+        "current": {
+            "status": eval_result.status.value,
+            "core_score": eval_result.core_score,
+            "overall_score": eval_result.overall_score,
+        },
+        "changed_checks": changed,
+    })
+    writer.write_artifact_manifest()
+
+    _ingest_result(
+        results_db or str(default_results_db(Path(manifest.project_root).parent)),
+        eval_result,
+        dataclasses.replace(manifest, evidence_dir=str(rescore_dir)),
+        logger,
+    )
+    logger.info(
+        f"Re-verify complete: {eval_result.status.value} "
+        f"(core={eval_result.core_score:.0%}, {len(changed)} checks changed) -> {rescore_dir}"
+    )
+    return eval_result
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -1228,10 +1841,35 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_CLEANUP_TIMEOUT,
         help=f"Cleanup timeout in seconds (default: {DEFAULT_CLEANUP_TIMEOUT})",
     )
+    parser.add_argument(
+        "--results-db",
+        help="Cross-run results store (default: $EVAL_RESULTS_DB or <projects-root>/.eval-evidence/results.sqlite3)",
+    )
+    parser.add_argument(
+        "--no-check-cache",
+        action="store_true",
+        help="Re-run every check instead of reusing cached results from the evidence dir",
+    )
+    parser.add_argument(
+        "--profile-harness",
+        action="store_true",
+        help="cProfile each phase of the harness into <evidence-dir>/profiles/",
+    )
     parser.add_argument(
         "--resume",
         metavar="STATE_PATH",
-        help="Resume from a previous run_state.json",
+        help="Resume a crashed run from its run_state.json: the agent run and "
+             "evidence are reused, the remaining phases run again",
+    )
+    parser.add_argument(
+        "--reverify",
+        metavar="EVIDENCE_DIR",
+        help="Re-run verification and scoring for a finished run (no agent); "
+             "with --skip-deploy the recorded live results are kept",
+    )
+    parser.add_argument(
+        "--categories",
+        help="Comma-separated check categories to recompute with --reverify (default: all)",
     )
     parser.add_argument(
         "--cleanup-only",
@@ -1260,19 +1898,40 @@ def main(argv: list[str] | None = None) -> int:
         cleanup = run_cleanup_from_state(args.cleanup_only)
         return 0 if cleanup.completed else 1
 
-    result = asyncio.run(run_eval(
-        profile=args.profile,
-        eval_id=args.eval_id,
-        evidence_dir=args.evidence_dir,
-        projects_root=args.projects_root,
-        agent_timeout=args.agent_timeout,
-        verify_timeout=args.verification_timeout,
-        cleanup_timeout=args.cleanup_timeout,
-        skip_deploy=args.skip_deploy,
-        skip_cleanup=args.skip_cleanup,
-        verbose=args.verbose,
-        quiet=args.quiet,
-    ))
+    if args.reverify:
+        categories = (
+            {c.strip() for c in args.categories.split(",") if c.strip()}
+            if args.categories
+            else None
+        )
+        result = asyncio.run(reverify_eval(
+            args.reverify,
+            categories=categories,
+            skip_deploy=args.skip_deploy,
+            verify_timeout=args.verification_timeout,
+            results_db=args.results_db,
+            use_check_cache=not args.no_check_cache,
+            verbose=args.verbose,
+            quiet=args.quiet,
+        ))
+    else:
+        result = asyncio.run(run_eval(
+            profile=args.profile,
+            eval_id=args.eval_id,
+            evidence_dir=args.evidence_dir,
+            projects_root=args.projects_root,
+            agent_timeout=args.agent_timeout,
+            verify_timeout=args.verification_timeout,
+            cleanup_timeout=args.cleanup_timeout,
+            skip_deploy=args.skip_deploy,
+            skip_cleanup=args.skip_cleanup,
+            verbose=args.verbose,
+            quiet=args.quiet,
+            results_db=args.results_db,
+            use_check_cache=not args.no_check_cache,
+            profile_harness=args.profile_harness,
+            resume_state=args.resume,
+        ))
 
     # Exit codes: 0=PASS, 1=FAIL/PARTIAL, 2=INVALID, 3=ERROR
     exit_codes = {
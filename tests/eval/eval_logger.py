@@ -11,6 +11,9 @@ Usage::
     logger.check_start("scaff.dir_exists")
     logger.check_result("scaff.dir_exists", CheckStatus.PASS, "Directory found")
     logger.phase_end("scaffolding", "13/13 checks passed")
+
+Phases are also recorded as spans on ``logger.timings`` (see
+:mod:`tests.eval.timing`).
 """
 
 from __future__ import annotations
@@ -22,6 +25,7 @@ from pathlib import Path
 from typing import IO, Any, Optional
 
 from tests.eval.reason_codes import CheckStatus
+from tests.eval.timing import TimingRecorder, TimingSpan
 
 
 # ---------------------------------------------------------------------------
@@ -124,6 +128,10 @@ class EvalLogger:
         If True, console shows DEBUG. If False, console shows INFO+.
     quiet : bool
         If True, console is suppressed entirely.
+    timings : TimingRecorder or None
+        Recorder that receives a span per phase (default: a fresh one).
+    append : bool
+        If True, append to an existing ``eval.log`` (resumed runs).
     """
 
     def __init__(
@@ -132,10 +140,14 @@ class EvalLogger:
         eval_id: str = "",
         verbose: bool = False,
         quiet: bool = False,
+        timings: TimingRecorder | None = None,
+        append: bool = False,
     ) -> None:
         self._eval_id = eval_id
         self._phase = ""
         self._phase_start: float | None = None
+        self._phase_span: TimingSpan | None = None
+        self.timings = timings or TimingRecorder(eval_id or "run")
         self._check_timers: dict[str, float] = {}
         self._logger = logging.getLogger(f"eval.{eval_id or 'default'}")
         self._logger.setLevel(logging.DEBUG)
@@ -156,7 +168,7 @@ class EvalLogger:
         if evidence_dir:
             log_path = Path(evidence_dir) / "eval.log"
             log_path.parent.mkdir(parents=True, exist_ok=True)
-            fh = logging.FileHandler(str(log_path), mode="w", encoding="utf-8")
+            fh = logging.FileHandler(str(log_path), mode="a" if append else "w", encoding="utf-8")
             fh.setLevel(logging.DEBUG)
             fh.setFormatter(_FileFormatter())
             self._logger.addHandler(fh)
@@ -178,8 +190,11 @@ class EvalLogger:
 
     def phase_start(self, phase_name: str) -> None:
         """Mark the start of a verification phase."""
+        if self._phase_span is not None:
+            self.timings.end(self._phase_span)
         self._phase = phase_name
         self._phase_start = time.monotonic()
+        self._phase_span = self.timings.start(phase_name, "phase")
         self._logger.info(
             "Phase started: %s", phase_name,
             extra=self._extra(),
@@ -190,6 +205,9 @@ class EvalLogger:
         elapsed = None
         if self._phase_start is not None:
             elapsed = (time.monotonic() - self._phase_start) * 1000
+        if self._phase_span is not None:
+            self.timings.end(self._phase_span)
+            self._phase_span = None
 
         self._logger.info(
             "Phase ended: %s — %s", phase_name, summary,
@@ -198,6 +216,10 @@ class EvalLogger:
         self._phase = ""
         self._phase_start = None
 
+    def write_trace(self, path: str | Path) -> Path:
+        """Write the run's phases, checks and calls as a Chrome/Perfetto trace."""
+        return self.timings.to_trace().write(path)
+
     # -- Check lifecycle --------------------------------------------------
 
     def check_start(self, check_id: str) -> None:
@@ -144,10 +144,11 @@ class EvidenceWriter:
 
     def write_artifact_manifest(self) -> Path:
         """Write the artifact manifest listing all evidence files."""
+        artifacts = [a for a in self._artifacts if a.filename != "artifact_manifest.json"]
         manifest = {
-            "artifacts": [a.to_dict() for a in self._artifacts],
-            "total_bytes": sum(a.size_bytes for a in self._artifacts),
-            "artifact_count": len(self._artifacts),
+            "artifacts": [a.to_dict() for a in artifacts],
+            "total_bytes": sum(a.size_bytes for a in artifacts),
+            "artifact_count": len(artifacts),
         }
         return self.write_json(
             "artifact_manifest.json", manifest, redact=False
@@ -160,7 +161,8 @@ class EvidenceWriter:
         redacted: bool,
         producer: str,
     ) -> None:
-        """Record an artifact in the internal manifest."""
+        """Record an artifact in the internal manifest (a rewrite replaces its entry)."""
+        self._artifacts = [a for a in self._artifacts if a.filename != filename]
         self._artifacts.append(ArtifactEntry(
             filename=filename,
             sha256=hashlib.sha256(content_bytes).hexdigest(),
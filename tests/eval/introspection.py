@@ -25,6 +25,7 @@ from tests.eval.capabilities import (
 )
 from tests.eval.contracts import PlatformFacts
 from tests.eval.fly_cli import resolve_fly_cli
+from tests.eval.timing import command_label, span
 
 
 # ---------------------------------------------------------------------------
@@ -33,18 +34,22 @@ from tests.eval.fly_cli import resolve_fly_cli
 
 def _run(cmd: list[str], timeout: int = 10) -> tuple[int, str, str]:
     """Run a command and return (exit_code, stdout, stderr)."""
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-        return result.returncode, result.stdout.strip(), result.stderr.strip()
-    except FileNotFoundError:
-        return -1, "", f"command not found: {cmd[0]}"
-    except subprocess.TimeoutExpired:
-        return -2, "", f"command timed out: {' '.join(cmd)}"
+    with span(command_label(cmd), "subprocess") as call:
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            call.attrs["rc"] = result.returncode
+            return result.returncode, result.stdout.strip(), result.stderr.strip()
+        except FileNotFoundError:
+            call.attrs["rc"] = -1
+            return -1, "", f"command not found: {cmd[0]}"
+        except subprocess.TimeoutExpired:
+            call.attrs["rc"] = -2
+            return -2, "", f"command timed out: {' '.join(cmd)}"
 
 
 def _version_from_cmd(cmd: list[str]) -> str:
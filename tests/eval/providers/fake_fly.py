@@ -0,0 +1,560 @@
+"""Fake Fly.io provider for offline harness runs.
+
+Two halves that share one state directory:
+
+- a fake ``fly`` executable (this module run as ``python -m``) answering
+  ``apps list --json``, ``apps create``, ``apps destroy``, ``apps suspend``,
+  ``deploy``, ``auth whoami`` and ``version`` with configurable latency and
+  failure rates;
+- :class:`FakeAppHost`, a local HTTP server that serves every deployed app
+  under ``http://127.0.0.1:<port>/apps/<name>`` and implements the child-app
+  contract the deployment checks probe (``/health``, ``/info``, ``/notes``).
+
+Everything that resolves the CLI through ``FLYCTL_BIN`` (``FlyAdapter``,
+preflight, introspection, cleanup, the sweeper) picks the fake up from
+:meth:`FakeFlyProvider.env`, so ``run_eval`` can be load-tested locally::
+
+    with FakeFlyProvider(tmp_dir, FakeFlyConfig(deploy_latency_s=20)) as fly:
+        os.environ.update(fly.env())
+        fly.deploy("ce-0401-abcd1234", env={"VERIFICATION_NONCE": nonce})
+        ...
+
+Hosted URLs are plain ``http``, so ``deploy.url_well_formed`` fails against
+the fake by design; every other live check exercises real HTTP.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fcntl
+import json
+import os
+import random
+import stat
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterator
+
+FAKE_FLY_HOME_ENV = "FAKE_FLY_HOME"
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@dataclass
+class FakeFlyConfig:
+    """Timing and failure knobs for the fake CLI and app host.
+
+    Latencies are means in seconds; each call draws uniformly within
+    ``± jitter_ratio`` of the mean. Failure rates are probabilities in
+    ``[0, 1]``. ``warmup_s`` is how long a fresh deploy answers 503 before
+    it becomes healthy, matching Fly's machine start-up window.
+    """
+
+    deploy_latency_s: float = 0.0
+    destroy_latency_s: float = 0.0
+    suspend_latency_s: float = 0.0
+    list_latency_s: float = 0.0
+    request_latency_s: float = 0.0
+    jitter_ratio: float = 0.0
+    deploy_failure_rate: float = 0.0
+    destroy_failure_rate: float = 0.0
+    suspend_failure_rate: float = 0.0
+    list_failure_rate: float = 0.0
+    warmup_s: float = 0.0
+    seed: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FakeFlyConfig:
+        known = {name for name in cls.__dataclass_fields__}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+@dataclass
+class FakeApp:
+    """One app as recorded in the fake's state file."""
+
+    name: str
+    status: str = "pending"
+    hostname: str = ""
+    created_at: str = ""
+    deployed_at: float | None = None
+    env: dict[str, str] = field(default_factory=dict)
+
+    def to_list_entry(self) -> dict[str, Any]:
+        """Shape of one element of ``fly apps list --json``."""
+        return {
+            "ID": self.name,
+            "Name": self.name,
+            "Status": self.status,
+            "Deployed": self.deployed_at is not None,
+            "Hostname": self.hostname,
+            "Organization": {"Slug": "personal"},
+            "CreatedAt": self.created_at,
+        }
+
+
+class FakeFlyState:
+    """File-backed state shared by concurrent fake CLI processes and the app host.
+
+    Writers hold an exclusive ``flock`` only while reading and rewriting the
+    JSON file, never while sleeping out simulated latency, so concurrent
+    cleanup or sweeper calls overlap the way they would against Fly.
+    """
+
+    def __init__(self, home: str | Path) -> None:
+        self.home = Path(home)
+        self.state_path = self.home / "state.json"
+        self.calls_path = self.home / "calls.jsonl"
+        self._lock_path = self.home / "state.lock"
+
+    def initialize(self, config: FakeFlyConfig, host_url: str) -> None:
+        self.home.mkdir(parents=True, exist_ok=True)
+        with self.transaction() as data:
+            data["config"] = asdict(config)
+            data["host_url"] = host_url
+            data.setdefault("apps", {})
+            data.setdefault("sequence", 0)
+
+    @contextmanager
+    def transaction(self) -> Iterator[dict[str, Any]]:
+        with self._lock_path.open("a+") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                data = self._read()
+                yield data
+                tmp = self.state_path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                tmp.replace(self.state_path)
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock_path.open("a+") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_SH)
+            try:
+                return self._read()
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, Any]:
+        if not self.state_path.exists():
+            return {}
+        return json.loads(self.state_path.read_text(encoding="utf-8") or "{}")
+
+    def config(self) -> FakeFlyConfig:
+        return FakeFlyConfig.from_dict(self.snapshot().get("config", {}))
+
+    def apps(self) -> dict[str, FakeApp]:
+        return {
+            name: FakeApp(**entry)
+            for name, entry in self.snapshot().get("apps", {}).items()
+        }
+
+    def next_rng(self) -> random.Random:
+        """A generator seeded from the config seed and a shared call counter.
+
+        Sequences stay reproducible across runs even though every CLI call
+        is a separate process.
+        """
+        with self.transaction() as data:
+            data["sequence"] = int(data.get("sequence", 0)) + 1
+            seed = int(data.get("config", {}).get("seed", 0))
+            return random.Random(seed * 1_000_003 + data["sequence"])
+
+    def record_call(self, args: list[str], returncode: int, elapsed_s: float) -> None:
+        line = json.dumps({
+            "args": args,
+            "returncode": returncode,
+            "elapsed_s": round(elapsed_s, 6),
+            "started_at": time.time() - elapsed_s,
+            "pid": os.getpid(),
+        })
+        with self.calls_path.open("a", encoding="utf-8") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            handle.write(line + "\n")
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def calls(self) -> list[dict[str, Any]]:
+        if not self.calls_path.exists():
+            return []
+        return [
+            json.loads(line)
+            for line in self.calls_path.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Fake CLI
+# ---------------------------------------------------------------------------
+
+def _simulate(rng: random.Random, latency_s: float, jitter_ratio: float, failure_rate: float) -> bool:
+    """Sleep out one call's latency; returns False when the call should fail."""
+    if latency_s > 0:
+        spread = latency_s * max(0.0, jitter_ratio)
+        time.sleep(max(0.0, rng.uniform(latency_s - spread, latency_s + spread)))
+    return rng.random() >= failure_rate
+
+
+def _app_from_fly_toml(cwd: Path) -> str:
+    fly_toml = cwd / "fly.toml"
+    if not fly_toml.is_file():
+        return ""
+    for line in fly_toml.read_text(encoding="utf-8").splitlines():
+        key, _, value = line.partition("=")
+        if key.strip() == "app":
+            return value.strip().strip("'\"")
+    return ""
+
+
+def _cmd_apps_list(state: FakeFlyState, config: FakeFlyConfig, rng: random.Random) -> tuple[int, str, str]:
+    if not _simulate(rng, config.list_latency_s, config.jitter_ratio, config.list_failure_rate):
+        return 1, "", "Error: failed to list apps: 503 Service Unavailable"
+    apps = sorted(state.apps().values(), key=lambda app: app.name)
+    return 0, json.dumps([app.to_list_entry() for app in apps], indent=2), ""
+
+
+def _cmd_apps_create(state: FakeFlyState, name: str) -> tuple[int, str, str]:
+    with state.transaction() as data:
+        apps = data.setdefault("apps", {})
+        if name in apps:
+            return 1, "", f"Error: Name has already been taken ({name})"
+        apps[name] = asdict(FakeApp(
+            name=name,
+            created_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        ))
+    return 0, f"New app created: {name}", ""
+
+
+def _cmd_deploy(
+    state: FakeFlyState,
+    config: FakeFlyConfig,
+    rng: random.Random,
+    name: str,
+    env: dict[str, str],
+) -> tuple[int, str, str]:
+    if not name:
+        return 1, "", "Error: the config for your app is missing an app name"
+    _cmd_apps_create(state, name)
+    with state.transaction() as data:
+        data["apps"][name]["status"] = "deploying"
+    ok = _simulate(rng, config.deploy_latency_s, config.jitter_ratio, config.deploy_failure_rate)
+    with state.transaction() as data:
+        app = data["apps"].get(name)
+        if app is None:
+            return 1, "", f"Error: Could not find App \"{name}\" (destroyed during deploy)"
+        if not ok:
+            app["status"] = "failed"
+            return 1, "", f"Error: failed to deploy {name}: machine failed health checks"
+        app.update(
+            status="deployed",
+            hostname=f"{data['host_url']}/apps/{name}",
+            deployed_at=time.time(),
+            env={**app.get("env", {}), **env},
+        )
+    return 0, f"Visit your newly deployed app at {data['host_url']}/apps/{name}", ""
+
+
+def _cmd_apps_destroy(
+    state: FakeFlyState,
+    config: FakeFlyConfig,
+    rng: random.Random,
+    name: str,
+) -> tuple[int, str, str]:
+    if name not in state.apps():
+        return 1, "", f"Error: Could not find App \"{name}\""
+    if not _simulate(rng, config.destroy_latency_s, config.jitter_ratio, config.destroy_failure_rate):
+        return 1, "", f"Error: failed to destroy app {name}: 502 Bad Gateway"
+    with state.transaction() as data:
+        if data.get("apps", {}).pop(name, None) is None:
+            return 1, "", f"Error: Could not find App \"{name}\""
+    return 0, f"Destroyed app {name}", ""
+
+
+def _cmd_apps_suspend(
+    state: FakeFlyState,
+    config: FakeFlyConfig,
+    rng: random.Random,
+    name: str,
+) -> tuple[int, str, str]:
+    if name not in state.apps():
+        return 1, "", f"Error: Could not find App \"{name}\""
+    if not _simulate(rng, config.suspend_latency_s, config.jitter_ratio, config.suspend_failure_rate):
+        return 1, "", f"Error: failed to suspend app {name}: 502 Bad Gateway"
+    with state.transaction() as data:
+        app = data.get("apps", {}).get(name)
+        if app is None:
+            return 1, "", f"Error: Could not find App \"{name}\""
+        app["status"] = "suspended"
+    return 0, f"{name} is now suspended", ""
+
+
+def _build_cli_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="fly", add_help=False)
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("version")
+    auth = commands.add_parser("auth").add_subparsers(dest="auth_command")
+    auth.add_parser("whoami")
+
+    apps = commands.add_parser("apps").add_subparsers(dest="apps_command")
+    apps_list = apps.add_parser("list")
+    apps_list.add_argument("--json", "-j", action="store_true")
+    for verb in ("create", "destroy", "suspend"):
+        sub = apps.add_parser(verb)
+        sub.add_argument("name")
+        sub.add_argument("--yes", "-y", action="store_true")
+        sub.add_argument("--org", "-o", default="personal")
+
+    deploy = commands.add_parser("deploy")
+    deploy.add_argument("--app", "-a", default="")
+    deploy.add_argument("--env", "-e", action="append", default=[])
+    deploy.add_argument("--remote-only", action="store_true")
+    deploy.add_argument("--ha", default="")
+    return parser
+
+
+def run_cli(args: list[str], home: str | Path, cwd: str | Path | None = None) -> tuple[int, str, str]:
+    """Execute one fake ``fly`` invocation; returns ``(returncode, stdout, stderr)``."""
+    state = FakeFlyState(home)
+    parsed, _unknown = _build_cli_parser().parse_known_args(args)
+    config = state.config()
+
+    if parsed.command == "version":
+        return 0, "fly v0.3.0-fake linux/amd64", ""
+    if parsed.command == "auth" and parsed.auth_command == "whoami":
+        return 0, "fake@fly.invalid", ""
+    if parsed.command == "deploy":
+        env = dict(item.split("=", 1) for item in parsed.env if "=" in item)
+        name = parsed.app or _app_from_fly_toml(Path(cwd or os.getcwd()))
+        return _cmd_deploy(state, config, state.next_rng(), name, env)
+    if parsed.command == "apps":
+        if parsed.apps_command == "list":
+            return _cmd_apps_list(state, config, state.next_rng())
+        if parsed.apps_command == "create":
+            return _cmd_apps_create(state, parsed.name)
+        if parsed.apps_command == "destroy":
+            return _cmd_apps_destroy(state, config, state.next_rng(), parsed.name)
+        if parsed.apps_command == "suspend":
+            return _cmd_apps_suspend(state, config, state.next_rng(), parsed.name)
+    return 1, "", f"Error: unknown command for fake fly: {' '.join(args)}"
+
+
+def write_fake_fly_executable(home: str | Path) -> Path:
+    """Write ``<home>/bin/fly``, a shell shim that runs this module against ``home``."""
+    home = Path(home)
+    bin_dir = home / "bin"
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    path = bin_dir / "fly"
+    path.write_text(
+        "#!/bin/sh\n"
+        f"export {FAKE_FLY_HOME_ENV}='{home}'\n"
+        f"export PYTHONPATH='{_REPO_ROOT}'${{PYTHONPATH:+:$PYTHONPATH}}\n"
+        f"exec '{sys.executable}' -m tests.eval.providers.fake_fly \"$@\"\n",
+        encoding="utf-8",
+    )
+    path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# App host
+# ---------------------------------------------------------------------------
+
+class _AppHostHandler(BaseHTTPRequestHandler):
+    state: FakeFlyState
+    notes: dict[str, dict[str, dict[str, str]]]
+    notes_lock: threading.Lock
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def _send(self, status: int, body: Any) -> None:
+        if isinstance(body, str):
+            raw, content_type = body.encode("utf-8"), "text/html; charset=utf-8"
+        else:
+            raw, content_type = json.dumps(body).encode("utf-8"), "application/json"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _route(self, method: str) -> None:
+        parts = self.path.split("?", 1)[0].split("/", 3)
+        if len(parts) < 3 or parts[1] != "apps":
+            self._send(404, {"error": "not found"})
+            return
+        name, route = parts[2], "/" + (parts[3] if len(parts) > 3 else "")
+        app = self.state.apps().get(name)
+        config = self.state.config()
+        if config.request_latency_s > 0:
+            time.sleep(config.request_latency_s)
+        if app is None or app.deployed_at is None:
+            self._send(404, {"error": f"app {name} not found"})
+            return
+        if app.status != "deployed":
+            self._send(503, {"error": f"app {name} is {app.status}"})
+            return
+        if time.time() - app.deployed_at < config.warmup_s:
+            self._send(503, {"error": f"app {name} is starting"})
+            return
+        self._send(*self._respond(method, name, app, route.rstrip("/") or "/"))
+
+    def _respond(self, method: str, name: str, app: FakeApp, route: str) -> tuple[int, Any]:
+        eval_id = app.env.get("EVAL_ID", "")
+        if method == "GET" and route == "/":
+            return 200, f"<html><head><title>{name}</title></head><body>{name}</body></html>"
+        if method == "GET" and route == "/health":
+            return 200, {
+                "ok": True,
+                "app": name,
+                "eval_id": eval_id,
+                "verification_nonce": app.env.get("VERIFICATION_NONCE", ""),
+            }
+        if method == "GET" and route == "/info":
+            return 200, {"name": name, "version": "0.1.0", "eval_id": eval_id}
+        if method == "GET" and route == "/__bui/config":
+            return 200, {"app": {"name": name}, "auth": {"appName": name, "provider": "neon"}}
+        if method == "GET" and route == "/api/capabilities":
+            return 200, {"features": {}, "version": "0.1.0", "auth": {"provider": "neon"}}
+        return self._notes(method, name, route)
+
+    def _notes(self, method: str, name: str, route: str) -> tuple[int, Any]:
+        with self.notes_lock:
+            notes = self.notes.setdefault(name, {})
+            if route == "/notes" and method == "GET":
+                return 200, list(notes.values())
+            if route == "/notes" and method == "POST":
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError:
+                    return 422, {"error": "invalid JSON"}
+                note = {
+                    "id": uuid.uuid4().hex[:12],
+                    "text": str(payload.get("text", "")),
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                }
+                notes[note["id"]] = note
+                return 200, note
+            if route.startswith("/notes/") and method == "DELETE":
+                return 200, {"deleted": notes.pop(route.rsplit("/", 1)[1], None) is not None}
+        return 404, {"error": f"{method} {route} not found"}
+
+    def do_GET(self) -> None:
+        self._route("GET")
+
+    def do_POST(self) -> None:
+        self._route("POST")
+
+    def do_DELETE(self) -> None:
+        self._route("DELETE")
+
+
+class FakeAppHost:
+    """Serves every deployed fake app from one local HTTP server."""
+
+    def __init__(self, state: FakeFlyState, host: str = "127.0.0.1", port: int = 0) -> None:
+        handler = type("FakeAppHostHandler", (_AppHostHandler,), {
+            "state": state,
+            "notes": {},
+            "notes_lock": threading.Lock(),
+        })
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self.url = f"http://{host}:{self._server.server_address[1]}"
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-fly-host", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+class FakeFlyProvider:
+    """Fake ``fly`` executable plus app host sharing one state directory."""
+
+    def __init__(self, home: str | Path, config: FakeFlyConfig | None = None) -> None:
+        self.state = FakeFlyState(home)
+        self.config = config or FakeFlyConfig()
+        self.host = FakeAppHost(self.state)
+        self.fly_path = write_fake_fly_executable(home)
+
+    def env(self) -> dict[str, str]:
+        """Environment that points every Fly CLI lookup at the fake."""
+        return {
+            "FLYCTL_BIN": str(self.fly_path),
+            "FLY_API_TOKEN": "fake-fly-token",
+            FAKE_FLY_HOME_ENV: str(self.state.home),
+        }
+
+    def configure(self, **overrides: Any) -> None:
+        """Change timing or failure knobs; running CLI calls pick them up on their next invocation."""
+        for key, value in overrides.items():
+            if key not in FakeFlyConfig.__dataclass_fields__:
+                raise ValueError(f"unknown fake fly setting: {key}")
+            setattr(self.config, key, value)
+        with self.state.transaction() as data:
+            data["config"] = asdict(self.config)
+
+    def deploy(self, app_name: str, env: dict[str, str] | None = None, timeout: float = 600) -> bool:
+        """Deploy through the fake executable, as an agent's ``fly deploy`` would."""
+        args = [str(self.fly_path), "deploy", "--app", app_name]
+        for key, value in (env or {}).items():
+            args.extend(["--env", f"{key}={value}"])
+        result = subprocess.run(args, capture_output=True, text=True, timeout=timeout, check=False)
+        return result.returncode == 0
+
+    def apps(self) -> dict[str, FakeApp]:
+        return self.state.apps()
+
+    def calls(self) -> list[dict[str, Any]]:
+        return self.state.calls()
+
+    def start(self) -> FakeFlyProvider:
+        self.host.start()
+        self.state.initialize(self.config, self.host.url)
+        return self
+
+    def stop(self) -> None:
+        self.host.stop()
+
+    def __enter__(self) -> FakeFlyProvider:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    home = os.environ.get(FAKE_FLY_HOME_ENV, "").strip()
+    if not home:
+        print(f"Error: {FAKE_FLY_HOME_ENV} is not set", file=sys.stderr)
+        return 1
+    state = FakeFlyState(home)
+    start = time.monotonic()
+    returncode, stdout, stderr = run_cli(args, home)
+    state.record_call(args, returncode, time.monotonic() - start)
+    if stdout:
+        print(stdout)
+    if stderr:
+        print(stderr, file=sys.stderr)
+    return returncode
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from tests.eval.fly_cli import fly_cli_env, resolve_fly_cli
+from tests.eval.timing import command_label, span
 
 
 @dataclass
@@ -31,17 +32,21 @@ class FlyAdapter:
         self._cmd = resolve_fly_cli() or "fly"
 
     def _run(self, args: list[str], timeout: int = 30) -> tuple[int, str, str]:
-        try:
-            r = subprocess.run(
-                [self._cmd, *args],
-                capture_output=True, text=True, timeout=timeout,
-                env=fly_cli_env(),
-            )
-            return r.returncode, r.stdout.strip(), r.stderr.strip()
-        except FileNotFoundError:
-            return -1, "", f"fly CLI not found: {self._cmd}"
-        except subprocess.TimeoutExpired:
-            return -2, "", "timeout"
+        with span(command_label([self._cmd, *args]), "subprocess") as call:
+            try:
+                r = subprocess.run(
+                    [self._cmd, *args],
+                    capture_output=True, text=True, timeout=timeout,
+                    env=fly_cli_env(),
+                )
+                call.attrs["rc"] = r.returncode
+                return r.returncode, r.stdout.strip(), r.stderr.strip()
+            except FileNotFoundError:
+                call.attrs["rc"] = -1
+                return -1, "", f"fly CLI not found: {self._cmd}"
+            except subprocess.TimeoutExpired:
+                call.attrs["rc"] = -2
+                return -2, "", "timeout"
 
     def list_apps(self, prefix: str | None = None) -> list[AppInfo]:
         """List Fly apps, optionally filtered by name prefix."""
@@ -9,6 +9,8 @@ from __future__ import annotations
 import subprocess
 from typing import Any
 
+from tests.eval.timing import command_label, span
+
 try:
     import httpx
     _HAS_HTTPX = True
@@ -23,15 +25,19 @@ class NeonAdapter:
         self._bui = bui_cmd
 
     def _run(self, args: list[str], timeout: int = 30) -> tuple[int, str, str]:
-        try:
-            r = subprocess.run(
-                args, capture_output=True, text=True, timeout=timeout,
-            )
-            return r.returncode, r.stdout.strip(), r.stderr.strip()
-        except FileNotFoundError:
-            return -1, "", f"command not found: {args[0]}"
-        except subprocess.TimeoutExpired:
-            return -2, "", "timeout"
+        with span(command_label(args), "subprocess") as call:
+            try:
+                r = subprocess.run(
+                    args, capture_output=True, text=True, timeout=timeout,
+                )
+                call.attrs["rc"] = r.returncode
+                return r.returncode, r.stdout.strip(), r.stderr.strip()
+            except FileNotFoundError:
+                call.attrs["rc"] = -1
+                return -1, "", f"command not found: {args[0]}"
+            except subprocess.TimeoutExpired:
+                call.attrs["rc"] = -2
+                return -2, "", "timeout"
 
     def project_exists(self, project_id: str) -> bool:
         """Check if a Neon project exists via bui neon status."""
@@ -47,7 +53,9 @@ class NeonAdapter:
         """
         if _HAS_HTTPX:
             try:
-                resp = httpx.get(jwks_url, timeout=10, follow_redirects=True)
+                with span("GET jwks", "http") as call:
+                    resp = httpx.get(jwks_url, timeout=10, follow_redirects=True)
+                    call.attrs["status"] = resp.status_code
                 return resp.status_code == 200
             except Exception:
                 pass
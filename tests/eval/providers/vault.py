@@ -12,6 +12,7 @@ import subprocess
 from typing import Any
 
 from tests.eval.redaction import SecretRegistry
+from tests.eval.timing import command_label, span
 
 
 class VaultAdapter:
@@ -34,16 +35,20 @@ class VaultAdapter:
         return self._registry
 
     def _run(self, args: list[str], timeout: int = 15) -> tuple[int, str, str]:
-        try:
-            r = subprocess.run(
-                [self._cmd, *args],
-                capture_output=True, text=True, timeout=timeout,
-            )
-            return r.returncode, r.stdout.strip(), r.stderr.strip()
-        except FileNotFoundError:
-            return -1, "", f"vault CLI not found: {self._cmd}"
-        except subprocess.TimeoutExpired:
-            return -2, "", "timeout"
+        with span(command_label([self._cmd, *args]), "subprocess") as call:
+            try:
+                r = subprocess.run(
+                    [self._cmd, *args],
+                    capture_output=True, text=True, timeout=timeout,
+                )
+                call.attrs["rc"] = r.returncode
+                return r.returncode, r.stdout.strip(), r.stderr.strip()
+            except FileNotFoundError:
+                call.attrs["rc"] = -1
+                return -1, "", f"vault CLI not found: {self._cmd}"
+            except subprocess.TimeoutExpired:
+                call.attrs["rc"] = -2
+                return -2, "", "timeout"
 
     def read_secret(self, path: str, field: str) -> str | None:
         """Read a secret from Vault and auto-register it for redaction.
@@ -12,6 +12,7 @@ Detection methods (in priority order):
 from __future__ import annotations
 
 import base64
+import hashlib
 import math
 import re
 import subprocess
@@ -189,6 +190,17 @@ class SecretRegistry:
         """Number of registered secrets."""
         return len(self._secrets)
 
+    def fingerprint(self) -> str:
+        """Stable digest of the registered secrets (for check-result caching).
+
+        Only a SHA-256 over the sorted ``name=value`` pairs leaves the
+        registry; raw values are never exposed.
+        """
+        digest = hashlib.sha256()
+        for name in sorted(self._secrets):
+            digest.update(f"{name}\0{self._secrets[name]}\0".encode())
+        return digest.hexdigest()
+
     # -- Scanning ---------------------------------------------------------
 
     def scan(self, text: str) -> list[SecretMatch]:
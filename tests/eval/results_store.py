@@ -0,0 +1,554 @@
+"""Append-only cross-run results store for the eval harness.
+
+Every finished eval is ingested into a local SQLite database whose schema
+mirrors ``contracts.EvalResult``, ``CheckResult`` and ``CategoryScore``.
+Rows are only ever inserted — a re-ingest of an identical result is a
+no-op, and a re-score of the same ``eval_id`` becomes a new run row.
+Queries count only the latest row per ``eval_id``, so re-scores and
+resumed runs are not double-counted.
+
+Indexed queries answer the common questions without parsing evidence
+dirs: per-check flake rates, score trends and reason-code histograms.
+
+Usage::
+
+    python tests/eval/results_store.py ingest /home/ubuntu/projects/.eval-evidence
+    python tests/eval/results_store.py flakes --since 7d
+    python tests/eval/results_store.py reasons --check deploy.health_200 --since 7d
+    python tests/eval/results_store.py trend --profile core --since 30d
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.eval.contracts import EvalResult
+from tests.eval.reason_codes import CheckStatus
+
+
+SCHEMA_VERSION = 1
+RESULTS_DB_ENV = "EVAL_RESULTS_DB"
+RESULTS_DB_FILENAME = "results.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    eval_id TEXT NOT NULL,
+    result_digest TEXT NOT NULL,
+    profile TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL,
+    status_detail TEXT NOT NULL DEFAULT '',
+    core_score REAL NOT NULL,
+    extension_score REAL NOT NULL,
+    overall_score REAL NOT NULL,
+    critical_failures TEXT NOT NULL DEFAULT '[]',
+    must_pass_failures TEXT NOT NULL DEFAULT '[]',
+    deployed_url TEXT NOT NULL DEFAULT '',
+    fly_app_name TEXT NOT NULL DEFAULT '',
+    neon_project_id TEXT NOT NULL DEFAULT '',
+    evidence_dir TEXT NOT NULL DEFAULT '',
+    recorded_at REAL NOT NULL,
+    ingested_at REAL NOT NULL,
+    UNIQUE (eval_id, result_digest)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_recorded ON runs (recorded_at);
+CREATE INDEX IF NOT EXISTS idx_runs_profile_recorded ON runs (profile, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_runs_eval_recorded ON runs (eval_id, recorded_at);
+
+CREATE TABLE IF NOT EXISTS checks (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    check_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    weight REAL NOT NULL,
+    status TEXT NOT NULL,
+    reason_code TEXT NOT NULL DEFAULT '',
+    attribution TEXT NOT NULL DEFAULT 'unknown',
+    retriable INTEGER NOT NULL DEFAULT 0,
+    confidence TEXT NOT NULL DEFAULT 'high',
+    skipped INTEGER NOT NULL DEFAULT 0,
+    blocked_by TEXT NOT NULL DEFAULT '[]',
+    detail TEXT NOT NULL DEFAULT '',
+    profile TEXT NOT NULL DEFAULT '',
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (run_id, check_id)
+);
+CREATE INDEX IF NOT EXISTS idx_checks_check_recorded ON checks (check_id, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_checks_status_recorded ON checks (status, recorded_at);
+
+CREATE TABLE IF NOT EXISTS categories (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    name TEXT NOT NULL,
+    score REAL NOT NULL,
+    gate REAL NOT NULL,
+    gate_met INTEGER NOT NULL,
+    passed_weight REAL NOT NULL,
+    total_weight REAL NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+"""
+
+_SINCE_RE = re.compile(r"^(\d+(?:\.\d+)?)([hdw])$")
+_SINCE_UNITS = {"h": 3600, "d": 86400, "w": 7 * 86400}
+
+#: Latest row per eval_id (by recorded_at, then insertion order).
+_LATEST_RUN_IDS = """
+SELECT id FROM (
+    SELECT id, ROW_NUMBER() OVER (
+        PARTITION BY eval_id ORDER BY recorded_at DESC, id DESC
+    ) AS rn
+    FROM runs
+) WHERE rn = 1
+"""
+
+#: Check statuses that count as an observed outcome (SKIP/INVALID do not).
+_OBSERVED_STATUSES = (
+    CheckStatus.PASS.value,
+    CheckStatus.FAIL.value,
+    CheckStatus.ERROR.value,
+)
+
+
+def default_results_db(projects_root: str | Path) -> Path:
+    """Resolve the results DB path: ``$EVAL_RESULTS_DB`` or the evidence root."""
+    override = os.environ.get(RESULTS_DB_ENV, "").strip()
+    if override:
+        return Path(override)
+    return Path(projects_root) / ".eval-evidence" / RESULTS_DB_FILENAME
+
+
+def parse_since(value: str | None, now: float | None = None) -> float | None:
+    """Parse ``7d`` / ``24h`` / ``2w`` or an ISO date into an epoch cutoff."""
+    if not value:
+        return None
+    now = time.time() if now is None else now
+    m = _SINCE_RE.match(value.strip())
+    if m:
+        return now - float(m.group(1)) * _SINCE_UNITS[m.group(2)]
+    parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _parse_timestamp(value: Any) -> float | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def result_digest(result: EvalResult) -> str:
+    """Digest of *result* in canonical form.
+
+    ``EvalResult.from_dict`` normalises numbers (an int weight becomes a
+    float), so a result built in memory and the same result read back from
+    ``eval_result.json`` would otherwise hash differently.
+    """
+    canonical = EvalResult.from_dict(json.loads(json.dumps(result.to_dict()))).to_dict()
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+# ---------------------------------------------------------------------------
+# ResultsStore
+# ---------------------------------------------------------------------------
+
+class ResultsStore:
+    """SQLite-backed, append-only store of eval results."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path), timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),),
+        )
+        self._conn.commit()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> ResultsStore:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -- Ingest -----------------------------------------------------------
+
+    def ingest(
+        self,
+        result: EvalResult,
+        *,
+        profile: str = "",
+        evidence_dir: str = "",
+        recorded_at: float | None = None,
+    ) -> int | None:
+        """Append one EvalResult. Returns the new run id, or None if already stored."""
+        digest = result_digest(result)
+        recorded_at = time.time() if recorded_at is None else recorded_at
+
+        with self._conn:
+            cursor = self._conn.execute(
+                """
+                INSERT OR IGNORE INTO runs (
+                    eval_id, result_digest, profile, status, status_detail,
+                    core_score, extension_score, overall_score,
+                    critical_failures, must_pass_failures,
+                    deployed_url, fly_app_name, neon_project_id,
+                    evidence_dir, recorded_at, ingested_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    result.eval_id, digest, profile, result.status.value, result.status_detail,
+                    result.core_score, result.extension_score, result.overall_score,
+                    json.dumps(result.critical_failures), json.dumps(result.must_pass_failures),
+                    result.deployed_url, result.fly_app_name, result.neon_project_id,
+                    evidence_dir, recorded_at, time.time(),
+                ),
+            )
+            if cursor.rowcount == 0:
+                return None
+            run_id = int(cursor.lastrowid)
+            self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO checks (
+                    run_id, check_id, category, weight, status, reason_code,
+                    attribution, retriable, confidence, skipped, blocked_by,
+                    detail, profile, recorded_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        run_id, c.id, c.category, c.weight, c.status.value, c.reason_code,
+                        c.attribution.value, int(c.retriable), c.confidence.value,
+                        int(c.skipped), json.dumps(c.blocked_by), c.detail,
+                        profile, recorded_at,
+                    )
+                    for c in result.checks
+                ],
+            )
+            self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO categories (
+                    run_id, name, score, gate, gate_met, passed_weight, total_weight
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        run_id, cs.name, cs.score, cs.gate, int(cs.gate_met),
+                        cs.passed_weight, cs.total_weight,
+                    )
+                    for cs in result.categories
+                ],
+            )
+        return run_id
+
+    def ingest_evidence_dir(self, evidence_dir: str | Path) -> int | None:
+        """Ingest ``eval_result.json`` (plus manifest/summary metadata) from a run."""
+        evidence = Path(evidence_dir)
+        data = _read_json(evidence / "eval_result.json")
+        if data is None:
+            return None
+        manifest = _read_json(evidence / "run_manifest.json") or {}
+        summary = _read_json(evidence / "summary.json") or {}
+        recorded_at = _parse_timestamp(summary.get("timestamp"))
+        if recorded_at is None:
+            recorded_at = (evidence / "eval_result.json").stat().st_mtime
+        return self.ingest(
+            EvalResult.from_dict(data),
+            profile=str(manifest.get("platform_profile", "")),
+            evidence_dir=str(evidence),
+            recorded_at=recorded_at,
+        )
+
+    def ingest_tree(self, root: str | Path) -> tuple[int, int]:
+        """Ingest every evidence dir below *root*. Returns (added, seen)."""
+        added = seen = 0
+        for result_path in sorted(Path(root).rglob("eval_result.json")):
+            seen += 1
+            if self.ingest_evidence_dir(result_path.parent) is not None:
+                added += 1
+        return added, seen
+
+    # -- Queries ----------------------------------------------------------
+
+    def _rows(self, sql: str, params: list[Any]) -> list[dict[str, Any]]:
+        return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def check_flake_rates(
+        self,
+        *,
+        since: float | None = None,
+        profile: str | None = None,
+        check_id: str | None = None,
+        min_runs: int = 1,
+    ) -> list[dict[str, Any]]:
+        """Per-check pass/fail counts and flip rate over observed outcomes.
+
+        ``flip_rate`` is the fraction of consecutive runs (by time) whose
+        status differs from the previous run — 0.0 for a check that always
+        passes or always fails, approaching 1.0 for one that alternates.
+        """
+        where, params = self._check_filters(since, profile, check_id)
+        placeholders = ",".join("?" for _ in _OBSERVED_STATUSES)
+        rows = self._rows(
+            f"""
+            SELECT check_id, status
+            FROM checks
+            WHERE status IN ({placeholders}) AND run_id IN ({_LATEST_RUN_IDS}) {where}
+            ORDER BY check_id, recorded_at, run_id
+            """,
+            [*_OBSERVED_STATUSES, *params],
+        )
+
+        stats: dict[str, dict[str, Any]] = {}
+        previous: dict[str, str] = {}
+        for row in rows:
+            cid = row["check_id"]
+            entry = stats.setdefault(cid, {"check_id": cid, "runs": 0, "passed": 0, "failed": 0, "flips": 0})
+            entry["runs"] += 1
+            if row["status"] == CheckStatus.PASS.value:
+                entry["passed"] += 1
+            else:
+                entry["failed"] += 1
+            if cid in previous and previous[cid] != row["status"]:
+                entry["flips"] += 1
+            previous[cid] = row["status"]
+
+        report = []
+        for entry in stats.values():
+            if entry["runs"] < min_runs:
+                continue
+            entry["fail_rate"] = entry["failed"] / entry["runs"]
+            entry["flip_rate"] = entry["flips"] / (entry["runs"] - 1) if entry["runs"] > 1 else 0.0
+            report.append(entry)
+        report.sort(key=lambda e: (-e["flip_rate"], -e["fail_rate"], e["check_id"]))
+        return report
+
+    def reason_code_histogram(
+        self,
+        *,
+        since: float | None = None,
+        profile: str | None = None,
+        check_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Count non-passing check outcomes grouped by check and reason code."""
+        where, params = self._check_filters(since, profile, check_id)
+        return self._rows(
+            f"""
+            SELECT check_id, reason_code, status, COUNT(*) AS count
+            FROM checks
+            WHERE status IN (?, ?) AND run_id IN ({_LATEST_RUN_IDS}) {where}
+            GROUP BY check_id, reason_code, status
+            ORDER BY count DESC, check_id, reason_code
+            """,
+            [CheckStatus.FAIL.value, CheckStatus.ERROR.value, *params],
+        )
+
+    def score_trend(
+        self,
+        *,
+        since: float | None = None,
+        profile: str | None = None,
+        bucket: str = "day",
+    ) -> list[dict[str, Any]]:
+        """Average scores and pass rate per time bucket (``day`` or ``hour``)."""
+        fmt = "%Y-%m-%dT%H:00" if bucket == "hour" else "%Y-%m-%d"
+        clauses: list[str] = [f"id IN ({_LATEST_RUN_IDS})"]
+        params: list[Any] = []
+        if since is not None:
+            clauses.append("recorded_at >= ?")
+            params.append(since)
+        if profile:
+            clauses.append("profile = ?")
+            params.append(profile)
+        where = f"WHERE {' AND '.join(clauses)}"
+        return self._rows(
+            f"""
+            SELECT strftime('{fmt}', recorded_at, 'unixepoch') AS bucket,
+                   profile,
+                   COUNT(*) AS runs,
+                   AVG(core_score) AS avg_core_score,
+                   MIN(core_score) AS min_core_score,
+                   MAX(core_score) AS max_core_score,
+                   AVG(overall_score) AS avg_overall_score,
+                   AVG(CASE WHEN status = 'PASS' THEN 1.0 ELSE 0.0 END) AS pass_rate
+            FROM runs
+            {where}
+            GROUP BY bucket, profile
+            ORDER BY bucket, profile
+            """,
+            params,
+        )
+
+    def explain(self, sql: str, params: list[Any] | None = None) -> list[str]:
+        """Return SQLite's query plan details (used to verify index usage)."""
+        return [
+            str(row["detail"])
+            for row in self._conn.execute(f"EXPLAIN QUERY PLAN {sql}", params or [])
+        ]
+
+    @staticmethod
+    def _check_filters(
+        since: float | None,
+        profile: str | None,
+        check_id: str | None,
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if check_id:
+            clauses.append("check_id = ?")
+            params.append(check_id)
+        if since is not None:
+            clauses.append("recorded_at >= ?")
+            params.append(since)
+        if profile:
+            clauses.append("profile = ?")
+            params.append(profile)
+        return "".join(f" AND {c}" for c in clauses), params
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _print_table(rows: list[dict[str, Any]], columns: list[str]) -> None:
+    if not rows:
+        print("(no rows)")
+        return
+
+    def _fmt(value: Any) -> str:
+        if isinstance(value, float):
+            return f"{value:.3f}"
+        return "" if value is None else str(value)
+
+    widths = {
+        col: max(len(col), *(len(_fmt(row.get(col))) for row in rows))
+        for col in columns
+    }
+    print("  ".join(col.ljust(widths[col]) for col in columns))
+    for row in rows:
+        print("  ".join(_fmt(row.get(col)).ljust(widths[col]) for col in columns))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="results_store",
+        description="Query the cross-run eval results store",
+    )
+    parser.add_argument(
+        "--db",
+        help=f"Results DB path (default: ${RESULTS_DB_ENV} or <projects-root>/.eval-evidence/{RESULTS_DB_FILENAME})",
+    )
+    parser.add_argument(
+        "--projects-root",
+        default="/home/ubuntu/projects",
+        help="Root directory for generated projects",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit JSON instead of a table",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Backfill from evidence directories")
+    ingest.add_argument("paths", nargs="+", help="Evidence dirs or roots to scan")
+
+    for name, help_text in (
+        ("flakes", "Per-check fail and flip rates"),
+        ("reasons", "Reason-code histogram of failing checks"),
+        ("trend", "Score and pass-rate trend per time bucket"),
+    ):
+        query = sub.add_parser(name, help=help_text)
+        query.add_argument("--since", help="Window: 24h, 7d, 2w or an ISO date")
+        query.add_argument("--profile", help="Restrict to one profile")
+        if name != "trend":
+            query.add_argument("--check", help="Restrict to one check id")
+        if name == "flakes":
+            query.add_argument("--min-runs", type=int, default=2, help="Minimum observed runs (default: 2)")
+        if name == "trend":
+            query.add_argument("--bucket", choices=["day", "hour"], default="day")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point. Returns exit code."""
+    args = build_parser().parse_args(argv)
+    db_path = Path(args.db) if args.db else default_results_db(args.projects_root)
+
+    with ResultsStore(db_path) as store:
+        if args.command == "ingest":
+            total_added = total_seen = 0
+            for path in args.paths:
+                added, seen = store.ingest_tree(path)
+                total_added += added
+                total_seen += seen
+            print(f"Ingested {total_added} new results ({total_seen} scanned) into {db_path}")
+            return 0
+
+        since = parse_since(args.since)
+        if args.command == "flakes":
+            rows = store.check_flake_rates(
+                since=since, profile=args.profile, check_id=args.check, min_runs=args.min_runs,
+            )
+            columns = ["check_id", "runs", "passed", "failed", "fail_rate", "flip_rate"]
+        elif args.command == "reasons":
+            rows = store.reason_code_histogram(since=since, profile=args.profile, check_id=args.check)
+            columns = ["check_id", "reason_code", "status", "count"]
+        else:
+            rows = store.score_trend(since=since, profile=args.profile, bucket=args.bucket)
+            columns = [
+                "bucket", "profile", "runs", "pass_rate",
+                "avg_core_score", "min_core_score", "max_core_score",
+            ]
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        _print_table(rows, columns)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
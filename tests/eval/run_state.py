@@ -0,0 +1,196 @@
+"""Crash-safe run state: append-only journal plus atomic snapshot.
+
+``run_eval`` persists its recovery state at every phase boundary. Instead
+of rewriting the whole state each time, :class:`RunStateJournal` appends
+one JSON line per update to ``run_state.jsonl`` holding only the keys
+whose values changed (the manifest, capability issues and cleanup errors
+are written once, not once per phase), and fsyncs it before returning.
+
+Every few records — and always on the first and on terminal phases — the
+folded state is compacted into ``run_state.json``: written to a temporary
+file, fsynced and atomically renamed over the old snapshot, after which
+the journal is truncated. A crash can therefore tear at most the last
+journal line, which :func:`load_run_state` ignores; the snapshot itself
+is never half-written.
+
+Files in ``<evidence_dir>``::
+
+    run_state.json    compacted snapshot (``journal_seq`` = last folded record)
+    run_state.jsonl   {"seq": n, "ts": ..., "set": {...}, "unset": [...]}
+
+Readers (``--cleanup-only``, ``--reverify``, the sweeper) should always go
+through :func:`load_run_state`, which folds the journal into the snapshot.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+
+SNAPSHOT_FILENAME = "run_state.json"
+JOURNAL_FILENAME = "run_state.jsonl"
+
+#: Journal records between compactions.
+COMPACT_EVERY = 8
+
+#: run_state phases after which a run no longer owns its resources.
+TERMINAL_PHASES = frozenset({"complete", "cleanup_done", "error"})
+
+_SEQ_KEY = "journal_seq"
+
+
+def _normalise(value: Any) -> Any:
+    """JSON round-trip so in-memory values compare equal to what was written."""
+    return json.loads(json.dumps(value, default=str))
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def state_paths(path: str | Path) -> tuple[Path, Path]:
+    """``(snapshot, journal)`` for an evidence dir or either state file."""
+    target = Path(path)
+    directory = target.parent if target.name in (SNAPSHOT_FILENAME, JOURNAL_FILENAME) else target
+    return directory / SNAPSHOT_FILENAME, directory / JOURNAL_FILENAME
+
+
+def _fold(snapshot_path: Path, journal_path: Path) -> tuple[dict[str, Any], int]:
+    state: dict[str, Any] = {}
+    seq = 0
+    if snapshot_path.is_file():
+        loaded = json.loads(snapshot_path.read_text(encoding="utf-8"))
+        if not isinstance(loaded, dict):
+            raise ValueError(f"{snapshot_path} does not contain a JSON object")
+        seq = int(loaded.pop(_SEQ_KEY, 0) or 0)
+        state = loaded
+    if journal_path.is_file():
+        with journal_path.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # torn tail from a crash mid-append
+                if not isinstance(record, dict) or int(record.get("seq", 0)) <= seq:
+                    continue
+                for key in record.get("unset", []):
+                    state.pop(key, None)
+                state.update(record.get("set", {}))
+                seq = int(record["seq"])
+    return state, seq
+
+
+def load_run_state(path: str | Path) -> dict[str, Any]:
+    """Current run state: the snapshot with every later journal record applied.
+
+    ``path`` may be the evidence dir, ``run_state.json`` or ``run_state.jsonl``.
+    Raises ``FileNotFoundError`` when neither file exists.
+    """
+    snapshot_path, journal_path = state_paths(path)
+    if not snapshot_path.is_file() and not journal_path.is_file():
+        raise FileNotFoundError(f"no run state at {snapshot_path}")
+    state, _seq = _fold(snapshot_path, journal_path)
+    return state
+
+
+def run_state_mtime(path: str | Path) -> float | None:
+    """Latest modification time of the snapshot or journal, if either exists."""
+    mtimes = []
+    for candidate in state_paths(path):
+        try:
+            mtimes.append(candidate.stat().st_mtime)
+        except OSError:
+            continue
+    return max(mtimes) if mtimes else None
+
+
+class RunStateJournal:
+    """Incremental writer for one run's state.
+
+    With ``resume=False`` any previous state in ``evidence_dir`` is
+    discarded; with ``resume=True`` it is folded in and later updates are
+    diffed against it.
+    """
+
+    def __init__(
+        self,
+        evidence_dir: str | Path,
+        *,
+        resume: bool = False,
+        compact_every: int = COMPACT_EVERY,
+    ) -> None:
+        self.snapshot_path, self.journal_path = state_paths(Path(evidence_dir))
+        self.compact_every = compact_every
+        self.state: dict[str, Any] = {}
+        self.seq = 0
+        self._since_compact = 0
+        self._compacted = False
+        if resume and (self.snapshot_path.exists() or self.journal_path.exists()):
+            self.state, self.seq = _fold(self.snapshot_path, self.journal_path)
+            # Drops a torn tail so new records never append to a partial line.
+            self.compact()
+        elif not resume:
+            # A stale snapshot's seq would shadow this run's first records.
+            self.snapshot_path.unlink(missing_ok=True)
+            self.journal_path.unlink(missing_ok=True)
+
+    def update(self, state: dict[str, Any], *, sync: bool = True) -> None:
+        """Record ``state`` as the full current state, journaling only the difference."""
+        normalised = _normalise(state)
+        changed = {
+            key: value for key, value in normalised.items()
+            if key not in self.state or self.state[key] != value
+        }
+        removed = [key for key in self.state if key not in normalised]
+        if not changed and not removed and self._compacted:
+            return
+        self.seq += 1
+        record: dict[str, Any] = {"seq": self.seq, "ts": round(time.time(), 3), "set": changed}
+        if removed:
+            record["unset"] = removed
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.journal_path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+            fh.flush()
+            if sync:
+                os.fsync(fh.fileno())
+        for key in removed:
+            del self.state[key]
+        self.state.update(changed)
+        self._since_compact += 1
+        if (
+            not self._compacted
+            or self._since_compact >= self.compact_every
+            or self.state.get("phase") in TERMINAL_PHASES
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Atomically replace the snapshot with the folded state and truncate the journal."""
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            fh.write(json.dumps({**self.state, _SEQ_KEY: self.seq}, indent=2))
+            fh.flush()
+            os.fsync(fh.fileno())
+        tmp.replace(self.snapshot_path)
+        _fsync_dir(self.snapshot_path.parent)
+        # Records up to ``seq`` are now in the snapshot; a crash before the
+        # truncate leaves them in the journal, where the loader skips them.
+        with self.journal_path.open("w", encoding="utf-8"):
+            pass
+        self._since_compact = 0
+        self._compacted = True
@@ -181,6 +181,41 @@ class SubprocessRunner(AgentRunner):
                     pass
 
 
+# ---------------------------------------------------------------------------
+# Command log loading
+# ---------------------------------------------------------------------------
+
+def parse_command_log(raw: str) -> list[ObservedCommand]:
+    """Parse a command log saved as a JSON list or as JSON Lines."""
+    raw = raw.strip()
+    if not raw:
+        return []
+
+    try:
+        if raw.startswith("["):
+            payload = json.loads(raw)
+            return [
+                ObservedCommand.from_dict(item)
+                for item in payload
+                if isinstance(item, dict)
+            ]
+    except json.JSONDecodeError:
+        return []
+
+    commands: list[ObservedCommand] = []
+    for line in raw.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(payload, dict):
+            commands.append(ObservedCommand.from_dict(payload))
+    return commands
+
+
 # ---------------------------------------------------------------------------
 # MockRunner
 # ---------------------------------------------------------------------------
@@ -289,30 +324,4 @@ class MockRunner(AgentRunner):
             return 0
 
     def _load_command_log(self) -> list[ObservedCommand]:
-        raw = self._read_text("command_log.jsonl").strip()
-        if not raw:
-            return []
-
-        try:
-            if raw.startswith("["):
-                payload = json.loads(raw)
-                return [
-                    ObservedCommand.from_dict(item)
-                    for item in payload
-                    if isinstance(item, dict)
-                ]
-        except json.JSONDecodeError:
-            return []
-
-        commands: list[ObservedCommand] = []
-        for line in raw.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(payload, dict):
-                commands.append(ObservedCommand.from_dict(payload))
-        return commands
+        return parse_command_log(self._read_text("command_log.jsonl"))
@@ -0,0 +1,600 @@
+"""Fleet-wide orphan sweeper for leaked eval resources.
+
+Crashed or killed eval runs never reach their cleanup phase and leak
+``ce-<MMDD>-<rand8>`` Fly apps, Neon projects and project directories.
+The sweeper discovers every eval-prefixed resource, cross-references the
+``run_state.json`` files in ``<projects_root>/.eval-evidence``, and deletes
+resources older than an age threshold that no live run still owns.
+
+Batch runs (``batch.py``) each get their own projects root under
+``<projects_root>/.eval-batch/<batch-id>/runs/<slug>``; those roots are
+scanned for project directories and run state as well.
+
+Safety:
+    - Resources owned by a run whose state is non-terminal and recently
+      updated are never touched
+    - Directories are removed only through ``_safe_delete_project``
+    - Every decision (delete or skip) is recorded in one audit manifest
+
+Usage::
+
+    python tests/eval/sweeper.py --max-age-hours 6 --dry-run
+    python tests/eval/sweeper.py --projects-root /home/ubuntu/projects
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.eval.cleanup import _safe_delete_project
+from tests.eval.contracts import CleanupResult
+from tests.eval.eval_logger import EvalLogger
+from tests.eval.parsing import extract_neon_project_id
+from tests.eval.providers.fly import FlyAdapter
+from tests.eval.providers.neon import NeonAdapter
+from tests.eval.run_state import TERMINAL_PHASES, load_run_state, run_state_mtime
+
+
+DEFAULT_PREFIX = "ce-"
+DEFAULT_MAX_AGE_HOURS = 6.0
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MIN_INTERVAL_S = 0.5
+BATCH_DIRNAME = ".eval-batch"
+
+_EVAL_ID_TS_RE = re.compile(r"^child-eval-(\d{8}T\d{6}Z)-[a-z0-9]{8}$")
+_SLUG_DATE_RE = re.compile(r"^ce-(\d{2})(\d{2})-[a-z0-9]+$")
+
+
+# ---------------------------------------------------------------------------
+# Inventory records
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RunStateRecord:
+    """Summary of one ``run_state.json`` found under the evidence root."""
+
+    app_slug: str
+    path: str
+    phase: str = ""
+    eval_id: str = ""
+    project_root: str = ""
+    updated_at: float = 0.0        # latest state/journal mtime (epoch seconds)
+    readable: bool = True
+
+    @property
+    def terminal(self) -> bool:
+        return self.phase in TERMINAL_PHASES
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "app_slug": self.app_slug,
+            "path": self.path,
+            "phase": self.phase,
+            "eval_id": self.eval_id,
+            "project_root": self.project_root,
+            "updated_at": self.updated_at,
+            "readable": self.readable,
+        }
+
+
+@dataclass
+class SweepCandidate:
+    """A single eval-prefixed resource considered by the sweeper."""
+
+    resource_type: str             # "fly_app" | "neon_project" | "directory"
+    resource_id: str
+    app_slug: str
+    age_seconds: float | None = None
+    run_phase: str = ""            # phase of the owning run, if any
+    action: str = "skip"           # "delete" | "skip"
+    reason: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "resource_type": self.resource_type,
+            "resource_id": self.resource_id,
+            "app_slug": self.app_slug,
+            "age_seconds": self.age_seconds,
+            "run_phase": self.run_phase,
+            "action": self.action,
+            "reason": self.reason,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Sweep manifest
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SweepManifest:
+    """Audit record of a single sweep across the shared fleet."""
+
+    started_at: str
+    projects_root: str
+    prefix: str
+    max_age_seconds: float
+    dry_run: bool = False
+    candidates: list[SweepCandidate] = field(default_factory=list)
+    results: list[CleanupResult] = field(default_factory=list)
+    run_states: list[RunStateRecord] = field(default_factory=list)
+    completed: bool = False
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        deletions = [c for c in self.candidates if c.action == "delete"]
+        return {
+            "started_at": self.started_at,
+            "projects_root": self.projects_root,
+            "prefix": self.prefix,
+            "max_age_seconds": self.max_age_seconds,
+            "dry_run": self.dry_run,
+            "completed": self.completed,
+            "duration_seconds": self.duration_seconds,
+            "candidate_count": len(self.candidates),
+            "planned_deletions": len(deletions),
+            "succeeded": sum(1 for r in self.results if r.success),
+            "failed": sum(1 for r in self.results if not r.success),
+            "candidates": [c.to_dict() for c in self.candidates],
+            "results": [r.to_dict() for r in self.results],
+            "run_states": [s.to_dict() for s in self.run_states],
+        }
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
+
+
+# ---------------------------------------------------------------------------
+# Age helpers
+# ---------------------------------------------------------------------------
+
+def _started_at_from_eval_id(eval_id: str) -> datetime | None:
+    m = _EVAL_ID_TS_RE.match(eval_id or "")
+    if not m:
+        return None
+    return datetime.strptime(m.group(1), "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+
+
+def _started_at_from_slug(app_slug: str, now: datetime) -> datetime | None:
+    """Derive a conservative start time from a ``ce-<MMDD>-*`` slug.
+
+    The slug only carries month and day, so the end of that day is used
+    (under-estimating age) and dates in the future roll back one year.
+    """
+    m = _SLUG_DATE_RE.match(app_slug)
+    if not m:
+        return None
+    month, day = int(m.group(1)), int(m.group(2))
+    for year in (now.year, now.year - 1):
+        try:
+            end_of_day = datetime(year, month, day, tzinfo=timezone.utc) + timedelta(days=1)
+        except ValueError:
+            continue
+        if end_of_day - timedelta(days=1) <= now:
+            return min(end_of_day, now)
+    return None
+
+
+def _resource_age_seconds(
+    app_slug: str,
+    state: RunStateRecord | None,
+    now: datetime,
+    fallback_mtime: float | None = None,
+) -> float | None:
+    started = None
+    if state is not None:
+        started = _started_at_from_eval_id(state.eval_id)
+    if started is None:
+        started = _started_at_from_slug(app_slug, now)
+    if started is not None:
+        return max(0.0, (now - started).total_seconds())
+    if fallback_mtime is not None:
+        return max(0.0, now.timestamp() - fallback_mtime)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Inventory
+# ---------------------------------------------------------------------------
+
+def load_run_state_index(evidence_root: str | Path) -> dict[str, RunStateRecord]:
+    """Index every ``<evidence_root>/*/run_state.json`` (plus journal) by app slug.
+
+    Unreadable state files are kept (``readable=False``) so the owning
+    resources are still treated conservatively by age alone.
+    """
+    index: dict[str, RunStateRecord] = {}
+    root = Path(evidence_root)
+    if not root.is_dir():
+        return index
+
+    for path in sorted(root.glob("*/run_state.json")):
+        mtime = run_state_mtime(path)
+        if mtime is None:
+            continue
+        record = RunStateRecord(app_slug=path.parent.name, path=str(path), updated_at=mtime)
+        try:
+            state = load_run_state(path)
+        except (OSError, ValueError):
+            record.readable = False
+            index[record.app_slug] = record
+            continue
+
+        manifest = state.get("manifest") if isinstance(state, dict) else None
+        if isinstance(manifest, dict):
+            record.app_slug = str(manifest.get("app_slug") or record.app_slug)
+            record.project_root = str(manifest.get("project_root") or "")
+        if isinstance(state, dict):
+            record.phase = str(state.get("phase") or "")
+            record.eval_id = str(state.get("eval_id") or "")
+        index[record.app_slug] = record
+    return index
+
+
+def scan_roots(projects_root: str | Path) -> list[Path]:
+    """``projects_root`` followed by every batch run's own projects root."""
+    root = Path(projects_root)
+    batch_runs = [
+        path for path in sorted(root.glob(f"{BATCH_DIRNAME}/*/runs/*"))
+        if path.is_dir() and not path.is_symlink()
+    ]
+    return [root, *batch_runs]
+
+
+def load_fleet_run_states(projects_root: str | Path) -> dict[str, RunStateRecord]:
+    """:func:`load_run_state_index` over the evidence root of every scan root."""
+    index: dict[str, RunStateRecord] = {}
+    for root in scan_roots(projects_root):
+        index.update(load_run_state_index(root / ".eval-evidence"))
+    return index
+
+
+def _classify(
+    candidate: SweepCandidate,
+    state: RunStateRecord | None,
+    now: datetime,
+    max_age_seconds: float,
+) -> SweepCandidate:
+    if state is not None:
+        candidate.run_phase = state.phase
+        state_age = now.timestamp() - state.updated_at
+        if state.readable and not state.terminal and state_age < max_age_seconds:
+            candidate.action = "skip"
+            candidate.reason = f"owned by live run (phase={state.phase or 'unknown'})"
+            return candidate
+
+    if candidate.age_seconds is None:
+        candidate.action = "skip"
+        candidate.reason = "age unknown"
+    elif candidate.age_seconds < max_age_seconds:
+        candidate.action = "skip"
+        candidate.reason = "younger than threshold"
+    else:
+        candidate.action = "delete"
+        candidate.reason = (
+            f"orphaned after run phase {state.phase or 'unknown'}"
+            if state is not None
+            else "no run_state.json found"
+        )
+    return candidate
+
+
+def discover_candidates(
+    projects_root: str | Path,
+    *,
+    fly_adapter: FlyAdapter,
+    prefix: str = DEFAULT_PREFIX,
+    max_age_seconds: float = DEFAULT_MAX_AGE_HOURS * 3600,
+    run_states: dict[str, RunStateRecord] | None = None,
+    now: datetime | None = None,
+) -> list[SweepCandidate]:
+    """Inventory eval-prefixed Fly apps, Neon projects and directories.
+
+    Neon has no prefix listing, so Neon project IDs are recovered from each
+    slug's generated app config before its directory is removed.
+    """
+    now = now or datetime.now(timezone.utc)
+    projects_path = Path(projects_root)
+    states = run_states if run_states is not None else load_fleet_run_states(projects_path)
+    candidates: list[SweepCandidate] = []
+    slugs: set[str] = set()
+
+    for app in fly_adapter.list_apps(prefix=prefix):
+        slugs.add(app.name)
+        candidates.append(SweepCandidate(
+            resource_type="fly_app",
+            resource_id=app.name,
+            app_slug=app.name,
+            age_seconds=_resource_age_seconds(app.name, states.get(app.name), now),
+        ))
+
+    dir_mtimes: dict[str, float] = {}
+    dir_paths: dict[str, Path] = {}
+    for root in scan_roots(projects_path):
+        if not root.is_dir():
+            continue
+        for child in sorted(root.iterdir()):
+            if not child.name.startswith(prefix) or not child.is_dir() or child.is_symlink():
+                continue
+            slugs.add(child.name)
+            dir_paths[child.name] = child
+            try:
+                dir_mtimes[child.name] = child.stat().st_mtime
+            except OSError:
+                continue
+            candidates.append(SweepCandidate(
+                resource_type="directory",
+                resource_id=str(child),
+                app_slug=child.name,
+                age_seconds=_resource_age_seconds(
+                    child.name,
+                    states.get(child.name),
+                    now,
+                    fallback_mtime=dir_mtimes[child.name],
+                ),
+            ))
+
+    slugs.update(slug for slug in states if slug.startswith(prefix))
+    seen_neon: set[str] = set()
+    for slug in sorted(slugs):
+        state = states.get(slug)
+        project_root = (state.project_root if state and state.project_root else "") or str(
+            dir_paths.get(slug, projects_path / slug)
+        )
+        neon_project_id = extract_neon_project_id(project_root)
+        if not neon_project_id or neon_project_id in seen_neon:
+            continue
+        seen_neon.add(neon_project_id)
+        candidates.append(SweepCandidate(
+            resource_type="neon_project",
+            resource_id=neon_project_id,
+            app_slug=slug,
+            age_seconds=_resource_age_seconds(slug, state, now, fallback_mtime=dir_mtimes.get(slug)),
+        ))
+
+    return [
+        _classify(candidate, states.get(candidate.app_slug), now, max_age_seconds)
+        for candidate in candidates
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Deletion
+# ---------------------------------------------------------------------------
+
+class _RateLimiter:
+    """Spaces out provider calls by at least ``min_interval_s``."""
+
+    def __init__(self, min_interval_s: float) -> None:
+        self._interval = max(0.0, min_interval_s)
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+                now = time.monotonic()
+            self._next_at = now + self._interval
+
+
+def _delete_candidate(
+    candidate: SweepCandidate,
+    projects_root: str,
+    fly: FlyAdapter,
+    neon: NeonAdapter,
+) -> CleanupResult:
+    start = time.monotonic()
+    try:
+        if candidate.resource_type == "fly_app":
+            success = fly.delete_app(candidate.resource_id)
+            error = "" if success else "delete_app returned False"
+        elif candidate.resource_type == "neon_project":
+            success = neon.destroy_project(candidate.resource_id)
+            error = "" if success else "destroy_project returned False"
+        elif candidate.resource_type == "directory":
+            success, error = _safe_delete_project(candidate.resource_id, projects_root)
+        else:
+            success, error = False, f"unknown resource type {candidate.resource_type}"
+    except Exception as e:
+        success, error = False, str(e)
+    return CleanupResult(
+        resource_type=candidate.resource_type,
+        resource_id=candidate.resource_id,
+        success=success,
+        error=error,
+        duration_seconds=time.monotonic() - start,
+    )
+
+
+async def _delete_all(
+    candidates: list[SweepCandidate],
+    projects_root: str,
+    fly: FlyAdapter,
+    neon: NeonAdapter,
+    concurrency: int,
+    min_interval_s: float,
+    logger: EvalLogger | None,
+) -> list[CleanupResult]:
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = _RateLimiter(min_interval_s)
+
+    async def _one(candidate: SweepCandidate) -> CleanupResult:
+        async with semaphore:
+            await limiter.wait()
+            if logger:
+                logger.info(
+                    f"Sweep: deleting {candidate.resource_type} {candidate.resource_id} "
+                    f"({candidate.reason})"
+                )
+            return await asyncio.to_thread(
+                _delete_candidate, candidate, projects_root, fly, neon,
+            )
+
+    return list(await asyncio.gather(*(_one(c) for c in candidates)))
+
+
+def sweep_orphans(
+    projects_root: str = "/home/ubuntu/projects",
+    *,
+    prefix: str = DEFAULT_PREFIX,
+    max_age_seconds: float = DEFAULT_MAX_AGE_HOURS * 3600,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    min_interval_s: float = DEFAULT_MIN_INTERVAL_S,
+    dry_run: bool = False,
+    fly_adapter: FlyAdapter | None = None,
+    neon_adapter: NeonAdapter | None = None,
+    logger: EvalLogger | None = None,
+    manifest_path: str | Path | None = None,
+    now: datetime | None = None,
+) -> SweepManifest:
+    """Discover and delete orphaned eval resources across the fleet.
+
+    Fly apps and Neon projects are deleted before directories so that a
+    failed provider delete still leaves the local config needed to retry.
+    """
+    fly = fly_adapter or FlyAdapter()
+    neon = neon_adapter or NeonAdapter()
+    now = now or datetime.now(timezone.utc)
+    projects_root = str(projects_root)
+    evidence_root = Path(projects_root) / ".eval-evidence"
+    start = time.monotonic()
+
+    states = load_fleet_run_states(projects_root)
+    sweep = SweepManifest(
+        started_at=now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        projects_root=projects_root,
+        prefix=prefix,
+        max_age_seconds=max_age_seconds,
+        dry_run=dry_run,
+        run_states=list(states.values()),
+    )
+    sweep.candidates = discover_candidates(
+        projects_root,
+        fly_adapter=fly,
+        prefix=prefix,
+        max_age_seconds=max_age_seconds,
+        run_states=states,
+        now=now,
+    )
+    to_delete = [c for c in sweep.candidates if c.action == "delete"]
+    if logger:
+        logger.info(
+            f"Sweep: {len(sweep.candidates)} candidates, {len(to_delete)} orphaned"
+            + (" (dry run)" if dry_run else "")
+        )
+
+    if not dry_run and to_delete:
+        providers = [c for c in to_delete if c.resource_type != "directory"]
+        directories = [c for c in to_delete if c.resource_type == "directory"]
+        for batch in (providers, directories):
+            sweep.results.extend(asyncio.run(_delete_all(
+                batch, projects_root, fly, neon, concurrency, min_interval_s, logger,
+            )))
+
+    sweep.completed = True
+    sweep.duration_seconds = time.monotonic() - start
+    if manifest_path is None:
+        manifest_path = evidence_root / f"orphan_sweep_{now.strftime('%Y%m%dT%H%M%SZ')}.json"
+    try:
+        sweep.save(manifest_path)
+    except OSError:
+        pass  # best-effort
+    return sweep
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="sweeper",
+        description="Delete leaked ce-* eval resources (Fly apps, Neon projects, directories)",
+    )
+    parser.add_argument(
+        "--projects-root",
+        default="/home/ubuntu/projects",
+        help="Root directory for generated projects",
+    )
+    parser.add_argument(
+        "--prefix",
+        default=DEFAULT_PREFIX,
+        help=f"Resource name prefix to sweep (default: {DEFAULT_PREFIX})",
+    )
+    parser.add_argument(
+        "--max-age-hours",
+        type=float,
+        default=DEFAULT_MAX_AGE_HOURS,
+        help=f"Only delete resources older than this (default: {DEFAULT_MAX_AGE_HOURS})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Parallel deletions (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=DEFAULT_MIN_INTERVAL_S,
+        help=f"Minimum seconds between provider calls (default: {DEFAULT_MIN_INTERVAL_S})",
+    )
+    parser.add_argument(
+        "--manifest",
+        help="Audit manifest path (default: <projects-root>/.eval-evidence/orphan_sweep_<ts>.json)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be deleted without deleting anything",
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Suppress console output",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point. Returns exit code."""
+    args = build_parser().parse_args(argv)
+    logger = EvalLogger(eval_id="sweeper", quiet=args.quiet)
+    sweep = sweep_orphans(
+        args.projects_root,
+        prefix=args.prefix,
+        max_age_seconds=args.max_age_hours * 3600,
+        concurrency=args.concurrency,
+        min_interval_s=args.min_interval,
+        dry_run=args.dry_run,
+        logger=logger,
+        manifest_path=args.manifest,
+    )
+    failed = sum(1 for r in sweep.results if not r.success)
+    logger.info(
+        f"Sweep complete: {len(sweep.results)} deletions, {failed} failed "
+        f"({sweep.duration_seconds:.1f}s)"
+    )
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
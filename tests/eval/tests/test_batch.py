@@ -0,0 +1,201 @@
+"""Unit tests for the batch eval runner and trusted-port leasing.
+
+Run with: python3 -m pytest tests/eval/tests/test_batch.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import tests.eval.batch as batch_module
+import tests.eval.eval_child_app as eval_child_app_module
+from tests.eval.batch import (
+    BatchLimits,
+    _execute_jobs,
+    build_matrix_report,
+    plan_jobs,
+    run_batch,
+    score_distribution,
+)
+from tests.eval.contracts import CheckResult, EvalResult
+from tests.eval.reason_codes import CheckStatus
+from tests.eval.results_store import default_results_db
+
+
+def _result(eval_id: str, status: CheckStatus, core: float, check_status: CheckStatus) -> EvalResult:
+    return EvalResult(
+        eval_id=eval_id,
+        status=status,
+        core_score=core,
+        overall_score=core,
+        checks=[CheckResult(
+            id="deploy.health_200",
+            category="deployment",
+            weight=3.0,
+            status=check_status,
+        )],
+    )
+
+
+class TestPlanJobs:
+    def test_round_robin_across_profiles_with_isolated_roots(self, tmp_path):
+        jobs = plan_jobs(["core", "auth-plus"], 3, tmp_path)
+
+        assert [job.profile for job in jobs] == ["core", "auth-plus"] * 3
+        assert len({job.eval_id for job in jobs}) == 6
+        assert len({job.projects_root for job in jobs}) == 6
+        for job in jobs:
+            assert Path(job.evidence_dir).is_relative_to(Path(job.projects_root))
+
+
+class TestExecuteJobs:
+    def test_caps_fly_and_neon_concurrency(self, tmp_path):
+        jobs = plan_jobs(["core"], 6, tmp_path)
+        active = {"now": 0, "peak": 0}
+
+        async def fake_run(job):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return _result(job.eval_id, CheckStatus.PASS, 1.0, CheckStatus.PASS)
+
+        outcomes = asyncio.run(_execute_jobs(
+            jobs,
+            BatchLimits(workers=4, max_fly_deploys=2, max_neon_projects=3),
+            fake_run,
+            needs_fly=True,
+        ))
+
+        assert active["peak"] == 2
+        assert [o.job.eval_id for o in outcomes] == [job.eval_id for job in jobs]
+
+    def test_harness_exception_becomes_error_outcome(self, tmp_path):
+        jobs = plan_jobs(["core"], 1, tmp_path)
+
+        async def boom(job):
+            raise RuntimeError("agent crashed")
+
+        outcomes = asyncio.run(_execute_jobs(jobs, BatchLimits(), boom, needs_fly=False))
+
+        assert outcomes[0].status == CheckStatus.ERROR
+        assert "agent crashed" in outcomes[0].error
+
+
+class TestMatrixReport:
+    def test_score_distribution_quantiles_and_histogram(self):
+        dist = score_distribution([0.5, 1.0, 0.9, 0.1])
+
+        assert dist["count"] == 4
+        assert dist["min"] == 0.1
+        assert dist["max"] == 1.0
+        assert dist["p50"] == 0.7
+        assert dist["histogram"] == {
+            "0.0-0.2": 1, "0.2-0.4": 0, "0.4-0.6": 1, "0.6-0.8": 0, "0.8-1.0": 2,
+        }
+
+    def test_pass_rates_per_profile_and_check(self, tmp_path):
+        jobs = plan_jobs(["core"], 4, tmp_path)
+        results = iter([
+            _result("a", CheckStatus.PASS, 1.0, CheckStatus.PASS),
+            _result("b", CheckStatus.PASS, 0.9, CheckStatus.PASS),
+            _result("c", CheckStatus.FAIL, 0.5, CheckStatus.FAIL),
+            _result("d", CheckStatus.FAIL, 0.6, CheckStatus.SKIP),
+        ])
+
+        async def fake_run(job):
+            return next(results)
+
+        outcomes = asyncio.run(_execute_jobs(jobs, BatchLimits(workers=1), fake_run, needs_fly=False))
+        report = build_matrix_report(outcomes, batch_id="batch-test", limits=BatchLimits())
+        core = report["profiles"]["core"]
+
+        assert core["pass_rate"] == 0.5
+        assert core["statuses"] == {"PASS": 2, "FAIL": 2}
+        assert core["checks"]["deploy.health_200"]["runs"] == 3
+        assert core["checks"]["deploy.health_200"]["pass_rate"] == 2 / 3
+
+
+def test_run_batch_passes_isolated_paths_and_writes_report(tmp_path, monkeypatch):
+    calls = []
+
+    async def fake_run_eval(**kwargs):
+        calls.append(kwargs)
+        return _result(kwargs["eval_id"], CheckStatus.PASS, 0.95, CheckStatus.PASS)
+
+    monkeypatch.setattr(batch_module, "run_eval", fake_run_eval)
+
+    report = asyncio.run(run_batch(
+        ["core", "extensible"],
+        2,
+        batch_root=str(tmp_path / "batch"),
+        limits=BatchLimits(workers=2),
+        skip_deploy=True,
+        quiet=True,
+    ))
+
+    assert report["total_runs"] == 4
+    assert report["pass_rate"] == 1.0
+    assert {call["profile"] for call in calls} == {"core", "extensible"}
+    assert len({call["projects_root"] for call in calls}) == 4
+    assert all(call["skip_deploy"] is True for call in calls)
+    assert {call["results_db"] for call in calls} == {str(default_results_db("/home/ubuntu/projects"))}
+    saved = json.loads((tmp_path / "batch" / "batch_report.json").read_text(encoding="utf-8"))
+    assert saved["profiles"]["extensible"]["runs"] == 2
+
+
+class TestTrustedPortLeasing:
+    def test_concurrent_acquires_get_distinct_ports(self, monkeypatch):
+        monkeypatch.setattr(eval_child_app_module, "_port_is_available", lambda port: True)
+        monkeypatch.setattr(eval_child_app_module, "_LEASED_LOCAL_AUTH_PORTS", set())
+
+        first = eval_child_app_module._pick_trusted_local_auth_port()
+        second = eval_child_app_module._pick_trusted_local_auth_port()
+        eval_child_app_module._release_trusted_local_auth_port(first)
+        third = eval_child_app_module._pick_trusted_local_auth_port()
+
+        assert first != second
+        assert third == first
+
+    def test_acquire_waits_for_released_lease(self, monkeypatch):
+        ports = eval_child_app_module.TRUSTED_LOCAL_AUTH_PORTS
+        monkeypatch.setattr(eval_child_app_module, "_port_is_available", lambda port: True)
+        monkeypatch.setattr(eval_child_app_module, "_LEASED_LOCAL_AUTH_PORTS", set(ports))
+
+        async def scenario():
+            async def release_later():
+                await asyncio.sleep(0.05)
+                eval_child_app_module._release_trusted_local_auth_port(ports[0])
+
+            releaser = asyncio.create_task(release_later())
+            port = await eval_child_app_module._acquire_trusted_local_auth_port(5)
+            await releaser
+            return port
+
+        assert asyncio.run(scenario()) == ports[0]
+
+    def test_acquire_fails_fast_without_sibling_leases(self, monkeypatch):
+        monkeypatch.setattr(eval_child_app_module, "_port_is_available", lambda port: False)
+        monkeypatch.setattr(eval_child_app_module, "_LEASED_LOCAL_AUTH_PORTS", set())
+
+        assert asyncio.run(eval_child_app_module._acquire_trusted_local_auth_port(5)) is None
+
+
+def test_cli_passes_cleanup_timeout_through(tmp_path, monkeypatch):
+    calls = []
+
+    async def fake_run_eval(**kwargs):
+        calls.append(kwargs)
+        return _result(kwargs["eval_id"], CheckStatus.PASS, 1.0, CheckStatus.PASS)
+
+    monkeypatch.setattr(batch_module, "run_eval", fake_run_eval)
+
+    exit_code = batch_module.main([
+        "--runs", "1", "--projects-root", str(tmp_path), "--cleanup-timeout", "7", "-q",
+    ])
+
+    assert exit_code == 0
+    assert [call["cleanup_timeout"] for call in calls] == [7]
+    assert calls[0]["projects_root"].startswith(str(tmp_path / ".eval-batch"))
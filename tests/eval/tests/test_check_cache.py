@@ -0,0 +1,149 @@
+"""Unit tests for fingerprint-keyed check-result caching.
+
+Run with: python3 -m pytest tests/eval/tests/test_check_cache.py -v
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+
+import pytest
+
+import tests.eval.check_cache as check_cache_module
+from tests.eval.check_cache import CACHE_FILENAME, CheckCache, index_project_tree
+from tests.eval.checks.report_quality import run_report_quality_checks
+from tests.eval.checks.scaffolding import run_scaffolding_checks
+from tests.eval.checks.security import run_security_checks
+from tests.eval.redaction import SecretRegistry
+from tests.eval.tests.helpers import make_project_tree
+
+
+@pytest.fixture
+def manifest(sample_manifest, tmp_path):
+    project_root = tmp_path / "ce-0320-t3stv4lu"
+    make_project_tree(project_root, {
+        "boring.app.toml": '[app]\nname = "ce-0320-t3stv4lu"\n',
+        "src/app.py": "def create_app():\n    return None\n",
+    })
+    evidence = tmp_path / "evidence"
+    evidence.mkdir()
+    return dataclasses.replace(
+        sample_manifest,
+        project_root=str(project_root),
+        evidence_dir=str(evidence),
+    )
+
+
+def _fresh(manifest) -> CheckCache:
+    return CheckCache(manifest.evidence_dir)
+
+
+class TestCheckCache:
+    def test_unchanged_inputs_replay_results_across_instances(self, manifest):
+        first = _fresh(manifest)
+        computed = first.run(run_scaffolding_checks, manifest)
+        first.save()
+
+        second = _fresh(manifest)
+        replayed = second.run(run_scaffolding_checks, manifest)
+
+        assert first.stats.misses == ["scaffolding"]
+        assert second.stats.hits == ["scaffolding"]
+        assert second.stats.reused_checks == len(computed)
+        assert [c.to_dict() for c in replayed] == [c.to_dict() for c in computed]
+
+    def test_project_file_change_invalidates(self, manifest):
+        cache = _fresh(manifest)
+        cache.run(run_scaffolding_checks, manifest)
+        Path(manifest.project_root, "src", "app.py").write_text(
+            "def create_app():\n    return 1\n", encoding="utf-8",
+        )
+        cache.run(run_scaffolding_checks, manifest)
+
+        assert cache.stats.misses == ["scaffolding", "scaffolding"]
+        assert cache.stats.hits == []
+
+    def test_argument_change_invalidates(self, manifest):
+        cache = _fresh(manifest)
+        cache.run(run_report_quality_checks, manifest, agent_text="done", command_log=[])
+        cache.run(run_report_quality_checks, manifest, agent_text="done", command_log=[])
+        cache.run(run_report_quality_checks, manifest, agent_text="changed", command_log=[])
+
+        assert cache.stats.hits == ["report_quality"]
+        assert len(cache.stats.misses) == 2
+
+    def test_registry_and_evidence_files_are_fingerprinted(self, manifest):
+        registry = SecretRegistry()
+        kwargs = {"agent_stdout": "", "pre_snapshot": set(), "post_snapshot": set()}
+        cache = _fresh(manifest)
+        cache.run(run_security_checks, manifest, registry=registry, **kwargs)
+        cache.run(run_security_checks, manifest, registry=registry, **kwargs)
+        registry.register("NEON_API_KEY", "napi_supersecretvalue")
+        cache.run(run_security_checks, manifest, registry=registry, **kwargs)
+        (Path(manifest.evidence_dir) / "agent_stdout.txt").write_text(
+            "new output", encoding="utf-8",
+        )
+        cache.run(run_security_checks, manifest, registry=registry, **kwargs)
+
+        assert cache.stats.hits == ["security"]
+        assert len(cache.stats.misses) == 3
+
+    def test_undeclared_input_raises(self, manifest):
+        cache = _fresh(manifest)
+
+        with pytest.raises(ValueError, match="undeclared"):
+            cache.run(run_scaffolding_checks, manifest, agent_text="x")
+
+    def test_disabled_cache_always_recomputes(self, manifest):
+        cache = CheckCache(manifest.evidence_dir, enabled=False)
+        cache.run(run_scaffolding_checks, manifest)
+        cache.run(run_scaffolding_checks, manifest)
+        cache.save()
+
+        assert cache.stats.hits == cache.stats.misses == []
+        saved = json.loads((Path(manifest.evidence_dir) / CACHE_FILENAME).read_text())
+        assert saved["entries"] == {}
+
+    def test_read_only_cache_replays_but_never_writes(self, manifest):
+        writer = CheckCache(manifest.evidence_dir)
+        writer.run(run_scaffolding_checks, manifest)
+        writer.save()
+        path = Path(manifest.evidence_dir) / CACHE_FILENAME
+        before = path.read_bytes()
+
+        reader = CheckCache(manifest.evidence_dir, read_only=True)
+        reader.run(run_scaffolding_checks, manifest)
+        reader.run(run_report_quality_checks, manifest, agent_text="done", command_log=[])
+        reader.save()
+
+        assert reader.stats.hits == ["scaffolding"]
+        assert path.read_bytes() == before
+
+class TestProjectIndex:
+    def test_unchanged_files_are_not_rehashed(self, tmp_path, monkeypatch):
+        make_project_tree(tmp_path, {"a.py": "a", "node_modules/pkg/index.js": "x"})
+        first = index_project_tree(tmp_path)
+        calls = []
+        real = check_cache_module._sha256_file
+        monkeypatch.setattr(check_cache_module, "_sha256_file", lambda p: calls.append(p) or real(p))
+
+        second = index_project_tree(tmp_path, first)
+
+        assert second == first
+        assert calls == []
+        assert first["node_modules/pkg/index.js"][2] == ""
+        assert first["a.py"][2]
+
+    def test_symlinks_are_recorded_not_followed(self, tmp_path):
+        outside = tmp_path / "outside"
+        make_project_tree(outside, {"secret.txt": "s"})
+        project = tmp_path / "project"
+        make_project_tree(project, {"a.py": "a"})
+        (project / "escape").symlink_to(outside)
+
+        index = index_project_tree(project)
+
+        assert index["escape"][2] == f"link:{outside}"
+        assert not any(rel.startswith("escape/") for rel in index)
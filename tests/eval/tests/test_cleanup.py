@@ -6,10 +6,15 @@ Run with: python3 -m pytest tests/eval/tests/test_cleanup.py -v
 from __future__ import annotations
 
 import json
+import os
+from datetime import datetime, timezone
 from pathlib import Path
 
 from tests.eval.cleanup import _safe_delete_project, run_cleanup
 from tests.eval.contracts import NamingContract, RunManifest
+from tests.eval.providers.fly import AppInfo
+from tests.eval.run_state import RunStateJournal
+from tests.eval.sweeper import load_run_state_index, sweep_orphans
 
 
 class StubFlyAdapter:
@@ -185,3 +190,176 @@ class TestRunCleanup:
         assert results["neon_project"].success is False
         assert "neon api unavailable" in results["neon_project"].error
         assert results["directory"].success is True
+
+
+class StubSweepFlyAdapter:
+    def __init__(self, app_names: list[str]):
+        self.app_names = list(app_names)
+        self.delete_calls: list[str] = []
+
+    def list_apps(self, prefix: str | None = None) -> list[AppInfo]:
+        return [
+            AppInfo(name=name)
+            for name in self.app_names
+            if not prefix or name.startswith(prefix)
+        ]
+
+    def delete_app(self, app_name: str) -> bool:
+        self.delete_calls.append(app_name)
+        return True
+
+
+def _write_state(projects_root: Path, app_slug: str, eval_id: str, phase: str) -> Path:
+    evidence_dir = projects_root / ".eval-evidence" / app_slug
+    evidence_dir.mkdir(parents=True, exist_ok=True)
+    path = evidence_dir / "run_state.json"
+    path.write_text(json.dumps({
+        "phase": phase,
+        "eval_id": eval_id,
+        "manifest": {
+            "app_slug": app_slug,
+            "project_root": str(projects_root / app_slug),
+        },
+    }), encoding="utf-8")
+    return path
+
+
+class TestSweepOrphans:
+    NOW = datetime(2026, 3, 24, 18, 0, 0, tzinfo=timezone.utc)
+
+    def test_deletes_stale_resources_and_spares_live_runs(self, tmp_path):
+        old_slug = "ce-0322-oldoldol"
+        live_slug = "ce-0324-livelive"
+        (tmp_path / old_slug / ".boring").mkdir(parents=True)
+        (tmp_path / old_slug / ".boring" / "neon-config.env").write_text(
+            "NEON_PROJECT_ID=neon-old\n", encoding="utf-8",
+        )
+        (tmp_path / live_slug).mkdir()
+        (tmp_path / "plain-app").mkdir()
+        old_state = _write_state(
+            tmp_path, old_slug, "child-eval-20260322T080000Z-oldoldol", "agent_done",
+        )
+        live_state = _write_state(
+            tmp_path, live_slug, "child-eval-20260324T060000Z-livelive", "agent_done",
+        )
+        now_ts = self.NOW.timestamp()
+        os.utime(old_state, (now_ts - 2 * 86400, now_ts - 2 * 86400))
+        os.utime(live_state, (now_ts - 60, now_ts - 60))
+
+        fly = StubSweepFlyAdapter([old_slug, live_slug, "other-app"])
+        neon = StubNeonAdapter()
+
+        sweep = sweep_orphans(
+            str(tmp_path),
+            max_age_seconds=3600,
+            min_interval_s=0,
+            fly_adapter=fly,
+            neon_adapter=neon,
+            now=self.NOW,
+        )
+
+        assert fly.delete_calls == [old_slug]
+        assert neon.destroy_calls == ["neon-old"]
+        assert not (tmp_path / old_slug).exists()
+        assert (tmp_path / live_slug).exists()
+        assert (tmp_path / "plain-app").exists()
+        live = [c for c in sweep.candidates if c.app_slug == live_slug]
+        assert live and all(c.action == "skip" for c in live)
+        assert all("live run" in c.reason for c in live)
+
+        saved = list((tmp_path / ".eval-evidence").glob("orphan_sweep_*.json"))
+        assert len(saved) == 1
+        payload = json.loads(saved[0].read_text(encoding="utf-8"))
+        assert payload["succeeded"] == 3
+        assert payload["failed"] == 0
+
+    def test_threshold_and_dry_run_keep_everything(self, tmp_path):
+        fresh_slug = "ce-0324-freshfre"
+        stale_slug = "ce-0320-stalesta"
+        (tmp_path / fresh_slug).mkdir()
+        fly = StubSweepFlyAdapter([fresh_slug, stale_slug])
+
+        sweep = sweep_orphans(
+            str(tmp_path),
+            max_age_seconds=6 * 3600,
+            dry_run=True,
+            fly_adapter=fly,
+            neon_adapter=StubNeonAdapter(),
+            manifest_path=tmp_path / "audit.json",
+            now=self.NOW,
+        )
+
+        by_id = {c.resource_id: c for c in sweep.candidates}
+        assert by_id[fresh_slug].reason == "younger than threshold"
+        assert by_id[stale_slug].action == "delete"
+        assert fly.delete_calls == []
+        assert sweep.results == []
+        assert (tmp_path / fresh_slug).exists()
+        assert json.loads((tmp_path / "audit.json").read_text(encoding="utf-8"))["dry_run"] is True
+
+    def test_terminal_run_state_does_not_protect_leaked_app(self, tmp_path):
+        slug = "ce-0320-leakleak"
+        _write_state(tmp_path, slug, "child-eval-20260320T080000Z-leakleak", "cleanup_done")
+        fly = StubSweepFlyAdapter([slug])
+
+        sweep = sweep_orphans(
+            str(tmp_path),
+            max_age_seconds=3600,
+            min_interval_s=0,
+            fly_adapter=fly,
+            neon_adapter=StubNeonAdapter(),
+            now=self.NOW,
+        )
+
+        assert fly.delete_calls == [slug]
+        assert sweep.candidates[0].run_phase == "cleanup_done"
+
+    def test_batch_run_roots_are_scanned(self, tmp_path):
+        live_slug = "ce-0324-batchliv"
+        old_slug = "ce-0320-batchold"
+        for slug in (live_slug, old_slug):
+            run_root = tmp_path / ".eval-batch" / "batch-1" / "runs" / slug
+            (run_root / slug).mkdir(parents=True)
+        live_root = tmp_path / ".eval-batch" / "batch-1" / "runs" / live_slug
+        live_state = _write_state(live_root, live_slug, "child-eval-20260324T170000Z-batchliv", "agent_done")
+        now_ts = self.NOW.timestamp()
+        os.utime(live_state, (now_ts - 60, now_ts - 60))
+        old_dir = tmp_path / ".eval-batch" / "batch-1" / "runs" / old_slug / old_slug
+        os.utime(old_dir, (now_ts - 2 * 86400, now_ts - 2 * 86400))
+
+        sweep = sweep_orphans(
+            str(tmp_path),
+            max_age_seconds=3600,
+            min_interval_s=0,
+            fly_adapter=StubSweepFlyAdapter([live_slug]),
+            neon_adapter=StubNeonAdapter(),
+            now=self.NOW,
+        )
+
+        actions = {(c.resource_type, c.app_slug): c.action for c in sweep.candidates}
+        assert actions[("fly_app", live_slug)] == "skip"
+        assert actions[("directory", live_slug)] == "skip"
+        assert actions[("directory", old_slug)] == "delete"
+        assert not old_dir.exists()
+        assert (live_root / live_slug).exists()
+
+    def test_run_state_index_tolerates_corrupt_state(self, tmp_path):
+        evidence_dir = tmp_path / ".eval-evidence" / "ce-0320-corrupt0"
+        evidence_dir.mkdir(parents=True)
+        (evidence_dir / "run_state.json").write_text("{not json", encoding="utf-8")
+
+        index = load_run_state_index(tmp_path / ".eval-evidence")
+
+        assert index["ce-0320-corrupt0"].readable is False
+
+    def test_run_state_index_folds_journal_into_snapshot(self, tmp_path):
+        evidence_dir = tmp_path / ".eval-evidence" / "ce-0320-journal0"
+        journal = RunStateJournal(evidence_dir)
+        manifest = {"app_slug": "ce-0320-journal0", "project_root": str(tmp_path / "ce-0320-journal0")}
+        journal.update({"phase": "init", "eval_id": "child-eval-j", "manifest": manifest})
+        journal.update({"phase": "verification_done", "eval_id": "child-eval-j", "manifest": manifest})
+
+        record = load_run_state_index(tmp_path / ".eval-evidence")["ce-0320-journal0"]
+
+        assert record.phase == "verification_done"
+        assert record.updated_at == (evidence_dir / "run_state.jsonl").stat().st_mtime
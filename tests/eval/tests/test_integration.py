@@ -21,13 +21,22 @@ from tests.eval.checks.report_quality import run_report_quality_checks
 from tests.eval.checks.scaffolding import run_scaffolding_checks
 from tests.eval.checks.security import run_security_checks
 from tests.eval.checks.workflow import run_workflow_checks
-from tests.eval.contracts import CheckResult, RunManifest
-from tests.eval.eval_child_app import _load_run_state, _save_run_state, run_cleanup_from_state, run_eval
+from tests.eval.contracts import CheckResult, EvalResult, RunManifest
+from tests.eval.eval_child_app import (
+    _load_run_state,
+    _save_run_state,
+    load_run_result_from_evidence,
+    reverify_eval,
+    run_cleanup_from_state,
+    run_eval,
+)
 from tests.eval.eval_logger import EvalLogger
 from tests.eval.evidence import write_evidence_bundle
 from tests.eval.reason_codes import Attribution, CheckStatus
 from tests.eval.redaction import SecretRegistry
 from tests.eval.report_schema import BEGIN_MARKER, END_MARKER
+from tests.eval.results_store import ResultsStore, default_results_db
+from tests.eval.run_state import RunStateJournal
 from tests.eval.runners.mock import MockRunner
 from tests.eval.scoring import compute_scores
 from tests.eval.tests.helpers import make_project_tree
@@ -717,6 +726,209 @@ def test_run_eval_recovers_when_local_validation_times_out_after_agent_timeout(t
     assert state["phase"] == "complete"
     assert (evidence_dir / "eval_result.json").exists()
 
+    with ResultsStore(default_results_db(tmp_path)) as store:
+        flakes = store.check_flake_rates(min_runs=1)
+    assert {row["check_id"] for row in flakes} >= {"scaff.toml_valid"}
+
+
+def test_reverify_rescores_saved_run_without_agent(tmp_path, monkeypatch):
+    class MaterializingOnceRunner:
+        @property
+        def name(self) -> str:
+            return "materializing-once"
+
+        async def run(self, manifest: RunManifest, prompt: str, timeout_s: int = 600):
+            _materialize_project(manifest, "known-good")
+            return type("RunResultLike", (), {
+                "exit_code": 0,
+                "timed_out": False,
+                "stdout": "agent output",
+                "stderr": "",
+                "final_response": "All done.",
+                "command_log": [],
+                "elapsed_s": 0.1,
+            })()
+
+        async def cleanup(self) -> None:
+            return None
+
+    async def no_local_validation(manifest: RunManifest, timeout_s: int):
+        raise asyncio.TimeoutError
+
+    class FakeFlyAdapter:
+        def app_exists(self, app_name: str) -> bool:
+            return False
+
+        def app_url(self, app_name: str) -> str | None:
+            return None
+
+    monkeypatch.setattr(eval_child_app_module, "_run_local_dev_validation", no_local_validation)
+    monkeypatch.setattr(eval_child_app_module, "FlyAdapter", FakeFlyAdapter)
+
+    evidence_dir = tmp_path / "evidence"
+    original = asyncio.run(run_eval(
+        profile="core",
+        evidence_dir=str(evidence_dir),
+        projects_root=str(tmp_path),
+        verify_timeout=1,
+        skip_deploy=True,
+        skip_cleanup=True,
+        runner=MaterializingOnceRunner(),
+        quiet=True,
+    ))
+    original_bytes = (evidence_dir / "eval_result.json").read_bytes()
+    cache_bytes = (evidence_dir / "check_cache.json").read_bytes()
+
+    def fail_if_called(*args, **kwargs):
+        raise AssertionError("re-verify must not run unselected categories")
+
+    monkeypatch.setattr(eval_child_app_module, "run_local_dev_checks", fail_if_called)
+    monkeypatch.setattr(eval_child_app_module, "run_deployment_checks", fail_if_called)
+
+    rescored = asyncio.run(reverify_eval(
+        str(evidence_dir),
+        categories={"scaffolding", "report_quality"},
+        skip_deploy=True,
+        quiet=True,
+    ))
+    again = asyncio.run(reverify_eval(str(evidence_dir), categories={"workflow"}, quiet=True))
+
+    rescore = json.loads((evidence_dir / "rescores" / "v001" / "rescore.json").read_text(encoding="utf-8"))
+    assert (evidence_dir / "eval_result.json").read_bytes() == original_bytes
+    assert (evidence_dir / "check_cache.json").read_bytes() == cache_bytes
+    assert [c.to_dict() for c in rescored.checks] == [c.to_dict() for c in original.checks]
+    assert rescored.core_score == original.core_score
+    assert rescore["changed_checks"] == []
+    assert rescore["categories"] == ["report_quality", "scaffolding"]
+    assert set(rescore["check_cache"]["hits"]) == {"scaffolding", "report_quality"}
+    assert (evidence_dir / "rescores" / "v002" / "eval_result.json").exists()
+    assert again.status == original.status
+
+
+def test_resume_reuses_agent_run_after_crash_in_scoring(tmp_path, monkeypatch):
+    class MaterializingOnceRunner:
+        calls = 0
+
+        @property
+        def name(self) -> str:
+            return "materializing-once"
+
+        async def run(self, manifest: RunManifest, prompt: str, timeout_s: int = 600):
+            MaterializingOnceRunner.calls += 1
+            _materialize_project(manifest, "known-good")
+            return type("RunResultLike", (), {
+                "exit_code": 0,
+                "timed_out": False,
+                "stdout": "agent output",
+                "stderr": "",
+                "final_response": "All done.",
+                "command_log": [],
+                "elapsed_s": 42.0,
+            })()
+
+        async def cleanup(self) -> None:
+            return None
+
+    async def no_local_validation(manifest: RunManifest, timeout_s: int):
+        raise asyncio.TimeoutError
+
+    class FakeFlyAdapter:
+        def app_exists(self, app_name: str) -> bool:
+            return False
+
+        def app_url(self, app_name: str) -> str | None:
+            return None
+
+    def crash_scoring(*args, **kwargs):
+        raise RuntimeError("harness crashed while scoring")
+
+    monkeypatch.setattr(eval_child_app_module, "_run_local_dev_validation", no_local_validation)
+    monkeypatch.setattr(eval_child_app_module, "FlyAdapter", FakeFlyAdapter)
+    monkeypatch.setattr(eval_child_app_module, "compute_scores", crash_scoring)
+
+    evidence_dir = tmp_path / "evidence"
+    with pytest.raises(RuntimeError, match="while scoring"):
+        asyncio.run(run_eval(
+            profile="core",
+            evidence_dir=str(evidence_dir),
+            projects_root=str(tmp_path),
+            verify_timeout=1,
+            skip_deploy=True,
+            skip_cleanup=True,
+            runner=MaterializingOnceRunner(),
+            quiet=True,
+        ))
+    crashed = _load_run_state(str(evidence_dir / "run_state.json"))
+    assert crashed["phase"] == "error"
+    assert "verification" in crashed["completed_phases"]
+
+    # A row an earlier attempt left in the store stays, but stops counting.
+    with ResultsStore(default_results_db(tmp_path)) as store:
+        store.ingest(EvalResult(
+            eval_id=crashed["eval_id"],
+            status=CheckStatus.FAIL,
+            core_score=0.0,
+            overall_score=0.0,
+            checks=[CheckResult(id="scaff.toml_valid", category="scaffolding", weight=1.0, status=CheckStatus.FAIL)],
+        ), profile="core")
+
+    # The URL found before the crash is reused instead of rediscovered.
+    RunStateJournal(evidence_dir, resume=True).update({**crashed, "deployed_url": "https://saved.fly.dev"})
+    monkeypatch.setattr(eval_child_app_module, "compute_scores", compute_scores)
+    result = asyncio.run(run_eval(
+        skip_deploy=True,
+        skip_cleanup=True,
+        runner=MaterializingOnceRunner(),
+        quiet=True,
+        resume_state=str(evidence_dir / "run_state.json"),
+    ))
+
+    state = _load_run_state(str(evidence_dir / "run_state.json"))
+    assert MaterializingOnceRunner.calls == 1
+    assert result.eval_id == crashed["eval_id"]
+    assert state["phase"] == "complete"
+    assert state["completed_phases"].count("agent_execution") == 1
+    assert state["run_result"]["elapsed_s"] == 42.0
+    by_id = {check.id: check for check in result.checks}
+    assert by_id["scaff.toml_valid"].status == CheckStatus.PASS
+    assert "advisory" not in by_id["sec.only_project_dir_mutated"].detail
+    assert json.loads((evidence_dir / "eval_result.json").read_text(encoding="utf-8"))["eval_id"] == result.eval_id
+
+    # Once the bundle exists a second resume only re-ingests and cleans up.
+    monkeypatch.setattr(eval_child_app_module, "_run_verification", crash_scoring)
+    again = asyncio.run(run_eval(
+        skip_cleanup=True,
+        quiet=True,
+        resume_state=str(evidence_dir),
+    ))
+    assert again.core_score == result.core_score
+    assert result.deployed_url == again.deployed_url == "https://saved.fly.dev"
+    with ResultsStore(default_results_db(tmp_path)) as store:
+        # Stale row, resumed run, and the second resume (new timings) — all kept.
+        assert len(store._rows("SELECT id FROM runs WHERE eval_id = ?", [result.eval_id])) == 3
+        trend = store.score_trend()
+        flakes = {row["check_id"]: row for row in store.check_flake_rates(min_runs=1)}
+    assert [(row["runs"], row["avg_core_score"]) for row in trend] == [(1, result.core_score)]
+    assert (flakes["scaff.toml_valid"]["runs"], flakes["scaff.toml_valid"]["failed"]) == (1, 0)
+
+
+def test_load_run_result_from_evidence_uses_state_summary(tmp_path):
+    (tmp_path / "agent_stdout.txt").write_text("out", encoding="utf-8")
+    (tmp_path / "agent_final_response.txt").write_text("final", encoding="utf-8")
+    (tmp_path / "command_log.jsonl").write_text(
+        json.dumps([{"command": "bui init ce-0320-t3stv4lu", "exit_code": 0}]),
+        encoding="utf-8",
+    )
+
+    result = load_run_result_from_evidence(
+        tmp_path,
+        {"run_result": {"exit_code": 3, "timed_out": True, "elapsed_s": 12.5}},
+    )
+
+    assert (result.exit_code, result.timed_out, result.elapsed_s) == (3, True, 12.5)
+    assert (result.stdout, result.stderr, result.final_response) == ("out", "", "final")
+    assert [c.command for c in result.command_log] == ["bui init ce-0320-t3stv4lu"]
+
 
 @pytest.mark.parametrize("fixture_name", list(FIXTURE_MANIFESTS))
 def test_fixture_matrix_expected_status_and_cleanup(tmp_path, fixture_name):
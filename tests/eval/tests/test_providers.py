@@ -5,15 +5,23 @@ Run with: python3 -m pytest tests/eval/tests/test_providers.py -v
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
+import httpx
+import pytest
+
 import tests.eval.providers.neon as neon_module
+from tests.eval.checks.deployment import DeploymentContext, run_deployment_checks
 from tests.eval.fly_cli import resolve_fly_cli
+from tests.eval.providers.fake_fly import FakeFlyConfig, FakeFlyProvider
 from tests.eval.providers.fly import FlyAdapter
 from tests.eval.providers.neon import NeonAdapter
 from tests.eval.providers.vault import VaultAdapter
+from tests.eval.reason_codes import CheckStatus
 from tests.eval.redaction import SecretRegistry
+from tests.eval.sweeper import sweep_orphans
 
 
 class TestFlyCliDiscovery:
@@ -235,3 +243,102 @@ class TestVaultAdapter:
 
         assert adapter.read_and_register_eval_secrets() == 3
         assert registry.count == 3
+
+
+class TestFakeFlyProvider:
+    @pytest.fixture
+    def fake_fly(self, monkeypatch, tmp_path):
+        with FakeFlyProvider(tmp_path / "fly") as provider:
+            for key, value in provider.env().items():
+                monkeypatch.setenv(key, value)
+            yield provider
+
+    def test_adapter_lists_deploys_suspends_and_destroys(self, fake_fly):
+        adapter = FlyAdapter()
+        assert adapter._cmd == str(fake_fly.fly_path)
+        assert fake_fly.deploy("ce-0401-aaaa1111", env={"VERIFICATION_NONCE": "n-1"})
+
+        url = adapter.app_url("ce-0401-aaaa1111")
+        assert url == f"{fake_fly.host.url}/apps/ce-0401-aaaa1111"
+        assert httpx.get(f"{url}/health").json()["verification_nonce"] == "n-1"
+        assert [app.name for app in adapter.list_apps(prefix="ce-")] == ["ce-0401-aaaa1111"]
+
+        assert adapter.stop_app("ce-0401-aaaa1111")
+        assert httpx.get(f"{url}/health").status_code == 503
+        assert adapter.delete_app("ce-0401-aaaa1111")
+        assert adapter.app_url("ce-0401-aaaa1111") is None
+        # Destroying a missing app is treated as already cleaned up.
+        assert adapter.delete_app("ce-0401-aaaa1111")
+
+    def test_failure_rates_and_latency_are_applied_and_recorded(self, fake_fly):
+        fake_fly.configure(deploy_failure_rate=1.0)
+        assert not fake_fly.deploy("ce-0401-bbbb2222")
+        assert fake_fly.apps()["ce-0401-bbbb2222"].status == "failed"
+
+        fake_fly.configure(destroy_failure_rate=1.0, destroy_latency_s=0.2)
+        started = time.monotonic()
+        assert not FlyAdapter().delete_app("ce-0401-bbbb2222")
+        assert time.monotonic() - started >= 0.2
+
+        calls = fake_fly.calls()
+        assert [call["args"][:2] for call in calls] == [["deploy", "--app"], ["apps", "destroy"]]
+        assert [call["returncode"] for call in calls] == [1, 1]
+        assert calls[-1]["elapsed_s"] >= 0.2
+
+    def test_fresh_deploy_answers_503_until_warmup_elapses(self, monkeypatch, tmp_path):
+        with FakeFlyProvider(tmp_path / "fly", FakeFlyConfig(warmup_s=2.0)) as provider:
+            for key, value in provider.env().items():
+                monkeypatch.setenv(key, value)
+            assert provider.deploy("ce-0401-dddd4444")
+            url = FlyAdapter().app_url("ce-0401-dddd4444")
+
+            assert httpx.get(f"{url}/health").status_code == 503
+            deployed_at = provider.apps()["ce-0401-dddd4444"].deployed_at
+            time.sleep(max(0.0, deployed_at + 2.0 - time.time()))
+            assert httpx.get(f"{url}/health").status_code == 200
+
+    def test_deployment_checks_run_against_hosted_app(self, fake_fly, sample_manifest):
+        fake_fly.deploy(sample_manifest.app_slug, env={
+            "EVAL_ID": sample_manifest.eval_id,
+            "VERIFICATION_NONCE": sample_manifest.verification_nonce,
+        })
+        adapter = FlyAdapter()
+        ctx = DeploymentContext(
+            sample_manifest,
+            deployed_url=adapter.app_url(sample_manifest.app_slug),
+            fly_adapter=adapter,
+        )
+
+        by_id = {check.id: check for check in run_deployment_checks(ctx)}
+
+        for check_id in (
+            "deploy.fly_app_exists",
+            "deploy.health_200",
+            "deploy.custom_router_live",
+            "deploy.info_live",
+            "deploy.notes_crud",
+        ):
+            assert by_id[check_id].status == CheckStatus.PASS, by_id[check_id].detail
+        # Hosted URLs are plain http by design.
+        assert by_id["deploy.url_well_formed"].status == CheckStatus.FAIL
+
+    def test_sweeper_deletes_concurrently(self, fake_fly, tmp_path):
+        names = [f"ce-0401-cccc000{index}" for index in range(4)]
+        for name in names:
+            assert fake_fly.deploy(name)
+        fake_fly.configure(destroy_latency_s=0.5)
+
+        sweep = sweep_orphans(
+            str(tmp_path / "projects"),
+            max_age_seconds=0,
+            concurrency=4,
+            min_interval_s=0,
+            fly_adapter=FlyAdapter(),
+        )
+
+        assert sorted(result.resource_id for result in sweep.results) == names
+        assert all(result.success for result in sweep.results)
+        assert fake_fly.apps() == {}
+        destroys = [call for call in fake_fly.calls() if call["args"][:2] == ["apps", "destroy"]]
+        first_end = min(call["started_at"] + call["elapsed_s"] for call in destroys)
+        assert all(call["started_at"] < first_end for call in destroys)
@@ -0,0 +1,173 @@
+"""Unit tests for the cross-run eval results store.
+
+Run with: python3 -m pytest tests/eval/tests/test_results_store.py -v
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tests.eval.contracts import CategoryScore, CheckResult, EvalResult
+from tests.eval.reason_codes import CheckStatus
+from tests.eval.results_store import ResultsStore, main, parse_since
+
+
+NOW = 1_800_000_000.0
+DAY = 86400.0
+
+
+def _result(eval_id: str, health: CheckStatus, reason: str = "", core: float = 1.0) -> EvalResult:
+    return EvalResult(
+        eval_id=eval_id,
+        status=CheckStatus.PASS if health == CheckStatus.PASS else CheckStatus.FAIL,
+        core_score=core,
+        overall_score=core,
+        categories=[CategoryScore(
+            name="deployment",
+            score=core,
+            gate=0.8,
+            gate_met=core >= 0.8,
+            passed_weight=3.0 * core,
+            total_weight=3.0,
+        )],
+        checks=[
+            CheckResult(id="deploy.health_200", category="deployment", weight=3.0,
+                        status=health, reason_code=reason),
+            CheckResult(id="scaff.toml_valid", category="scaffolding", weight=1.0,
+                        status=CheckStatus.PASS),
+            CheckResult(id="deploy.info_200", category="deployment", weight=1.0,
+                        status=CheckStatus.SKIP, skipped=True),
+        ],
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultsStore(tmp_path / "results.sqlite3") as s:
+        yield s
+
+
+class TestIngest:
+    def test_identical_result_is_ingested_once(self, store):
+        result = _result("child-eval-1", CheckStatus.PASS)
+
+        assert store.ingest(result, profile="core", recorded_at=NOW) is not None
+        assert store.ingest(result, profile="core", recorded_at=NOW) is None
+
+        flakes = store.check_flake_rates()
+        assert {row["check_id"]: row["runs"] for row in flakes} == {
+            "deploy.health_200": 1,
+            "scaff.toml_valid": 1,
+        }
+
+    def test_rescore_of_same_eval_is_appended_but_counted_once(self, store):
+        store.ingest(_result("child-eval-1", CheckStatus.PASS), recorded_at=NOW)
+        store.ingest(_result("child-eval-1", CheckStatus.FAIL, "HTTP_500", core=0.5), recorded_at=NOW + 1)
+
+        assert len(store._rows("SELECT id FROM runs", [])) == 2
+        trend = store.score_trend()
+        assert (trend[0]["runs"], trend[0]["avg_core_score"]) == (1, 0.5)
+        health = {row["check_id"]: row for row in store.check_flake_rates()}["deploy.health_200"]
+        assert (health["runs"], health["failed"]) == (1, 1)
+        assert [r["count"] for r in store.reason_code_histogram()] == [1]
+
+    def test_result_read_back_from_disk_is_not_reingested(self, store):
+        result = _result("child-eval-1", CheckStatus.PASS)
+        result.checks[1].weight = 4
+
+        assert store.ingest(result, recorded_at=NOW) is not None
+        reloaded = EvalResult.from_dict(json.loads(json.dumps(result.to_dict())))
+        assert reloaded.checks[1].weight == 4.0
+        assert store.ingest(reloaded, recorded_at=NOW) is None
+
+    def test_ingest_tree_reads_evidence_metadata(self, store, tmp_path):
+        evidence = tmp_path / ".eval-evidence" / "ce-0101-abcdefgh"
+        evidence.mkdir(parents=True)
+        (evidence / "eval_result.json").write_text(
+            json.dumps(_result("child-eval-1", CheckStatus.PASS).to_dict()), encoding="utf-8",
+        )
+        (evidence / "run_manifest.json").write_text(
+            json.dumps({"platform_profile": "extensible"}), encoding="utf-8",
+        )
+        (evidence / "summary.json").write_text(
+            json.dumps({"timestamp": "2027-01-15T08:00:00Z"}), encoding="utf-8",
+        )
+
+        assert store.ingest_tree(tmp_path) == (1, 1)
+        assert store.ingest_tree(tmp_path) == (0, 1)
+        trend = store.score_trend(profile="extensible")
+        assert trend == [pytest.approx({
+            "bucket": "2027-01-15",
+            "profile": "extensible",
+            "runs": 1,
+            "avg_core_score": 1.0,
+            "min_core_score": 1.0,
+            "max_core_score": 1.0,
+            "avg_overall_score": 1.0,
+            "pass_rate": 1.0,
+        })]
+
+
+class TestQueries:
+    @pytest.fixture(autouse=True)
+    def _seed(self, store):
+        statuses = [CheckStatus.PASS, CheckStatus.FAIL, CheckStatus.PASS, CheckStatus.FAIL, CheckStatus.FAIL]
+        for i, status in enumerate(statuses):
+            reason = "HTTP_502" if i < 4 else "TIMEOUT"
+            store.ingest(
+                _result(f"child-eval-{i}", status, reason if status != CheckStatus.PASS else ""),
+                profile="core",
+                recorded_at=NOW - (len(statuses) - i) * DAY,
+            )
+
+    def test_flake_rates_count_flips_in_time_order(self, store):
+        rows = {row["check_id"]: row for row in store.check_flake_rates(min_runs=2)}
+
+        health = rows["deploy.health_200"]
+        assert (health["passed"], health["failed"]) == (2, 3)
+        assert health["flip_rate"] == pytest.approx(3 / 4)
+        assert rows["scaff.toml_valid"]["flip_rate"] == 0.0
+        assert "deploy.info_200" not in rows
+
+    def test_since_window_limits_rows(self, store):
+        rows = store.check_flake_rates(since=NOW - 2.5 * DAY, check_id="deploy.health_200")
+
+        assert rows[0]["runs"] == 2
+        assert rows[0]["flip_rate"] == 0.0
+
+    def test_reason_histogram_groups_failures(self, store):
+        rows = store.reason_code_histogram(check_id="deploy.health_200")
+
+        assert [(r["reason_code"], r["count"]) for r in rows] == [("HTTP_502", 2), ("TIMEOUT", 1)]
+
+    def test_check_queries_use_index(self, store):
+        plan = " ".join(store.explain(
+            "SELECT status FROM checks WHERE check_id = ? AND recorded_at >= ?",
+            ["deploy.health_200", NOW],
+        ))
+
+        assert "idx_checks_check_recorded" in plan
+
+
+def test_parse_since_relative_and_iso():
+    assert parse_since("7d", now=NOW) == NOW - 7 * DAY
+    assert parse_since("12h", now=NOW) == NOW - 12 * 3600
+    assert parse_since("2027-01-15T00:00:00Z") == parse_since("2027-01-15")
+    assert parse_since(None) is None
+
+
+def test_cli_ingest_and_reasons(tmp_path, capsys):
+    evidence = tmp_path / "ev"
+    evidence.mkdir()
+    (evidence / "eval_result.json").write_text(
+        json.dumps(_result("child-eval-1", CheckStatus.FAIL, "HTTP_502").to_dict()), encoding="utf-8",
+    )
+    db = str(tmp_path / "results.sqlite3")
+
+    assert main(["--db", db, "ingest", str(tmp_path)]) == 0
+    assert main(["--db", db, "--json", "reasons"]) == 0
+
+    rows = json.loads(capsys.readouterr().out.split("\n", 1)[1])
+    assert rows == [{"check_id": "deploy.health_200", "reason_code": "HTTP_502", "status": "FAIL", "count": 1}]
@@ -0,0 +1,85 @@
+"""Unit tests for the run_state journal and its loader.
+
+Run with: python3 -m pytest tests/eval/tests/test_run_state.py -v
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tests.eval.run_state import (
+    JOURNAL_FILENAME,
+    SNAPSHOT_FILENAME,
+    RunStateJournal,
+    load_run_state,
+)
+
+
+MANIFEST = {"eval_id": "child-eval-1", "app_slug": "ce-1018-abcdefgh", "project_root": "/tmp/ce"}
+
+
+def _records(evidence_dir) -> list[dict]:
+    lines = (evidence_dir / JOURNAL_FILENAME).read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines]
+
+
+def test_journal_appends_only_changed_keys_between_compactions(tmp_path):
+    journal = RunStateJournal(tmp_path, compact_every=4)
+    journal.update({"phase": "init", "completed_phases": [], "manifest": MANIFEST})
+
+    # The first update compacts so a snapshot exists from the start.
+    assert _records(tmp_path) == []
+    assert json.loads((tmp_path / SNAPSHOT_FILENAME).read_text(encoding="utf-8"))["journal_seq"] == 1
+
+    journal.update({"phase": "preflight_done", "completed_phases": ["preflight"], "manifest": MANIFEST})
+    journal.update({"phase": "preflight_done", "completed_phases": ["preflight"], "manifest": MANIFEST})
+    journal.update({"phase": "agent_done", "completed_phases": ["preflight"], "manifest": MANIFEST, "run_result": {"exit_code": 0}})
+
+    assert [record["set"] for record in _records(tmp_path)] == [
+        {"phase": "preflight_done", "completed_phases": ["preflight"]},
+        {"phase": "agent_done", "run_result": {"exit_code": 0}},
+    ]
+    assert load_run_state(tmp_path / SNAPSHOT_FILENAME) == {
+        "phase": "agent_done",
+        "completed_phases": ["preflight"],
+        "manifest": MANIFEST,
+        "run_result": {"exit_code": 0},
+    }
+
+    journal.update({"phase": "complete", "completed_phases": ["preflight", "complete"], "manifest": MANIFEST})
+
+    assert _records(tmp_path) == []
+    snapshot = json.loads((tmp_path / SNAPSHOT_FILENAME).read_text(encoding="utf-8"))
+    assert snapshot["phase"] == "complete"
+    assert "run_result" not in snapshot
+    assert not (tmp_path / "run_state.tmp").exists()
+
+
+def test_loader_ignores_torn_tail_and_records_already_in_snapshot(tmp_path):
+    journal = RunStateJournal(tmp_path)
+    journal.update({"phase": "init", "manifest": MANIFEST})
+    journal.update({"phase": "parsing_done", "manifest": MANIFEST})
+    stale = json.dumps({"seq": 1, "set": {"phase": "stale"}})
+    with (tmp_path / JOURNAL_FILENAME).open("r+", encoding="utf-8") as fh:
+        current = fh.read()
+        fh.seek(0)
+        fh.write(stale + "\n" + current + '{"seq": 3, "set": {"phase": "verif')
+
+    assert load_run_state(tmp_path)["phase"] == "parsing_done"
+
+    resumed = RunStateJournal(tmp_path, resume=True)
+    resumed.update({"phase": "verification_done", "manifest": MANIFEST})
+
+    assert resumed.seq == 3
+    assert load_run_state(tmp_path / JOURNAL_FILENAME) == {"phase": "verification_done", "manifest": MANIFEST}
+
+
+def test_fresh_journal_discards_previous_run_state(tmp_path):
+    RunStateJournal(tmp_path).update({"phase": "complete", "manifest": MANIFEST, "error": "old"})
+
+    RunStateJournal(tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        load_run_state(tmp_path)
@@ -0,0 +1,141 @@
+"""Unit tests for the run_eval timing tree and harness profiling.
+
+Run with: python3 -m pytest tests/eval/tests/test_timing.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import time
+
+import tests.eval.eval_child_app as eval_child_app_module
+from tests.eval.checks.local_dev import LocalDevContext
+from tests.eval.contracts import CheckResult
+from tests.eval.eval_child_app import run_eval
+from tests.eval.eval_logger import EvalLogger
+from tests.eval.reason_codes import CheckStatus
+from tests.eval.results_store import ResultsStore, default_results_db
+from tests.eval.runners.mock import MockRunner
+from tests.eval.timing import TimingRecorder, command_label, run_checks, span
+
+
+def _result(check_id: str) -> CheckResult:
+    return CheckResult(id=check_id, category="deployment", weight=1.0, status=CheckStatus.PASS)
+
+
+def _walk(node: dict, kind: str) -> list[dict]:
+    found = [node] if node["kind"] == kind else []
+    for child in node.get("children", []):
+        found.extend(_walk(child, kind))
+    return found
+
+
+def test_each_invoked_check_gets_a_span_that_adopts_its_calls():
+    recorder = TimingRecorder("run")
+
+    def _check_health(ctx: str) -> CheckResult:
+        with span("GET /health", "http") as call:
+            time.sleep(0.01)
+            call.attrs["status"] = 200
+        return _result("deploy.health_200")
+
+    def _check_url(ctx: str) -> CheckResult:
+        return _result("deploy.url_well_formed")
+
+    def record() -> None:
+        recorder.activate()
+        logger = EvalLogger(quiet=True, timings=recorder)
+        logger.phase_start("verification")
+        with span("deployment", "check_family"):
+            # Results built outside a check invocation cut no spans.
+            _result("replayed.from_cache")
+            run_checks("ctx", [_check_health, _check_url])
+        logger.phase_end("verification", "done")
+
+    contextvars.copy_context().run(record)
+    data = recorder.to_dict()
+    [phase] = data["tree"]["children"]
+    [family] = phase["children"]
+    first, second = family["children"]
+
+    assert (phase["kind"], family["kind"]) == ("phase", "check_family")
+    assert (first["name"], second["name"]) == ("deploy.health_200", "deploy.url_well_formed")
+    assert first["children"][0]["attrs"] == {"status": 200}
+    assert first["duration_s"] >= 0.01
+    assert "children" not in second
+    assert data["totals_s"]["http"] == first["children"][0]["duration_s"]
+    assert data["totals_s"]["check"] <= data["totals_s"]["check_family"] <= data["totals_s"]["phase"]
+
+
+def test_span_is_a_noop_outside_a_recorded_run():
+    async def unrecorded() -> str:
+        with span("fly apps", "subprocess") as call:
+            call.attrs["rc"] = 0
+        return call.name
+
+    assert asyncio.run(unrecorded()) == "fly apps"
+    assert command_label(["/home/u/.fly/bin/fly", "apps", "list", "--json"]) == "fly apps list"
+    assert command_label(["bui", "--version"]) == "bui"
+
+
+def test_run_eval_records_timing_tree_and_phase_profiles(tmp_path, monkeypatch):
+    async def no_local_validation(manifest, timeout_s):
+        return LocalDevContext(manifest, dev_started=False), None
+
+    class NoAppFlyAdapter:
+        def app_exists(self, app_name: str) -> bool:
+            return False
+
+        def app_url(self, app_name: str) -> str | None:
+            return None
+
+    monkeypatch.setattr(eval_child_app_module, "_run_local_dev_validation", no_local_validation)
+    monkeypatch.setattr(eval_child_app_module, "FlyAdapter", NoAppFlyAdapter)
+    evidence_dir = tmp_path / "evidence"
+
+    asyncio.run(run_eval(
+        profile="core",
+        evidence_dir=str(evidence_dir),
+        projects_root=str(tmp_path),
+        verify_timeout=5,
+        skip_deploy=True,
+        skip_cleanup=True,
+        runner=MockRunner(),
+        quiet=True,
+        profile_harness=True,
+    ))
+
+    saved = json.loads((evidence_dir / "eval_result.json").read_text(encoding="utf-8"))
+    timings = saved["operational_metrics"]["timings"]
+    phases = {node["name"]: node for node in timings["tree"]["children"] if node["kind"] == "phase"}
+
+    assert list(phases) == [
+        "preflight", "prompt_generation", "agent_execution", "parsing",
+        "verification", "scoring", "evidence",
+    ]
+    assert not any(node.get("open") for node in phases.values())
+    families = {node["name"]: node for node in _walk(phases["verification"], "check_family")}
+    assert {"scaffolding", "workflow", "local_dev", "security", "report_quality"} <= set(families)
+    assert any(check["name"] == "scaff.toml_valid" for check in families["scaffolding"]["children"])
+    assert _walk(phases["preflight"], "subprocess")
+    assert timings["totals_s"]["phase"] > 0
+
+    profile_ref = phases["verification"]["attrs"]["profile"]
+    assert (evidence_dir / profile_ref).is_file()
+    assert (evidence_dir / profile_ref).with_suffix(".txt").read_text(encoding="utf-8").strip()
+
+    assert [sample["label"] for sample in timings["samples"][:2]] == ["preflight:start", "preflight:end"]
+    trace = json.loads((evidence_dir / "trace.json").read_text(encoding="utf-8"))
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert {"verification", "scaff.toml_valid"} <= {event["name"] for event in spans}
+    assert {event["name"] for event in trace["traceEvents"] if event["ph"] == "C"} == {"cpu_s", "max_rss_mb"}
+
+    artifacts = json.loads((evidence_dir / "artifact_manifest.json").read_text(encoding="utf-8"))
+    filenames = [a["filename"] for a in artifacts["artifacts"]]
+    assert filenames.count("eval_result.json") == 1
+    assert "trace.json" in filenames
+
+    with ResultsStore(default_results_db(tmp_path)) as store:
+        assert store.ingest_evidence_dir(evidence_dir) is None
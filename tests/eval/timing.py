@@ -0,0 +1,254 @@
+"""Structured timing tree and per-phase harness profiling.
+
+``run_eval`` records one tree per run::
+
+    run → phase → check_family → check → subprocess / http
+
+Phases are opened and closed by ``EvalLogger.phase_start``/``phase_end``;
+check families are wrapped with :func:`span` in ``_run_verification``;
+each family runner invokes its checks through :func:`run_checks`, which
+gives every check its own span; provider adapters and HTTP helpers wrap
+each external call in :func:`span`.
+
+The active span lives in a context variable, so concurrent evals (one
+asyncio task each) keep separate trees and ``asyncio.to_thread`` work
+nests under the span that started it. :func:`span` is a cheap no-op
+outside a recorded run.
+
+With ``profile_dir`` set, every phase additionally runs under
+:mod:`cProfile` and dumps ``<NN>-<phase>.pstats`` (load with ``pstats``,
+snakeviz or ``flameprof``) plus a top-N text summary. Only the thread that
+drives the event loop is profiled — i.e. the harness itself, not the agent
+or deploy subprocesses it waits on.
+
+Every phase boundary also takes a resource sample (harness and reaped-child
+CPU seconds, peak RSS); :meth:`TimingRecorder.to_trace` turns the tree and
+samples into a Chrome/Perfetto trace with counters.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from tests.smoke.smoke_lib.trace import ChromeTrace
+
+#: Span kinds whose durations are summed into ``totals_s``.
+TOTAL_KINDS = ("phase", "check_family", "check", "subprocess", "http")
+
+PROFILE_TOP_N = 40
+
+_current: ContextVar[TimingSpan | None] = ContextVar("eval_timing_span", default=None)
+_Ctx = TypeVar("_Ctx")
+
+
+@dataclass
+class TimingSpan:
+    """One node of the timing tree; times are seconds since the run started."""
+
+    name: str
+    kind: str
+    start_s: float
+    duration_s: float | None = None
+    attrs: dict[str, Any] = field(default_factory=dict)
+    children: list[TimingSpan] = field(default_factory=list)
+    _origin: float = field(default=0.0, repr=False)
+    _token: Token | None = field(default=None, repr=False)
+    _profile: cProfile.Profile | None = field(default=None, repr=False)
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def child(self, name: str, kind: str, **attrs: Any) -> TimingSpan:
+        node = TimingSpan(name, kind, self._now(), attrs=attrs, _origin=self._origin)
+        self.children.append(node)
+        return node
+
+    def close(self) -> None:
+        if self.duration_s is None:
+            self.duration_s = self._now() - self.start_s
+
+    def to_dict(self) -> dict[str, Any]:
+        duration = self.duration_s if self.duration_s is not None else self._now() - self.start_s
+        data: dict[str, Any] = {
+            "name": self.name,
+            "kind": self.kind,
+            "start_s": round(self.start_s, 6),
+            "duration_s": round(duration, 6),
+        }
+        if self.duration_s is None:
+            data["open"] = True
+        if self.attrs:
+            data["attrs"] = dict(self.attrs)
+        if self.children:
+            data["children"] = [node.to_dict() for node in list(self.children)]
+        return data
+
+
+class TimingRecorder:
+    """Owns one run's timing tree and (optionally) its phase profiles."""
+
+    def __init__(self, name: str = "run", profile_dir: str | Path | None = None) -> None:
+        origin = time.perf_counter()
+        self.root = TimingSpan(name, "run", 0.0, _origin=origin)
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.samples: list[dict[str, Any]] = []
+        self._phase_count = 0
+
+    def activate(self) -> None:
+        """Make the root the current span for the calling task/context."""
+        _current.set(self.root)
+
+    def start(self, name: str, kind: str, **attrs: Any) -> TimingSpan:
+        """Open a span under the current one (or the root) and make it current."""
+        parent = _current.get() or self.root
+        node = parent.child(name, kind, **attrs)
+        node._token = _current.set(node)
+        if kind == "phase":
+            self.sample(f"{name}:start")
+            if self.profile_dir is not None:
+                self._start_profile(node)
+        return node
+
+    def end(self, node: TimingSpan) -> None:
+        """Close ``node`` and restore its parent as the current span."""
+        if node._profile is not None:
+            self._stop_profile(node)
+        node.close()
+        if node.kind == "phase":
+            self.sample(f"{node.name}:end")
+        if node._token is not None:
+            try:
+                _current.reset(node._token)
+            except ValueError:
+                # Closed from a different context than it was opened in.
+                _current.set(None)
+            node._token = None
+
+    def sample(self, label: str) -> None:
+        """Record CPU and memory for the harness process at this point of the run."""
+        if resource is None:
+            return
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        # ru_maxrss is KiB on Linux, bytes on macOS.
+        rss_scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+        self.samples.append({
+            "t_s": round(self.root._now(), 6),
+            "label": label,
+            "cpu_s": round(own.ru_utime + own.ru_stime, 3),
+            "children_cpu_s": round(children.ru_utime + children.ru_stime, 3),
+            "max_rss_mb": round(own.ru_maxrss / rss_scale, 1),
+        })
+
+    def to_dict(self) -> dict[str, Any]:
+        tree = self.root.to_dict()
+        data: dict[str, Any] = {"tree": tree, "totals_s": totals_by_kind(tree)}
+        if self.samples:
+            data["samples"] = list(self.samples)
+        return data
+
+    def to_trace(self) -> ChromeTrace:
+        """Chrome/Perfetto trace of the tree; open in ui.perfetto.dev or chrome://tracing."""
+        from tests.smoke.smoke_lib.trace import trace_timing_tree
+
+        return trace_timing_tree(self.to_dict(), name=self.root.name)
+
+    def _start_profile(self, node: TimingSpan) -> None:
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as exc:  # another profiler is already active
+            node.attrs["profile_error"] = str(exc)
+            return
+        node._profile = profile
+
+    def _stop_profile(self, node: TimingSpan) -> None:
+        assert self.profile_dir is not None and node._profile is not None
+        profile, node._profile = node._profile, None
+        profile.disable()
+        self._phase_count += 1
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{self._phase_count:02d}-{node.name}"
+        stats_path = self.profile_dir / f"{stem}.pstats"
+        profile.dump_stats(str(stats_path))
+        summary = io.StringIO()
+        pstats.Stats(profile, stream=summary).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+        (self.profile_dir / f"{stem}.txt").write_text(summary.getvalue(), encoding="utf-8")
+        node.attrs["profile"] = f"{self.profile_dir.name}/{stats_path.name}"
+
+
+@contextmanager
+def span(name: str, kind: str, **attrs: Any) -> Iterator[TimingSpan]:
+    """Time a block under the current span; callers may add ``attrs`` to the yielded node.
+
+    Outside a recorded run the yielded node is detached and discarded.
+    """
+    parent = _current.get()
+    if parent is None:
+        yield TimingSpan(name, kind, 0.0, attrs=attrs)
+        return
+    node = parent.child(name, kind, **attrs)
+    token = _current.set(node)
+    try:
+        yield node
+    finally:
+        node.close()
+        _current.reset(token)
+
+
+def run_checks(ctx: _Ctx, checks: list[Callable[[_Ctx], Any]]) -> list[Any]:
+    """Call each ``check(ctx)`` under its own ``check`` span, in order.
+
+    The span is named after the returned result's ``id`` (the function name
+    until the check returns), so calls a check makes nest under it.
+    """
+    results = []
+    for check in checks:
+        with span(check.__name__.removeprefix("_check_"), "check") as node:
+            result = check(ctx)
+            node.name = getattr(result, "id", node.name)
+        results.append(result)
+    return results
+
+
+def totals_by_kind(tree: dict[str, Any]) -> dict[str, float]:
+    """Sum span durations per kind without double-counting nested spans of the same kind."""
+    totals = {kind: 0.0 for kind in TOTAL_KINDS}
+
+    def visit(node: dict[str, Any], inside: frozenset[str]) -> None:
+        kind = node["kind"]
+        if kind in totals and kind not in inside:
+            totals[kind] += node["duration_s"]
+            inside = inside | {kind}
+        for child in node.get("children", []):
+            visit(child, inside)
+
+    visit(tree, frozenset())
+    return {kind: round(value, 6) for kind, value in totals.items()}
+
+
+def command_label(cmd: list[str], words: int = 2) -> str:
+    """Short span name for a command: executable basename plus leading subcommands."""
+    if not cmd:
+        return ""
+    parts = [Path(cmd[0]).name]
+    for arg in cmd[1:]:
+        if len(parts) > words or arg.startswith("-"):
+            break
+        parts.append(arg)
+    return " ".join(parts)
@@ -19,19 +19,48 @@ Usage:
 
     # Child apps: add extra suites via --extra-suites
     python tests/smoke/run_all.py --base-url https://... --extra-suites /path/to/smoke_macro.py
+
+    # Custom latency budgets; keep per-step timings across runs in the evidence dir
+    python tests/smoke/run_all.py --base-url https://... --budgets my_budgets.json --evidence-dir evidence/
+
+    # Offline Neon auth: serve the local stand-in (start the app with
+    # NEON_AUTH_BASE_URL=http://127.0.0.1:8788 so it trusts the stand-in's JWKS)
+    python tests/smoke/run_all.py --base-url http://localhost:8000 --neon-stub
+
+    # Real Neon Auth, but confirmation mail relayed over SMTP to a local sink
+    python tests/smoke/run_all.py --base-url http://localhost:8000 --mail-sink --mail-sink-smtp-port 2525
+
+    # Chrome/Perfetto traces: <suite>.trace.json per suite plus trace.json for the run
+    python tests/smoke/run_all.py --base-url http://localhost:8000 --evidence-dir evidence/ --trace
+
+Latency budgets (tests/smoke/budgets.json by default) are a separate failure
+class: functional failures exit 1, budget-only violations exit 2 unless
+--budgets-warn-only is set.
 """
 
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
+import os
 import subprocess
 import sys
+import tempfile
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
 SMOKE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SMOKE_DIR))
+
+from smoke_lib.budgets import BUDGETS_ENV, append_timings, new_run_id, write_timing_trend
+from smoke_lib.mail_sink import MailSinkServer
+from smoke_lib.neon_stub import DEFAULT_PORT as NEON_STUB_DEFAULT_PORT, NeonAuthStub
+from smoke_lib.trace import TRACE_ENV, ChromeTrace
+
+EXIT_FUNCTIONAL_FAILURE = 1
+EXIT_BUDGET_FAILURE = 2
 
 # Base boring-ui smoke suites in execution order.
 # Each entry: (name, script_filename, requires_auth, extra_args)
@@ -57,11 +86,60 @@ class SuiteResult:
     exit_code: int
     elapsed_s: float
     output: str = ""
+    budget_violations: list[dict] = field(default_factory=list)
 
     @property
     def ok(self) -> bool:
         return self.exit_code == 0
 
+    @property
+    def budget_ok(self) -> bool:
+        return not self.budget_violations
+
+
+def collect_suite_evidence(
+    result: SuiteResult,
+    evidence_file: Path,
+    *,
+    history_dir: Path | None,
+    run_id: str,
+) -> None:
+    """Pull budget violations from a suite's evidence JSON and record its step timings."""
+    if not evidence_file.exists():
+        return
+    try:
+        report = json.loads(evidence_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        print(f"[runner] WARN: unreadable evidence for {result.name}: {exc}")
+        return
+    result.budget_violations = list((report.get("budgets") or {}).get("violations") or [])
+    if history_dir is not None:
+        append_timings(history_dir, result.name, report.get("steps") or [], run_id=run_id)
+
+
+def start_neon_stub(args: argparse.Namespace) -> NeonAuthStub:
+    """Serve the Neon Auth stand-in for this run and point suites at it.
+
+    Suites inherit ``SMOKE_MAIL_SINK_URL`` so confirmation emails are read
+    from the stand-in's mail sink instead of Resend.
+    """
+    stub = NeonAuthStub(port=args.neon_stub_port).start()
+    atexit.register(stub.stop)
+    os.environ.update(stub.env())
+    args.neon_auth_url = stub.base_url
+    print(f"[runner] Neon Auth stand-in at {stub.base_url} (app must use NEON_AUTH_BASE_URL={stub.base_url})")
+    return stub
+
+
+def start_mail_sink(args: argparse.Namespace) -> MailSinkServer:
+    """Serve a local mail sink and point the suites' confirmation-email waits at it."""
+    sink = MailSinkServer(smtp_port=args.mail_sink_smtp_port).start()
+    atexit.register(sink.stop)
+    os.environ.update(sink.env())
+    smtp = f", SMTP on 127.0.0.1:{sink.smtp.port}" if sink.smtp is not None else ""
+    print(f"[runner] Mail sink at {sink.base_url}{smtp}")
+    return sink
+
 
 def build_auth_args(args: argparse.Namespace) -> list[str]:
     """Build common auth CLI args from parsed args."""
@@ -164,7 +242,32 @@ def main() -> int:
                         help="Pass --expect-routers to capabilities suite")
     parser.add_argument("--fail-fast", action="store_true",
                         help="Stop on first suite failure")
+    parser.add_argument("--budgets", default="",
+                        help="Latency budgets JSON (default: tests/smoke/budgets.json)")
+    parser.add_argument("--no-budgets", action="store_true",
+                        help="Do not check latency budgets")
+    parser.add_argument("--budgets-warn-only", action="store_true",
+                        help="Report budget violations without failing the run")
+    parser.add_argument("--trend-runs", type=int, default=20,
+                        help="Runs to include in evidence-dir/timings-trend.json (default: 20)")
+    parser.add_argument("--neon-stub", action="store_true",
+                        help="Serve a local Neon Auth stand-in and mail sink instead of the real services")
+    parser.add_argument("--neon-stub-port", type=int, default=NEON_STUB_DEFAULT_PORT,
+                        help=f"Port for --neon-stub (default: {NEON_STUB_DEFAULT_PORT})")
+    parser.add_argument("--mail-sink", action="store_true",
+                        help="Read confirmation emails from a local sink instead of Resend (implied by --neon-stub)")
+    parser.add_argument("--mail-sink-smtp-port", type=int, default=None,
+                        help="Also accept mail over SMTP on this port (with --mail-sink)")
+    parser.add_argument("--trace", action="store_true",
+                        help="Write Chrome/Perfetto traces into --evidence-dir")
     args = parser.parse_args()
+    if args.trace and not args.evidence_dir:
+        parser.error("--trace requires --evidence-dir")
+
+    if args.neon_stub:
+        start_neon_stub(args)
+    elif args.mail_sink:
+        start_mail_sink(args)
 
     # Resolve suites to run
     selected = set(s.strip() for s in args.suites.split(",") if s.strip()) if args.suites else None
@@ -213,12 +316,16 @@ def main() -> int:
 
     # Add extra suites (child app tests).
     # Extra suites don't receive auth args — they handle auth themselves or don't need it.
+    # They only get --evidence-out when --evidence-dir was given, since they
+    # may not accept it.
+    extra_suite_names: set[str] = set()
     if args.extra_suites:
         for path_str in args.extra_suites.split(","):
             path = Path(path_str.strip()).resolve()
             if path.is_file():
                 name = path.stem.replace("smoke_", "").replace("_", "-")
                 suites.append((name, str(path), False, []))
+                extra_suite_names.add(name)
             else:
                 print(f"[runner] WARN: extra suite not found: {path}")
 
@@ -226,6 +333,22 @@ def main() -> int:
     if evidence_dir:
         evidence_dir.mkdir(parents=True, exist_ok=True)
 
+    # Budgets are evaluated by each suite's SmokeClient.report(); the runner
+    # reads them back from the evidence JSON, so collect evidence into a
+    # scratch dir when none was requested.
+    check_budgets = not args.no_budgets
+    if check_budgets and args.budgets:
+        os.environ[BUDGETS_ENV] = str(Path(args.budgets).resolve())
+    suite_evidence_dir = evidence_dir
+    if check_budgets and suite_evidence_dir is None:
+        suite_evidence_dir = Path(tempfile.mkdtemp(prefix="boring-ui-smoke-evidence-"))
+    run_id = new_run_id()
+    if args.trace:
+        os.environ[TRACE_ENV] = "1"
+    run_trace = ChromeTrace(f"smoke {run_id}")
+    run_lane = run_trace.lane(1, "suites")
+    run_started = time.monotonic()
+
     auth_args = build_auth_args(args)
     results: list[SuiteResult] = []
 
@@ -237,6 +360,11 @@ def main() -> int:
     print(f"{'#'*60}")
 
     for name, script, requires_auth, extra in suites:
+        suite_dir = evidence_dir if name in extra_suite_names else suite_evidence_dir
+        if suite_dir is not None:
+            # A report left by an earlier run must not be read back as this one's.
+            (suite_dir / f"{name}.json").unlink(missing_ok=True)
+        suite_started = time.monotonic() - run_started
         result = run_suite(
             name=name,
             script=script,
@@ -244,9 +372,20 @@ def main() -> int:
             auth_args=auth_args,
             requires_auth=requires_auth,
             extra_args=extra,
-            evidence_dir=evidence_dir,
+            evidence_dir=suite_dir,
             timeout_s=args.suite_timeout,
         )
+        run_trace.span(name, suite_started, result.elapsed_s, tid=run_lane, cat="suite",
+                       args={"exit_code": result.exit_code})
+        if suite_dir is not None:
+            collect_suite_evidence(
+                result,
+                suite_dir / f"{name}.json",
+                history_dir=evidence_dir,
+                run_id=run_id,
+            )
+            if not check_budgets:
+                result.budget_violations = []
         results.append(result)
         if not result.ok and args.fail_fast:
             print(f"\n[runner] FAIL-FAST: stopping after {name}")
@@ -255,15 +394,23 @@ def main() -> int:
     # Summary
     passed = [r for r in results if r.ok]
     failed = [r for r in results if not r.ok]
+    over_budget = [r for r in results if not r.budget_ok]
     total_time = sum(r.elapsed_s for r in results)
 
     print(f"\n{'#'*60}")
     print(f"  SMOKE RUNNER SUMMARY")
     print(f"{'#'*60}")
     for r in results:
-        status = "PASS" if r.ok else "FAIL"
+        status = "FAIL" if not r.ok else "SLOW" if not r.budget_ok else "PASS"
         print(f"  [{status}] {r.name:25s} ({r.elapsed_s:.1f}s)")
+        for violation in r.budget_violations:
+            print(
+                f"         budget {violation['name']}: p50 {violation['p50_ms']}ms max {violation['max_ms']}ms "
+                f"(budget {violation['budget']}, n={violation['samples']})"
+            )
     print(f"\n  {len(passed)}/{len(results)} suites passed ({total_time:.1f}s total)")
+    if over_budget:
+        print(f"  {len(over_budget)} suite(s) over latency budget")
 
     if evidence_dir:
         summary = {
@@ -274,18 +421,34 @@ def main() -> int:
             "passed": len(passed),
             "failed": len(failed),
             "total_time_s": round(total_time, 1),
+            "run_id": run_id,
+            "budget_ok": len(over_budget) == 0,
+            "budget_failed": len(over_budget),
             "suites": [
-                {"name": r.name, "ok": r.ok, "elapsed_s": round(r.elapsed_s, 1)}
+                {
+                    "name": r.name,
+                    "ok": r.ok,
+                    "elapsed_s": round(r.elapsed_s, 1),
+                    "budget_ok": r.budget_ok,
+                    **({"budget_violations": r.budget_violations} if r.budget_violations else {}),
+                }
                 for r in results
             ],
         }
         (evidence_dir / "summary.json").write_text(
             json.dumps(summary, indent=2) + "\n", encoding="utf-8"
         )
+        write_timing_trend(evidence_dir, last_runs=args.trend_runs)
+        if args.trace:
+            run_trace.write(evidence_dir / "trace.json")
 
     if failed:
         print(f"\n  FAILED SUITES: {[r.name for r in failed]}", file=sys.stderr)
-        return 1
+        return EXIT_FUNCTIONAL_FAILURE
+    if over_budget:
+        print(f"\n  OVER-BUDGET SUITES: {[r.name for r in over_budget]}", file=sys.stderr)
+        if not args.budgets_warn_only:
+            return EXIT_BUDGET_FAILURE
     print(f"\n  ALL SUITES PASSED")
     return 0
 
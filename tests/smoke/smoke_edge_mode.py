@@ -38,6 +38,8 @@ def main() -> int:
     parser.add_argument("--skip-sprite", action="store_true", help="Skip sprite/sandbox phases (10-16)")
     parser.add_argument("--skip-agent", action="store_true", help="Skip agent WebSocket test")
     parser.add_argument("--sandbox-url", help="Sandbox gateway URL (for sprite proxy access)")
+    parser.add_argument("--runtime-events", action="store_true",
+                        help="Follow the runtime SSE stream instead of polling (server must expose it)")
     args = parser.parse_args()
 
     client = SmokeClient(args.base_url)
@@ -101,7 +103,12 @@ def main() -> int:
             client,
             workspace_id,
             timeout_seconds=args.provision_timeout,
+            use_events=args.runtime_events,
         )
+        provisioning = client.metrics.get("runtime_provisioning", {})
+        for step in provisioning.get("steps", []):
+            label = step["provisioning_step"] or step["state"]
+            print(f"[smoke]   {label}: {step['duration_ms']:.0f}ms")
         sprite_url = runtime.get("sprite_url", "")
         if not sprite_url:
             print("[smoke] ERROR: Runtime ready but no sprite_url", file=sys.stderr)
@@ -483,17 +483,27 @@ def main() -> int:
         run_step("Exec short command", step_17_exec_short)
 
         def step_18_exec_long():
+            started_at = time.monotonic()
             job = start_exec_job(
                 client,
                 command="printf 'job-start\\n'; sleep 1; printf 'job-done\\n'",
             )
-            result = wait_for_exec_job(client, str(job["job_id"]), timeout_seconds=args.exec_timeout)
+            result = wait_for_exec_job(
+                client,
+                str(job["job_id"]),
+                timeout_seconds=args.exec_timeout,
+                started_at=started_at,
+            )
             output = str(result.get("combined_output", ""))
             if "job-start" not in output or "job-done" not in output:
                 raise RuntimeError(f"job output mismatch: {output!r}")
             if result.get("exit_code") not in (0, None):
                 raise RuntimeError(f"unexpected job exit_code: {result.get('exit_code')}")
-            return output.strip()
+            ttfb = result.get("ttfb_ms")
+            return (
+                f"{output.strip()} (ttfb={'-' if ttfb is None else f'{ttfb:.0f}ms'}, "
+                f"total={result['total_ms']:.0f}ms, polls={result['polls']})"
+            )
 
         run_step("Exec long-running command", step_18_exec_long)
 
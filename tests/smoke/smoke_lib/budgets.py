@@ -0,0 +1,186 @@
+"""Per-step latency budgets for smoke runs, and the cross-run timing history.
+
+Budgets live in a JSON file (``tests/smoke/budgets.json`` by default, or
+``$SMOKE_BUDGETS_FILE``) as a list of rules. Each rule selects steps by
+``phase``/``path``/``method`` glob and sets a ``p50_ms`` and/or ``max_ms``
+ceiling over the matching successful steps::
+
+    {"budgets": [
+        {"name": "files-list", "path": "/api/v1/files/list*", "p50_ms": 500, "max_ms": 2000}
+    ]}
+
+Budget violations are reported separately from functional step failures:
+a slow run is not a broken run, and callers decide how to treat each.
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Iterable
+
+
+DEFAULT_BUDGETS_PATH = Path(__file__).resolve().parents[1] / "budgets.json"
+BUDGETS_ENV = "SMOKE_BUDGETS_FILE"
+TIMINGS_HISTORY_FILE = "timings.jsonl"
+TIMINGS_TREND_FILE = "timings-trend.json"
+
+
+@dataclass(frozen=True)
+class Budget:
+    name: str
+    phase: str = "*"
+    path: str = "*"
+    method: str = "*"
+    p50_ms: float | None = None
+    max_ms: float | None = None
+
+    def matches(self, step: dict[str, Any]) -> bool:
+        return (
+            fnmatchcase(str(step.get("phase", "")), self.phase)
+            and fnmatchcase(str(step.get("path", "")), self.path)
+            and fnmatchcase(str(step.get("method", "")).upper(), self.method.upper())
+        )
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(q / 100.0 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def parse_budgets(data: dict[str, Any]) -> list[Budget]:
+    budgets = []
+    for index, raw in enumerate(data.get("budgets") or []):
+        if raw.get("p50_ms") is None and raw.get("max_ms") is None:
+            raise ValueError(f"budget #{index} sets neither p50_ms nor max_ms")
+        budgets.append(Budget(
+            name=str(raw.get("name") or f"budget-{index}"),
+            phase=str(raw.get("phase") or "*"),
+            path=str(raw.get("path") or "*"),
+            method=str(raw.get("method") or "*"),
+            p50_ms=float(raw["p50_ms"]) if raw.get("p50_ms") is not None else None,
+            max_ms=float(raw["max_ms"]) if raw.get("max_ms") is not None else None,
+        ))
+    return budgets
+
+
+def load_budgets(path: str | Path | None = None) -> list[Budget]:
+    """Load budgets from ``path``, ``$SMOKE_BUDGETS_FILE`` or the default file.
+
+    An explicit or env-provided file must exist; a missing default file just
+    means no budgets.
+    """
+    explicit = path or os.environ.get(BUDGETS_ENV, "").strip()
+    target = Path(explicit) if explicit else DEFAULT_BUDGETS_PATH
+    if not target.exists():
+        if explicit:
+            raise FileNotFoundError(f"budgets file not found: {target}")
+        return []
+    return parse_budgets(json.loads(target.read_text(encoding="utf-8")))
+
+
+def evaluate_budgets(steps: Iterable[dict[str, Any]], budgets: list[Budget]) -> dict[str, Any]:
+    """Check successful steps against each budget; failed steps are a functional concern."""
+    timed = [step for step in steps if step.get("ok")]
+    results = []
+    violations = []
+    for budget in budgets:
+        samples = [float(step["elapsed_ms"]) for step in timed if budget.matches(step)]
+        if not samples:
+            continue
+        observed = {"p50_ms": round(_percentile(samples, 50), 1), "max_ms": round(max(samples), 1)}
+        exceeded = [
+            key for key, limit in (("p50_ms", budget.p50_ms), ("max_ms", budget.max_ms))
+            if limit is not None and observed[key] > limit
+        ]
+        entry = {
+            "name": budget.name,
+            "samples": len(samples),
+            **observed,
+            "budget": {key: value for key, value in (("p50_ms", budget.p50_ms), ("max_ms", budget.max_ms)) if value is not None},
+            "ok": not exceeded,
+        }
+        results.append(entry)
+        if exceeded:
+            violations.append({**entry, "exceeded": exceeded})
+    return {
+        "ok": not violations,
+        "checked": len(results),
+        "violations": violations,
+        "results": results,
+    }
+
+
+def append_timings(evidence_dir: Path, suite: str, steps: Iterable[dict[str, Any]], *, run_id: str) -> int:
+    """Append one JSON line per step to ``evidence_dir/timings.jsonl``; returns lines written."""
+    evidence_dir.mkdir(parents=True, exist_ok=True)
+    lines = [
+        json.dumps({
+            "run_id": run_id,
+            "suite": suite,
+            "phase": step.get("phase", ""),
+            "method": step.get("method", ""),
+            "path": step.get("path", ""),
+            "status": step.get("status"),
+            "ok": bool(step.get("ok")),
+            "elapsed_ms": step.get("elapsed_ms"),
+        })
+        for step in steps
+    ]
+    if lines:
+        with (evidence_dir / TIMINGS_HISTORY_FILE).open("a", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+    return len(lines)
+
+
+def timing_trend(evidence_dir: Path, *, last_runs: int = 20) -> dict[str, Any]:
+    """Per-step p50 for each of the last ``last_runs`` runs in ``timings.jsonl``."""
+    history = evidence_dir / TIMINGS_HISTORY_FILE
+    if not history.exists():
+        return {"runs": [], "steps": {}}
+    per_run: dict[str, dict[str, list[float]]] = {}
+    run_order: list[str] = []
+    for line in history.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not record.get("ok") or record.get("elapsed_ms") is None:
+            continue
+        run_id = str(record.get("run_id", ""))
+        if run_id not in per_run:
+            per_run[run_id] = {}
+            run_order.append(run_id)
+        key = f"{record.get('suite')} {record.get('phase')} {record.get('method')} {record.get('path')}"
+        per_run[run_id].setdefault(key, []).append(float(record["elapsed_ms"]))
+    runs = run_order[-last_runs:]
+    keys = sorted({key for run_id in runs for key in per_run[run_id]})
+    return {
+        "runs": runs,
+        "steps": {
+            key: [
+                round(_percentile(per_run[run_id][key], 50), 1) if key in per_run[run_id] else None
+                for run_id in runs
+            ]
+            for key in keys
+        },
+    }
+
+
+def write_timing_trend(evidence_dir: Path, *, last_runs: int = 20) -> Path:
+    target = evidence_dir / TIMINGS_TREND_FILE
+    target.write_text(json.dumps(timing_trend(evidence_dir, last_runs=last_runs), indent=2) + "\n", encoding="utf-8")
+    return target
+
+
+def new_run_id() -> str:
+    """Sortable, unique per invocation even when two runs start in the same second."""
+    return f"{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}-{uuid.uuid4().hex[:6]}"
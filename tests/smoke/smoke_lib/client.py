@@ -1,15 +1,19 @@
 """SmokeClient: httpx wrapper with cookie jar, base_url switching, and reporting."""
 from __future__ import annotations
 
+from contextlib import contextmanager
 from http.cookies import SimpleCookie
 import json
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import httpx
 
+from .budgets import Budget, evaluate_budgets, load_budgets
+from .trace import ChromeTrace, trace_enabled, trace_path_for, trace_smoke_client
+
 
 _REDACTED_HEADERS = {"authorization", "cookie", "set-cookie", "x-api-key"}
 _REDACTED_JSON_KEYS = {
@@ -87,29 +91,71 @@ class StepResult:
     response_headers: dict[str, str] = field(default_factory=dict)
     request_body: Any = None
     response_body: str = ""
+    # Wall-clock start of the request; lets traces line up steps from several clients.
+    started_at: float = 0.0
 
 
 class SmokeClient:
     """httpx.Client wrapper with cookie persistence, base_url switching, result collection."""
 
-    def __init__(self, base_url: str, *, timeout: float = 30.0, capture_details: bool = False):
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        timeout: float = 30.0,
+        capture_details: bool = False,
+        budgets: list[Budget] | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.capture_details = capture_details
+        # None means "load from $SMOKE_BUDGETS_FILE or tests/smoke/budgets.json at report time".
+        self.budgets = budgets
         self.cookies: dict[str, str] = {}
         self.results: list[StepResult] = []
+        self.metrics: dict[str, Any] = {}
         self._phase = "init"
+        self._http: httpx.Client | None = None
 
     def set_phase(self, phase: str) -> None:
         self._phase = phase
 
     def _client(self) -> httpx.Client:
-        return httpx.Client(
-            base_url=self.base_url,
-            cookies=dict(self.cookies),
-            timeout=self.timeout,
-            follow_redirects=False,
-        )
+        """Return a keep-alive client for the current base URL.
+
+        The connection pool is reused across requests; the cookie jar is
+        re-seeded from ``self.cookies`` every time so explicit edits to the
+        dict behave exactly as they did with one client per request.
+        """
+        if self._http is None or self._http.is_closed or str(self._http.base_url).rstrip("/") != self.base_url:
+            self.close()
+            self._http = httpx.Client(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                follow_redirects=False,
+            )
+        self._http.cookies = httpx.Cookies(dict(self.cookies))
+        return self._http
+
+    def close(self) -> None:
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def __enter__(self) -> "SmokeClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _absorb_cookies(self, resp: httpx.Response) -> None:
+        for cookie_name in _deleted_cookie_names(resp.headers):
+            self.cookies.pop(cookie_name, None)
+        for cookie_name, cookie_value in resp.cookies.items():
+            if not cookie_value:
+                self.cookies.pop(str(cookie_name), None)
+                continue
+            self.cookies[str(cookie_name)] = str(cookie_value)
 
     def _record(
         self,
@@ -121,6 +167,7 @@ class SmokeClient:
         detail: str = "",
         *,
         request_body: Any = None,
+        started_at: float = 0.0,
     ) -> None:
         capture_http_details = self.capture_details or not ok
         response_body = resp.text if capture_http_details else ""
@@ -138,40 +185,68 @@ class SmokeClient:
             response_headers=_sanitize_headers(resp.headers) if capture_http_details else {},
             request_body=_redact_value(request_body) if capture_http_details and request_body is not None else None,
             response_body=response_body,
+            started_at=started_at,
         ))
 
     def request(self, method: str, path: str, *, expect_status: int | tuple[int, ...] | None = None, **kw) -> httpx.Response:
-        with self._client() as client:
-            request_body = None
-            if "json" in kw:
-                request_body = kw["json"]
-            elif "content" in kw:
-                request_body = _decode_body(kw["content"] if isinstance(kw["content"], bytes) else str(kw["content"]).encode())
-            elif "data" in kw:
-                request_body = kw["data"]
-            if kw.get("params") is not None:
-                request_body = {
-                    "params": _redact_value(dict(kw["params"])),
-                    **({"body": _redact_value(request_body)} if request_body is not None else {}),
-                }
-            t0 = time.monotonic()
-            resp = client.request(method, path, **kw)
+        client = self._client()
+        request_body = None
+        if "json" in kw:
+            request_body = kw["json"]
+        elif "content" in kw:
+            request_body = _decode_body(kw["content"] if isinstance(kw["content"], bytes) else str(kw["content"]).encode())
+        elif "data" in kw:
+            request_body = kw["data"]
+        if kw.get("params") is not None:
+            request_body = {
+                "params": _redact_value(dict(kw["params"])),
+                **({"body": _redact_value(request_body)} if request_body is not None else {}),
+            }
+        started_at = time.time()
+        t0 = time.monotonic()
+        resp = client.request(method, path, **kw)
+        elapsed = (time.monotonic() - t0) * 1000
+        self._absorb_cookies(resp)
+        if expect_status is not None:
+            if isinstance(expect_status, int):
+                expect_status = (expect_status,)
+            ok = resp.status_code in expect_status
+        else:
+            ok = 200 <= resp.status_code < 400
+        self._record(method, path, resp, ok, elapsed, request_body=request_body, started_at=started_at)
+        return resp
+
+    @contextmanager
+    def stream(self, method: str, path: str, *, expect_status: int | tuple[int, ...] | None = None, **kw) -> Iterator[httpx.Response]:
+        """Open a streaming response (SSE, chunked) on the pooled connection.
+
+        The step is recorded when the headers arrive, so ``elapsed_ms`` is
+        time-to-first-byte rather than the lifetime of the stream.
+        """
+        client = self._client()
+        started_at = time.time()
+        t0 = time.monotonic()
+        with client.stream(method, path, **kw) as resp:
             elapsed = (time.monotonic() - t0) * 1000
-            for cookie_name in _deleted_cookie_names(resp.headers):
-                self.cookies.pop(cookie_name, None)
-            for cookie_name, cookie_value in resp.cookies.items():
-                if not cookie_value:
-                    self.cookies.pop(str(cookie_name), None)
-                    continue
-                self.cookies[str(cookie_name)] = str(cookie_value)
+            self._absorb_cookies(resp)
             if expect_status is not None:
                 if isinstance(expect_status, int):
                     expect_status = (expect_status,)
                 ok = resp.status_code in expect_status
             else:
                 ok = 200 <= resp.status_code < 400
-            self._record(method, path, resp, ok, elapsed, request_body=request_body)
-            return resp
+            self.results.append(StepResult(
+                phase=self._phase,
+                method=method,
+                path=path,
+                status=resp.status_code,
+                ok=ok,
+                elapsed_ms=elapsed,
+                detail="stream",
+                url=str(resp.request.url),
+                started_at=started_at,
+            ))
+            yield resp
 
     def get(self, path: str, **kw) -> httpx.Response:
         return self.request("GET", path, **kw)
@@ -189,31 +264,41 @@ class SmokeClient:
         self.base_url = new_base_url.rstrip("/")
 
     def report(self) -> dict[str, Any]:
+        """Summarize recorded steps.
+
+        ``ok`` covers functional failures only; latency budget violations are
+        reported under ``budgets`` with their own ``budget_ok`` flag.
+        """
         passed = sum(1 for r in self.results if r.ok)
         failed = sum(1 for r in self.results if not r.ok)
+        steps = [
+            {
+                "phase": r.phase,
+                "method": r.method,
+                "path": r.path,
+                "status": r.status,
+                "ok": r.ok,
+                "elapsed_ms": round(r.elapsed_ms, 1),
+                "detail": r.detail,
+                "url": r.url,
+                "response_size": r.response_size,
+                **({"request_headers": r.request_headers} if r.request_headers else {}),
+                **({"response_headers": r.response_headers} if r.response_headers else {}),
+                **({"request_body": r.request_body} if r.request_body is not None else {}),
+                **({"response_body": r.response_body} if r.response_body else {}),
+            }
+            for r in self.results
+        ]
+        budgets = self.budgets if self.budgets is not None else load_budgets()
+        budget_report = evaluate_budgets(steps, budgets) if budgets else None
         return {
             "ok": failed == 0,
             "passed": passed,
             "failed": failed,
             "total": len(self.results),
-            "steps": [
-                {
-                    "phase": r.phase,
-                    "method": r.method,
-                    "path": r.path,
-                    "status": r.status,
-                    "ok": r.ok,
-                    "elapsed_ms": round(r.elapsed_ms, 1),
-                    "detail": r.detail,
-                    "url": r.url,
-                    "response_size": r.response_size,
-                    **({"request_headers": r.request_headers} if r.request_headers else {}),
-                    **({"response_headers": r.response_headers} if r.response_headers else {}),
-                    **({"request_body": r.request_body} if r.request_body is not None else {}),
-                    **({"response_body": r.response_body} if r.response_body else {}),
-                }
-                for r in self.results
-            ],
+            "steps": steps,
+            **({"metrics": self.metrics} if self.metrics else {}),
+            **({"budget_ok": budget_report["ok"], "budgets": budget_report} if budget_report else {}),
         }
 
     def write_report(self, path: str | Path, *, extra: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -223,8 +308,17 @@ class SmokeClient:
         target = Path(path)
         target.parent.mkdir(parents=True, exist_ok=True)
         target.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        if trace_enabled():
+            self.write_trace(trace_path_for(target), name=target.stem)
         return report
 
+    def trace(self, *, name: str = "smoke") -> ChromeTrace:
+        """Chrome/Perfetto trace of the recorded steps, nested under their phases."""
+        return trace_smoke_client(self.results, name=name)
+
+    def write_trace(self, path: str | Path, *, name: str = "smoke") -> Path:
+        return self.trace(name=name).write(path)
+
     def assert_all_passed(self) -> None:
         failures = [r for r in self.results if not r.ok]
         if failures:
@@ -2,9 +2,17 @@
 from __future__ import annotations
 
 import time
+from pathlib import Path
+from typing import Callable
 
 from .client import SmokeClient
 
+#: Long-poll window requested from the server (it caps this at 25 s).
+DEFAULT_LONG_POLL_MS = 10_000
+#: Idle backoff bounds used when the server does not long-poll.
+MIN_POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 2.0
+
 
 def run_exec(client: SmokeClient, *, command: str, cwd: str | None = None) -> dict:
     """POST /api/v1/exec — run a short command synchronously."""
@@ -36,11 +44,25 @@ def start_exec_job(client: SmokeClient, *, command: str, cwd: str | None = None)
     return data
 
 
-def read_exec_job(client: SmokeClient, job_id: str, *, after: int | None = None) -> dict:
-    """GET /api/v1/exec/jobs/{job_id} — read job chunks."""
+def read_exec_job(
+    client: SmokeClient,
+    job_id: str,
+    *,
+    after: int | None = None,
+    wait_ms: int | None = None,
+) -> dict:
+    """GET /api/v1/exec/jobs/{job_id} — read job chunks.
+
+    With ``wait_ms`` the server holds the request until new output or a
+    state change (long-poll); servers without support ignore it.
+    """
     client.set_phase("exec-job-read")
-    params = {"after": str(after)} if after is not None else None
-    resp = client.get(f"/api/v1/exec/jobs/{job_id}", params=params, expect_status=(200,))
+    params: dict[str, str] = {}
+    if after is not None:
+        params["after"] = str(after)
+    if wait_ms is not None:
+        params["wait_ms"] = str(int(wait_ms))
+    resp = client.get(f"/api/v1/exec/jobs/{job_id}", params=params or None, expect_status=(200,))
     if resp.status_code != 200:
         raise RuntimeError(f"Exec job read failed: {resp.status_code} {resp.text[:300]}")
     return resp.json()
@@ -60,28 +82,115 @@ def collect_job_output(chunks: list[object] | None) -> str:
     return "".join(text_parts)
 
 
-def wait_for_exec_job(
+def follow_exec_job(
     client: SmokeClient,
     job_id: str,
     *,
+    on_output: Callable[[str], None] | None = None,
+    output_path: str | Path | None = None,
     timeout_seconds: float = 30.0,
-    poll_interval: float = 0.5,
+    wait_ms: int = DEFAULT_LONG_POLL_MS,
+    min_interval: float = MIN_POLL_INTERVAL,
+    max_interval: float = MAX_POLL_INTERVAL,
+    started_at: float | None = None,
 ) -> dict:
-    """Poll an exec job until done, returning the final payload plus combined output."""
+    """Follow an exec job to completion, streaming output as it arrives.
+
+    Each read asks the server to long-poll for ``wait_ms``. When the server
+    does not echo ``wait_ms`` back (no long-poll support), idle reads back
+    off exponentially from ``min_interval`` to ``max_interval`` and reset on
+    new output. Output goes to ``on_output`` and/or ``output_path`` and is
+    not retained. ``started_at`` (a ``time.monotonic()`` value, e.g. taken
+    before ``start_exec_job``) anchors the latency figures; it defaults to
+    the time of the call.
+
+    Returns the final job payload (without chunks) plus ``ttfb_ms``,
+    ``total_ms``, ``polls``, ``output_bytes`` and ``long_poll``.
+    """
+    t0 = time.monotonic() if started_at is None else started_at
     deadline = time.monotonic() + timeout_seconds
+    # Keep the long-poll comfortably inside the HTTP client timeout.
+    client_timeout = float(getattr(client, "timeout", 30.0) or 30.0)
+    wait_cap_ms = max(0, int((client_timeout - 5.0) * 1000))
     cursor: int | None = None
-    combined_chunks: list[dict] = []
-
-    while time.monotonic() < deadline:
-        data = read_exec_job(client, job_id, after=cursor)
-        combined_chunks.extend(data.get("chunks", []))
-        cursor = data.get("cursor", cursor)
-        if data.get("done"):
-            return {
-                **data,
-                "combined_output": collect_job_output(combined_chunks),
-                "chunks": combined_chunks,
-            }
-        time.sleep(poll_interval)
-
-    raise RuntimeError(f"Exec job {job_id} did not finish within {timeout_seconds}s")
+    long_poll: bool | None = None
+    interval = min_interval
+    ttfb_ms: float | None = None
+    polls = 0
+    output_bytes = 0
+
+    sink = Path(output_path).open("w", encoding="utf-8") if output_path else None
+    try:
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                raise RuntimeError(f"Exec job {job_id} did not finish within {timeout_seconds}s")
+            request_wait = min(wait_ms, wait_cap_ms, remaining_ms) if long_poll is not False else None
+            data = read_exec_job(client, job_id, after=cursor, wait_ms=request_wait)
+            polls += 1
+            if long_poll is None:
+                long_poll = "wait_ms" in data
+
+            text = collect_job_output(data.get("chunks"))
+            if text:
+                if ttfb_ms is None:
+                    ttfb_ms = (time.monotonic() - t0) * 1000
+                output_bytes += len(text.encode("utf-8"))
+                if on_output is not None:
+                    on_output(text)
+                if sink is not None:
+                    sink.write(text)
+                    sink.flush()
+            cursor = data.get("cursor", cursor)
+
+            if data.get("done"):
+                total_ms = (time.monotonic() - t0) * 1000
+                print(
+                    f"[smoke] Exec job {job_id} done: exit_code={data.get('exit_code')} "
+                    f"ttfb={'-' if ttfb_ms is None else f'{ttfb_ms:.0f}ms'} total={total_ms:.0f}ms "
+                    f"polls={polls} ({'long-poll' if long_poll else 'polling'})"
+                )
+                return {
+                    **{key: value for key, value in data.items() if key != "chunks"},
+                    "ttfb_ms": ttfb_ms,
+                    "total_ms": total_ms,
+                    "polls": polls,
+                    "output_bytes": output_bytes,
+                    "long_poll": bool(long_poll),
+                }
+
+            if long_poll and request_wait:
+                continue
+            if text:
+                interval = min_interval
+            time.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+            if not text:
+                interval = min(interval * 2, max_interval)
+    finally:
+        if sink is not None:
+            sink.close()
+
+
+def wait_for_exec_job(
+    client: SmokeClient,
+    job_id: str,
+    *,
+    timeout_seconds: float = 30.0,
+    poll_interval: float = MAX_POLL_INTERVAL,
+    started_at: float | None = None,
+) -> dict:
+    """Follow an exec job until done, returning the final payload plus combined output.
+
+    ``poll_interval`` caps the idle backoff used when the server cannot
+    long-poll. See ``follow_exec_job`` for the latency fields.
+    """
+    parts: list[str] = []
+    result = follow_exec_job(
+        client,
+        job_id,
+        on_output=parts.append,
+        timeout_seconds=timeout_seconds,
+        max_interval=max(poll_interval, MIN_POLL_INTERVAL),
+        started_at=started_at,
+    )
+    return {**result, "combined_output": "".join(parts)}
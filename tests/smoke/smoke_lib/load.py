@@ -0,0 +1,154 @@
+"""Concurrent virtual-user driver and latency aggregation for smoke load runs.
+
+Each virtual user gets its own ``SmokeClient`` (own cookie jar, own
+connection pool) and runs the blocking smoke helpers on a worker thread, so
+the existing ``smoke_lib`` journeys can be reused unchanged under asyncio.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from .client import SmokeClient, StepResult
+
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_UUID = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
+_GENERATED_SEGMENT = re.compile(r"^[A-Za-z0-9_.-]*\d[A-Za-z0-9_.-]*$")
+
+
+@dataclass
+class VirtualUserResult:
+    user: int
+    ok: bool
+    started_s: float
+    elapsed_s: float
+    steps: list[StepResult] = field(default_factory=list)
+    error: str = ""
+
+
+def route_key(method: str, path: str) -> str:
+    """Collapse per-user ids in ``path`` so steps aggregate by route."""
+    segments = []
+    for segment in path.split("?", 1)[0].split("/"):
+        if _UUID.match(segment) or (len(segment) >= 6 and _GENERATED_SEGMENT.match(segment)):
+            segments.append("{id}")
+        else:
+            segments.append(segment)
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(q / 100.0 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def latency_histogram(values_ms: list[float]) -> dict[str, Any]:
+    buckets: dict[str, int] = {f"<={int(edge)}": 0 for edge in LATENCY_BUCKETS_MS}
+    buckets[f">{int(LATENCY_BUCKETS_MS[-1])}"] = 0
+    for value in values_ms:
+        for edge in LATENCY_BUCKETS_MS:
+            if value <= edge:
+                buckets[f"<={int(edge)}"] += 1
+                break
+        else:
+            buckets[f">{int(LATENCY_BUCKETS_MS[-1])}"] += 1
+    return {
+        "count": len(values_ms),
+        "mean_ms": round(sum(values_ms) / len(values_ms), 1) if values_ms else 0.0,
+        "p50_ms": round(percentile(values_ms, 50), 1),
+        "p95_ms": round(percentile(values_ms, 95), 1),
+        "p99_ms": round(percentile(values_ms, 99), 1),
+        "max_ms": round(max(values_ms), 1) if values_ms else 0.0,
+        "buckets": buckets,
+    }
+
+
+def summarize(users: list[VirtualUserResult], *, wall_seconds: float) -> dict[str, Any]:
+    """Aggregate virtual-user results into per-route latency and error rates."""
+    by_route: dict[str, list[StepResult]] = {}
+    for user in users:
+        for step in user.steps:
+            by_route.setdefault(route_key(step.method, step.path), []).append(step)
+
+    routes: dict[str, Any] = {}
+    for key in sorted(by_route):
+        steps = by_route[key]
+        errors = sum(1 for step in steps if not step.ok)
+        routes[key] = {
+            "requests": len(steps),
+            "errors": errors,
+            "error_rate": round(errors / len(steps), 4),
+            "statuses": dict(sorted(Counter(str(step.status) for step in steps).items())),
+            "latency": latency_histogram([step.elapsed_ms for step in steps]),
+        }
+
+    total_requests = sum(route["requests"] for route in routes.values())
+    total_errors = sum(route["errors"] for route in routes.values())
+    failed_users = [user for user in users if not user.ok]
+    return {
+        "users": len(users),
+        "users_failed": len(failed_users),
+        "requests": total_requests,
+        "errors": total_errors,
+        "error_rate": round(total_errors / total_requests, 4) if total_requests else 0.0,
+        "wall_seconds": round(wall_seconds, 2),
+        "throughput_rps": round(total_requests / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+        "journey": latency_histogram([user.elapsed_s * 1000 for user in users]),
+        "failures": dict(Counter(user.error for user in failed_users).most_common(10)),
+        "routes": routes,
+    }
+
+
+async def run_virtual_users(
+    count: int,
+    journey: Callable[[int, SmokeClient], None],
+    *,
+    client_factory: Callable[[int], SmokeClient],
+    ramp_seconds: float = 0.0,
+) -> list[VirtualUserResult]:
+    """Start ``count`` users spread evenly over ``ramp_seconds`` and wait for all.
+
+    A journey that raises marks its user failed; the steps it recorded up to
+    that point are still kept so the failing route shows up in the report.
+    """
+    loop = asyncio.get_running_loop()
+    origin = time.monotonic()
+
+    def run_one(index: int) -> VirtualUserResult:
+        client = client_factory(index)
+        started = time.monotonic()
+        error = ""
+        try:
+            journey(index, client)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {str(exc)[:200]}"
+        finally:
+            client.close()
+        return VirtualUserResult(
+            user=index,
+            ok=not error,
+            started_s=round(started - origin, 3),
+            elapsed_s=time.monotonic() - started,
+            steps=list(client.results),
+            error=error,
+        )
+
+    async def user(index: int, executor: ThreadPoolExecutor) -> VirtualUserResult:
+        if ramp_seconds > 0 and count > 1:
+            await asyncio.sleep(ramp_seconds * index / count)
+        return await loop.run_in_executor(executor, run_one, index)
+
+    with ThreadPoolExecutor(max_workers=max(1, count), thread_name_prefix="smoke-vu") as executor:
+        return list(await asyncio.gather(*(user(index, executor) for index in range(count))))
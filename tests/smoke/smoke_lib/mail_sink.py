@@ -0,0 +1,338 @@
+"""Local mail sink for offline smokes: SMTP and HTTP in, push-based waits out.
+
+:class:`MailSink` keeps messages in memory and wakes waiters through a
+condition variable the moment a message lands, so a confirmation-email wait
+returns in milliseconds instead of polling Resend every few seconds.
+
+Messages arrive via:
+
+- :meth:`MailSink.send` in-process (the Neon Auth stand-in uses this)
+- an SMTP listener (:class:`SmtpSink`) for apps configured with an SMTP relay
+- ``POST /emails`` with a Resend-style send payload
+
+and are read over HTTP with Resend-compatible ``GET /emails`` and
+``GET /emails/<id>``, plus ``GET /emails/wait?to=&since=&timeout=`` which
+long-polls the condition variable. ``smoke_lib.resend`` uses that endpoint
+when ``SMOKE_MAIL_SINK_URL`` is set.
+
+Run standalone (from ``tests/smoke``)::
+
+    python -m smoke_lib.mail_sink --http-port 8789 --smtp-port 2525
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import socketserver
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from email import message_from_bytes, policy
+from email.utils import getaddresses
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+MAIL_SINK_ENV = "SMOKE_MAIL_SINK_URL"
+MAX_WAIT_SECONDS = 60.0
+
+
+class MailSink:
+    """In-memory outbox; waiters are woken as soon as a message lands."""
+
+    def __init__(self) -> None:
+        self._messages: list[dict[str, Any]] = []
+        self._epochs: list[float] = []
+        self._cond = threading.Condition()
+
+    def send(
+        self,
+        *,
+        to: str | list[str],
+        subject: str,
+        html: str,
+        text: str,
+        sender: str = "Smoke Mail Sink <sink@stub.invalid>",
+    ) -> dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        message = {
+            "id": str(uuid.uuid4()),
+            "to": [to] if isinstance(to, str) else list(to),
+            "from": sender,
+            "subject": subject,
+            "html": html,
+            "text": text,
+            "created_at": now.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+        }
+        with self._cond:
+            self._messages.append(message)
+            self._epochs.append(now.timestamp())
+            self._cond.notify_all()
+        return message
+
+    def messages(self) -> list[dict[str, Any]]:
+        with self._cond:
+            return list(self._messages)
+
+    def get(self, message_id: str) -> dict[str, Any] | None:
+        with self._cond:
+            return next((item for item in self._messages if item["id"] == message_id), None)
+
+    def _match(self, recipient: str, after: int, since: float | None) -> dict[str, Any] | None:
+        for index in range(after, len(self._messages)):
+            if since is not None and self._epochs[index] < since:
+                continue
+            message = self._messages[index]
+            if recipient in {item.lower() for item in message["to"]}:
+                return message
+        return None
+
+    def wait_for(
+        self,
+        recipient: str,
+        *,
+        after: int = 0,
+        since: float | None = None,
+        timeout: float = 10.0,
+    ) -> dict[str, Any]:
+        """Block until a message to ``recipient`` exists at index >= ``after`` (and not before ``since``)."""
+        recipient = recipient.lower()
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                message = self._match(recipient, after, since)
+                if message is not None:
+                    return message
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"no mail to {recipient} within {timeout}s")
+                self._cond.wait(remaining)
+
+
+def _summary(message: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in message.items() if key not in {"html", "text"}}
+
+
+def handle_mail_request(sink: MailSink, method: str, path: str, query: dict[str, list[str]], body: Any = None) -> tuple[int, Any] | None:
+    """Serve the sink's HTTP API; returns ``(status, json_body)`` or None when ``path`` is not a mail route.
+
+    Shared by :class:`MailSinkServer` and the Neon Auth stand-in so both
+    expose the same routes.
+    """
+    if path == "/emails" and method == "GET":
+        limit = int((query.get("limit") or ["25"])[0])
+        return 200, {"object": "list", "data": [_summary(item) for item in reversed(sink.messages())][:limit]}
+    if path == "/emails" and method == "POST":
+        if not isinstance(body, dict) or not body.get("to"):
+            return 422, {"name": "validation_error", "message": "`to` is required"}
+        message = sink.send(
+            to=body["to"],
+            subject=str(body.get("subject") or ""),
+            html=str(body.get("html") or ""),
+            text=str(body.get("text") or ""),
+            sender=str(body.get("from") or "Smoke Mail Sink <sink@stub.invalid>"),
+        )
+        return 200, {"id": message["id"]}
+    if path == "/emails/wait" and method == "GET":
+        recipient = (query.get("to") or [""])[0].strip()
+        if not recipient:
+            return 400, {"name": "validation_error", "message": "`to` is required"}
+        since = (query.get("since") or [""])[0]
+        timeout = min(float((query.get("timeout") or ["10"])[0]), MAX_WAIT_SECONDS)
+        try:
+            message = sink.wait_for(recipient, since=float(since) if since else None, timeout=timeout)
+        except TimeoutError as exc:
+            return 408, {"name": "timeout", "message": str(exc)}
+        return 200, {"object": "email", **message}
+    if path.startswith("/emails/") and method == "GET":
+        message = sink.get(path.rsplit("/", 1)[1])
+        if message is None:
+            return 404, {"name": "not_found", "message": "email not found"}
+        return 200, {"object": "email", **message}
+    return None
+
+
+class _HttpHandler(BaseHTTPRequestHandler):
+    sink: MailSink
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def _respond(self, method: str) -> None:
+        parsed = urlparse(self.path)
+        body = None
+        if method == "POST":
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                body = None
+        result = handle_mail_request(self.sink, method, parsed.path.rstrip("/") or "/", parse_qs(parsed.query), body)
+        if result is None:
+            result = (200, {"ok": True}) if parsed.path in {"/", "/health"} else (404, {"name": "not_found"})
+        status, payload = result
+        raw = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_GET(self) -> None:
+        self._respond("GET")
+
+    def do_POST(self) -> None:
+        self._respond("POST")
+
+
+def parse_smtp_message(raw: bytes, envelope_to: list[str]) -> dict[str, Any]:
+    """Subject, recipients and html/text bodies of an RFC 5322 message."""
+    parsed = message_from_bytes(raw, policy=policy.default)
+    html_part = parsed.get_body(preferencelist=("html",))
+    text_part = parsed.get_body(preferencelist=("plain",))
+    header_to = [address for _, address in getaddresses(parsed.get_all("To", []))]
+    return {
+        "to": envelope_to or header_to,
+        "subject": str(parsed.get("Subject", "")),
+        "sender": str(parsed.get("From", "")),
+        "html": html_part.get_content() if html_part is not None else "",
+        "text": text_part.get_content() if text_part is not None else "",
+    }
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP (RFC 5321) for a relay client: no auth, no TLS, no extensions."""
+
+    sink: MailSink
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self) -> None:
+        self._reply("220 smoke-mail-sink ESMTP")
+        recipients: list[str] = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb in {"EHLO", "HELO"}:
+                self._reply("250 smoke-mail-sink")
+            elif verb == "MAIL":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[1].strip() if ":" in command else ""
+                recipients.append(address.strip("<>").strip())
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                for data_line in iter(self.rfile.readline, b""):
+                    if data_line in {b".\r\n", b".\n"}:
+                        break
+                    lines.append(data_line[1:] if data_line.startswith(b"..") else data_line)
+                self.sink.send(**parse_smtp_message(b"".join(lines), recipients))
+                recipients = []
+                self._reply("250 OK queued")
+            elif verb in {"RSET", "NOOP"}:
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class SmtpSink:
+    """SMTP listener feeding ``sink`` on a background thread."""
+
+    def __init__(self, sink: MailSink, host: str = "127.0.0.1", port: int = 0) -> None:
+        handler = type("SmtpSinkHandler", (_SmtpHandler,), {"sink": sink})
+        self._server = _ThreadingTCPServer((host, port), handler)
+        self.host = host
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> "SmtpSink":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="smtp-sink", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+class MailSinkServer:
+    """HTTP API (and optionally SMTP) for a :class:`MailSink`: ``with MailSinkServer() as sink: ...``."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, *, smtp_port: int | None = None, sink: MailSink | None = None) -> None:
+        self.sink = sink or MailSink()
+        handler = type("MailSinkHttpHandler", (_HttpHandler,), {"sink": self.sink})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self.base_url = f"http://{host}:{self._server.server_address[1]}"
+        self.smtp = SmtpSink(self.sink, host, smtp_port) if smtp_port is not None else None
+        self._thread: threading.Thread | None = None
+
+    def env(self) -> dict[str, str]:
+        return {MAIL_SINK_ENV: self.base_url}
+
+    def start(self) -> "MailSinkServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mail-sink", daemon=True)
+        self._thread.start()
+        if self.smtp is not None:
+            self.smtp.start()
+        return self
+
+    def stop(self) -> None:
+        if self.smtp is not None:
+            self.smtp.stop()
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "MailSinkServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve the smoke mail sink until interrupted")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--http-port", type=int, default=8789)
+    parser.add_argument("--smtp-port", type=int, default=2525, help="SMTP listener port (-1 to disable)")
+    args = parser.parse_args()
+    server = MailSinkServer(args.host, args.http_port, smtp_port=None if args.smtp_port < 0 else args.smtp_port).start()
+    print(f"[mail-sink] http {server.base_url}")
+    if server.smtp is not None:
+        print(f"[mail-sink] smtp {server.smtp.host}:{server.smtp.port}")
+    print(f"export {MAIL_SINK_ENV}={server.base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
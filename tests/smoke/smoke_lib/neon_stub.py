@@ -0,0 +1,547 @@
+"""Hermetic Neon Auth stand-in for offline auth smokes.
+
+Implements the slice of the Neon Auth (Better Auth) HTTP API that boring-ui
+and ``smoke_lib.auth`` use:
+
+- ``POST /sign-up/email`` / ``POST /sign-in/email`` set a session cookie
+- ``GET /token`` returns an EdDSA JWT for that session
+- ``GET /.well-known/jwks.json`` publishes the Ed25519 key in the shape
+  ``internal/auth/neon.go`` and ``src/server/auth/neonClient.ts`` accept
+- ``POST /send-verification-email`` / ``GET /verify-email`` deliver and
+  consume a verification link
+
+Outgoing mail goes to an in-process :class:`~smoke_lib.mail_sink.MailSink`
+instead of Resend, and the sink's HTTP routes (``/emails``, ``/emails/wait``)
+are served alongside, so ``smoke_lib.resend`` reads it with
+``SMOKE_MAIL_SINK_URL`` pointed here.
+
+Signing uses a small pure-Python Ed25519 (RFC 8032) so the stand-in needs
+nothing beyond the standard library. It is fine for a test double and far
+too slow and unhardened for anything else.
+
+Run standalone (from ``tests/smoke``)::
+
+    python -m smoke_lib.neon_stub --port 8788
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urljoin, urlencode, urlparse
+
+from .mail_sink import MAIL_SINK_ENV, MailSink, handle_mail_request
+
+SESSION_COOKIE = "better-auth.session_token"
+TOKEN_TTL_SECONDS = 900
+DEFAULT_PORT = 8788
+
+
+# ---------------------------------------------------------------------------
+# Ed25519 (RFC 8032, section 5.1) over extended twisted Edwards coordinates
+# ---------------------------------------------------------------------------
+
+_P = 2**255 - 19
+_L = 2**252 + 27742317777372353535851937790883648493
+_D = -121665 * pow(121666, _P - 2, _P) % _P
+_SQRT_M1 = pow(2, (_P - 1) // 4, _P)
+
+
+def _recover_x(y: int, sign: int) -> int | None:
+    if y >= _P:
+        return None
+    x2 = (y * y - 1) * pow(_D * y * y + 1, _P - 2, _P)
+    if x2 == 0:
+        return None if sign else 0
+    x = pow(x2, (_P + 3) // 8, _P)
+    if (x * x - x2) % _P != 0:
+        x = x * _SQRT_M1 % _P
+    if (x * x - x2) % _P != 0:
+        return None
+    if (x & 1) != sign:
+        x = _P - x
+    return x
+
+
+_BASE_Y = 4 * pow(5, _P - 2, _P) % _P
+_BASE_X = _recover_x(_BASE_Y, 0)
+_BASE = (_BASE_X, _BASE_Y, 1, _BASE_X * _BASE_Y % _P)
+_IDENTITY = (0, 1, 1, 0)
+
+
+def _point_add(p: tuple[int, int, int, int], q: tuple[int, int, int, int]) -> tuple[int, int, int, int]:
+    a = (p[1] - p[0]) * (q[1] - q[0]) % _P
+    b = (p[1] + p[0]) * (q[1] + q[0]) % _P
+    c = 2 * p[3] * q[3] * _D % _P
+    d = 2 * p[2] * q[2] % _P
+    e, f, g, h = b - a, d - c, d + c, b + a
+    return (e * f % _P, g * h % _P, f * g % _P, e * h % _P)
+
+
+def _point_mul(scalar: int, point: tuple[int, int, int, int]) -> tuple[int, int, int, int]:
+    result = _IDENTITY
+    while scalar:
+        if scalar & 1:
+            result = _point_add(result, point)
+        point = _point_add(point, point)
+        scalar >>= 1
+    return result
+
+
+def _point_equal(p: tuple[int, int, int, int], q: tuple[int, int, int, int]) -> bool:
+    return (p[0] * q[2] - q[0] * p[2]) % _P == 0 and (p[1] * q[2] - q[1] * p[2]) % _P == 0
+
+
+def _point_compress(point: tuple[int, int, int, int]) -> bytes:
+    zinv = pow(point[2], _P - 2, _P)
+    x, y = point[0] * zinv % _P, point[1] * zinv % _P
+    return int.to_bytes(y | ((x & 1) << 255), 32, "little")
+
+
+def _point_decompress(raw: bytes) -> tuple[int, int, int, int] | None:
+    if len(raw) != 32:
+        return None
+    y = int.from_bytes(raw, "little")
+    sign = y >> 255
+    y &= (1 << 255) - 1
+    x = _recover_x(y, sign)
+    if x is None:
+        return None
+    return (x, y, 1, x * y % _P)
+
+
+def _sha512_int(*parts: bytes) -> int:
+    return int.from_bytes(hashlib.sha512(b"".join(parts)).digest(), "little")
+
+
+def _expand_secret(seed: bytes) -> tuple[int, bytes]:
+    digest = hashlib.sha512(seed).digest()
+    scalar = int.from_bytes(digest[:32], "little")
+    scalar &= (1 << 254) - 8
+    scalar |= 1 << 254
+    return scalar, digest[32:]
+
+
+def ed25519_public_key(seed: bytes) -> bytes:
+    scalar, _ = _expand_secret(seed)
+    return _point_compress(_point_mul(scalar, _BASE))
+
+
+def ed25519_sign(seed: bytes, message: bytes) -> bytes:
+    scalar, prefix = _expand_secret(seed)
+    public = _point_compress(_point_mul(scalar, _BASE))
+    r = _sha512_int(prefix, message) % _L
+    encoded_r = _point_compress(_point_mul(r, _BASE))
+    k = _sha512_int(encoded_r, public, message) % _L
+    s = (r + k * scalar) % _L
+    return encoded_r + int.to_bytes(s, 32, "little")
+
+
+def ed25519_verify(public: bytes, message: bytes, signature: bytes) -> bool:
+    if len(signature) != 64:
+        return False
+    point_a = _point_decompress(public)
+    point_r = _point_decompress(signature[:32])
+    s = int.from_bytes(signature[32:], "little")
+    if point_a is None or point_r is None or s >= _L:
+        return False
+    k = _sha512_int(signature[:32], public, message) % _L
+    return _point_equal(_point_mul(s, _BASE), _point_add(point_r, _point_mul(k, point_a)))
+
+
+def _b64url(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64url_decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+# ---------------------------------------------------------------------------
+# Signing key and account store
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SigningKey:
+    kid: str
+    seed: bytes
+
+    @classmethod
+    def generate(cls) -> "SigningKey":
+        return cls(kid=f"stub-{secrets.token_hex(4)}", seed=secrets.token_bytes(32))
+
+    @property
+    def public_key(self) -> bytes:
+        return ed25519_public_key(self.seed)
+
+    def jwk(self) -> dict[str, str]:
+        return {"kty": "OKP", "crv": "Ed25519", "alg": "EdDSA", "use": "sig", "kid": self.kid, "x": _b64url(self.public_key)}
+
+    def sign_jwt(self, claims: dict[str, Any]) -> str:
+        header = {"alg": "EdDSA", "typ": "JWT", "kid": self.kid}
+        signing_input = f"{_b64url(json.dumps(header, separators=(',', ':')).encode())}.{_b64url(json.dumps(claims, separators=(',', ':')).encode())}"
+        return f"{signing_input}.{_b64url(ed25519_sign(self.seed, signing_input.encode('ascii')))}"
+
+
+def decode_jwt(token: str, jwks: dict[str, Any]) -> dict[str, Any]:
+    """Verify an EdDSA JWT against ``jwks`` and return its claims; raises ValueError."""
+    try:
+        header_b64, claims_b64, signature_b64 = token.split(".")
+        header = json.loads(_b64url_decode(header_b64))
+        claims = json.loads(_b64url_decode(claims_b64))
+    except (ValueError, json.JSONDecodeError) as exc:
+        raise ValueError(f"malformed JWT: {exc}") from exc
+    if header.get("alg") != "EdDSA":
+        raise ValueError(f"unexpected alg {header.get('alg')!r}")
+    keys = {key.get("kid"): key for key in jwks.get("keys", [])}
+    key = keys.get(header.get("kid"))
+    if key is None:
+        raise ValueError(f"unknown kid {header.get('kid')!r}")
+    signing_input = f"{header_b64}.{claims_b64}".encode("ascii")
+    if not ed25519_verify(_b64url_decode(key["x"]), signing_input, _b64url_decode(signature_b64)):
+        raise ValueError("bad signature")
+    return claims
+
+
+@dataclass
+class _Account:
+    user_id: str
+    email: str
+    name: str
+    password_hash: str
+    email_verified: bool = False
+
+
+@dataclass
+class NeonAuthState:
+    base_url: str
+    key: SigningKey = field(default_factory=SigningKey.generate)
+    retired_keys: list[SigningKey] = field(default_factory=list)
+    mail: MailSink = field(default_factory=MailSink)
+    token_ttl_seconds: int = TOKEN_TTL_SECONDS
+    jwks_delay_seconds: float = 0.0
+    accounts: dict[str, _Account] = field(default_factory=dict)
+    sessions: dict[str, str] = field(default_factory=dict)
+    verifications: dict[str, tuple[str, str]] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def origin(self) -> str:
+        parsed = urlparse(self.base_url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def jwks(self) -> dict[str, Any]:
+        with self.lock:
+            keys = [self.key, *self.retired_keys]
+        return {"keys": [key.jwk() for key in keys]}
+
+    def rotate_key(self, new_key: SigningKey | None = None, *, keep_previous: bool = True) -> SigningKey:
+        """Start signing with ``new_key``; ``keep_previous=False`` publishes only the new key."""
+        new_key = new_key or SigningKey.generate()
+        with self.lock:
+            if keep_previous:
+                self.retired_keys.insert(0, self.key)
+            else:
+                self.retired_keys.clear()
+            self.key = new_key
+        return new_key
+
+    def issue_token(self, *, sub: str, email: str, name: str = "", key: SigningKey | None = None, **extra: Any) -> str:
+        now = int(time.time())
+        return (key or self.key).sign_jwt({
+            "sub": sub,
+            "email": email,
+            "name": name or email.split("@")[0],
+            "role": "authenticated",
+            "iss": self.origin,
+            "aud": self.origin,
+            "iat": now,
+            "exp": now + self.token_ttl_seconds,
+            **extra,
+        })
+
+    def mint_token(self, account: _Account) -> str:
+        return self.issue_token(
+            sub=account.user_id,
+            email=account.email,
+            name=account.name,
+            email_verified=account.email_verified,
+        )
+
+    def open_session(self, account: _Account) -> str:
+        session_id = secrets.token_urlsafe(24)
+        with self.lock:
+            self.sessions[session_id] = account.email
+        return session_id
+
+    def session_account(self, session_id: str) -> _Account | None:
+        with self.lock:
+            email = self.sessions.get(session_id)
+            return self.accounts.get(email) if email else None
+
+
+def _hash_password(password: str) -> str:
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+def _account_payload(account: _Account) -> dict[str, Any]:
+    return {"id": account.user_id, "email": account.email, "name": account.name, "emailVerified": account.email_verified}
+
+
+# ---------------------------------------------------------------------------
+# HTTP handler
+# ---------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    state: NeonAuthState
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def _send_json(self, status: int, body: Any, *, session_id: str | None = None) -> None:
+        raw = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        if session_id:
+            self._set_session_cookie(session_id)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _set_session_cookie(self, session_id: str) -> None:
+        self.send_header("Set-Cookie", f"{SESSION_COOKIE}={session_id}; Path=/; HttpOnly; SameSite=Lax")
+
+    def _error(self, status: int, code: str, message: str) -> None:
+        self._send_json(status, {"code": code, "message": message})
+
+    def _json_body(self) -> dict[str, Any] | None:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            return None
+        return body if isinstance(body, dict) else None
+
+    def _session_id(self) -> str:
+        cookie = SimpleCookie()
+        cookie.load(self.headers.get("Cookie") or "")
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else ""
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        path = parsed.path.rstrip("/") or "/"
+        query = parse_qs(parsed.query)
+        state = self.state
+        if path == "/.well-known/jwks.json":
+            state.count("jwks")
+            if state.jwks_delay_seconds > 0:
+                time.sleep(state.jwks_delay_seconds)
+            self._send_json(200, state.jwks())
+        elif path == "/token":
+            state.count("token")
+            account = state.session_account(self._session_id())
+            if account is None:
+                self._error(401, "UNAUTHORIZED", "No active session")
+                return
+            self._send_json(200, {"token": state.mint_token(account)})
+        elif path == "/get-session":
+            account = state.session_account(self._session_id())
+            self._send_json(200, {"user": _account_payload(account)} if account else None)
+        elif path == "/verify-email":
+            self._verify_email((query.get("token") or [""])[0], (query.get("callbackURL") or [""])[0])
+        elif path.startswith("/emails"):
+            status, body = handle_mail_request(state.mail, "GET", path, query) or (404, {"code": "NOT_FOUND"})
+            self._send_json(status, body)
+        elif path in {"/", "/health"}:
+            self._send_json(200, {"ok": True, "counters": dict(state.counters)})
+        else:
+            self._error(404, "NOT_FOUND", f"no route for {path}")
+
+    def do_POST(self) -> None:
+        path = urlparse(self.path).path.rstrip("/")
+        body = self._json_body()
+        if body is None:
+            self._error(400, "INVALID_JSON", "Expected JSON object")
+            return
+        if path == "/sign-up/email":
+            self._sign_up(body)
+        elif path == "/sign-in/email":
+            self._sign_in(body)
+        elif path == "/send-verification-email":
+            self._send_verification(body)
+        elif path == "/sign-out":
+            with self.state.lock:
+                self.state.sessions.pop(self._session_id(), None)
+            self._send_json(200, {"success": True})
+        else:
+            self._error(404, "NOT_FOUND", f"no route for {path}")
+
+    def _sign_up(self, body: dict[str, Any]) -> None:
+        state = self.state
+        state.count("sign_up")
+        email = str(body.get("email") or "").strip().lower()
+        password = str(body.get("password") or "")
+        if not email or not password:
+            self._error(400, "VALIDATION_ERROR", "email and password are required")
+            return
+        with state.lock:
+            if email in state.accounts:
+                self._error(422, "USER_ALREADY_EXISTS", "User already exists")
+                return
+            account = _Account(
+                user_id=str(uuid.uuid4()),
+                email=email,
+                name=str(body.get("name") or email.split("@")[0]),
+                password_hash=_hash_password(password),
+            )
+            state.accounts[email] = account
+        session_id = state.open_session(account)
+        self._send_json(200, {"token": session_id, "user": _account_payload(account)}, session_id=session_id)
+
+    def _sign_in(self, body: dict[str, Any]) -> None:
+        state = self.state
+        state.count("sign_in")
+        email = str(body.get("email") or "").strip().lower()
+        with state.lock:
+            account = state.accounts.get(email)
+        if account is None or account.password_hash != _hash_password(str(body.get("password") or "")):
+            self._error(401, "INVALID_EMAIL_OR_PASSWORD", "Invalid email or password")
+            return
+        session_id = state.open_session(account)
+        self._send_json(
+            200,
+            {"redirect": False, "token": session_id, "user": _account_payload(account)},
+            session_id=session_id,
+        )
+
+    def _send_verification(self, body: dict[str, Any]) -> None:
+        state = self.state
+        email = str(body.get("email") or "").strip().lower()
+        with state.lock:
+            account = state.accounts.get(email)
+        if account is None:
+            # Better Auth does not reveal whether the address exists.
+            self._send_json(200, {"status": True})
+            return
+        callback = str(body.get("callbackURL") or "")
+        if callback and not urlparse(callback).scheme:
+            callback = urljoin((self.headers.get("Origin") or state.origin).rstrip("/") + "/", callback.lstrip("/"))
+        token = secrets.token_urlsafe(24)
+        with state.lock:
+            state.verifications[token] = (email, callback)
+        link = f"{state.base_url}/verify-email?{urlencode({'token': token, 'callbackURL': callback} if callback else {'token': token})}"
+        state.mail.send(
+            to=email,
+            subject="Verify your email address",
+            sender="Neon Auth Stub <auth@stub.invalid>",
+            html=f'<p>Click the link to verify your email: <a href="{link}">{link}</a></p>',
+            text=f"Click the link to verify your email: {link}",
+        )
+        state.count("verification_email")
+        self._send_json(200, {"status": True})
+
+    def _verify_email(self, token: str, callback: str) -> None:
+        state = self.state
+        with state.lock:
+            entry = state.verifications.pop(token, None)
+            account = state.accounts.get(entry[0]) if entry else None
+            if account is not None:
+                account.email_verified = True
+        if account is None:
+            self._error(400, "INVALID_TOKEN", "Invalid or expired verification token")
+            return
+        session_id = state.open_session(account)
+        target = callback or entry[1]
+        if target:
+            self.send_response(302)
+            self.send_header("Location", target)
+            self.send_header("Content-Length", "0")
+            self._set_session_cookie(session_id)
+            self.end_headers()
+            return
+        self._send_json(200, {"status": True, "user": _account_payload(account)}, session_id=session_id)
+
+
+class NeonAuthStub:
+    """Run the stand-in on a background thread: ``with NeonAuthStub() as stub: ...``."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        handler = type("NeonAuthStubHandler", (_Handler,), {})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self.base_url = f"http://{host}:{self._server.server_address[1]}"
+        self.state = NeonAuthState(base_url=self.base_url)
+        handler.state = self.state
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def mail(self) -> MailSink:
+        return self.state.mail
+
+    def env(self) -> dict[str, str]:
+        """Environment pointing the app at the stand-in and ``smoke_lib.resend`` at its sink."""
+        return {
+            "NEON_AUTH_BASE_URL": self.base_url,
+            "NEON_AUTH_JWKS_URL": f"{self.base_url}/.well-known/jwks.json",
+            MAIL_SINK_ENV: self.base_url,
+        }
+
+    def start(self) -> "NeonAuthStub":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="neon-auth-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "NeonAuthStub":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve the Neon Auth stand-in until interrupted")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("NEON_STUB_PORT") or DEFAULT_PORT))
+    args = parser.parse_args()
+    stub = NeonAuthStub(args.host, args.port).start()
+    print(f"[neon-stub] serving {stub.base_url}")
+    for name, value in stub.env().items():
+        print(f"export {name}={value}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
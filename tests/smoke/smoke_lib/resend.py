@@ -1,15 +1,23 @@
-"""Resend email polling and confirmation URL extraction."""
+"""Confirmation-email delivery checks and confirmation URL extraction.
+
+``wait_for_email``/``get_email`` go through a :class:`MailBackend`: Resend
+polling by default, or the local sink from ``smoke_lib.mail_sink`` (which
+pushes messages to waiters) when ``SMOKE_MAIL_SINK_URL`` is set.
+"""
 from __future__ import annotations
 
 import html
+import os
 import re
 import time
 from datetime import datetime
-from typing import Any
+from typing import Any, Protocol
 from urllib.parse import parse_qs, unquote, urlparse
 
 import httpx
 
+from .mail_sink import MAIL_SINK_ENV
+
 RESEND_API_BASE = "https://api.resend.com"
 CONFIRMATION_CODE_RE = re.compile(r"\b(\d{6})\b")
 
@@ -64,7 +72,7 @@ def list_emails(api_key: str, *, limit: int = 25) -> list[dict[str, Any]]:
     raise RuntimeError("Resend list endpoint kept returning rate limits")
 
 
-def get_email(api_key: str, *, email_id: str) -> dict[str, Any]:
+def _get_resend_email(api_key: str, *, email_id: str) -> dict[str, Any]:
     last_payload: dict[str, Any] | None = None
     for attempt in range(1, 8):
         resp = httpx.get(
@@ -112,28 +120,104 @@ def _message_bodies(payload: dict[str, Any]) -> list[str]:
     return bodies
 
 
+class MailBackend(Protocol):
+    name: str
+
+    def wait_for_email(self, *, recipient: str, sent_after_epoch: float, timeout_seconds: int) -> dict[str, Any]:
+        """Summary (at least ``id``) of the first message to ``recipient`` sent after ``sent_after_epoch``."""
+
+    def get_email(self, email_id: str) -> dict[str, Any]:
+        """Full message including ``html``/``text``."""
+
+
+class ResendBackend:
+    """Poll the Resend API; every run sharing ``api_key`` shares its rate limit."""
+
+    name = "resend"
+
+    def __init__(self, api_key: str, *, poll_interval: float = 3.0) -> None:
+        self.api_key = api_key
+        self.poll_interval = poll_interval
+
+    def wait_for_email(self, *, recipient: str, sent_after_epoch: float, timeout_seconds: int) -> dict[str, Any]:
+        deadline = time.monotonic() + timeout_seconds
+        recipient_lower = recipient.lower()
+        while time.monotonic() < deadline:
+            for email in list_emails(self.api_key):
+                if not isinstance(email, dict):
+                    continue
+                recipients = _normalize_recipients(email.get("to"))
+                if recipient_lower not in {item.lower() for item in recipients}:
+                    continue
+                created_epoch = _iso_to_epoch(email.get("created_at"))
+                if created_epoch is not None and created_epoch + 5 < sent_after_epoch:
+                    continue
+                return email
+            time.sleep(self.poll_interval)
+        raise RuntimeError(f"Timed out ({timeout_seconds}s) waiting for signup email to {recipient}")
+
+    def get_email(self, email_id: str) -> dict[str, Any]:
+        return _get_resend_email(self.api_key, email_id=email_id)
+
+
+class SinkBackend:
+    """Long-poll a local ``smoke_lib.mail_sink``; returns as soon as the message lands."""
+
+    name = "sink"
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url.rstrip("/")
+
+    def wait_for_email(self, *, recipient: str, sent_after_epoch: float, timeout_seconds: int) -> dict[str, Any]:
+        # The sink caps each long poll (mail_sink.MAX_WAIT_SECONDS), so
+        # re-poll until our own deadline rather than trusting one request.
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            remaining = max(deadline - time.monotonic(), 0.0)
+            # Same 5 s clock-skew allowance as the Resend path.
+            resp = httpx.get(
+                f"{self.base_url}/emails/wait",
+                params={"to": recipient, "since": sent_after_epoch - 5, "timeout": remaining},
+                timeout=remaining + 10.0,
+            )
+            if resp.status_code != 408:
+                resp.raise_for_status()
+                return resp.json()
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Timed out ({timeout_seconds}s) waiting for signup email to {recipient}")
+
+    def get_email(self, email_id: str) -> dict[str, Any]:
+        resp = httpx.get(f"{self.base_url}/emails/{email_id}", timeout=20.0)
+        resp.raise_for_status()
+        return resp.json()
+
+
+def mail_backend(api_key: str) -> MailBackend:
+    """The local sink when ``SMOKE_MAIL_SINK_URL`` is set, else Resend with ``api_key``."""
+    sink_url = os.environ.get(MAIL_SINK_ENV, "").strip()
+    if sink_url:
+        return SinkBackend(sink_url)
+    return ResendBackend(api_key)
+
+
 def wait_for_email(
     api_key: str,
     *,
     recipient: str,
     sent_after_epoch: float,
     timeout_seconds: int = 180,
+    backend: MailBackend | None = None,
 ) -> dict[str, Any]:
-    deadline = time.monotonic() + timeout_seconds
-    recipient_lower = recipient.lower()
-    while time.monotonic() < deadline:
-        for email in list_emails(api_key):
-            if not isinstance(email, dict):
-                continue
-            recipients = _normalize_recipients(email.get("to"))
-            if recipient_lower not in {item.lower() for item in recipients}:
-                continue
-            created_epoch = _iso_to_epoch(email.get("created_at"))
-            if created_epoch is not None and created_epoch + 5 < sent_after_epoch:
-                continue
-            return email
-        time.sleep(3)
-    raise RuntimeError(f"Timed out ({timeout_seconds}s) waiting for signup email to {recipient}")
+    backend = backend or mail_backend(api_key)
+    return backend.wait_for_email(
+        recipient=recipient,
+        sent_after_epoch=sent_after_epoch,
+        timeout_seconds=timeout_seconds,
+    )
+
+
+def get_email(api_key: str, *, email_id: str, backend: MailBackend | None = None) -> dict[str, Any]:
+    return (backend or mail_backend(api_key)).get_email(email_id)
 
 
 def extract_confirmation_url(payload: dict[str, Any]) -> str:
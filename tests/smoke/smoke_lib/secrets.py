@@ -3,6 +3,8 @@ from __future__ import annotations
 import os
 import subprocess
 
+from .mail_sink import MAIL_SINK_ENV
+
 
 def vault(path: str, field: str) -> str:
     return subprocess.check_output(
@@ -19,6 +21,9 @@ def secret(*, env: str, vault_path: str, vault_field: str) -> str:
 
 
 def resend_api_key() -> str:
+    # A local mail sink (smoke_lib.mail_sink) needs no Resend key.
+    if (os.environ.get(MAIL_SINK_ENV) or "").strip():
+        return (os.environ.get("RESEND_API_KEY") or "").strip()
     return secret(
         env="RESEND_API_KEY",
         vault_path="secret/agent/services/resend",
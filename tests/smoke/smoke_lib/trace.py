@@ -0,0 +1,242 @@
+"""Chrome Trace Event export for smoke and eval timelines.
+
+Produces the JSON object format (``{"traceEvents": [...]}``) that
+``chrome://tracing``, ``ui.perfetto.dev`` and speedscope open directly:
+
+- complete events (``ph: "X"``) for spans; spans on the same lane nest by
+  containment, so parents must be emitted on the lane of their children
+- one lane (``tid``) per concurrent actor; overlapping siblings are spread
+  over extra lanes by :func:`assign_lanes` so nothing renders on top of
+  anything else
+- counter events (``ph: "C"``) for sampled values such as in-flight
+  requests or process CPU
+
+Exporters:
+
+- :func:`trace_smoke_client` — one ``SmokeClient``'s phases and steps
+- :func:`trace_virtual_users` — a load run, one lane per virtual user
+- :func:`trace_timing_tree` — an eval ``TimingRecorder.to_dict()`` payload
+
+Set ``SMOKE_TRACE=1`` to have ``SmokeClient.write_report`` write
+``<report>.trace.json`` next to every suite report.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from .client import StepResult
+    from .load import VirtualUserResult
+
+
+TRACE_ENV = "SMOKE_TRACE"
+_PID = 1
+
+
+class ChromeTrace:
+    """Accumulates trace events; timestamps are seconds, emitted as microseconds."""
+
+    def __init__(self, process_name: str) -> None:
+        self.events: list[dict[str, Any]] = [
+            {"ph": "M", "name": "process_name", "pid": _PID, "tid": 0, "args": {"name": process_name}},
+        ]
+        self._lanes: dict[int, str] = {}
+
+    def lane(self, tid: int, name: str) -> int:
+        if tid not in self._lanes:
+            self._lanes[tid] = name
+            self.events.append({"ph": "M", "name": "thread_name", "pid": _PID, "tid": tid, "args": {"name": name}})
+            self.events.append({"ph": "M", "name": "thread_sort_index", "pid": _PID, "tid": tid, "args": {"sort_index": tid}})
+        return tid
+
+    def next_lane(self) -> int:
+        return max(self._lanes, default=0) + 1
+
+    def span(
+        self,
+        name: str,
+        start_s: float,
+        duration_s: float,
+        *,
+        tid: int,
+        cat: str = "",
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        event: dict[str, Any] = {
+            "ph": "X",
+            "name": name,
+            "cat": cat,
+            "pid": _PID,
+            "tid": tid,
+            "ts": round(start_s * 1e6, 3),
+            "dur": round(max(duration_s, 0.0) * 1e6, 3),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def counter(self, name: str, ts_s: float, values: dict[str, float]) -> None:
+        self.events.append({
+            "ph": "C",
+            "name": name,
+            "pid": _PID,
+            "ts": round(ts_s * 1e6, 3),
+            "args": values,
+        })
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str | Path) -> Path:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(self.to_dict()) + "\n", encoding="utf-8")
+        return target
+
+
+def assign_lanes(intervals: list[tuple[float, float]]) -> list[int]:
+    """First-fit lane per ``(start, end)`` so intervals sharing a lane never overlap."""
+    lane_ends: list[float] = []
+    lanes = [0] * len(intervals)
+    for index in sorted(range(len(intervals)), key=lambda i: intervals[i][0]):
+        start, end = intervals[index]
+        for lane, lane_end in enumerate(lane_ends):
+            if start >= lane_end:
+                lane_ends[lane] = end
+                lanes[index] = lane
+                break
+        else:
+            lanes[index] = len(lane_ends)
+            lane_ends.append(end)
+    return lanes
+
+
+def concurrency_samples(intervals: Iterable[tuple[float, float]]) -> list[tuple[float, int]]:
+    """Step function of how many intervals are open, one point per change."""
+    edges: list[tuple[float, int]] = []
+    for start, end in intervals:
+        edges.append((start, 1))
+        edges.append((end, -1))
+    samples: list[tuple[float, int]] = []
+    level = 0
+    for ts, delta in sorted(edges, key=lambda edge: (edge[0], edge[1])):
+        level += delta
+        if samples and samples[-1][0] == ts:
+            samples[-1] = (ts, level)
+        else:
+            samples.append((ts, level))
+    return samples
+
+
+def _step_args(step: StepResult) -> dict[str, Any]:
+    return {"status": step.status, "ok": step.ok, "bytes": step.response_size, **({"detail": step.detail} if step.detail else {})}
+
+
+def _add_steps(trace: ChromeTrace, steps: list[StepResult], origin: float, tid: int) -> None:
+    """Phase spans (runs of consecutive steps with the same phase) with their steps nested."""
+    index = 0
+    while index < len(steps):
+        phase = steps[index].phase
+        end = index
+        while end < len(steps) and steps[end].phase == phase:
+            end += 1
+        group = steps[index:end]
+        phase_start = group[0].started_at - origin
+        phase_end = max(step.started_at + step.elapsed_ms / 1000 for step in group) - origin
+        trace.span(phase, phase_start, phase_end - phase_start, tid=tid, cat="phase")
+        for step in group:
+            trace.span(
+                f"{step.method} {step.path}",
+                step.started_at - origin,
+                step.elapsed_ms / 1000,
+                tid=tid,
+                cat="http" if step.ok else "http,error",
+                args=_step_args(step),
+            )
+        index = end
+
+
+def trace_smoke_client(steps: list[StepResult], *, name: str = "smoke") -> ChromeTrace:
+    """Trace of one client's recorded steps, grouped by phase."""
+    trace = ChromeTrace(name)
+    timed = [step for step in steps if step.started_at]
+    if not timed:
+        return trace
+    origin = min(step.started_at for step in timed)
+    _add_steps(trace, timed, origin, trace.lane(1, name))
+    return trace
+
+
+def trace_virtual_users(users: list[VirtualUserResult], *, name: str = "smoke-load") -> ChromeTrace:
+    """Trace of a load run: one lane per user plus active-user and in-flight counters."""
+    trace = ChromeTrace(name)
+    steps = [step for user in users for step in user.steps if step.started_at]
+    if not steps:
+        return trace
+    origin = min(step.started_at for step in steps)
+    journeys: list[tuple[float, float]] = []
+    for user in sorted(users, key=lambda item: item.user):
+        timed = [step for step in user.steps if step.started_at]
+        if not timed:
+            continue
+        tid = trace.lane(user.user + 1, f"vu-{user.user}")
+        start = timed[0].started_at - origin
+        end = max(step.started_at + step.elapsed_ms / 1000 for step in timed) - origin
+        journeys.append((start, end))
+        trace.span(
+            f"journey vu-{user.user}",
+            start,
+            end - start,
+            tid=tid,
+            cat="journey" if user.ok else "journey,error",
+            args={"ok": user.ok, **({"error": user.error} if user.error else {})},
+        )
+        _add_steps(trace, timed, origin, tid)
+    for ts, level in concurrency_samples(journeys):
+        trace.counter("active_users", ts, {"users": level})
+    requests = [(step.started_at - origin, step.started_at - origin + step.elapsed_ms / 1000) for step in steps]
+    for ts, level in concurrency_samples(requests):
+        trace.counter("in_flight_requests", ts, {"requests": level})
+    return trace
+
+
+def trace_timing_tree(timings: dict[str, Any], *, name: str = "eval") -> ChromeTrace:
+    """Trace of an eval timing tree; overlapping siblings get their own lanes."""
+    trace = ChromeTrace(name)
+    tree = timings.get("tree")
+    if not tree:
+        return trace
+
+    def emit(node: dict[str, Any], tid: int) -> None:
+        args = dict(node.get("attrs", {}))
+        if node.get("open"):
+            args["open"] = True
+        trace.span(node["name"], node["start_s"], node["duration_s"], tid=tid, cat=node["kind"], args=args)
+        children = node.get("children", [])
+        lanes = assign_lanes([(child["start_s"], child["start_s"] + child["duration_s"]) for child in children])
+        spill: dict[int, int] = {0: tid}
+        for child, lane in zip(children, lanes):
+            if lane not in spill:
+                spill[lane] = trace.lane(trace.next_lane(), f"{node['name']} #{lane}")
+            emit(child, spill[lane])
+
+    emit(tree, trace.lane(1, tree["name"]))
+    for sample in timings.get("samples", []):
+        ts = sample["t_s"]
+        trace.counter("cpu_s", ts, {key: sample[key] for key in ("cpu_s", "children_cpu_s") if key in sample})
+        if "max_rss_mb" in sample:
+            trace.counter("max_rss_mb", ts, {"harness": sample["max_rss_mb"]})
+    return trace
+
+
+def trace_enabled() -> bool:
+    return os.environ.get(TRACE_ENV, "").strip().lower() not in {"", "0", "false", "no"}
+
+
+def trace_path_for(report_path: str | Path) -> Path:
+    """``foo.json`` → ``foo.trace.json`` next to the report."""
+    report = Path(report_path)
+    return report.with_name(f"{report.stem}.trace.json")
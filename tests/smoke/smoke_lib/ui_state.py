@@ -0,0 +1,109 @@
+"""UI state smoke helpers — /api/v1/ui state CRUD (workspace-scoped)."""
+from __future__ import annotations
+
+from typing import Any
+
+from .client import SmokeClient
+
+DEFAULT_PANELS = [
+    {"id": "filetree", "title": "Files", "placement": "left"},
+    {"id": "editor", "title": "Editor", "placement": "center"},
+]
+
+
+def upsert_ui_state(
+    client: SmokeClient,
+    *,
+    client_id: str,
+    active_panel_id: str = "editor",
+    open_panels: list[dict] | None = None,
+    phase: str = "ui-state-upsert",
+    **fields: Any,
+) -> dict:
+    """PUT /api/v1/ui/state — create or overwrite a client's UI state.
+
+    Extra keyword arguments (``project_root``, ``meta``, ...) are sent as-is.
+    """
+    client.set_phase(phase)
+    resp = client.put(
+        "/api/v1/ui/state",
+        json={
+            "client_id": client_id,
+            "active_panel_id": active_panel_id,
+            "open_panels": DEFAULT_PANELS if open_panels is None else open_panels,
+            **fields,
+        },
+        expect_status=(200,),
+    )
+    if resp.status_code != 200:
+        raise RuntimeError(f"UI state upsert failed: {resp.status_code} {resp.text[:300]}")
+    data = resp.json()
+    if not data.get("ok"):
+        raise RuntimeError(f"UI state upsert not ok: {data}")
+    return data
+
+
+def list_ui_states(client: SmokeClient, *, phase: str = "ui-state-list") -> list[dict]:
+    """GET /api/v1/ui/state and return every stored state."""
+    client.set_phase(phase)
+    resp = client.get("/api/v1/ui/state", expect_status=(200,))
+    if resp.status_code != 200:
+        raise RuntimeError(f"UI state list failed: {resp.status_code} {resp.text[:300]}")
+    return resp.json().get("states", [])
+
+
+def get_ui_state(client: SmokeClient, *, client_id: str) -> dict:
+    """GET /api/v1/ui/state/{client_id} and return the stored state."""
+    client.set_phase("ui-state-get-by-id")
+    resp = client.get(f"/api/v1/ui/state/{client_id}", expect_status=(200,))
+    if resp.status_code != 200:
+        raise RuntimeError(f"UI state read failed: {resp.status_code} {resp.text[:300]}")
+    return resp.json().get("state", {})
+
+
+def get_latest_ui_state(client: SmokeClient) -> dict:
+    """GET /api/v1/ui/state/latest and return the most recently written state."""
+    client.set_phase("ui-state-latest")
+    resp = client.get("/api/v1/ui/state/latest", expect_status=(200,))
+    if resp.status_code != 200:
+        raise RuntimeError(f"UI state latest failed: {resp.status_code} {resp.text[:300]}")
+    return resp.json().get("state", {})
+
+
+def list_panes(client: SmokeClient, *, client_id: str | None = None) -> list[dict]:
+    """GET /api/v1/ui/panes[/{client_id}] — open panels of the latest (or one) client."""
+    client.set_phase("ui-state-panes-by-id" if client_id else "ui-state-panes")
+    path = f"/api/v1/ui/panes/{client_id}" if client_id else "/api/v1/ui/panes"
+    resp = client.get(path, expect_status=(200,))
+    if resp.status_code != 200:
+        raise RuntimeError(f"UI panes failed: {resp.status_code} {resp.text[:300]}")
+    return resp.json().get("open_panels", [])
+
+
+def delete_ui_state(client: SmokeClient, *, client_id: str) -> None:
+    """DELETE /api/v1/ui/state/{client_id}."""
+    client.set_phase("ui-state-delete")
+    resp = client.delete(f"/api/v1/ui/state/{client_id}", expect_status=(200,))
+    if resp.status_code != 200:
+        raise RuntimeError(f"UI state delete failed: {resp.status_code} {resp.text[:300]}")
+    data = resp.json()
+    if not data.get("ok"):
+        raise RuntimeError(f"UI state delete not ok: {data}")
+
+
+def verify_ui_state_deleted(client: SmokeClient, *, client_id: str) -> None:
+    """GET /api/v1/ui/state/{client_id} must 404 once deleted."""
+    client.set_phase("ui-state-verify-deleted")
+    resp = client.get(f"/api/v1/ui/state/{client_id}", expect_status=(404,))
+    if resp.status_code != 404:
+        raise RuntimeError(f"UI state still present after delete: {resp.status_code}")
+
+
+def ui_state_cycle(client: SmokeClient, *, client_id: str) -> None:
+    """Upsert → read back → overwrite → delete one client's UI state."""
+    upsert_ui_state(client, client_id=client_id)
+    state = get_ui_state(client, client_id=client_id)
+    if state.get("active_panel_id") != "editor":
+        raise RuntimeError(f"UI state read-back mismatch: {state}")
+    upsert_ui_state(client, client_id=client_id, active_panel_id="filetree")
+    delete_ui_state(client, client_id=client_id)
@@ -1,8 +1,11 @@
 """Workspace lifecycle smoke helpers."""
 from __future__ import annotations
 
+import json
 import time
 
+import httpx
+
 from .client import SmokeClient
 
 
@@ -119,28 +122,159 @@ def check_workspace_root(client: SmokeClient, workspace_id: str) -> None:
     print(f"[smoke] Workspace root OK: {workspace_id}")
 
 
+RUNTIME_EVENTS_PATH = "/api/v1/workspaces/{workspace_id}/runtime/events"
+
+
+class _ProvisioningClock:
+    """Attribute wall time to each (state, provisioning_step) the runtime passes through."""
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.current: tuple[str, str] | None = None
+        self.entered = self.started
+        self.steps: list[dict] = []
+        self.last_state = ""
+
+    def observe(self, runtime: dict) -> bool:
+        key = (str(runtime.get("state", "")), str(runtime.get("provisioning_step") or ""))
+        if key == self.current:
+            return False
+        now = time.monotonic()
+        self._close(now)
+        self.current, self.entered = key, now
+        state, step = key
+        print(f"[smoke] Runtime state: {state}" + (f" ({step})" if step else ""))
+        self.last_state = state
+        return True
+
+    def _close(self, now: float) -> None:
+        if self.current is None:
+            return
+        state, step = self.current
+        self.steps.append({
+            "state": state,
+            "provisioning_step": step,
+            "duration_ms": round((now - self.entered) * 1000, 1),
+        })
+
+    def summary(self, *, transport: str, polls: int, outcome: str) -> dict:
+        now = time.monotonic()
+        self._close(now)
+        self.current = None
+        return {
+            "outcome": outcome,
+            "transport": transport,
+            "polls": polls,
+            "total_ms": round((now - self.started) * 1000, 1),
+            "steps": self.steps,
+        }
+
+
+def _runtime_from_event(payload: str) -> dict | None:
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    runtime = data.get("runtime", data)
+    return runtime if isinstance(runtime, dict) and "state" in runtime else None
+
+
+def _wait_via_events(
+    client: SmokeClient,
+    workspace_id: str,
+    clock: _ProvisioningClock,
+    deadline: float,
+) -> dict | None:
+    """Follow the runtime SSE stream until a terminal state.
+
+    Returns the ready runtime, raises on ``error``, and returns None when the
+    server has no event stream (or it closes early) so the caller can poll.
+    """
+    remaining = max(1.0, deadline - time.monotonic())
+    with client.stream(
+        "GET",
+        RUNTIME_EVENTS_PATH.format(workspace_id=workspace_id),
+        headers={"Accept": "text/event-stream"},
+        timeout=httpx.Timeout(client.timeout, read=remaining),
+        expect_status=(200, 404, 405, 406),
+    ) as resp:
+        content_type = resp.headers.get("content-type", "")
+        if resp.status_code != 200 or "text/event-stream" not in content_type:
+            return None
+        data_lines: list[str] = []
+        for line in resp.iter_lines():
+            if time.monotonic() >= deadline:
+                return None
+            if line.startswith("data:"):
+                data_lines.append(line[5:].lstrip())
+                continue
+            if line or not data_lines:
+                continue
+            runtime = _runtime_from_event("\n".join(data_lines))
+            data_lines = []
+            if runtime is None:
+                continue
+            clock.observe(runtime)
+            if runtime.get("state") == "ready":
+                return runtime
+            if runtime.get("state") == "error":
+                raise RuntimeError(f"Runtime entered error state: {runtime.get('last_error')}")
+    return None
+
+
 def poll_runtime_ready(
     client: SmokeClient,
     workspace_id: str,
     *,
     timeout_seconds: int = 120,
     poll_interval: float = 3.0,
+    min_poll_interval: float = 0.25,
+    use_events: bool = False,
 ) -> dict:
-    """Poll runtime until state=ready or error/timeout."""
+    """Wait for state=ready, raising on error/timeout.
+
+    With ``use_events`` (only for servers that expose ``RUNTIME_EVENTS_PATH``;
+    none of the current backends do) it follows the runtime event stream.
+    Otherwise, or if the stream is unavailable, it polls ``/runtime``
+    adaptively: ``min_poll_interval`` after every transition, doubling up to
+    ``poll_interval`` while nothing changes.
+    Per-step durations land in ``client.metrics["runtime_provisioning"]``.
+    """
     client.set_phase("poll-runtime")
     deadline = time.monotonic() + timeout_seconds
-    last_state = ""
-    while time.monotonic() < deadline:
-        data = get_runtime(client, workspace_id)
-        runtime = data.get("runtime", {})
-        state = runtime.get("state", "")
-        if state != last_state:
-            step = runtime.get("provisioning_step", "")
-            print(f"[smoke] Runtime state: {state}" + (f" ({step})" if step else ""))
-            last_state = state
-        if state == "ready":
-            return runtime
-        if state == "error":
-            raise RuntimeError(f"Runtime entered error state: {runtime.get('last_error')}")
-        time.sleep(poll_interval)
-    raise RuntimeError(f"Runtime did not reach ready within {timeout_seconds}s (last: {last_state})")
+    clock = _ProvisioningClock()
+    transport = "poll"
+    polls = 0
+    outcome = "timeout"
+    try:
+        if use_events:
+            try:
+                runtime = _wait_via_events(client, workspace_id, clock, deadline)
+            except httpx.HTTPError:
+                runtime = None
+            if runtime is not None:
+                transport, outcome = "sse", "ready"
+                return runtime
+        interval = min_poll_interval
+        while time.monotonic() < deadline:
+            data = get_runtime(client, workspace_id)
+            polls += 1
+            runtime = data.get("runtime", {})
+            state = runtime.get("state", "")
+            changed = clock.observe(runtime)
+            if state == "ready":
+                outcome = "ready"
+                return runtime
+            if state == "error":
+                raise RuntimeError(f"Runtime entered error state: {runtime.get('last_error')}")
+            interval = min_poll_interval if changed else min(interval * 2, poll_interval)
+            time.sleep(max(0.0, min(interval, deadline - time.monotonic())))
+        raise RuntimeError(f"Runtime did not reach ready within {timeout_seconds}s (last: {clock.last_state})")
+    finally:
+        if outcome != "ready" and clock.last_state == "error":
+            outcome = "error"
+        client.metrics["runtime_provisioning"] = clock.summary(
+            transport=transport, polls=polls, outcome=outcome,
+        )
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Load smoke: N concurrent virtual users, each with its own workspace.
+
+Every user dev-logs in, creates a workspace, updates user + workspace
+settings, then runs file CRUD, UI state CRUD and a git cycle inside the
+workspace scope. Users are ramped in evenly over --ramp-seconds. The report
+has per-route latency histograms and error rates built from StepResults.
+
+Intended for a local dev-mode server (auth-mode dev), not shared environments.
+
+Usage:
+    python tests/smoke/smoke_load.py --base-url http://localhost:8000 --users 50 --ramp-seconds 10
+    python tests/smoke/smoke_load.py --users 200 --ramp-seconds 30 --iterations 3 --evidence-out /tmp/load.json
+    python tests/smoke/smoke_load.py --users 50 --trace-out /tmp/load.trace.json   # open in ui.perfetto.dev
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import sys
+import time
+
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from smoke_lib.client import SmokeClient
+from smoke_lib.files import full_file_cycle
+from smoke_lib.git import full_git_cycle
+from smoke_lib.load import run_virtual_users, summarize
+from smoke_lib.session_bootstrap import dev_login
+from smoke_lib.settings import update_user_settings, update_workspace_settings, verify_user_settings
+from smoke_lib.trace import trace_enabled, trace_path_for, trace_virtual_users
+from smoke_lib.ui_state import ui_state_cycle
+from smoke_lib.workspace import create_workspace
+
+
+def build_journey(args: argparse.Namespace, run_tag: str):
+    base_url = args.base_url.rstrip("/")
+
+    def journey(index: int, client: SmokeClient) -> None:
+        user_tag = f"{run_tag}-u{index}"
+        dev_login(client, user_id=user_tag, email=f"{user_tag}@test.local")
+        ws_data = create_workspace(client, name=user_tag)
+        ws = ws_data.get("workspace") or ws_data
+        workspace_id = ws.get("workspace_id") or ws.get("id")
+        if not workspace_id:
+            raise RuntimeError(f"No workspace_id: {ws_data}")
+
+        update_user_settings(client, display_name=f"Load User {index}")
+        verify_user_settings(client, expected_display_name=f"Load User {index}")
+        update_workspace_settings(client, workspace_id, settings={"load_user": index})
+
+        client.switch_base(f"{base_url}/w/{workspace_id}")
+        for iteration in range(args.iterations):
+            full_file_cycle(client, prefix=f"{user_tag}-i{iteration}")
+            ui_state_cycle(client, client_id=f"{user_tag}-i{iteration}")
+        if not args.skip_git:
+            full_git_cycle(client, file_path=f"{user_tag}.txt", content=f"load {user_tag}")
+
+    return journey
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--ramp-seconds", type=float, default=10.0)
+    parser.add_argument("--iterations", type=int, default=1, help="File + UI state cycles per user")
+    parser.add_argument("--skip-git", action="store_true")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout")
+    parser.add_argument("--max-error-rate", type=float, default=0.0,
+                        help="Fail when the overall request error rate exceeds this")
+    parser.add_argument("--verbose", action="store_true", help="Show per-step helper output")
+    parser.add_argument("--evidence-out", default="")
+    parser.add_argument("--trace-out", default="",
+                        help="Write a Chrome/Perfetto trace (one lane per user); "
+                             "defaults to <evidence-out>.trace.json when SMOKE_TRACE is set")
+    args = parser.parse_args()
+
+    run_tag = f"load-{int(time.time())}"
+    print(f"[smoke] Load run {run_tag}: {args.users} users over {args.ramp_seconds:g}s against {args.base_url}")
+
+    started = time.monotonic()
+    helper_output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    with helper_output:
+        users = asyncio.run(run_virtual_users(
+            args.users,
+            build_journey(args, run_tag),
+            client_factory=lambda _index: SmokeClient(args.base_url, timeout=args.timeout),
+            ramp_seconds=args.ramp_seconds,
+        ))
+    summary = summarize(users, wall_seconds=time.monotonic() - started)
+    report = {"suite": "load", "run_tag": run_tag, **summary}
+
+    if args.evidence_out:
+        target = Path(args.evidence_out)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    trace_out = args.trace_out or (str(trace_path_for(args.evidence_out)) if args.evidence_out and trace_enabled() else "")
+    if trace_out:
+        trace_virtual_users(users, name=run_tag).write(trace_out)
+
+    print(json.dumps(report, indent=2))
+    for route, stats in report["routes"].items():
+        latency = stats["latency"]
+        print(
+            f"[smoke] {route:<48} n={stats['requests']:<5} err={stats['error_rate']:.2%} "
+            f"p50={latency['p50_ms']:.0f}ms p95={latency['p95_ms']:.0f}ms p99={latency['p99_ms']:.0f}ms"
+        )
+
+    ok = report["users_failed"] == 0 and report["error_rate"] <= args.max_error_rate
+    if ok:
+        print(f"\nSMOKE LOAD: {report['users']} USERS, {report['requests']} REQUESTS, "
+              f"{report['throughput_rps']} req/s")
+        return 0
+    print(
+        f"\nSMOKE LOAD: {report['users_failed']}/{report['users']} USERS FAILED, "
+        f"error rate {report['error_rate']:.2%}",
+        file=sys.stderr,
+    )
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
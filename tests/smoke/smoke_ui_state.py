@@ -16,8 +16,18 @@ import time
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from smoke_lib.client import SmokeClient
+from smoke_lib.client import SmokeClient, StepResult
 from smoke_lib.session_bootstrap import ensure_session
+from smoke_lib.ui_state import (
+    DEFAULT_PANELS,
+    delete_ui_state,
+    get_latest_ui_state,
+    get_ui_state,
+    list_panes,
+    list_ui_states,
+    upsert_ui_state,
+    verify_ui_state_deleted,
+)
 from smoke_lib.workspace import create_workspace
 
 
@@ -80,123 +90,71 @@ def main() -> int:
             print(f"\nSMOKE UI STATE: SKIPPED (feature not enabled)")
             return 0
 
-    # --- Phase 4: GET /state — empty initially ---
-    client.set_phase("ui-state-list-empty")
-    resp = client.get("/api/v1/ui/state", expect_status=(200,))
-    if resp.status_code == 200:
-        data = resp.json()
-        states = data.get("states", [])
-        print(f"[smoke] Initial states count: {data.get('count', len(states))}")
-
-    # --- Phase 5: PUT /state — upsert a state ---
-    client_id = f"smoke-client-{ts}"
-    client.set_phase("ui-state-upsert")
-    state_payload = {
-        "client_id": client_id,
-        "active_panel_id": "editor",
-        "open_panels": [
-            {"id": "filetree", "title": "Files", "placement": "left"},
-            {"id": "editor", "title": "Editor", "placement": "center"},
-        ],
-        "project_root": "/tmp/smoke",
-        "meta": {"smoke_ts": ts},
-    }
-    resp = client.put("/api/v1/ui/state", json=state_payload, expect_status=(200,))
-    if resp.status_code == 200:
-        data = resp.json()
-        assert data.get("ok"), f"Expected ok=true, got {data}"
+    # Phases 4-13 stop at the first failure, but the report below is always
+    # written so the evidence shows which step broke.
+    try:
+        # --- Phase 4: GET /state — empty initially ---
+        states = list_ui_states(client, phase="ui-state-list-empty")
+        print(f"[smoke] Initial states count: {len(states)}")
+
+        # --- Phase 5: PUT /state — upsert a state ---
+        client_id = f"smoke-client-{ts}"
+        upsert_ui_state(client, client_id=client_id, project_root="/tmp/smoke", meta={"smoke_ts": ts})
         print(f"[smoke] UI state upserted for client_id={client_id}")
-    else:
-        print(f"[smoke] FAIL: PUT /state returned {resp.status_code}")
-
-    # --- Phase 6: GET /state/{client_id} — read back ---
-    client.set_phase("ui-state-get-by-id")
-    resp = client.get(f"/api/v1/ui/state/{client_id}", expect_status=(200,))
-    if resp.status_code == 200:
-        data = resp.json()
-        state = data.get("state", {})
+
+        # --- Phase 6: GET /state/{client_id} — read back ---
+        state = get_ui_state(client, client_id=client_id)
         assert state.get("client_id") == client_id, f"client_id mismatch: {state.get('client_id')}"
         assert state.get("active_panel_id") == "editor", f"active_panel_id mismatch"
         panels = state.get("open_panels", [])
         assert len(panels) == 2, f"Expected 2 open_panels, got {len(panels)}"
         print(f"[smoke] UI state read-back OK: {len(panels)} panels, active=editor")
-    else:
-        print(f"[smoke] FAIL: GET /state/{client_id} returned {resp.status_code}")
-
-    # --- Phase 7: GET /state/latest — should match our upsert ---
-    client.set_phase("ui-state-latest")
-    resp = client.get("/api/v1/ui/state/latest", expect_status=(200,))
-    if resp.status_code == 200:
-        data = resp.json()
-        state = data.get("state", {})
+
+        # --- Phase 7: GET /state/latest — should match our upsert ---
+        state = get_latest_ui_state(client)
         assert state.get("client_id") == client_id, f"Latest client_id mismatch"
         print(f"[smoke] UI state latest OK: client_id={state.get('client_id')}")
-    else:
-        print(f"[smoke] FAIL: GET /state/latest returned {resp.status_code}")
-
-    # --- Phase 8: GET /panes — list open panels from latest ---
-    client.set_phase("ui-state-panes")
-    resp = client.get("/api/v1/ui/panes", expect_status=(200,))
-    if resp.status_code == 200:
-        data = resp.json()
-        panels = data.get("open_panels", [])
+
+        # --- Phase 8: GET /panes — list open panels from latest ---
+        panels = list_panes(client)
         print(f"[smoke] Panes list: {len(panels)} panels")
-    else:
-        print(f"[smoke] FAIL: GET /panes returned {resp.status_code}")
-
-    # --- Phase 9: GET /panes/{client_id} ---
-    client.set_phase("ui-state-panes-by-id")
-    resp = client.get(f"/api/v1/ui/panes/{client_id}", expect_status=(200,))
-    if resp.status_code == 200:
-        data = resp.json()
-        panels = data.get("open_panels", [])
-        panel_ids = [p.get("id") for p in panels]
+
+        # --- Phase 9: GET /panes/{client_id} ---
+        panel_ids = [p.get("id") for p in list_panes(client, client_id=client_id)]
         assert "filetree" in panel_ids, f"Expected filetree in panels: {panel_ids}"
         assert "editor" in panel_ids, f"Expected editor in panels: {panel_ids}"
         print(f"[smoke] Panes for client OK: {panel_ids}")
-    else:
-        print(f"[smoke] FAIL: GET /panes/{client_id} returned {resp.status_code}")
 
-    # --- Phase 10: PUT /state — update (overwrite) ---
-    client.set_phase("ui-state-update")
-    state_payload["active_panel_id"] = "filetree"
-    state_payload["open_panels"].append(
-        {"id": "shell", "title": "Shell", "placement": "bottom"}
-    )
-    resp = client.put("/api/v1/ui/state", json=state_payload, expect_status=(200,))
-    if resp.status_code == 200:
+        # --- Phase 10: PUT /state — update (overwrite) ---
+        upsert_ui_state(
+            client,
+            client_id=client_id,
+            active_panel_id="filetree",
+            open_panels=[*DEFAULT_PANELS, {"id": "shell", "title": "Shell", "placement": "bottom"}],
+            phase="ui-state-update",
+            project_root="/tmp/smoke",
+            meta={"smoke_ts": ts},
+        )
         print(f"[smoke] UI state updated: active=filetree, 3 panels")
-    else:
-        print(f"[smoke] FAIL: PUT /state update returned {resp.status_code}")
-
-    # --- Phase 11: GET /state — list should show our state ---
-    client.set_phase("ui-state-list-after")
-    resp = client.get("/api/v1/ui/state", expect_status=(200,))
-    if resp.status_code == 200:
-        data = resp.json()
-        count = data.get("count", 0)
+
+        # --- Phase 11: GET /state — list should show our state ---
+        count = len(list_ui_states(client, phase="ui-state-list-after"))
         assert count >= 1, f"Expected at least 1 state, got {count}"
         print(f"[smoke] State list after upsert: {count} state(s)")
-    else:
-        print(f"[smoke] FAIL: GET /state list returned {resp.status_code}")
-
-    # --- Phase 12: DELETE /state/{client_id} ---
-    client.set_phase("ui-state-delete")
-    resp = client.delete(f"/api/v1/ui/state/{client_id}", expect_status=(200,))
-    if resp.status_code == 200:
-        data = resp.json()
-        assert data.get("ok"), f"Expected ok=true on delete"
+
+        # --- Phase 12: DELETE /state/{client_id} ---
+        delete_ui_state(client, client_id=client_id)
         print(f"[smoke] UI state deleted: client_id={client_id}")
-    else:
-        print(f"[smoke] FAIL: DELETE /state/{client_id} returned {resp.status_code}")
 
-    # --- Phase 13: GET /state/{client_id} — should 404 ---
-    client.set_phase("ui-state-verify-deleted")
-    resp = client.get(f"/api/v1/ui/state/{client_id}", expect_status=(404,))
-    if resp.status_code == 404:
+        # --- Phase 13: GET /state/{client_id} — should 404 ---
+        verify_ui_state_deleted(client, client_id=client_id)
         print(f"[smoke] Verified: state deleted (404)")
-    else:
-        print(f"[smoke] FAIL: Expected 404 after delete, got {resp.status_code}")
+    except Exception as exc:
+        print(f"[smoke] FAIL: {exc}", file=sys.stderr)
+        client.results.append(StepResult(
+            phase="ui-state-aborted", method="-", path="",
+            status=0, ok=False, elapsed_ms=0, detail=str(exc),
+        ))
 
     # --- Report ---
     report = client.report()
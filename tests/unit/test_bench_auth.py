@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import sys
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import bench_auth  # noqa: E402
+from bench_auth import Sample  # noqa: E402
+
+
+def test_mint_hs256_signs_with_session_secret() -> None:
+    token = bench_auth.mint_hs256("s3cret", {"sub": "u1", "email": "u1@example.com", "exp": 1})
+
+    header, payload, signature = token.split(".")
+    expected = hmac.new(b"s3cret", f"{header}.{payload}".encode(), hashlib.sha256).digest()
+    assert base64.urlsafe_b64decode(signature + "=" * (-len(signature) % 4)) == expected
+    assert json.loads(base64.urlsafe_b64decode(header + "==")) == {"alg": "HS256", "typ": "JWT"}
+
+
+def test_run_at_rate_is_open_loop() -> None:
+    class _Response:
+        status_code = 200
+
+    async def slow_call(index: int) -> _Response:
+        await asyncio.sleep(0.05)
+        return _Response()
+
+    run = asyncio.run(bench_auth.run_at_rate(200, 0.1, slow_call))
+
+    summary = run.summary()
+    assert summary["requests"] == 20 and summary["errors"] == 0
+    # Closed-loop with one worker would need 20 * 50ms; open-loop overlaps them.
+    assert run.wall_seconds < 0.5
+    assert summary["p50_ms"] >= 50
+
+
+def test_rotation_summary_splits_around_rotation() -> None:
+    samples = [
+        Sample(offset_s=0.1, latency_ms=2.0, lag_ms=0.0, status="200", ok=True),
+        Sample(offset_s=1.0, latency_ms=90.0, lag_ms=0.0, status="200", ok=True),
+        Sample(offset_s=1.2, latency_ms=80.0, lag_ms=0.0, status="502", ok=False),
+        Sample(offset_s=2.5, latency_ms=3.0, lag_ms=0.0, status="200", ok=True),
+    ]
+
+    summary = bench_auth.rotation_summary(samples, rotated_at_s=1.0, window_s=1.0, wall_seconds=3.0)
+
+    assert summary["before"]["requests"] == 1
+    assert summary["rotation_window"]["requests"] == 2
+    assert summary["rotation_window"]["errors"] == 1
+    assert summary["rotation_window"]["p99_ms"] == 90.0
+    assert summary["after"]["p50_ms"] == 3.0
+
+
+def test_overhead_rows_subtract_baselines_per_rate() -> None:
+    rows = bench_auth.overhead_rows({
+        "public": [{"rate": 50, "p50_ms": 1.0, "p99_ms": 2.0}],
+        "session_cookie": [{"rate": 50, "p50_ms": 1.5, "p99_ms": 3.0}],
+        "exchange_hs256": [{"rate": 50, "p50_ms": 4.0, "p99_ms": 9.0}],
+        "exchange_eddsa": [{"rate": 50, "p50_ms": 4.25, "p99_ms": 12.0}],
+    })
+
+    assert rows == [{
+        "rate": 50,
+        "session_cookie_over_public_p50_ms": 0.5,
+        "eddsa_over_hs256_p50_ms": 0.25,
+        "eddsa_over_hs256_p99_ms": 3.0,
+    }]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import bench_control_plane  # noqa: E402
+
+
+def test_parse_state_sizes_and_mix() -> None:
+    sizes = bench_control_plane.parse_state_sizes("10x20, 1000X5")
+
+    assert [size.label for size in sizes] == ["10x20", "1000x5"]
+    assert bench_control_plane.parse_mix("list_workspaces:3,put_settings") == {"list_workspaces": 3, "put_settings": 1}
+    with pytest.raises(ValueError):
+        bench_control_plane.parse_mix("drop_tables:1")
+
+
+def test_build_schedule_follows_mix_and_is_deterministic() -> None:
+    mix = {"list_workspaces": 50, "put_settings": 30, "create_workspace": 20}
+
+    schedule = bench_control_plane.build_schedule(mix, 100, seed=7)
+
+    assert Counter(schedule) == {"list_workspaces": 50, "put_settings": 30, "create_workspace": 20}
+    assert schedule == bench_control_plane.build_schedule(mix, 100, seed=7)
+    assert len(bench_control_plane.build_schedule({"get_settings": 1, "put_settings": 1}, 3, seed=1)) == 3
+
+
+def test_seed_local_state_matches_repository_layout(tmp_path: Path) -> None:
+    state_path = tmp_path / ".boring" / "local_db.json"
+
+    written = bench_control_plane.seed_local_state(state_path, bench_control_plane.StateSize(users=3, workspaces=7))
+
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    assert written == state_path.stat().st_size
+    assert set(state) == {"users", "workspaces", "memberships", "invites", "workspace_settings", "workspace_runtime"}
+    assert len(state["users"]) == 3
+    assert len(state["workspaces"]) == len(state["memberships"]) == len(state["workspace_runtime"]) == 7
+    membership = state["memberships"]["ws-bench000004:bench-user-1"]
+    assert membership["role"] == "owner" and membership["status"] == "active"
+    assert state["workspaces"]["ws-bench000004"]["created_by"] == "bench-user-1"
+
+
+def test_lock_probe_sees_a_held_flock(tmp_path: Path) -> None:
+    lock_path = tmp_path / "local_db.json.lock"
+    probe = bench_control_plane.LockProbe(lock_path, interval=0.001)
+    with lock_path.open("a+") as holder:
+        fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+        probe.start()
+        time.sleep(0.05)
+        fcntl.flock(holder.fileno(), fcntl.LOCK_UN)
+    time.sleep(0.02)
+    summary = probe.stop()
+
+    assert summary["probes"] >= 2
+    assert summary["contended"] >= 1
+    assert summary["max_ms"] >= 40
+
+
+def test_queueing_delay_is_relative_to_lowest_level() -> None:
+    runs = [
+        {"concurrency": 1, "operations": {"list_workspaces": {"p50_ms": 2.0}}},
+        {"concurrency": 8, "operations": {"list_workspaces": {"p50_ms": 11.0}}},
+    ]
+
+    rows = bench_control_plane.queueing_delay(runs)
+
+    assert rows == [
+        {"concurrency": 1, "p50_wait_ms": {"list_workspaces": 0.0}},
+        {"concurrency": 8, "p50_wait_ms": {"list_workspaces": 9.0}},
+    ]
+
+
+def test_seed_postgres_sql_mirrors_local_seed() -> None:
+    sql = bench_control_plane.seed_postgres_sql(bench_control_plane.StateSize(users=3, workspaces=7), "k'ey")
+
+    assert "generate_series(0, 2)" in sql and "generate_series(0, 6)" in sql
+    assert sql.count("pgp_sym_encrypt(") == 3
+    assert "'k''ey'" in sql
+    assert "'ws-bench' || lpad(i::text, 6, '0')" in sql
+    assert "'bench-user-' || (i % 3)" in sql
+
+
+def test_declared_pool_limits_reads_pool_go(tmp_path: Path) -> None:
+    pool_go = tmp_path / "pool.go"
+    pool_go.write_text("const (\n\tDefaultMinConns int32 = 3\n\tDefaultMaxConns int32 = 25\n)\n", encoding="utf-8")
+
+    assert bench_control_plane.declared_pool_limits(pool_go) == {"min_conns": 3, "max_conns": 25}
+    assert bench_control_plane.declared_pool_limits(tmp_path / "missing.go") == {"min_conns": None, "max_conns": None}
+    assert bench_control_plane.declared_pool_limits()["max_conns"] is not None
+
+
+def test_pool_summary_reports_saturation() -> None:
+    samples = [
+        {"total": 2, "active": 1, "idle": 1},
+        {"total": 10, "active": 10, "idle": 0},
+        {"total": 10, "active": 9, "idle": 1},
+        {"total": 10, "active": 10, "idle": 0},
+    ]
+
+    summary = bench_control_plane.pool_summary(samples, 10)
+
+    assert summary["peak_total"] == 10 and summary["peak_active"] == 10
+    assert summary["saturated_ratio"] == 0.5
+    assert bench_control_plane.pool_summary([], 10) == {"samples": 0, "max_conns": 10}
+
+
+def test_compare_providers_pairs_runs_by_size_and_level() -> None:
+    def size(label: str, p50: float, rps: float) -> dict:
+        return {"size": label, "runs": [{"concurrency": 4, "operations": {"list_workspaces": {"p50_ms": p50, "throughput_rps": rps}}}]}
+
+    rows = bench_control_plane.compare_providers({
+        "local": [size("10x20", 4.0, 200.0), size("100x200", 40.0, 20.0)],
+        "postgres": [size("10x20", 2.0, 400.0)],
+    })
+
+    assert rows == [{
+        "size": "10x20",
+        "concurrency": 4,
+        "operation": "list_workspaces",
+        "local_p50_ms": 4.0,
+        "postgres_p50_ms": 2.0,
+        "p50_ratio": 0.5,
+        "throughput_ratio": 2.0,
+    }]
+    with pytest.raises(ValueError):
+        bench_control_plane.parse_providers("local,mysql")
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import bench_files_api  # noqa: E402
+from bench_common import run_at_concurrency  # noqa: E402
+
+
+def test_parse_sizes_accepts_units_and_weights() -> None:
+    buckets = bench_files_api.parse_sizes("512:3, 4k:2,1m")
+
+    assert [(b.label, b.size, b.weight) for b in buckets] == [
+        ("512", 512, 3),
+        ("4k", 4096, 2),
+        ("1m", 1024 * 1024, 1),
+    ]
+    with pytest.raises(ValueError):
+        bench_files_api.parse_sizes("4g:1")
+
+
+def test_generate_tree_is_deterministic_and_mixes_encodings(tmp_path: Path) -> None:
+    sizes = bench_files_api.parse_sizes("1k:1,8k:1")
+    kwargs = dict(depth=2, fanout=2, files_per_dir=5, sizes=sizes, binary_ratio=0.2, utf16_ratio=0.2, seed=7)
+
+    dirs, files = bench_files_api.generate_tree(tmp_path / "a", **kwargs)
+    _, again = bench_files_api.generate_tree(tmp_path / "b", **kwargs)
+
+    assert len(dirs) == 1 + 2 + 4
+    assert len(files) == 7 * 5
+    assert files == again
+    assert {item.kind for item in files} == {"text", "utf16", "binary"}
+    utf16 = next(item for item in files if item.kind == "utf16")
+    assert (tmp_path / "a" / utf16.path).read_bytes()[:2] in (b"\xff\xfe", b"\xfe\xff")
+    binary = next(item for item in files if item.kind == "binary")
+    assert b"\x00" in (tmp_path / "a" / binary.path).read_bytes()
+
+
+def test_saturation_concurrency_finds_throughput_plateau() -> None:
+    runs = [
+        {"concurrency": 1, "throughput_rps": 10.0},
+        {"concurrency": 2, "throughput_rps": 19.0},
+        {"concurrency": 4, "throughput_rps": 29.0},
+        {"concurrency": 8, "throughput_rps": 30.0},
+    ]
+
+    assert bench_files_api.saturation_concurrency(runs) == 4
+    assert bench_files_api.saturation_concurrency(runs[:2]) is None
+
+
+def test_declared_search_slots_reads_go_constant() -> None:
+    assert bench_files_api.declared_search_slots() == 3
+
+
+def test_run_at_concurrency_counts_unexpected_statuses_as_errors() -> None:
+    in_flight = {"now": 0, "peak": 0}
+
+    async def call(index: int) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.001)
+        in_flight["now"] -= 1
+        return httpx.Response(503 if index % 5 == 0 else 200)
+
+    run = asyncio.run(run_at_concurrency(3, 20, call))
+    summary = run.summary()
+
+    assert in_flight["peak"] == 3
+    assert summary["requests"] == 20
+    assert summary["errors"] == 4
+    assert summary["statuses"] == {"200": 16, "503": 4}
+    assert len(run.latencies_ms) == 16
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import bench_git_ops  # noqa: E402
+
+
+def test_parse_repo_sizes() -> None:
+    sizes = bench_git_ops.parse_repo_sizes("10x100, 2000X50")
+
+    assert [(s.commits, s.files, s.label) for s in sizes] == [(10, 100, "10x100"), (2000, 50, "2000x50")]
+    with pytest.raises(ValueError):
+        bench_git_ops.parse_repo_sizes("0x10")
+
+
+def test_build_repository_creates_history_branches_and_dirty_tree(tmp_path: Path) -> None:
+    repo = bench_git_ops.build_repository(
+        tmp_path,
+        bench_git_ops.RepoSize(commits=12, files=40),
+        dirty_ratio=0.1,
+        untracked_ratio=0.05,
+        branches=3,
+    )
+
+    def git(*args: str) -> str:
+        return subprocess.run(["git", *args], cwd=repo.work, capture_output=True, text=True, check=True).stdout
+
+    assert git("rev-list", "--count", "HEAD").strip() == "12"
+    assert len(git("ls-files").splitlines()) == 40
+    assert {"bench-0", "bench-1", "bench-2"} <= {line.strip("* ").strip() for line in git("branch").splitlines()}
+    status = git("status", "--porcelain").splitlines()
+    assert sorted(line[3:] for line in status if line.startswith(" M")) == sorted(repo.dirty_paths)
+    assert len(repo.dirty_paths) == 4
+    assert any(line.startswith("??") and "untracked" in line for line in status)
+    assert not any("boring.app.toml" in line for line in status)
+    assert (repo.work / "boring.app.toml").is_file()
+
+
+def test_ascii_plot_scales_to_slowest_sample() -> None:
+    rows = [
+        {"route": "status", "size": "10x100", "p50_ms": 5.0},
+        {"route": "status", "size": "1000x5000", "p50_ms": 20.0},
+    ]
+
+    plot = bench_git_ops.ascii_plot(rows, width=8)
+
+    assert "10x100 ## 5.0ms" in plot
+    assert "######## 20.0ms" in plot
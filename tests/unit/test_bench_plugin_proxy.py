@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import time
+import tomllib
+from pathlib import Path
+
+import httpx
+import pytest
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import bench_plugin_proxy  # noqa: E402
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_parse_payload_sizes() -> None:
+    assert bench_plugin_proxy.parse_payload_sizes("0, 512,4k,1M") == [0, 512, 4096, 1024 * 1024]
+    with pytest.raises(ValueError):
+        bench_plugin_proxy.parse_payload_sizes("4g")
+
+
+def test_write_plugin_manifest_is_discoverable(tmp_path: Path) -> None:
+    source = bench_plugin_proxy.write_plugin(tmp_path, "echo")
+
+    manifest = tomllib.loads((tmp_path / "kurt" / "plugins" / "echo" / "plugin.toml").read_text(encoding="utf-8"))
+    assert manifest == {"name": "echo", "command": [sys.executable, "server.py"], "watch": ["server.py"]}
+    assert source == tmp_path / "kurt" / "plugins" / "echo" / "server.py"
+
+
+def test_plugin_server_answers_health_whoami_and_echo(tmp_path: Path) -> None:
+    source = bench_plugin_proxy.write_plugin(tmp_path, "echo")
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, source.name],
+        cwd=source.parent,
+        env={**os.environ, "PORT": str(port)},
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=1.0) as client:
+            deadline = time.monotonic() + 10
+            while True:
+                try:
+                    assert client.get("/health").status_code == 200
+                    break
+                except httpx.TransportError:
+                    if time.monotonic() > deadline:
+                        raise
+                    time.sleep(0.05)
+            assert client.get("/whoami").json()["pid"] == process.pid
+            assert client.post("/echo", content=b"abc" * 100).content == b"abc" * 100
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+
+def test_overhead_reports_added_latency() -> None:
+    direct = {"p50_ms": 1.0, "p95_ms": 2.0, "p99_ms": 3.0, "mean_ms": 1.5, "throughput_rps": 1000.0}
+    proxied = {"p50_ms": 1.4, "p95_ms": 2.5, "p99_ms": 4.0, "mean_ms": 2.0, "throughput_rps": 800.0}
+
+    result = bench_plugin_proxy.overhead(direct, proxied)
+
+    assert result["p50_added_ms"] == pytest.approx(0.4)
+    assert result["p99_added_ms"] == pytest.approx(1.0)
+    assert result["throughput_ratio"] == pytest.approx(0.8)
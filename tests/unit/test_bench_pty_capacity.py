@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+pytest.importorskip("websockets")
+import bench_pty_capacity  # noqa: E402
+
+
+BASELINE = {"rss_mb": 20.0, "threads": 8, "fds": 10, "children": 0}
+
+
+def test_growth_per_session_averages_over_samples() -> None:
+    samples = [
+        {"rss_mb": 21.0, "threads": 9, "fds": 14, "children": 1},
+        {"rss_mb": 22.0, "threads": 10, "fds": 18, "children": 2},
+    ]
+
+    assert bench_pty_capacity.growth_per_session(samples, BASELINE) == {
+        "rss_mb": 1.0,
+        "threads": 1.0,
+        "fds": 4.0,
+        "children": 1.0,
+    }
+
+
+def test_returned_to_baseline_flags_leaked_children_and_fds() -> None:
+    after = {"rss_mb": 23.0, "threads": 9, "fds": 16, "children": 1}
+
+    assert bench_pty_capacity.returned_to_baseline(BASELINE, after, rss_tolerance_mb=5.0) == {
+        "rss": True,
+        "fds": False,
+        "children": False,
+        "threads": True,
+    }
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+pytest.importorskip("websockets")
+import bench_stream_replay  # noqa: E402
+
+
+def test_expected_replay_respects_history_window() -> None:
+    assert bench_stream_replay.expected_replay(1000, 0, 128) == 128
+    assert bench_stream_replay.expected_replay(1000, 990, 128) == 10
+    assert bench_stream_replay.expected_replay(100, 0, 128) == 100
+    assert bench_stream_replay.expected_replay(100, 100, 128) == 0
+
+
+def test_replay_offsets_are_distinct_and_clamped() -> None:
+    assert bench_stream_replay.replay_offsets(1000, [0, 0.5, 0.9, 0.99, 1.5]) == [0, 500, 900, 990, 1000]
+    assert bench_stream_replay.replay_offsets(1, [0, 0.5]) == [0]
+
+
+def test_stub_bridge_emits_bursts_and_done_marker(tmp_path: Path) -> None:
+    stub = bench_stream_replay.write_stub_bridge(tmp_path)
+    stdin = "\n".join([
+        json.dumps({"type": "user", "message": "ignored"}),
+        json.dumps({"type": "bench_burst", "start": 5, "count": 3, "bytes": 4}),
+    ]) + "\n"
+
+    result = subprocess.run([sys.executable, str(stub)], input=stdin, capture_output=True, text=True, check=True)
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+
+    assert lines[0] == {"type": "system", "subtype": "init"}
+    assert [line["seq"] for line in lines[1:4]] == [5, 6, 7]
+    assert lines[1]["text"] == "xxxx"
+    assert lines[4] == {"type": "result", "subtype": bench_stream_replay.BURST_DONE, "count": 3}
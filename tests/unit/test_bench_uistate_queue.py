@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import bench_uistate_queue  # noqa: E402
+
+
+def test_client_state_keeps_focus_target_open() -> None:
+    state = bench_uistate_queue.client_state("c1", round_=5, panels=3)
+
+    assert state["client_id"] == "c1"
+    assert [panel["id"] for panel in state["open_panels"]] == ["panel-0", "panel-1", "panel-2"]
+    assert state["active_panel_id"] == "panel-2"
+
+
+def test_write_amplification_scales_with_file_size() -> None:
+    result = bench_uistate_queue.write_amplification(10, [1000, 2000, 3000], payload_bytes=500)
+
+    assert result["mean_file_bytes"] == 2000
+    assert result["max_file_bytes"] == 3000
+    assert result["estimated_bytes_written"] == 20000
+    assert result["amplification"] == 40
+    assert bench_uistate_queue.write_amplification(0, [], 0)["amplification"] == 0.0
+
+
+def test_operation_stats_summary_counts_errors() -> None:
+    stats = bench_uistate_queue.OperationStats()
+    stats.record(200, 4.0, ok=True)
+    stats.record(200, 6.0, ok=True)
+    stats.record(409, 1.0, ok=False)
+
+    summary = stats.summary(wall_seconds=1.5)
+
+    assert summary["requests"] == 3
+    assert summary["errors"] == 1
+    assert summary["throughput_rps"] == 2.0
+    assert summary["statuses"] == {"200": 2, "409": 1}
+    assert summary["max_ms"] == 6.0
+
+
+def test_read_proc_io_for_current_process() -> None:
+    counters = bench_uistate_queue.read_proc_io(os.getpid())
+
+    if counters is not None:
+        assert "wchar" in counters
+    assert bench_uistate_queue.read_proc_io(2**22 + 12345) is None
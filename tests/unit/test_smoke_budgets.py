@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tests.smoke.smoke_lib.budgets import (
+    DEFAULT_BUDGETS_PATH,
+    Budget,
+    append_timings,
+    evaluate_budgets,
+    load_budgets,
+    parse_budgets,
+    timing_trend,
+)
+from tests.smoke.smoke_lib.client import SmokeClient, StepResult
+
+
+def _step(path: str, elapsed_ms: float, *, ok: bool = True, phase: str = "files", method: str = "GET") -> dict:
+    return {"phase": phase, "method": method, "path": path, "ok": ok, "elapsed_ms": elapsed_ms, "status": 200}
+
+
+def test_default_budgets_file_parses() -> None:
+    budgets = load_budgets(DEFAULT_BUDGETS_PATH)
+
+    assert budgets
+    assert all(budget.p50_ms is not None or budget.max_ms is not None for budget in budgets)
+
+
+def test_parse_budgets_requires_a_limit() -> None:
+    with pytest.raises(ValueError):
+        parse_budgets({"budgets": [{"name": "empty", "path": "/x"}]})
+
+
+def test_load_budgets_env_file_must_exist(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("SMOKE_BUDGETS_FILE", str(tmp_path / "missing.json"))
+
+    with pytest.raises(FileNotFoundError):
+        load_budgets()
+
+
+def test_evaluate_budgets_flags_p50_and_max_separately() -> None:
+    budgets = [
+        Budget(name="list", path="/api/v1/files/list*", p50_ms=100, max_ms=1000),
+        Budget(name="health", phase="health", max_ms=50),
+    ]
+    steps = [
+        _step("/api/v1/files/list?path=.", 80),
+        _step("/api/v1/files/list", 90),
+        _step("/api/v1/files/list", 8000),
+        _step("/api/v1/files/list", 99999, ok=False),
+        _step("/health", 10, phase="health"),
+    ]
+
+    result = evaluate_budgets(steps, budgets)
+
+    assert result["ok"] is False
+    assert result["checked"] == 2
+    [violation] = result["violations"]
+    assert violation["name"] == "list"
+    assert violation["samples"] == 3
+    assert violation["p50_ms"] == 90
+    assert violation["exceeded"] == ["max_ms"]
+
+
+def test_report_keeps_budget_violations_out_of_functional_ok() -> None:
+    client = SmokeClient("https://example.test", budgets=[Budget(name="slow", path="/api/*", max_ms=100)])
+    client.results.append(StepResult(phase="p", method="GET", path="/api/v1/files/list", status=200, ok=True, elapsed_ms=8000))
+
+    report = client.report()
+
+    assert report["ok"] is True
+    assert report["budget_ok"] is False
+    assert report["budgets"]["violations"][0]["name"] == "slow"
+
+
+def test_report_without_matching_budgets_omits_budget_section() -> None:
+    client = SmokeClient("https://example.test", budgets=[])
+    client.results.append(StepResult(phase="p", method="GET", path="/x", status=200, ok=True, elapsed_ms=1))
+
+    assert "budgets" not in client.report()
+
+
+def test_timing_trend_tracks_p50_per_run(tmp_path: Path) -> None:
+    append_timings(tmp_path, "files", [_step("/a", 10), _step("/a", 30), _step("/b", 5)], run_id="r1")
+    append_timings(tmp_path, "files", [_step("/a", 20)], run_id="r2")
+    append_timings(tmp_path, "files", [_step("/a", 40)], run_id="r3")
+
+    trend = timing_trend(tmp_path, last_runs=2)
+
+    assert trend["runs"] == ["r2", "r3"]
+    assert trend["steps"]["files files GET /a"] == [20.0, 40.0]
+    assert "files files GET /b" not in trend["steps"]
+    lines = (tmp_path / "timings.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 5
+    assert json.loads(lines[0])["run_id"] == "r1"
@@ -110,3 +110,26 @@ def test_smoke_client_clears_deleted_cookie_from_set_cookie_header(monkeypatch)
     client.get("/auth/logout", expect_status=(302,))
 
     assert "boring_session" not in client.cookies
+
+
+def test_smoke_client_reuses_connection_pool_until_base_url_changes(monkeypatch) -> None:
+    seen: list[tuple[httpx.Client, str]] = []
+
+    def fake_request(self, method, path, **kwargs):
+        seen.append((self, self.cookies.get("boring_session") or ""))
+        return httpx.Response(200, request=httpx.Request(method, f"{self.base_url}{path}"))
+
+    monkeypatch.setattr(httpx.Client, "request", fake_request)
+
+    client = SmokeClient("https://example.test")
+    client.get("/health")
+    client.cookies["boring_session"] = "abc"
+    client.get("/health")
+    client.switch_base("https://other.test")
+    client.get("/health")
+    client.close()
+
+    assert seen[0][0] is seen[1][0]
+    assert seen[1][1] == "abc"
+    assert seen[2][0] is not seen[0][0]
+    assert seen[0][0].is_closed
@@ -26,7 +26,7 @@ def test_wait_for_exec_job_polls_until_done(monkeypatch) -> None:
         ]
     )
 
-    monkeypatch.setattr(exec_module, "read_exec_job", lambda client, job_id, after=None: next(responses))
+    monkeypatch.setattr(exec_module, "read_exec_job", lambda client, job_id, after=None, wait_ms=None: next(responses))
     monkeypatch.setattr(exec_module.time, "sleep", lambda _delay: None)
 
     result = exec_module.wait_for_exec_job(_FakeClient(), "job-1", timeout_seconds=1.0, poll_interval=0.01)
@@ -34,3 +34,85 @@ def test_wait_for_exec_job_polls_until_done(monkeypatch) -> None:
     assert result["done"] is True
     assert result["exit_code"] == 0
     assert result["combined_output"] == "hello world"
+
+
+class _TimedClient:
+    timeout = 30.0
+
+    def set_phase(self, _phase: str) -> None:
+        return None
+
+
+def test_follow_exec_job_uses_long_poll_without_sleeping(monkeypatch, tmp_path) -> None:
+    calls: list[dict] = []
+    responses = iter(
+        [
+            {"chunks": [], "cursor": 0, "done": False, "wait_ms": 10_000},
+            {"chunks": ["hello "], "cursor": 1, "done": False, "wait_ms": 10_000},
+            {"chunks": ["world"], "cursor": 2, "done": True, "exit_code": 0, "wait_ms": 10_000},
+        ]
+    )
+
+    def fake_read(client, job_id, after=None, wait_ms=None):
+        calls.append({"after": after, "wait_ms": wait_ms})
+        return next(responses)
+
+    def no_sleep(_delay):
+        raise AssertionError("long-poll follower must not sleep")
+
+    monkeypatch.setattr(exec_module, "read_exec_job", fake_read)
+    monkeypatch.setattr(exec_module.time, "sleep", no_sleep)
+    streamed: list[str] = []
+    output = tmp_path / "job.log"
+
+    result = exec_module.follow_exec_job(
+        _TimedClient(),
+        "job-1",
+        on_output=streamed.append,
+        output_path=output,
+        timeout_seconds=60.0,
+    )
+
+    assert streamed == ["hello ", "world"]
+    assert output.read_text(encoding="utf-8") == "hello world"
+    assert [call["after"] for call in calls] == [None, 0, 1]
+    assert all(call["wait_ms"] == 10_000 for call in calls)
+    assert result["long_poll"] is True
+    assert result["polls"] == 3
+    assert result["output_bytes"] == len("hello world")
+    assert result["ttfb_ms"] is not None and result["total_ms"] >= result["ttfb_ms"]
+    assert "chunks" not in result
+
+
+def test_follow_exec_job_backs_off_when_idle_and_resets_on_output(monkeypatch) -> None:
+    responses = iter(
+        [
+            {"chunks": [], "cursor": 0, "done": False},
+            {"chunks": [], "cursor": 0, "done": False},
+            {"chunks": [], "cursor": 0, "done": False},
+            {"chunks": ["x"], "cursor": 1, "done": False},
+            {"chunks": [], "cursor": 1, "done": False},
+            {"chunks": [], "cursor": 1, "done": True, "exit_code": 0},
+        ]
+    )
+    sleeps: list[float] = []
+    waits: list[int | None] = []
+
+    def fake_read(client, job_id, after=None, wait_ms=None):
+        waits.append(wait_ms)
+        return next(responses)
+
+    monkeypatch.setattr(exec_module, "read_exec_job", fake_read)
+    monkeypatch.setattr(exec_module.time, "sleep", sleeps.append)
+
+    result = exec_module.follow_exec_job(
+        _TimedClient(),
+        "job-1",
+        timeout_seconds=60.0,
+        min_interval=0.1,
+        max_interval=0.3,
+    )
+
+    assert result["long_poll"] is False
+    assert waits[0] is not None and waits[1:] == [None] * 5
+    assert sleeps == [0.1, 0.2, 0.3, 0.1, 0.1]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+
+from tests.smoke.smoke_lib.client import SmokeClient, StepResult
+from tests.smoke.smoke_lib.load import latency_histogram, route_key, run_virtual_users, summarize
+
+
+def test_route_key_collapses_generated_ids() -> None:
+    assert route_key("get", "/api/v1/ui/state/load-1700000000-u3-i0") == "GET /api/v1/ui/state/{id}"
+    assert (
+        route_key("PUT", "/api/v1/workspaces/5b1f7a1e-8a1c-4c44-9a43-1b0c8d3e2f10/settings?x=1")
+        == "PUT /api/v1/workspaces/{id}/settings"
+    )
+    assert route_key("GET", "/api/v1/files/list") == "GET /api/v1/files/list"
+
+
+def test_latency_histogram_buckets_and_percentiles() -> None:
+    hist = latency_histogram([1.0, 7.0, 30.0, 30.0, 20000.0])
+
+    assert hist["count"] == 5
+    assert hist["p50_ms"] == 30.0
+    assert hist["p99_ms"] == 20000.0
+    assert hist["buckets"]["<=5"] == 1
+    assert hist["buckets"]["<=10"] == 1
+    assert hist["buckets"]["<=50"] == 2
+    assert hist["buckets"][">10000"] == 1
+
+
+def test_run_virtual_users_keeps_steps_from_failed_journeys() -> None:
+    def journey(index: int, client: SmokeClient) -> None:
+        client.results.append(StepResult("files", "GET", "/api/v1/files/list", 200, True, 10.0 + index))
+        if index == 2:
+            client.results.append(StepResult("files", "PUT", "/api/v1/files/write", 500, False, 50.0))
+            raise RuntimeError("Write failed: 500")
+
+    users = asyncio.run(run_virtual_users(
+        4,
+        journey,
+        client_factory=lambda _index: SmokeClient("http://localhost:8000"),
+        ramp_seconds=0.02,
+    ))
+    summary = summarize(users, wall_seconds=2.0)
+
+    assert [user.user for user in users] == [0, 1, 2, 3]
+    assert summary["users_failed"] == 1
+    assert summary["failures"] == {"RuntimeError: Write failed: 500": 1}
+    assert summary["requests"] == 5
+    assert summary["throughput_rps"] == 2.5
+    assert summary["routes"]["GET /api/v1/files/list"]["error_rate"] == 0.0
+    assert summary["routes"]["PUT /api/v1/files/write"]["statuses"] == {"500": 1}
+    assert summary["routes"]["PUT /api/v1/files/write"]["error_rate"] == 1.0
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+
+import httpx
+import pytest
+
+from tests.smoke.smoke_lib import mail_sink as mail_sink_module
+from tests.smoke.smoke_lib import resend as resend_module
+from tests.smoke.smoke_lib.mail_sink import MailSink, MailSinkServer, SmtpSink
+
+
+def test_mail_sink_wakes_waiter_without_polling() -> None:
+    sink = MailSink()
+    threading.Timer(0.05, lambda: sink.send(to="Late@Example.com", subject="hi", html="", text="")).start()
+
+    message = sink.wait_for("late@example.com", timeout=5)
+
+    assert message["subject"] == "hi"
+    with pytest.raises(TimeoutError):
+        sink.wait_for("late@example.com", after=1, timeout=0.05)
+    with pytest.raises(TimeoutError):
+        sink.wait_for("late@example.com", since=time.time() + 60, timeout=0.05)
+
+
+def test_smtp_listener_delivers_multipart_message() -> None:
+    sink = MailSink()
+    smtp = SmtpSink(sink).start()
+    try:
+        message = EmailMessage()
+        message["From"] = "auth@example.com"
+        message["To"] = "user@example.com"
+        message["Subject"] = "Verify your email"
+        message.set_content("Open https://auth.example.com/verify-email?token=abc&type=signup")
+        message.add_alternative('<a href="https://auth.example.com/verify-email?token=abc&amp;type=signup">verify</a>', subtype="html")
+        with smtplib.SMTP(smtp.host, smtp.port, timeout=5) as client:
+            client.send_message(message)
+    finally:
+        smtp.stop()
+
+    received = sink.wait_for("user@example.com", timeout=1)
+    assert received["subject"] == "Verify your email"
+    assert "token=abc" in received["text"]
+    assert resend_module.extract_confirmation_url(received).endswith("token=abc&type=signup")
+
+
+def test_sink_backend_long_polls_and_times_out() -> None:
+    with MailSinkServer() as server:
+        backend = resend_module.SinkBackend(server.base_url)
+        sent_after = time.time()
+        threading.Timer(
+            0.05,
+            lambda: httpx.post(f"{server.base_url}/emails", json={"to": ["qa@example.com"], "subject": "Code", "text": "Your code is 123456"}),
+        ).start()
+
+        started = time.monotonic()
+        summary = resend_module.wait_for_email("", recipient="qa@example.com", sent_after_epoch=sent_after, timeout_seconds=5, backend=backend)
+        assert time.monotonic() - started < 1.0
+        details = resend_module.get_email("", email_id=summary["id"], backend=backend)
+        assert resend_module.extract_confirmation_code(details) == "123456"
+
+        with pytest.raises(RuntimeError, match="Timed out"):
+            backend.wait_for_email(recipient="nobody@example.com", sent_after_epoch=sent_after, timeout_seconds=0)
+
+
+def test_sink_backend_repolls_past_the_sink_wait_cap(monkeypatch) -> None:
+    monkeypatch.setattr(mail_sink_module, "MAX_WAIT_SECONDS", 0.05)
+    with MailSinkServer() as server:
+        backend = resend_module.SinkBackend(server.base_url)
+        sent_after = time.time()
+        threading.Timer(
+            0.3,
+            lambda: httpx.post(f"{server.base_url}/emails", json={"to": ["qa@example.com"], "subject": "Code", "text": "Your code is 123456"}),
+        ).start()
+
+        summary = backend.wait_for_email(recipient="qa@example.com", sent_after_epoch=sent_after, timeout_seconds=5)
+
+        assert summary["subject"] == "Code"
+
+
+def test_mail_backend_selects_sink_from_environment(monkeypatch) -> None:
+    monkeypatch.delenv("SMOKE_MAIL_SINK_URL", raising=False)
+    assert isinstance(resend_module.mail_backend("key"), resend_module.ResendBackend)
+
+    monkeypatch.setenv("SMOKE_MAIL_SINK_URL", "http://127.0.0.1:8789/")
+    backend = resend_module.mail_backend("key")
+    assert isinstance(backend, resend_module.SinkBackend)
+    assert backend.base_url == "http://127.0.0.1:8789"
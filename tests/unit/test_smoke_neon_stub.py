@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import time
+from urllib.parse import urlparse
+
+import httpx
+import pytest
+
+from tests.smoke import run_all
+from tests.smoke.smoke_lib import auth as auth_module
+from tests.smoke.smoke_lib import resend as resend_module
+from tests.smoke.smoke_lib.neon_stub import (
+    SESSION_COOKIE,
+    NeonAuthStub,
+    decode_jwt,
+    ed25519_public_key,
+    ed25519_sign,
+    ed25519_verify,
+)
+
+
+@pytest.fixture
+def stub():
+    with NeonAuthStub() as running:
+        yield running
+
+
+@pytest.mark.parametrize(
+    ("seed", "public", "message", "signature"),
+    [
+        (
+            "9d61b19deffd5a60ba844af492ec2cc44449c5697b326919703bac031cae7f60",
+            "d75a980182b10ab7d54bfed3c964073a0ee172f3daa62325af021a68f707511a",
+            "",
+            "e5564300c360ac729086e2cc806e828a84877f1eb8e5d974d873e065224901555fb8821590a33bacc61e39701cf9b46bd25bf5f0595bbe24655141438e7a100b",
+        ),
+        (
+            "4ccd089b28ff96da9db6c346ec114e0f5b8a319f35aba624da8cf6ed4fb8a6fb",
+            "3d4017c3e843895a92b70aa74d1b7ebc9c982ccf2ec4968cc0cd55f12af4660c",
+            "72",
+            "92a009a9f0d4cab8720e820b5f642540a2b27b5416503f8fb3762223ebdb69da085ac1e43e15996e458f3613d0f11d8c387b2eaeb4302aeeb00d291612bb0c00",
+        ),
+    ],
+)
+def test_ed25519_matches_rfc8032_vectors(seed: str, public: str, message: str, signature: str) -> None:
+    seed_bytes, message_bytes = bytes.fromhex(seed), bytes.fromhex(message)
+
+    assert ed25519_public_key(seed_bytes).hex() == public
+    assert ed25519_sign(seed_bytes, message_bytes).hex() == signature
+    assert ed25519_verify(bytes.fromhex(public), message_bytes, bytes.fromhex(signature))
+    assert not ed25519_verify(bytes.fromhex(public), message_bytes + b"x", bytes.fromhex(signature))
+
+
+def test_signup_signin_and_token_produce_jwt_the_jwks_verifies(stub: NeonAuthStub) -> None:
+    signup = auth_module.neon_signup(neon_auth_url=stub.base_url, email="New@Example.com", password="pw-1")
+    assert signup.status_code == 200
+    assert SESSION_COOKIE in signup.cookies
+
+    duplicate = auth_module.neon_signup(neon_auth_url=stub.base_url, email="new@example.com", password="pw-2")
+    assert duplicate.status_code == 422
+    wrong = auth_module.neon_signin(neon_auth_url=stub.base_url, email="new@example.com", password="nope")
+    assert wrong.status_code == 401
+
+    signin = auth_module.neon_signin(neon_auth_url=stub.base_url, email="new@example.com", password="pw-1")
+    token = auth_module.neon_fetch_jwt(neon_auth_url=stub.base_url, session_cookies=dict(signin.cookies))
+    assert token
+    jwks = httpx.get(f"{stub.base_url}/.well-known/jwks.json").json()
+    [key] = jwks["keys"]
+    assert (key["kty"], key["crv"], key["alg"]) == ("OKP", "Ed25519", "EdDSA")
+
+    claims = decode_jwt(token, jwks)
+    assert claims["email"] == "new@example.com"
+    assert claims["aud"] == stub.base_url
+    assert claims["exp"] > time.time()
+    assert auth_module.neon_fetch_jwt(neon_auth_url=stub.base_url, session_cookies={}) is None
+
+
+def test_verification_mail_is_readable_through_resend_helpers(monkeypatch, stub: NeonAuthStub) -> None:
+    monkeypatch.setenv("SMOKE_MAIL_SINK_URL", stub.base_url)
+    auth_module.neon_signup(neon_auth_url=stub.base_url, email="verify@example.com", password="pw")
+    sent_after = time.time()
+    resp = httpx.post(
+        f"{stub.base_url}/send-verification-email",
+        headers={"Origin": "http://app.test:8000"},
+        json={"email": "verify@example.com", "callbackURL": "/auth/callback?redirect_uri=%2F&pending_login=abc"},
+    )
+    assert resp.status_code == 200
+
+    started = time.monotonic()
+    summary = resend_module.wait_for_email("key", recipient="verify@example.com", sent_after_epoch=sent_after, timeout_seconds=5)
+    assert time.monotonic() - started < 1.0
+    details = resend_module.get_email("key", email_id=summary["id"])
+    link = resend_module.extract_confirmation_url(details)
+    assert resend_module.confirmation_callback_url(link).startswith("http://app.test:8000/auth/callback?")
+
+    with httpx.Client() as browser:
+        verified = browser.get(link)
+        assert verified.status_code == 302
+        assert urlparse(verified.headers["location"]).netloc == "app.test:8000"
+        assert browser.get(f"{stub.base_url}/token").json()["token"]
+        assert browser.get(link).status_code == 400
+
+
+def test_run_all_neon_stub_points_neon_auth_suite_at_stand_in(monkeypatch) -> None:
+    captured: dict[str, object] = {}
+
+    def fake_run_suite(*, name, script, base_url, auth_args, requires_auth, extra_args, evidence_dir, timeout_s):
+        captured["extra_args"] = extra_args
+        captured["mail_sink"] = run_all.os.environ.get("SMOKE_MAIL_SINK_URL")
+        return run_all.SuiteResult(name=name, exit_code=0, elapsed_s=0.1)
+
+    monkeypatch.setattr(run_all.os, "environ", dict(run_all.os.environ))
+    monkeypatch.setattr(run_all, "run_suite", fake_run_suite)
+    monkeypatch.setattr(run_all.atexit, "register", lambda fn: captured.setdefault("stop", fn))
+    monkeypatch.setattr(
+        "sys.argv",
+        ["run_all.py", "--suites", "neon-auth", "--neon-stub", "--neon-stub-port", "0", "--no-budgets"],
+    )
+
+    try:
+        assert run_all.main() == 0
+    finally:
+        captured["stop"]()
+
+    extra_args = captured["extra_args"]
+    neon_url = extra_args[extra_args.index("--neon-auth-url") + 1]
+    assert neon_url.startswith("http://127.0.0.1:")
+    assert captured["mail_sink"] == neon_url
+
+
+def test_rotated_key_signs_new_tokens_and_old_key_stays_published(stub: NeonAuthStub) -> None:
+    old_token = stub.state.issue_token(sub="u1", email="u1@example.com")
+    old_kid = stub.state.key.kid
+
+    new_key = stub.state.rotate_key()
+    jwks = httpx.get(f"{stub.base_url}/.well-known/jwks.json").json()
+
+    assert [key["kid"] for key in jwks["keys"]] == [new_key.kid, old_kid]
+    assert decode_jwt(old_token, jwks)["sub"] == "u1"
+    assert decode_jwt(stub.state.issue_token(sub="u2", email="u2@example.com"), jwks)["sub"] == "u2"
+    assert stub.state.counters["jwks"] == 1
+    stub.state.rotate_key(keep_previous=False)
+    with pytest.raises(ValueError):
+        decode_jwt(old_token, httpx.get(f"{stub.base_url}/.well-known/jwks.json").json())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from argparse import Namespace
 from pathlib import Path
 
@@ -146,3 +147,84 @@ def test_main_forwards_public_origin_and_recipient_to_neon_auth_suite(
         "--timeout",
         "180",
     ]
+
+
+def test_main_exits_with_budget_failure_class_and_keeps_timings(monkeypatch, tmp_path: Path) -> None:
+    evidence_dir = tmp_path / "evidence"
+
+    def fake_run_suite(
+        *,
+        name,
+        script,
+        base_url,
+        auth_args,
+        requires_auth,
+        extra_args,
+        evidence_dir,
+        timeout_s,
+    ):
+        (evidence_dir / f"{name}.json").write_text(json.dumps({
+            "ok": True,
+            "steps": [{"phase": "1-health", "method": "GET", "path": "/health", "ok": True, "elapsed_ms": 9000.0}],
+            "budget_ok": False,
+            "budgets": {"ok": False, "violations": [{
+                "name": "health", "samples": 1, "p50_ms": 9000.0, "max_ms": 9000.0,
+                "budget": {"max_ms": 2000.0}, "ok": False, "exceeded": ["max_ms"],
+            }]},
+        }), encoding="utf-8")
+        return run_all.SuiteResult(name=name, exit_code=0, elapsed_s=0.1)
+
+    monkeypatch.setattr(run_all, "run_suite", fake_run_suite)
+    argv = ["run_all.py", "--suites", "health", "--evidence-dir", str(evidence_dir)]
+    monkeypatch.setattr("sys.argv", argv)
+
+    assert run_all.main() == run_all.EXIT_BUDGET_FAILURE
+    summary = json.loads((evidence_dir / "summary.json").read_text(encoding="utf-8"))
+    assert summary["ok"] is True
+    assert summary["budget_ok"] is False
+    assert summary["suites"][0]["budget_violations"][0]["name"] == "health"
+
+    monkeypatch.setattr("sys.argv", [*argv, "--budgets-warn-only"])
+    assert run_all.main() == 0
+    assert len((evidence_dir / "timings.jsonl").read_text(encoding="utf-8").splitlines()) == 2
+    trend = json.loads((evidence_dir / "timings-trend.json").read_text(encoding="utf-8"))
+    assert trend["steps"]["health 1-health GET /health"] == [9000.0, 9000.0]
+
+
+def test_main_ignores_stale_suite_evidence_and_extra_suites_get_none(monkeypatch, tmp_path: Path) -> None:
+    captured: dict[str, object] = {}
+    extra = tmp_path / "smoke_macro.py"
+    extra.write_text("", encoding="utf-8")
+
+    def fake_run_suite(
+        *,
+        name,
+        script,
+        base_url,
+        auth_args,
+        requires_auth,
+        extra_args,
+        evidence_dir,
+        timeout_s,
+    ):
+        captured[name] = evidence_dir
+        if evidence_dir is not None:
+            assert not (evidence_dir / f"{name}.json").exists()
+        return run_all.SuiteResult(name=name, exit_code=0, elapsed_s=0.1)
+
+    monkeypatch.setattr(run_all, "run_suite", fake_run_suite)
+    monkeypatch.setattr("sys.argv", ["run_all.py", "--suites", "health", "--extra-suites", str(extra)])
+    real_mkdtemp = run_all.tempfile.mkdtemp
+
+    def seeded_mkdtemp(**kwargs):
+        scratch = Path(real_mkdtemp(dir=tmp_path, **kwargs))
+        (scratch / "health.json").write_text(json.dumps({
+            "budgets": {"violations": [{"name": "stale", "ok": False}]},
+        }), encoding="utf-8")
+        return str(scratch)
+
+    monkeypatch.setattr(run_all.tempfile, "mkdtemp", seeded_mkdtemp)
+
+    assert run_all.main() == 0
+    assert captured["health"] is not None
+    assert captured["macro"] is None
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+
+from tests.smoke.smoke_lib.client import SmokeClient, StepResult
+from tests.smoke.smoke_lib.load import VirtualUserResult
+from tests.smoke.smoke_lib.trace import assign_lanes, concurrency_samples, trace_timing_tree, trace_virtual_users
+
+
+def _spans(trace: dict, tid: int | None = None) -> list[dict]:
+    return [e for e in trace["traceEvents"] if e["ph"] == "X" and (tid is None or e["tid"] == tid)]
+
+
+def test_write_report_emits_trace_with_steps_nested_in_phases(monkeypatch, tmp_path) -> None:
+    def fake_request(self, method, path, **kwargs):
+        return httpx.Response(200 if path != "/missing" else 404, text="{}", request=httpx.Request(method, f"https://example.test{path}"))
+
+    monkeypatch.setattr(httpx.Client, "request", fake_request)
+    monkeypatch.setenv("SMOKE_TRACE", "1")
+
+    client = SmokeClient("https://example.test", budgets=[])
+    client.set_phase("health")
+    client.get("/health")
+    client.get("/missing")
+    client.set_phase("files")
+    client.get("/api/v1/files/list")
+    client.write_report(tmp_path / "filesystem.json")
+
+    trace = json.loads((tmp_path / "filesystem.trace.json").read_text(encoding="utf-8"))
+    spans = _spans(trace)
+    assert [(e["name"], e["cat"]) for e in spans] == [
+        ("health", "phase"),
+        ("GET /health", "http"),
+        ("GET /missing", "http,error"),
+        ("files", "phase"),
+        ("GET /api/v1/files/list", "http"),
+    ]
+    health, first, second = spans[:3]
+    assert health["ts"] == first["ts"] == 0
+    assert health["ts"] + health["dur"] >= second["ts"] + second["dur"] - 1
+    assert second["args"]["status"] == 404
+    assert {e["args"]["name"] for e in trace["traceEvents"] if e["name"] == "thread_name"} == {"filesystem"}
+
+
+def test_virtual_user_trace_has_lane_per_user_and_concurrency_counters() -> None:
+    def step(path: str, started_at: float, elapsed_ms: float) -> StepResult:
+        return StepResult("files", "GET", path, 200, True, elapsed_ms, started_at=started_at)
+
+    users = [
+        VirtualUserResult(0, True, 0.0, 1.0, [step("/a", 10.0, 500.0), step("/b", 10.5, 500.0)]),
+        VirtualUserResult(1, False, 0.25, 0.5, [step("/a", 10.25, 500.0)], error="boom"),
+    ]
+
+    trace = trace_virtual_users(users).to_dict()
+
+    journeys = [e for e in _spans(trace) if e["cat"].startswith("journey")]
+    assert [(e["tid"], e["ts"], e["dur"]) for e in journeys] == [(1, 0, 1000000), (2, 250000, 500000)]
+    assert journeys[1]["args"] == {"ok": False, "error": "boom"}
+    in_flight = [e["args"]["requests"] for e in trace["traceEvents"] if e["name"] == "in_flight_requests"]
+    assert max(in_flight) == 2 and in_flight[-1] == 0
+    assert concurrency_samples([(0, 2), (1, 3), (2, 4)]) == [(0, 1), (1, 2), (2, 2), (3, 1), (4, 0)]
+
+
+def test_timing_tree_spreads_overlapping_siblings_over_lanes() -> None:
+    timings = {
+        "tree": {
+            "name": "eval-1", "kind": "run", "start_s": 0.0, "duration_s": 5.0,
+            "children": [
+                {"name": "fly deploy", "kind": "subprocess", "start_s": 0.0, "duration_s": 3.0},
+                {"name": "GET /health", "kind": "http", "start_s": 1.0, "duration_s": 1.0},
+                {"name": "GET /info", "kind": "http", "start_s": 3.5, "duration_s": 1.0, "open": True},
+            ],
+        },
+        "samples": [{"t_s": 0.0, "label": "x:start", "cpu_s": 0.1, "children_cpu_s": 0.0, "max_rss_mb": 40.0}],
+    }
+
+    trace = trace_timing_tree(timings).to_dict()
+
+    lanes = {e["name"]: e["tid"] for e in _spans(trace)}
+    assert lanes["eval-1"] == lanes["fly deploy"] == lanes["GET /info"] == 1
+    assert lanes["GET /health"] == 2
+    assert _spans(trace, 1)[-1]["args"] == {"open": True}
+    assert [e["name"] for e in trace["traceEvents"] if e["ph"] == "C"] == ["cpu_s", "max_rss_mb"]
+    assert assign_lanes([(0, 2), (1, 3), (2, 4), (2.5, 5)]) == [0, 1, 0, 2]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+
+from tests.smoke import smoke_ui_state
+from tests.smoke.smoke_lib import ui_state
+from tests.smoke.smoke_lib.client import SmokeClient
+
+
+def _fake_ui_api(states: dict[str, dict], *, delete_ok: bool = True):
+    """``httpx.Client.request`` stand-in backed by an in-memory state store."""
+
+    def fake_request(self, method, path, **kwargs):
+        status, body = 200, {"ok": True}
+        tail = path.removeprefix("/api/v1/ui/")
+        if path == "/api/capabilities":
+            body["features"] = {"ui_state": True}
+        elif method == "PUT" and tail == "state":
+            states[kwargs["json"]["client_id"]] = kwargs["json"]
+            body["state"] = kwargs["json"]
+        elif tail == "state":
+            body.update(states=list(states.values()), count=len(states))
+        elif tail == "state/latest":
+            body["state"] = list(states.values())[-1]
+        elif tail.startswith("panes"):
+            client_id = tail.removeprefix("panes").strip("/") or list(states)[-1]
+            body["open_panels"] = states[client_id]["open_panels"]
+        elif method == "DELETE":
+            if delete_ok:
+                states.pop(tail.rsplit("/", 1)[1])
+            else:
+                body["ok"] = False
+        elif tail.rsplit("/", 1)[1] in states:
+            body["state"] = states[tail.rsplit("/", 1)[1]]
+        else:
+            status, body = 404, {"ok": False}
+        return httpx.Response(status, text=json.dumps(body), request=httpx.Request(method, f"https://example.test{path}"))
+
+    return fake_request
+
+
+def test_ui_state_helpers_round_trip_against_in_memory_store(monkeypatch) -> None:
+    states: dict[str, dict] = {}
+    monkeypatch.setattr(httpx.Client, "request", _fake_ui_api(states))
+    client = SmokeClient("https://example.test", budgets=[])
+
+    assert ui_state.list_ui_states(client) == []
+    ui_state.upsert_ui_state(client, client_id="c1", meta={"smoke_ts": 1})
+    assert ui_state.get_ui_state(client, client_id="c1")["meta"] == {"smoke_ts": 1}
+    assert ui_state.get_latest_ui_state(client)["client_id"] == "c1"
+    assert [p["id"] for p in ui_state.list_panes(client, client_id="c1")] == ["filetree", "editor"]
+    ui_state.delete_ui_state(client, client_id="c1")
+    ui_state.verify_ui_state_deleted(client, client_id="c1")
+
+    report = client.report()
+    assert report["ok"] is True
+    assert [step["phase"] for step in report["steps"]][-2:] == ["ui-state-delete", "ui-state-verify-deleted"]
+
+
+def test_suite_writes_evidence_when_a_step_fails(monkeypatch, tmp_path) -> None:
+    evidence_out = tmp_path / "ui-state.json"
+    monkeypatch.setattr(httpx.Client, "request", _fake_ui_api({}, delete_ok=False))
+    monkeypatch.setattr(smoke_ui_state, "ensure_session", lambda client, **kwargs: None)
+    monkeypatch.setattr(smoke_ui_state, "create_workspace", lambda client, *, name: {"workspace": {"id": "ws-1"}})
+    monkeypatch.setattr(
+        "sys.argv",
+        ["smoke_ui_state.py", "--base-url", "https://example.test", "--evidence-out", str(evidence_out)],
+    )
+
+    exit_code = smoke_ui_state.main()
+
+    report = json.loads(evidence_out.read_text(encoding="utf-8"))
+    assert exit_code == 1
+    assert report["ok"] is False
+    assert report["workspace_id"] == "ws-1"
+    # The delete answered 200 with ok=false; the verify phase never ran.
+    assert [step["phase"] for step in report["steps"]][-2:] == ["ui-state-delete", "ui-state-aborted"]
+    assert "delete not ok" in report["steps"][-1]["detail"]
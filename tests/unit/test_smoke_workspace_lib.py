@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from tests.smoke.smoke_lib import workspace as workspace_module
+from tests.smoke.smoke_lib.client import SmokeClient
+
+
+def _runtime(state: str, step: str = "") -> dict:
+    return {"runtime": {"state": state, "provisioning_step": step, "sprite_url": "https://sprite.test"}}
+
+
+def test_poll_runtime_ready_falls_back_to_adaptive_polling(monkeypatch) -> None:
+    client = SmokeClient("https://example.test")
+    responses = iter([
+        _runtime("provisioning", "create_sandbox"),
+        _runtime("provisioning", "create_sandbox"),
+        _runtime("provisioning", "create_sandbox"),
+        _runtime("provisioning", "bootstrap"),
+        _runtime("ready"),
+    ])
+    sleeps: list[float] = []
+
+    def fake_send(self, request, **kwargs):
+        assert not request.url.path.endswith("/runtime/events")
+        return httpx.Response(200, json=next(responses), request=request)
+
+    monkeypatch.setattr(httpx.Client, "send", fake_send)
+    monkeypatch.setattr(workspace_module.time, "sleep", sleeps.append)
+
+    runtime = workspace_module.poll_runtime_ready(client, "ws-1", poll_interval=1.0, min_poll_interval=0.25)
+
+    assert runtime["state"] == "ready"
+    assert sleeps == [0.25, 0.5, 1.0, 0.25]
+    metrics = client.report()["metrics"]["runtime_provisioning"]
+    assert metrics["outcome"] == "ready"
+    assert metrics["transport"] == "poll"
+    assert metrics["polls"] == 5
+    assert [step["provisioning_step"] for step in metrics["steps"]] == ["create_sandbox", "bootstrap", ""]
+    assert client.report()["ok"] is True
+
+
+def test_poll_runtime_ready_falls_back_when_event_stream_is_missing(monkeypatch) -> None:
+    client = SmokeClient("https://example.test")
+
+    def fake_send(self, request, **kwargs):
+        if request.url.path.endswith("/runtime/events"):
+            return httpx.Response(404, json={"error": "not_found"}, request=request)
+        return httpx.Response(200, json=_runtime("ready"), request=request)
+
+    monkeypatch.setattr(httpx.Client, "send", fake_send)
+
+    runtime = workspace_module.poll_runtime_ready(client, "ws-1", use_events=True)
+
+    assert runtime["state"] == "ready"
+    assert client.metrics["runtime_provisioning"]["transport"] == "poll"
+
+
+def test_poll_runtime_ready_follows_event_stream(monkeypatch) -> None:
+    client = SmokeClient("https://example.test")
+    body = (
+        b": connected\n\n"
+        b'data: {"runtime": {"state": "provisioning", "provisioning_step": "create_sandbox"}}\n\n'
+        b'data: {"state": "provisioning", "provisioning_step": "bootstrap"}\n\n'
+        b'data: {"runtime": {"state": "ready", "sprite_url": "https://sprite.test"}}\n\n'
+    )
+
+    def fake_send(self, request, **kwargs):
+        assert request.url.path == "/api/v1/workspaces/ws-1/runtime/events"
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream"},
+            stream=httpx.ByteStream(body),
+            request=request,
+        )
+
+    monkeypatch.setattr(httpx.Client, "send", fake_send)
+
+    runtime = workspace_module.poll_runtime_ready(client, "ws-1", use_events=True)
+
+    assert runtime["sprite_url"] == "https://sprite.test"
+    metrics = client.metrics["runtime_provisioning"]
+    assert metrics["transport"] == "sse"
+    assert metrics["polls"] == 0
+    assert [step["provisioning_step"] for step in metrics["steps"]] == ["create_sandbox", "bootstrap", ""]
+
+
+def test_poll_runtime_ready_records_error_outcome(monkeypatch) -> None:
+    client = SmokeClient("https://example.test")
+
+    def fake_send(self, request, **kwargs):
+        payload = {"runtime": {"state": "error", "provisioning_step": "bootstrap", "last_error": "boom"}}
+        return httpx.Response(200, json=payload, request=request)
+
+    monkeypatch.setattr(httpx.Client, "send", fake_send)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        workspace_module.poll_runtime_ready(client, "ws-1", use_events=False)
+
+    assert client.metrics["runtime_provisioning"]["outcome"] == "error"